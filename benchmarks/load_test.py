@@ -0,0 +1,115 @@
+"""
+Teste de carga local da API do validador.
+
+Abre `--concurrency` conexões keep-alive, envia `--requests` requisições no total e
+reporta latência p50/p99 e requisições por segundo.
+
+Uso:
+    PYTHONPATH=src python -m api.server --port 8000 &
+    python benchmarks/load_test.py --port 8000 --concurrency 16 --requests 5000
+    python benchmarks/load_test.py --port 8000 --endpoint batch --batch-size 1000 --requests 200
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+
+def _experiment(rng: random.Random) -> dict:
+    visitors_a = rng.randint(1_000, 100_000)
+    visitors_b = rng.randint(1_000, 100_000)
+    return {
+        "name": "carga",
+        "start_date": "2025-01-01",
+        "end_date": "2025-02-01",
+        "variation_a_visitors": visitors_a,
+        "conversions_a": int(visitors_a * 0.03),
+        "variation_b_visitors": visitors_b,
+        "conversions_b": int(visitors_b * rng.uniform(0.028, 0.034)),
+        "tail_numbers": rng.choice([1, 2]),
+        "confidence_level": rng.choice([90.0, 95.0, 99.0]),
+        "estimated_uplift": 10.0,
+    }
+
+
+def _request(args: argparse.Namespace, rng: random.Random) -> bytes:
+    if args.endpoint == "batch":
+        body = "\n".join(json.dumps(_experiment(rng)) for _ in range(args.batch_size)).encode()
+        path, content_type = "/analyze/batch", "application/x-ndjson"
+    else:
+        body = json.dumps(_experiment(rng)).encode()
+        path, content_type = "/analyze", "application/json"
+    return (f"POST {path} HTTP/1.1\r\nHost: {args.host}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n").encode() + body
+
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode().partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding") == "chunked":
+        while (size := int((await reader.readline()).strip(), 16)) > 0:
+            await reader.readexactly(size + 2)
+        await reader.readline()
+    else:
+        await reader.readexactly(int(headers["content-length"]))
+    return status
+
+
+async def _client(args: argparse.Namespace, queue: asyncio.Queue, latencies: list, errors: list) -> None:
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        while True:
+            try:
+                request = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(args.requests):
+        queue.put_nowait(_request(args, rng))
+
+    latencies: list = []
+    errors: list = []
+    started = time.perf_counter()
+    await asyncio.gather(*(_client(args, queue, latencies, errors) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"endpoint={args.endpoint} concorrência={args.concurrency} requisições={len(latencies)} erros={len(errors)}")
+    print(f"p50={quantiles[49] * 1000:.2f} ms  p99={quantiles[98] * 1000:.2f} ms  "
+          f"{len(latencies) / elapsed:.0f} req/s")
+    if args.endpoint == "batch":
+        print(f"{len(latencies) * args.batch_size / elapsed:.0f} experimentos/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--endpoint", choices=["analyze", "batch"], default="analyze")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark da execução paralela do validador em lote.
+
+Mede o tempo de ParallelBatchRunner para 1..N processos sobre uma carteira sintética
+e imprime a curva de escalonamento (tempo e speedup em relação a 1 processo).
+
+Uso:
+    PYTHONPATH=src python benchmarks/parallel_scaling.py --experiments 2000000 --max-workers 8
+"""
+import argparse
+import os
+import time
+from datetime import date
+import numpy as np
+from domain.entities.variation_batch import VariationBatch
+from logic.parallel_analysis import ParallelBatchRunner
+
+
+def synthetic_portfolio(size: int, seed: int = 0) -> VariationBatch:
+    rng = np.random.default_rng(seed)
+    visitors_a = rng.integers(1_000, 200_000, size)
+    visitors_b = rng.integers(1_000, 200_000, size)
+    return VariationBatch(
+        variation_a_visitors=visitors_a,
+        variation_b_visitors=visitors_b,
+        conversions_a=rng.binomial(visitors_a, 0.03),
+        conversions_b=rng.binomial(visitors_b, 0.031),
+        tail_numbers=rng.integers(1, 3, size),
+        confidence_level=rng.choice([90.0, 95.0, 99.0], size),
+        estimated_uplift=10.0,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--experiments", type=int, default=2_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    variations = synthetic_portfolio(args.experiments)
+    start_dates = np.datetime64("2025-01-01")
+    end_dates = np.datetime64("2025-02-01")
+
+    print(f"{args.experiments:,} experimentos, melhor de {args.repeats} execuções")
+    print(f"{'workers':>8} {'tempo (s)':>10} {'speedup':>8}")
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        with ParallelBatchRunner(workers=workers, today=date(2025, 2, 1)) as runner:
+            runner.run(variations[:workers * 2], start_dates, end_dates)  # aquece o pool
+            timings = []
+            for _ in range(args.repeats):
+                started = time.perf_counter()
+                runner.run(variations, start_dates, end_dates)
+                timings.append(time.perf_counter() - started)
+        best = min(timings)
+        baseline = baseline or best
+        print(f"{workers:>8} {best:>10.3f} {baseline / best:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
-def main():
-    print("Hello from ab-test-calculator!")
+import sys
+from pathlib import Path
+
+# Os pacotes da aplicação ficam em src/ (o mesmo PYTHONPATH usado pelo CI e pelo Procfile)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+
+from cli.main import main
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,324 @@
+"""
+API HTTP (JSON) do validador, sem dependência do Streamlit.
+
+Servidor HTTP/1.1 assíncrono e enxuto sobre asyncio, com conexões keep-alive:
+
+- POST /analyze         Analisa um teste (JSON) com o ABStatisticalValidator.
+- POST /analyze/batch   Analisa vários testes (array JSON ou NDJSON) com o validador
+                        em lote e devolve NDJSON em streaming (chunked).
+- GET  /health          Estado do serviço e contadores do cache.
+
+Uso:
+    PYTHONPATH=src python -m api.server --port 8000
+"""
+import argparse
+import asyncio
+import json
+import math
+from datetime import date
+from typing import Any, Dict, Iterable, List, Tuple
+import pandas as pd
+from domain.entities.ab_tester import ABTester
+from domain.entities.variation import Variation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.group_sequential import precompute_boundary_table
+from logic.bulk_analysis import DEFAULT_PARAMETERS, analyze_frame
+from logic.result_cache import ResultCache, canonical_input_key
+
+REQUIRED_FIELDS = ("start_date", "variation_a_visitors", "conversions_a", "variation_b_visitors", "conversions_b")
+MAX_BODY_BYTES = 64 * 1024 * 1024
+BATCH_CHUNK_SIZE = 5_000
+KEEP_ALIVE_TIMEOUT = 15.0
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(Exception):
+    """ Erro do cliente, convertido em uma resposta JSON com o status informado. """
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _json_safe(value: Any) -> Any:
+    """ Converte tipos NumPy e valores não finitos (ex: uplift infinito) para JSON estrito. """
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _parse_date(value: Any, field: str) -> date | None:
+    if value in (None, ""):
+        return None
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        raise RequestError(400, f"Data inválida em '{field}': {value}")
+
+
+def parse_experiment(payload: Dict[str, Any]) -> Tuple[ABTester, Variation]:
+    """
+    Converte o JSON de um experimento (mesmas colunas da CLI) nas entidades do domínio.
+    """
+    if not isinstance(payload, dict):
+        raise RequestError(400, "Cada experimento deve ser um objeto JSON.")
+    try:
+        parameters = {key: payload.get(key, default) for key, default in DEFAULT_PARAMETERS.items()}
+        variation = Variation(
+            variation_a_visitors=int(payload["variation_a_visitors"]),
+            variation_b_visitors=int(payload["variation_b_visitors"]),
+            conversions_a=int(payload["conversions_a"]),
+            conversions_b=int(payload["conversions_b"]),
+            tail_numbers=int(parameters["tail_numbers"]),
+            confidence_level=float(parameters["confidence_level"]),
+            estimated_uplift=float(parameters["estimated_uplift"]),
+            count_relative_error=float(parameters["count_relative_error"]),
+        )
+    except KeyError as error:
+        raise RequestError(400, f"Campo obrigatório ausente: {error.args[0]}")
+    except (TypeError, ValueError) as error:
+        raise RequestError(400, f"Valor inválido: {error}")
+
+    start_date = _parse_date(payload.get("start_date"), "start_date")
+    if start_date is None:
+        raise RequestError(400, "Campo obrigatório ausente: start_date")
+    tester = ABTester(
+        name=str(payload.get("name", "")),
+        start_date=start_date,
+        end_date=_parse_date(payload.get("end_date"), "end_date"),
+        hypothesis=str(payload.get("hypothesis", "")),
+        desired_confidence_level=variation.confidence_level * 100,
+    )
+    return tester, variation
+
+
+def _check_required_fields(record: Any) -> None:
+    """ Validação leve usada no lote (sem instanciar entidades por registro). """
+    if not isinstance(record, dict):
+        raise RequestError(400, "Cada experimento deve ser um objeto JSON.")
+    for field in REQUIRED_FIELDS:
+        if record.get(field) is None:
+            raise RequestError(400, f"Campo obrigatório ausente: {field}")
+
+
+def _parse_batch(body: bytes, content_type: str) -> List[Dict[str, Any]]:
+    try:
+        if "ndjson" in content_type:
+            return [json.loads(line) for line in body.splitlines() if line.strip()]
+        records = json.loads(body)
+    except json.JSONDecodeError as error:
+        raise RequestError(400, f"JSON inválido: {error}")
+    if isinstance(records, dict):
+        records = records.get("experiments")
+    if not isinstance(records, list):
+        raise RequestError(400, "O lote deve ser um array JSON, NDJSON ou {\"experiments\": [...]}.")
+    return records
+
+
+class ValidatorService:
+    """
+    Regras da API, independentes do transporte HTTP.
+    """
+    def __init__(self, cache: ResultCache | None = None) -> None:
+        self.cache = cache or ResultCache()
+
+    def analyze(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        tester, variation = parse_experiment(payload)
+        today = date.today()
+        key = canonical_input_key(tester, variation, today=today)
+        validator = ABStatisticalValidator(variation=variation, tester=tester, today=today)
+        try:
+            results = self.cache.get_or_compute(key, validator.get_statistical_results)
+        except ValueError as error:
+            raise RequestError(400, str(error))
+        return _json_safe(results)
+
+    def analyze_batch_chunk(self, records: List[Dict[str, Any]]) -> List[str]:
+        """ Analisa um bloco de experimentos e devolve uma linha NDJSON por experimento. """
+        for record in records:
+            _check_required_fields(record)
+        # Campos opcionais ausentes em alguns registros recebem os valores padrão da CLI
+        frame = pd.DataFrame.from_records(records).fillna(value=DEFAULT_PARAMETERS)
+        try:
+            output = analyze_frame(frame)
+        except ValueError as error:
+            raise RequestError(400, str(error))
+        return [json.dumps(_json_safe(row)) + "\n" for row in output.to_dict(orient="records")]
+
+
+class HttpServer:
+    """
+    Servidor HTTP/1.1 mínimo (Content-Length nas requisições, keep-alive e respostas chunked).
+    """
+    def __init__(self, service: ValidatorService | None = None) -> None:
+        self.service = service or ValidatorService()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), KEEP_ALIVE_TIMEOUT)
+                except RequestError as error:
+                    await self._send_json(writer, error.status, {"error": str(error)}, keep_alive=False)
+                    break
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    keep_alive = await self._dispatch(method, path, headers, body, writer, keep_alive)
+                except RequestError as error:
+                    await self._send_json(writer, error.status, {"error": str(error)}, keep_alive)
+                except Exception as error:  # noqa: BLE001 - a conexão não deve cair por um erro interno
+                    await self._send_json(writer, 500, {"error": f"Erro interno: {error}"}, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        try:
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise ConnectionError("Linha de requisição inválida")
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise RequestError(411, "Envie o corpo com Content-Length.")
+        length = self._content_length(headers)
+        if length > MAX_BODY_BYTES:
+            raise RequestError(413, "Corpo da requisição muito grande.")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), path.split("?", 1)[0], headers, body
+
+    @staticmethod
+    def _content_length(headers: Dict[str, str]) -> int:
+        """ Content-Length como inteiro não negativo (0 quando ausente). """
+        value = headers.get("content-length", "") or "0"
+        if not (value.isascii() and value.isdigit()):
+            raise RequestError(400, f"Content-Length inválido: {value!r}.")
+        return int(value)
+
+    async def _dispatch(self, method: str, path: str, headers: Dict[str, str], body: bytes,
+                        writer: asyncio.StreamWriter, keep_alive: bool) -> bool:
+        """ Responde à requisição e devolve se a conexão pode continuar aberta. """
+        if path == "/health":
+            if method != "GET":
+                raise RequestError(405, "Use GET.")
+            await self._send_json(writer, 200, {"status": "ok", "cache": self.service.cache.stats()}, keep_alive)
+        elif path == "/analyze":
+            if method != "POST":
+                raise RequestError(405, "Use POST.")
+            payload = self._load_json(body)
+            await self._send_json(writer, 200, self.service.analyze(payload), keep_alive)
+        elif path == "/analyze/batch":
+            if method != "POST":
+                raise RequestError(405, "Use POST.")
+            records = _parse_batch(body, headers.get("content-type", ""))
+            return await self._stream_batch(writer, records, keep_alive)
+        else:
+            raise RequestError(404, f"Rota não encontrada: {path}")
+        return keep_alive
+
+    @staticmethod
+    def _load_json(body: bytes) -> Any:
+        try:
+            return json.loads(body or b"null")
+        except json.JSONDecodeError as error:
+            raise RequestError(400, f"JSON inválido: {error}")
+
+    async def _stream_batch(self, writer: asyncio.StreamWriter, records: List[Dict[str, Any]],
+                            keep_alive: bool) -> bool:
+        """
+        Calcula o lote em blocos (fora do event loop) e envia cada bloco assim que fica pronto.
+        O primeiro bloco é validado antes de enviar o cabeçalho 200.
+
+        Depois do cabeçalho, um erro em um bloco vira uma linha NDJSON {"error": ...} e o
+        corpo é encerrado normalmente; se o erro for interno, a conexão é fechada em seguida.
+
+        Returns:
+            Se a conexão pode continuar aberta.
+        """
+        loop = asyncio.get_running_loop()
+        chunks = [records[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(records), BATCH_CHUNK_SIZE)]
+        first_lines = await loop.run_in_executor(None, self.service.analyze_batch_chunk, chunks[0]) if chunks else []
+
+        writer.write(self._head(200, "application/x-ndjson", keep_alive, chunked=True))
+        await self._write_chunk(writer, first_lines)
+        for chunk in chunks[1:]:
+            try:
+                lines = await loop.run_in_executor(None, self.service.analyze_batch_chunk, chunk)
+            except RequestError as error:
+                await self._write_chunk(writer, [json.dumps({"error": str(error)}) + "\n"])
+                break
+            except Exception as error:  # noqa: BLE001 - o cabeçalho 200 já foi enviado
+                await self._write_chunk(writer, [json.dumps({"error": f"Erro interno: {error}"}) + "\n"])
+                keep_alive = False
+                break
+            await self._write_chunk(writer, lines)
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        return keep_alive
+
+    @staticmethod
+    async def _write_chunk(writer: asyncio.StreamWriter, lines: Iterable[str]) -> None:
+        data = "".join(lines).encode("utf-8")
+        if data:
+            writer.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+            await writer.drain()
+
+    @staticmethod
+    def _head(status: int, content_type: str, keep_alive: bool,
+              content_length: int | None = None, chunked: bool = False) -> bytes:
+        lines = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+            f"Content-Type: {content_type}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if chunked:
+            lines.append("Transfer-Encoding: chunked")
+        else:
+            lines.append(f"Content-Length: {content_length}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _send_json(self, writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(self._head(status, "application/json", keep_alive, content_length=len(body)) + body)
+        await writer.drain()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8000) -> None:
+    server = HttpServer()
+    precompute_boundary_table()
+    async with await asyncio.start_server(server.handle_connection, host, port) as tcp_server:
+        print(f"API do validador em http://{host}:{port}")
+        await tcp_server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API HTTP da Calculadora de Testes A/B.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,11 @@ from domain.entities.ab_tester import ABTester
 from domain.entities.variation import Variation
 from components.ab_tester_component import ABTesterComponent
 from components.variation_component import VariationComponent
-from components.results_component import ResultsComponent 
+from components.results_component import ResultsComponent
+from components.multi_arm_results_component import MultiArmResultsComponent
+from components.segment_analysis_component import SegmentAnalysisComponent
+from components.planning_explorer_component import PlanningExplorerComponent
+from logic.analysis import perform_statistical_analysis, precompute_group_sequential_tables
 
 def load_layout_css():
     # noinspection PyStringFormat,PyUnresolvedReferences
@@ -26,6 +30,7 @@ def load_layout_css():
     """, unsafe_allow_html=True)
 
 load_layout_css()
+precompute_group_sequential_tables()
 
 if "init" not in st.session_state:
     st.session_state.chart_data = pd.DataFrame(
@@ -38,52 +43,6 @@ if "init" not in st.session_state:
     st.session_state.init = True
 
 
-def hash_ab_tester_entity(tester: ABTester) -> tuple:
-    """Cria uma impressão digital (hash) para a entidade ABTester."""
-    # Ajuste esta tupla para incluir todos os atributos de ABTester
-    # que afetam os cálculos em ABStatisticalValidator ou a exibição em ResultsComponent.
-    # Exemplo: name, start_date, end_date, hypothesis, desired_confidence_level
-    return (
-        tester.name,
-        tester.start_date,
-        tester.end_date,
-        tester.hypothesis,
-        tester.desired_confidence_level
-
-    )
-
-def hash_variation_entity(variation: Variation) -> tuple:
-    """Cria uma impressão digital (hash) para a entidade Variation."""
-
-    return (
-        variation.variation_a_visitors,
-        variation.conversions_a,
-        variation.variation_b_visitors,
-        variation.conversions_b,
-        variation.tail_numbers,
-        variation.confidence_level, 
-        variation.estimated_uplift
-    )
-
-@st.cache_data(
-    ttl=3600,
-    hash_funcs={
-        ABTester: hash_ab_tester_entity,
-        Variation: hash_variation_entity
-    }
-)
-def perform_statistical_analysis(tester_entity: ABTester, variation_entity: Variation):
-    """
-    Cria o componente de resultados. Os cálculos são feitos dentro do ResultsComponent.
-    O decorator @st.cache_data garante que ela só rode se os inputs (entidades) mudarem.
-    """
-    print("Instanciando ResultsComponent (cache miss para perform_statistical_analysis)...") # Para debug
-    # ResultsComponent agora faz os cálculos em seu __init__
-    results_display_component = ResultsComponent(tester=tester_entity, variation=variation_entity)
-    return results_display_component
-
-
-
 # --- Lógica do Botão de Limpeza ---
 def clear_state():
     """Limpa o cache e todos os dados do session_state."""
@@ -110,15 +69,36 @@ with st.sidebar:
 
 
 # --- Página Principal com os Resultados (Outputs) ---
+# Mantém o relatório visível quando um widget do próprio relatório dispara um rerun
 if calculate_button:
+    st.session_state.show_results = True
+
+if st.session_state.get("show_results") and variation_form.is_multi_arm:
+    tester_entity = ab_tester_form.get_ab_tester_entity()
+    multi_arm_entity = variation_form.get_multi_arm_entity()
+
+    if tester_entity and multi_arm_entity:
+        with st.spinner("Calculando resultados..."):
+            MultiArmResultsComponent(
+                tester=tester_entity,
+                variation=multi_arm_entity,
+                correction=st.session_state.var_correction,
+                all_pairs=st.session_state.var_all_pairs,
+            ).render()
+elif st.session_state.get("show_results"):
     tester_entity = ab_tester_form.get_ab_tester_entity()
     variation_entity = variation_form.get_variation_entity()
 
     if tester_entity and variation_entity:
         with st.spinner("Calculando resultados..."):
-            results_component = ResultsComponent(tester=tester_entity, variation=variation_entity)
+            results = perform_statistical_analysis(tester_entity, variation_entity)
+            results_component = ResultsComponent(tester=tester_entity, variation=variation_entity, results=results)
             results_component.render()
     else:
         st.error("Erro ao obter dados dos formulários. Verifique os inputs.")
 else:
     st.info("Preencha os dados do teste na barra lateral e clique em 'Analisar Resultados' para começar.")
+
+# --- Análise por Segmento e Planejamento (independentes do botão de análise) ---
+SegmentAnalysisComponent().render()
+PlanningExplorerComponent().render()
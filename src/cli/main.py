@@ -0,0 +1,230 @@
+import argparse
+import json
+import sys
+import time
+from typing import Sequence
+import pandas as pd
+from logic.bulk_analysis import DEFAULT_CHUNK_SIZE, analyze_file
+from domain.entities.hyperloglog import DEFAULT_PRECISION
+from logic.event_ingestion import (
+    DEFAULT_CHUNK_ROWS,
+    EVENT_FORMATS,
+    ingest_event_log,
+    read_sketches,
+    sketch_event_log,
+    summarize_sketches,
+    write_sketches,
+)
+from logic.ratio_metrics import analyze_ratio_file
+from logic.simulation import DEFAULT_CHUNK_SIZE as DEFAULT_SIMULATION_CHUNK_SIZE, simulate_experiments
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ab-calc",
+        description="Calculadora de Validação de Testes A/B (linha de comando).",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    analyze = subparsers.add_parser(
+        "analyze",
+        help="Analisa um arquivo CSV/Parquet de experimentos (um experimento por linha).",
+    )
+    analyze.add_argument("input", help="Arquivo de entrada (.csv ou .parquet).")
+    analyze.add_argument("--out", required=True, help="Arquivo de saída (.csv ou .parquet).")
+    analyze.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Número de experimentos processados por bloco (padrão: {DEFAULT_CHUNK_SIZE}).",
+    )
+    analyze.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Número de processos usados no cálculo (padrão: 1).",
+    )
+
+    ratio = subparsers.add_parser(
+        "ratio",
+        help="Analisa métricas de razão (ex: cliques por sessão) a partir das somas por braço (método delta).",
+    )
+    ratio.add_argument(
+        "input",
+        help="Tabela de somas (.csv ou .parquet): metric, arm, units, numerator, denominator, "
+             "numerator_squares, denominator_squares, cross_products e, opcionalmente, experiment.",
+    )
+    ratio.add_argument("--out", required=True, help="Arquivo de saída (.csv ou .parquet).")
+    ratio.add_argument("--tails", type=int, choices=(1, 2), default=2, help="Número de caudas (padrão: 2).")
+    ratio.add_argument("--confidence", type=float, default=95.0, help="Nível de confiança em %% (padrão: 95).")
+    ratio.add_argument("--mde", type=float, default=10.0, help="MDE relativo em %% (padrão: 10).")
+
+    ingest = subparsers.add_parser(
+        "ingest",
+        help="Converte um log bruto de eventos (CSV/NDJSON/Parquet) em visitantes e conversões por braço.",
+    )
+    ingest.add_argument("input", help="Log de eventos com as colunas user_id, event, arm e timestamp.")
+    ingest.add_argument("--format", choices=EVENT_FORMATS, help="Formato do log (padrão: pela extensão).")
+    ingest.add_argument("--out", help="Arquivo CSV com as contagens por braço (padrão: saída padrão).")
+    ingest.add_argument(
+        "--daily-out",
+        help="Arquivo CSV com as contagens diárias por braço (com --approximate, estimadas pelas uniões "
+             "acumuladas dos sketches e com as conversões no dia da conversão).",
+    )
+    ingest.add_argument(
+        "--keep-multi-arm-users",
+        action="store_true",
+        help="Mantém no braço da primeira exposição os usuários expostos a mais de um braço.",
+    )
+    ingest.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        help=f"Número de eventos lidos por bloco (padrão: {DEFAULT_CHUNK_ROWS}).",
+    )
+    ingest.add_argument(
+        "--approximate",
+        action="store_true",
+        help="Conta usuários únicos com HyperLogLog (memória constante, contagens aproximadas).",
+    )
+    ingest.add_argument(
+        "--precision",
+        type=int,
+        default=DEFAULT_PRECISION,
+        help=f"Precisão dos sketches HyperLogLog (padrão: {DEFAULT_PRECISION}).",
+    )
+    ingest.add_argument("--sketch-out", help="Grava os sketches por dia e braço (NDJSON) para combinar depois.")
+
+    merge = subparsers.add_parser(
+        "merge-sketches",
+        help="Combina sketches gravados por 'ingest --sketch-out' em contagens por braço.",
+    )
+    merge.add_argument("inputs", nargs="+", help="Arquivos de sketches (um por partição).")
+    merge.add_argument("--out", help="Arquivo CSV com as contagens por braço (padrão: saída padrão).")
+    merge.add_argument("--daily-out", help="Arquivo CSV com as contagens diárias estimadas por braço.")
+
+    simulate = subparsers.add_parser(
+        "simulate",
+        help="Simula testes A/A ou A/B e mede o erro tipo I, o poder e a cobertura dos intervalos.",
+    )
+    simulate.add_argument("--simulations", type=int, default=1_000_000, help="Número de testes simulados.")
+    simulate.add_argument("--control-rate", type=float, required=True, help="Taxa verdadeira do controle (ex: 0.03).")
+    simulate.add_argument("--uplift", type=float, default=0.0,
+                          help="Uplift relativo verdadeiro da variação em %% (padrão: 0, teste A/A).")
+    simulate.add_argument("--daily-visitors", type=int, default=1_000, help="Visitantes por dia (total).")
+    simulate.add_argument("--days", type=int, default=28, help="Duração do teste em dias (padrão: 28).")
+    simulate.add_argument("--looks", type=int, nargs="+",
+                          help="Dias em que o resultado é olhado (padrão: só no último dia).")
+    simulate.add_argument("--tails", type=int, choices=(1, 2), default=2, help="Número de caudas (padrão: 2).")
+    simulate.add_argument("--confidence", type=float, default=95.0, help="Nível de confiança em %% (padrão: 95).")
+    simulate.add_argument("--mde", type=float, default=10.0, help="MDE em %% usado pelo teste sequencial (padrão: 10).")
+    simulate.add_argument("--seed", type=int, help="Semente para resultados reprodutíveis.")
+    simulate.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_SIMULATION_CHUNK_SIZE,
+        help=f"Testes simulados por bloco (padrão: {DEFAULT_SIMULATION_CHUNK_SIZE}).",
+    )
+    simulate.add_argument("--workers", type=int, default=1, help="Número de processos (padrão: 1).")
+
+    serve = subparsers.add_parser("serve", help="Inicia a API HTTP (JSON) do validador.")
+    serve.add_argument("--host", default="127.0.0.1", help="Endereço de escuta (padrão: 127.0.0.1).")
+    serve.add_argument("--port", type=int, default=8000, help="Porta de escuta (padrão: 8000).")
+    return parser
+
+
+def _write_counts(summary: dict, out: str | None) -> None:
+    counts = pd.DataFrame({
+        "arm": summary["arms"],
+        "visitors": [summary["visitors"][arm] for arm in summary["arms"]],
+        "conversions": [summary["conversions"][arm] for arm in summary["arms"]],
+    })
+    counts.to_csv(out if out else sys.stdout, index=False)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "analyze":
+        try:
+            processed = analyze_file(args.input, args.out, chunk_size=args.chunk_size, workers=args.workers)
+        except (ValueError, FileNotFoundError) as error:
+            parser.error(str(error))
+        print(f"{processed} experimentos analisados -> {args.out}", file=sys.stderr)
+    elif args.command == "ratio":
+        try:
+            analyzed = analyze_ratio_file(args.input, args.out, tail_numbers=args.tails,
+                                          confidence_level=args.confidence, estimated_uplift=args.mde)
+        except (ValueError, FileNotFoundError) as error:
+            parser.error(str(error))
+        print(f"{analyzed} métricas de razão analisadas -> {args.out}", file=sys.stderr)
+    elif args.command == "ingest":
+        if args.sketch_out and not args.approximate:
+            parser.error("--sketch-out requer --approximate.")
+        try:
+            if args.approximate:
+                sketches, counters = sketch_event_log(args.input, file_format=args.format,
+                                                      precision=args.precision, chunk_rows=args.chunk_size)
+                if args.sketch_out:
+                    write_sketches(sketches, args.sketch_out)
+                summary = summarize_sketches(sketches, **counters)
+            else:
+                summary = ingest_event_log(args.input, file_format=args.format,
+                                           drop_multi_arm_users=not args.keep_multi_arm_users,
+                                           chunk_rows=args.chunk_size)
+        except (ValueError, FileNotFoundError) as error:
+            parser.error(str(error))
+        _write_counts(summary, args.out)
+        if args.daily_out and summary["daily"] is not None:
+            summary["daily"].to_csv(args.daily_out, index=False)
+        if summary["counting"] == "sketch":
+            print(f"Contagens aproximadas (HyperLogLog): erro relativo de ±{summary['relative_error']:.2%}.",
+                  file=sys.stderr)
+            print(
+                f"{summary['events']} eventos lidos; {summary['events_without_user_id']} sem user_id; "
+                f"{summary['conversions_without_exposure']} conversões sem exposição. Usuários em mais de um "
+                "braço e conversões antes da exposição não são verificados na contagem aproximada.",
+                file=sys.stderr,
+            )
+        else:
+            print(
+                f"{summary['events']} eventos lidos; {summary['events_without_user_id']} sem user_id; "
+                f"{summary['users_in_multiple_arms']} usuários em mais de um braço; "
+                f"{summary['conversions_without_exposure']} conversões sem exposição e "
+                f"{summary['conversions_before_exposure']} antes da exposição.",
+                file=sys.stderr,
+            )
+    elif args.command == "merge-sketches":
+        try:
+            summary = summarize_sketches(read_sketches(args.inputs))
+        except (ValueError, FileNotFoundError) as error:
+            parser.error(str(error))
+        _write_counts(summary, args.out)
+        if args.daily_out and summary["daily"] is not None:
+            summary["daily"].to_csv(args.daily_out, index=False)
+        print(f"{len(args.inputs)} partições combinadas; erro relativo de ±{summary['relative_error']:.2%}.",
+              file=sys.stderr)
+    elif args.command == "simulate":
+        started = time.perf_counter()
+        try:
+            summary = simulate_experiments(
+                args.simulations, args.control_rate, true_uplift=args.uplift,
+                daily_visitors=args.daily_visitors, days=args.days, looks=args.looks,
+                tail_numbers=args.tails, confidence_level=args.confidence, estimated_uplift=args.mde,
+                seed=args.seed, chunk_size=args.chunk_size, workers=args.workers,
+            )
+        except ValueError as error:
+            parser.error(str(error))
+        json.dump(summary, sys.stdout, indent=2)
+        print(file=sys.stdout)
+        print(f"{args.simulations:,} testes simulados em {time.perf_counter() - started:.1f} s.", file=sys.stderr)
+    elif args.command == "serve":
+        import asyncio
+        from api.server import serve
+        asyncio.run(serve(args.host, args.port))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+import pandas as pd
+import streamlit as st
+from typing import Any, Dict
+from domain.entities.ab_tester import ABTester
+from domain.entities.multi_arm_variation import MultiArmVariation
+from domain.use_cases.multi_arm_validator import MultiArmStatisticalValidator
+
+CORRECTION_NAMES = {
+    "holm": "Holm",
+    "bonferroni": "Bonferroni",
+    "dunnett": "Dunnett",
+    "none": "sem correção",
+}
+
+
+class MultiArmResultsComponent:
+    """
+    Relatório de um teste A/B/n: uma tabela com todos os braços no lugar das
+    duas colunas fixas (Controle e Variação) do teste A/B.
+    """
+    def __init__(self, tester: ABTester, variation: MultiArmVariation, correction: str = "holm",
+                 all_pairs: bool = False, results: Dict[str, Any] | None = None):
+        """
+        Args:
+            results: Resultados já calculados. Se omitido, o componente executa o
+                MultiArmStatisticalValidator.
+        """
+        self.tester = tester
+        self.variation = variation
+        if results is None:
+            try:
+                validator = MultiArmStatisticalValidator(variation, correction=correction, all_pairs=all_pairs)
+                results = validator.get_statistical_results()
+            except ValueError as error:
+                st.error(str(error))
+                results = {}
+        self.results = results
+
+    def _display_main_result(self):
+        winners = [
+            comparison for comparison in self.results["comparisons"]
+            if comparison["is_significant"] and comparison["baseline"] == self.variation.control_name
+            and comparison["difference"] > 0
+        ]
+        correction = CORRECTION_NAMES.get(self.results["correction"], self.results["correction"])
+        with st.container(key="result_card"):
+            if winners:
+                best = max(winners, key=lambda comparison: comparison["difference"])
+                st.success(f"### 🎉 A variação **{best['arm']}** supera o controle!")
+                st.write(
+                    f"{len(winners)} variação(ões) apresentaram desempenho superior ao controle "
+                    f"({self.variation.control_name}) após a correção de múltiplas comparações ({correction})."
+                )
+            else:
+                st.warning("### 😵 Resultado Inconclusivo")
+                st.write(
+                    f"Nenhuma variação superou o controle com significância estatística após a correção "
+                    f"de múltiplas comparações ({correction})."
+                )
+
+    def _display_arms_table(self):
+        with st.container(key="confidence_intervals"):
+            st.subheader("🧪 Braços do Teste")
+            arms = pd.DataFrame(self.results["arms"])
+            arms["Intervalo de Confiança"] = [
+                f"{lower:.2%} — {upper:.2%}" for lower, upper in zip(arms["lower_bound"], arms["upper_bound"])
+            ]
+            arms["conversion_rate"] = arms["conversion_rate"].map(lambda x: f"{x:.2%}")
+            bayesian = self.results["bayesian_results"]
+            arms["Prob. de Ser o Melhor"] = [f"{x:.2%}" for x in bayesian["probability_best"]]
+            arms["Perda Esperada"] = [f"{x:.4%}" for x in bayesian["expected_loss"]]
+            st.dataframe(
+                arms[["arm", "visitors", "conversions", "conversion_rate", "Intervalo de Confiança",
+                      "Prob. de Ser o Melhor", "Perda Esperada"]].rename(columns={
+                    "arm": "Braço",
+                    "visitors": "Visitantes",
+                    "conversions": "Conversões",
+                    "conversion_rate": "Taxa de Conversão",
+                }),
+                hide_index=True,
+                use_container_width=True,
+            )
+
+    def _display_comparisons_table(self):
+        with st.container(key="test_validity"):
+            st.subheader("⚖️ Comparações")
+            st.markdown(
+                "Cada linha compara um braço com a sua base. O **p-valor ajustado** já considera que "
+                "várias comparações foram feitas ao mesmo tempo e é ele que decide a significância."
+            )
+            comparisons = pd.DataFrame(self.results["comparisons"])
+            table = pd.DataFrame({
+                "Base": comparisons["baseline"],
+                "Braço": comparisons["arm"],
+                "Uplift": comparisons["conversion_rate_uplift"].map(lambda x: f"{x:.2%}"),
+                "Z-Score": comparisons["z_score"].map(lambda x: f"{x:.4f}"),
+                "P-Valor": comparisons["p_value"].map(lambda x: f"{x:.4f}"),
+                "P-Valor Ajustado": comparisons["adjusted_p_value"].map(lambda x: f"{x:.4f}"),
+                "Significante": comparisons["is_significant"].map(lambda x: "Sim" if x else "Não"),
+            })
+            st.dataframe(table, hide_index=True, use_container_width=True)
+
+    def _display_srm(self):
+        srm_results = self.results["srm_results"]
+        st.subheader("SRM (Sample Ratio Mismatch)")
+        if not srm_results["has_srm"]:
+            st.success(f"**NÃO HÁ SRM.** (P-valor do SRM: {srm_results['srm_p_value']:.3f})")
+        else:
+            st.error(f"**ALERTA DE SRM!** (P-valor do SRM: {srm_results['srm_p_value']:.3f})")
+            st.write("A divisão de tráfego entre os braços difere da divisão planejada. Verifique sua ferramenta de A/B testing.")
+
+    def render(self):
+        if not self.results:
+            st.error("Não foi possível gerar o relatório de resultados. Verifique os dados de entrada.")
+            return
+        st.title("📊 Relatório de Resultados (A/B/n)")
+        self._display_main_result()
+        st.divider()
+        self._display_arms_table()
+        self._display_comparisons_table()
+        self._display_srm()
@@ -0,0 +1,110 @@
+import time
+import altair as alt
+import numpy as np
+import pandas as pd
+import streamlit as st
+from domain.use_cases.planning_surface import (
+    BASELINE_RANGE,
+    MDE_RANGE,
+    POWER_RANGE,
+    PlanningSurface,
+    get_planning_surface,
+)
+
+HEATMAP_POINTS = 40
+
+
+class PlanningExplorerComponent:
+    """
+    Explorador de planejamento: mostra usuários e dias necessários para qualquer
+    combinação de taxa base, MDE e poder, consultando a superfície pré-computada
+    (sem resolver o tamanho de amostra a cada interação).
+    """
+    def _initialize_state(self):
+        if "planning_baseline" not in st.session_state:
+            visitors = st.session_state.get("var_control_visitors", 10000)
+            conversions = st.session_state.get("var_control_conversions", 500)
+            baseline = 100 * conversions / visitors if visitors else 5.0
+            st.session_state.planning_baseline = float(np.clip(baseline, 100 * BASELINE_RANGE[0], 100 * BASELINE_RANGE[1]))
+        if "planning_mde" not in st.session_state:
+            mde = st.session_state.get("var_estimated_uplift", 10.0)
+            st.session_state.planning_mde = float(np.clip(mde, 100 * MDE_RANGE[0], 100 * MDE_RANGE[1]))
+        if "planning_power" not in st.session_state:
+            st.session_state.planning_power = 80
+        if "planning_daily_visitors" not in st.session_state:
+            st.session_state.planning_daily_visitors = 1000
+
+    def render(self):
+        with st.expander("🧭 Explorador de Planejamento"):
+            self._initialize_state()
+            confidence = st.session_state.get("ab_tester_confidence", 95.0)
+            tails = st.session_state.get("var_tail_numbers", 2)
+            surface = get_planning_surface(alpha=1 - confidence / 100, tails=tails)
+
+            st.markdown(
+                f"Usuários e dias necessários para **{confidence:.0f}% de confiança** em um teste "
+                f"**{'bicaudal' if tails == 2 else 'unicaudal'}** (configurações da barra lateral)."
+            )
+            col1, col2 = st.columns(2)
+            with col1:
+                st.slider("Taxa de Conversão Base (%)", min_value=100 * BASELINE_RANGE[0],
+                          max_value=100 * BASELINE_RANGE[1], step=0.1, key="planning_baseline")
+                st.slider("MDE (%)", min_value=100 * MDE_RANGE[0], max_value=100 * MDE_RANGE[1],
+                          step=0.5, key="planning_mde")
+            with col2:
+                st.slider("Poder (%)", min_value=int(100 * POWER_RANGE[0]), max_value=int(100 * POWER_RANGE[1]),
+                          step=1, key="planning_power")
+                st.number_input("Visitantes por Dia", min_value=1, step=100, key="planning_daily_visitors")
+
+            baseline = st.session_state.planning_baseline / 100
+            mde = st.session_state.planning_mde / 100
+            power = st.session_state.planning_power / 100
+            daily_visitors = st.session_state.planning_daily_visitors
+
+            start = time.perf_counter()
+            users = int(surface.lookup(baseline, mde, power))
+            lookup_ms = (time.perf_counter() - start) * 1000
+            days = int(np.ceil(users / daily_visitors))
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Usuários Necessários", f"{users:,}", help="Total dos dois grupos, com divisão 50/50.")
+            col2.metric("Dias Necessários", f"{days}")
+            col3.metric("Tempo da Consulta", f"{lookup_ms:.3f} ms")
+
+            self._display_heatmap(surface, baseline, mde, power, daily_visitors)
+            rows, columns, powers = surface.shape
+            st.caption(
+                f"Grade de {rows} x {columns} x {powers} pontos (taxa base x MDE x poder) construída em "
+                f"{surface.build_seconds * 1000:.0f} ms, ocupando {surface.nbytes / 1024 ** 2:.1f} MB em memória."
+            )
+
+    def _display_heatmap(self, surface: PlanningSurface, baseline: float, mde: float, power: float,
+                         daily_visitors: int):
+        heatmap = pd.DataFrame(surface.heatmap(power, points=HEATMAP_POINTS))
+        # Bordas de cada célula (eixos em escala log)
+        baseline_step = np.exp((np.log(BASELINE_RANGE[1]) - np.log(BASELINE_RANGE[0])) / (HEATMAP_POINTS - 1) / 2)
+        mde_step = np.exp((np.log(MDE_RANGE[1]) - np.log(MDE_RANGE[0])) / (HEATMAP_POINTS - 1) / 2)
+        heatmap["baseline_start"] = heatmap["baseline"] / baseline_step
+        heatmap["baseline_end"] = heatmap["baseline"] * baseline_step
+        heatmap["mde_start"] = heatmap["mde"] / mde_step
+        heatmap["mde_end"] = heatmap["mde"] * mde_step
+        heatmap["days"] = np.ceil(heatmap["users"] / daily_visitors)
+
+        cells = alt.Chart(heatmap).mark_rect().encode(
+            x=alt.X("baseline_start:Q", title="Taxa de Conversão Base", scale=alt.Scale(type="log"),
+                    axis=alt.Axis(format="%")),
+            x2="baseline_end:Q",
+            y=alt.Y("mde_start:Q", title="MDE", scale=alt.Scale(type="log"), axis=alt.Axis(format="%")),
+            y2="mde_end:Q",
+            color=alt.Color("days:Q", title="Dias", scale=alt.Scale(type="log", scheme="viridis", reverse=True)),
+            tooltip=[
+                alt.Tooltip("baseline:Q", title="Taxa Base", format=".2%"),
+                alt.Tooltip("mde:Q", title="MDE", format=".1%"),
+                alt.Tooltip("users:Q", title="Usuários", format=","),
+                alt.Tooltip("days:Q", title="Dias", format=","),
+            ],
+        )
+        selection = alt.Chart(pd.DataFrame({"baseline": [baseline], "mde": [mde]})).mark_point(
+            shape="cross", size=200, color="red", filled=True
+        ).encode(x="baseline:Q", y="mde:Q")
+        st.altair_chart(cells + selection, use_container_width=True)
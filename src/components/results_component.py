@@ -1,12 +1,43 @@
+import altair as alt
+import io
+import math
 import pandas as pd
 import streamlit as st
 import textwrap
+from typing import Any, Dict
 from domain.entities.ab_tester import ABTester
 from domain.entities.variation import Variation
+from domain.entities.continuous_variation import StreamingCovariance
 from domain.use_cases.ab_statistical_validator import ABStatisticalValidator 
+from domain.use_cases.cuped import CupedAnalysis
+from domain.use_cases.sequential_testing import SequentialMonitor
+from logic.continuous_metrics import accumulate_covariances
+from logic.daily_trajectory import DAILY_COLUMNS, calculate_trajectories, read_daily_table
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _calculate_daily_trajectories(data: str | bytes, tail_numbers: int, confidence_level: float,
+                                  estimated_uplift: float) -> pd.DataFrame:
+    """ Lê a tabela diária e calcula as trajetórias (memorizado pelo conteúdo). """
+    return calculate_trajectories(
+        read_daily_table(data),
+        tail_numbers=tail_numbers,
+        confidence_level=confidence_level,
+        estimated_uplift=estimated_uplift,
+    )
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _accumulate_cuped_file(data: bytes) -> Dict[Any, StreamingCovariance]:
+    """ Pares (covariável, métrica) por braço do CSV enviado (memorizado pelo conteúdo). """
+    return accumulate_covariances(io.BytesIO(data))
 
 class ResultsComponent:
-    def __init__(self, tester: ABTester, variation: Variation): # Changed signature
+    def __init__(self, tester: ABTester, variation: Variation, results: Dict[str, Any] | None = None):
+        """
+        Args:
+            results: Resultados já calculados (ex: vindos do cache). Se omitido,
+                o componente executa o ABStatisticalValidator.
+        """
         self.tester = tester
         self.variation = variation # Store variation entity
 
@@ -15,9 +46,10 @@ class ResultsComponent:
             self.results = {} # Initialize as empty dict to avoid errors
             return
 
-        # Perform statistical validation internally
-        validator = ABStatisticalValidator(variation=self.variation, tester=self.tester)
-        self.results = validator.get_statistical_results()
+        if results is None:
+            validator = ABStatisticalValidator(variation=self.variation, tester=self.tester)
+            results = validator.get_statistical_results()
+        self.results = results
 
         # Ensure conversion rates are in self.results for _display_confidence_intervals
         # if they are not already added by ABStatisticalValidator
@@ -32,7 +64,7 @@ class ResultsComponent:
   
         <style>
             /* Agora usamos seletores de classe simples e diretos! */
-            .st-key-result_card, .st-key-criteria_card, .st-key-confidence_intervals, .st-key-test_validity, .st-key-temporal_analysis, .st-key-full_results_table {
+            .st-key-result_card, .st-key-criteria_card, .st-key-confidence_intervals, .st-key-test_validity, .st-key-temporal_analysis, .st-key-sequential_analysis, .st-key-full_results_table {
                 background-color: #FFFFFF;
                 border: 1px solid #E9E9E9;
                 border-radius: 10px;
@@ -69,9 +101,22 @@ class ResultsComponent:
      
            
 
-    def _display_main_result(self):
+    def _update_sequential_monitor(self) -> Dict[str, Any]:
+        """
+        Atualiza o monitor sequencial deste teste, guardado na sessão, com as contagens atuais.
+        Cada consulta custa O(1): o histórico não é recalculado.
+        """
+        monitors = st.session_state.setdefault("sequential_monitors", {})
+        key = (self.tester.name, self.tester.start_date, self.variation.tail_numbers,
+               self.variation.confidence_level, self.variation.estimated_uplift)
+        monitor = monitors.setdefault(key, SequentialMonitor())
+        return monitor.observe(self.variation)
+
+    def _display_main_result(self, sequential_mode: bool = False):
         
         p_value = self.results.get("p_value", 1.0)
+        if sequential_mode:
+            p_value = self.results.get("sequential_monitor", {}).get("sequential_p_value", 1.0)
         
         # Nível de confiança desejado, ex: 95.0
         desired_confidence = self.tester.desired_confidence_level
@@ -132,6 +177,25 @@ class ResultsComponent:
             help="Representa a probabilidade de que a diferença observada seja real. Calculada como (1 - p-valor), oferece uma interpretação intuitiva da significância. Uma confiança de 97% corresponde a um p-valor de 0.03."
         )
 
+        bayesian = self.results.get("bayesian_results", {})
+        if bayesian:
+            col1, col2, col3 = st.columns(3)
+            col1.metric(
+                label="Probabilidade de B Superar A",
+                value=f"{bayesian['probability_b_beats_a']:.2%}",
+                help="Leitura bayesiana (priori Beta uniforme): a probabilidade de a taxa de conversão real da Variação (B) ser maior que a do Controle (A), dados os resultados observados."
+            )
+            col2.metric(
+                label="Perda Esperada (escolher B)",
+                value=f"{bayesian['expected_loss_b']:.4%}",
+                help="Quanto de taxa de conversão se espera perder, em média, ao escolher a Variação (B) caso ela seja a pior opção. Valores próximos de zero indicam uma escolha de baixo risco."
+            )
+            col3.metric(
+                label="Perda Esperada (manter A)",
+                value=f"{bayesian['expected_loss_a']:.4%}",
+                help="Quanto de taxa de conversão se espera perder, em média, ao manter o Controle (A) caso a Variação (B) seja melhor."
+            )
+
     def _display_confidence_intervals(self):
         """
         Exibe a análise de significância estatística com uma interface clara e conclusões diretas.
@@ -188,6 +252,37 @@ class ResultsComponent:
             st.caption("Nota Técnica: Um nível de confiança de 95% indica que, se repetíssemos o teste 100 vezes, em 95 delas a taxa de conversão real estaria dentro do intervalo.")
 
 
+    def _display_sequential_analysis(self):
+        """
+        Exibe o p-valor sempre válido e a sequência de confiança do monitoramento contínuo.
+        """
+        with st.container(key="sequential_analysis"):
+            st.subheader("🔁 Monitoramento Contínuo (Teste Sequencial)")
+            st.markdown("""
+            No modo sequencial o resultado pode ser consultado **a qualquer momento**, quantas vezes quiser, sem aumentar a chance de falso positivo. O p-valor nunca aumenta entre consultas e a faixa da diferença só se estreita.
+            """)
+            monitor = self.results.get("sequential_monitor", {})
+            lower = monitor.get("sequential_lower_bound", float("-inf"))
+            upper = monitor.get("sequential_upper_bound", float("inf"))
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric(
+                label="P-Valor Sempre Válido",
+                value=f"{monitor.get('sequential_p_value', 1.0):.4f}",
+                help="P-valor do mSPRT (mixture Sequential Probability Ratio Test). É o menor valor observado entre as consultas e continua válido mesmo com o teste sendo acompanhado diariamente."
+            )
+            col2.metric(
+                label="Diferença Absoluta (B - A)",
+                value=f"{lower:.2%} — {upper:.2%}",
+                help="Sequência de confiança da diferença entre as taxas de conversão. Se não contém 0%, a diferença é significante."
+            )
+            col3.metric(label="Consultas Registradas", value=f"{monitor.get('looks', 0)}")
+
+            if monitor.get("is_significant"):
+                st.success("✅ O teste sequencial já permite encerrar o experimento com segurança.")
+            else:
+                st.info("⏳ Continue coletando dados: a evidência ainda não é suficiente no modo sequencial.")
+
     def _display_temporal_and_planning_analysis(self):
         """
         Exibe a análise temporal com um visual aprimorado usando barras de progresso.
@@ -253,6 +348,232 @@ class ResultsComponent:
                         dias_faltantes_95 = max(0, dias_necessarios_95 - dias_corridos)
                         st.info(f"⏳ **Em andamento:** Faltam {dias_faltantes_95} dias para atingir a meta.")
 
+            self._display_group_sequential_planning()
+            self._display_cuped_planning(planning_results)
+
+    def _display_group_sequential_planning(self):
+        """
+        Planejamento com K análises interinas (get_group_sequential_plan): fronteiras de
+        cada análise, amostra máxima e esperada e a economia em relação ao desenho fixo.
+        """
+        with st.expander("📐 Planejamento Sequencial em Grupos"):
+            st.markdown(
+                "Planeje olhadas interinas igualmente espaçadas (ex: uma por semana). Em cada análise, "
+                "o teste pode parar se o z-score cruzar a fronteira; o gasto de alfa mantém o erro tipo I "
+                "no nível de confiança configurado."
+            )
+            col1, col2 = st.columns(2)
+            looks = col1.number_input("Número de análises (incluindo a final)", min_value=2, max_value=20,
+                                      value=5, step=1, key="gs_looks")
+            spending = col2.selectbox(
+                "Função de gasto de alfa",
+                options=["obrien_fleming", "pocock"],
+                format_func={"obrien_fleming": "O'Brien-Fleming", "pocock": "Pocock"}.get,
+                key="gs_spending",
+            )
+            try:
+                validator = ABStatisticalValidator(variation=self.variation, tester=self.tester)
+                plan = validator.get_group_sequential_plan(looks=int(looks), spending=spending)
+            except ValueError as error:
+                st.error(f"Não foi possível calcular o desenho sequencial: {error}")
+                return
+
+            for power in (80, 95):
+                st.markdown(f"##### Para {power}% de Poder Estatístico")
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Amostra Máxima", f"{plan[f'max_users_{power}_power']:,}")
+                col2.metric("Amostra Esperada (efeito = MDE)", f"{plan[f'expected_users_{power}_power']:,}")
+                col3.metric("Economia Esperada", f"{plan[f'expected_savings_{power}_power']:.1%}")
+                col4.metric("Dias Máximos", f"{plan[f'max_days_{power}_power']}")
+
+            st.table(pd.DataFrame({
+                "Análise": range(1, plan["looks"] + 1),
+                "Fronteira Z": [f"{bound:.3f}" for bound in plan["boundaries"]],
+                "P-Valor Nominal": [f"{p_value:.4f}" for p_value in plan["nominal_p_values"]],
+                "Usuários Acumulados (80% Poder)": [f"{users:,}" for users in plan["users_per_look_80_power"]],
+                "Usuários Acumulados (95% Poder)": [f"{users:,}" for users in plan["users_per_look_95_power"]],
+            }).set_index("Análise"))
+
+    def _display_cuped_planning(self, planning_results: Dict[str, Any]):
+        """
+        Análise CUPED a partir de um CSV com uma linha por usuário: efeito ajustado,
+        redução de variância e o corte nos dias necessários do planejamento.
+        """
+        with st.expander("🧪 Redução de Variância (CUPED)"):
+            st.markdown(
+                "Envie um CSV com uma linha por usuário e as colunas `arm`, `value` (a métrica do teste, "
+                "ex: 0/1 para conversão) e `covariate` (a mesma métrica no período anterior ao teste). "
+                "O primeiro braço do arquivo é o controle."
+            )
+            uploaded = st.file_uploader("Dados por usuário (CSV)", type=["csv"], key="cuped_upload")
+            if uploaded is None:
+                return
+            try:
+                covariances = _accumulate_cuped_file(uploaded.getvalue())
+                if len(covariances) != 2:
+                    raise ValueError(f"O arquivo deve ter exatamente dois braços; encontrados: {len(covariances)}.")
+                covariance_a, covariance_b = covariances.values()
+                cuped = CupedAnalysis(
+                    covariance_a, covariance_b, self.tester,
+                    tail_numbers=self.variation.tail_numbers,
+                    confidence_level=self.variation.confidence_level * 100,
+                    estimated_uplift=self.variation.estimated_uplift * 100,
+                ).get_results()
+            except (ValueError, KeyError, pd.errors.ParserError) as error:
+                st.error(f"Não foi possível ler os dados por usuário: {error}")
+                return
+
+            reduction = cuped["variance_reduction"]
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Redução de Variância", f"{reduction:.1%}")
+            col2.metric("Correlação Pré/Pós (ρ)", f"{cuped['correlation']:.2f}")
+            col3.metric("θ", f"{cuped['theta']:.4f}")
+
+            rows = {
+                "Efeito (B - A)": "effect",
+                "Erro Padrão": "standard_error",
+                "IC Inferior": "effect_lower_bound",
+                "IC Superior": "effect_upper_bound",
+                "P-Valor": "p_value",
+            }
+            table = pd.DataFrame({
+                label: {name: f"{cuped[path][key]:.4g}" for name, key in rows.items()}
+                for label, path in (("Sem CUPED", "unadjusted"), ("Com CUPED", "adjusted"))
+            })
+            for power in (80, 95):
+                table.loc[f"Usuários Necessários ({power}% Poder)"] = [
+                    f"{cuped[path]['planning_results'][f'required_users_{power}_power']:,}"
+                    for path in ("unadjusted", "adjusted")]
+                table.loc[f"Dias Necessários ({power}% Poder)"] = [
+                    f"{cuped[path]['planning_results'][f'required_days_{power}_power']}"
+                    for path in ("unadjusted", "adjusted")]
+            st.table(table)
+
+            # A amostra necessária cai na mesma proporção da variância
+            days_80 = planning_results.get('required_days_80_power', 0)
+            days_95 = planning_results.get('required_days_95_power', 0)
+            if days_80 > 0:
+                st.success(
+                    f"Com CUPED, o planejamento deste teste cairia de {days_80} para "
+                    f"{math.ceil(days_80 * (1 - reduction))} dias (80% de poder) e de {days_95} para "
+                    f"{math.ceil(days_95 * (1 - reduction))} dias (95% de poder)."
+                )
+
+
+    def _display_daily_trajectories(self):
+        """
+        Exibe a evolução diária das métricas acumuladas a partir de uma tabela com as
+        contagens de cada dia por braço (arquivo enviado ou texto colado).
+        """
+        with st.container(key="daily_trajectories"):
+            st.subheader("📈 Evolução Diária do Teste")
+            st.markdown(
+                "Envie ou cole uma tabela com uma linha por dia e braço, com as colunas "
+                f"`{'`, `'.join(DAILY_COLUMNS)}`. O primeiro braço da tabela é o controle."
+            )
+            tab_upload, tab_paste = st.tabs(["Enviar Arquivo", "Colar Tabela"])
+            with tab_upload:
+                uploaded = st.file_uploader("Contagens diárias (CSV)", type=["csv", "tsv", "txt"], key="daily_upload")
+            with tab_paste:
+                pasted = st.text_area("Contagens diárias", key="daily_paste", height=150,
+                                      placeholder="date,arm,visitors,conversions\n2024-01-01,A,1000,50\n2024-01-01,B,1000,55")
+
+            data = uploaded.getvalue() if uploaded is not None else (pasted or "").strip()
+            if not data:
+                return
+            try:
+                trajectory = _calculate_daily_trajectories(
+                    data,
+                    tail_numbers=self.variation.tail_numbers,
+                    confidence_level=self.variation.confidence_level * 100,
+                    estimated_uplift=self.variation.estimated_uplift * 100,
+                )
+            except (ValueError, KeyError, pd.errors.ParserError) as error:
+                st.error(f"Não foi possível ler a tabela diária: {error}")
+                return
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("##### Taxa de Conversão Acumulada")
+                st.altair_chart(self._rates_chart(trajectory), use_container_width=True)
+                st.markdown("##### P-Valor Acumulado")
+                st.altair_chart(self._p_values_chart(trajectory), use_container_width=True)
+            with col2:
+                st.markdown("##### Uplift Acumulado")
+                st.altair_chart(self._uplift_chart(trajectory), use_container_width=True)
+                st.markdown("##### SRM Diário")
+                st.altair_chart(self._daily_srm_chart(trajectory), use_container_width=True)
+
+            srm_days = int(trajectory["daily_has_srm"].sum())
+            if srm_days:
+                st.warning(f"⚠️ {srm_days} dia(s) com SRM (p-valor ≤ 0,01) na divisão diária de tráfego.")
+            st.caption(
+                "As curvas mostram o resultado acumulado até cada dia. Oscilações do p-valor no começo do teste "
+                "são esperadas; para decidir antes do fim planejado, use o p-valor sequencial."
+            )
+
+    @staticmethod
+    def _rates_chart(trajectory: pd.DataFrame) -> alt.Chart:
+        arms = pd.concat([
+            pd.DataFrame({
+                "date": trajectory["date"],
+                "arm": label,
+                "rate": trajectory[f"conversion_rate_{suffix}"],
+                "lower": trajectory[f"{prefix}_lower_bound"],
+                "upper": trajectory[f"{prefix}_upper_bound"],
+            })
+            for label, suffix, prefix in (("Controle", "a", "control"), ("Variação", "b", "variation"))
+        ])
+        base = alt.Chart(arms).encode(x=alt.X("date:T", title="Dia"),
+                                      color=alt.Color("arm:N", title="Grupo"))
+        band = base.mark_area(opacity=0.2).encode(y=alt.Y("lower:Q", title="Taxa", axis=alt.Axis(format="%")),
+                                                  y2="upper:Q")
+        line = base.mark_line(point=True).encode(
+            y="rate:Q",
+            tooltip=[alt.Tooltip("date:T", title="Dia"), alt.Tooltip("arm:N", title="Grupo"),
+                     alt.Tooltip("rate:Q", title="Taxa", format=".2%")],
+        )
+        return band + line
+
+    @staticmethod
+    def _uplift_chart(trajectory: pd.DataFrame) -> alt.Chart:
+        line = alt.Chart(trajectory).mark_line(point=True).encode(
+            x=alt.X("date:T", title="Dia"),
+            y=alt.Y("conversion_rate_uplift:Q", title="Uplift", axis=alt.Axis(format="%")),
+            tooltip=[alt.Tooltip("date:T", title="Dia"),
+                     alt.Tooltip("conversion_rate_uplift:Q", title="Uplift", format=".2%")],
+        )
+        zero = alt.Chart(pd.DataFrame({"y": [0.0]})).mark_rule(strokeDash=[4, 4], color="gray").encode(y="y:Q")
+        return line + zero
+
+    def _p_values_chart(self, trajectory: pd.DataFrame) -> alt.Chart:
+        p_values = trajectory.melt(
+            id_vars="date", value_vars=["p_value", "sequential_p_value"], var_name="kind", value_name="p"
+        ).replace({"kind": {"p_value": "Horizonte Fixo", "sequential_p_value": "Sequencial"}})
+        lines = alt.Chart(p_values).mark_line(point=True).encode(
+            x=alt.X("date:T", title="Dia"),
+            y=alt.Y("p:Q", title="P-Valor", scale=alt.Scale(domain=[0, 1])),
+            color=alt.Color("kind:N", title="Teste"),
+            tooltip=[alt.Tooltip("date:T", title="Dia"), alt.Tooltip("kind:N", title="Teste"),
+                     alt.Tooltip("p:Q", title="P-Valor", format=".4f")],
+        )
+        alpha = 1 - self.variation.confidence_level
+        threshold = alt.Chart(pd.DataFrame({"y": [alpha]})).mark_rule(strokeDash=[4, 4], color="red").encode(y="y:Q")
+        return lines + threshold
+
+    @staticmethod
+    def _daily_srm_chart(trajectory: pd.DataFrame) -> alt.Chart:
+        bars = alt.Chart(trajectory).mark_bar().encode(
+            x=alt.X("date:T", title="Dia"),
+            y=alt.Y("daily_srm_p_value:Q", title="P-Valor do SRM", scale=alt.Scale(domain=[0, 1])),
+            color=alt.condition("datum.daily_has_srm", alt.value("red"), alt.value("steelblue")),
+            tooltip=[alt.Tooltip("date:T", title="Dia"),
+                     alt.Tooltip("daily_variation_a_visitors:Q", title="Visitantes A", format=","),
+                     alt.Tooltip("daily_variation_b_visitors:Q", title="Visitantes B", format=","),
+                     alt.Tooltip("daily_srm_p_value:Q", title="P-Valor", format=".4f")],
+        )
+        threshold = alt.Chart(pd.DataFrame({"y": [0.01]})).mark_rule(strokeDash=[4, 4], color="red").encode(y="y:Q")
+        return bars + threshold
 
     def _display_test_validity(self):
         with st.container(key="test_validity"):
@@ -323,6 +644,9 @@ class ResultsComponent:
                 {'label': 'Uplift da Conversão', 'path': ('conversion_rate_uplift',), 'description': 'A melhoria percentual da Variação (B) em relação ao Controle (A).', 'formatter': lambda x: f"{x:.2%}"},
                 {'label': 'P-Valor', 'path': ('p_value',), 'description': 'Probabilidade do resultado ser aleatório. Um valor baixo (< 0.05) indica significância estatística.', 'formatter': lambda x: f"{x:.4f}"},
                 {'label': 'Confiança do Resultado', 'path': ('current_confidence',), 'description': 'Certeza de que a diferença observada é real (calculada como 1 - P-Valor).', 'formatter': lambda x: f"{x:.2%}"},
+                {'label': 'Probabilidade de B Superar A', 'path': ('bayesian_results', 'probability_b_beats_a'), 'description': 'Probabilidade bayesiana (priori Beta uniforme) de a Variação (B) ter a maior taxa de conversão real.', 'formatter': lambda x: f"{x:.2%}"},
+                {'label': 'Perda Esperada (escolher B)', 'path': ('bayesian_results', 'expected_loss_b'), 'description': 'Taxa de conversão que se espera perder ao escolher a Variação (B) caso ela seja pior.', 'formatter': lambda x: f"{x:.4%}"},
+                {'label': 'P-Valor Sequencial (mSPRT)', 'path': ('sequential_results', 'sequential_p_value'), 'description': 'P-valor sempre válido, que pode ser consultado a qualquer momento sem inflar falsos positivos.', 'formatter': lambda x: f"{x:.4f}"},
                 
                 # --- Validade do Teste ---
                 {'label': 'Poder do Teste Observado', 'path': ('observed_test_power',), 'description': 'Probabilidade de detectar um efeito real, caso ele exista. Idealmente > 80%.', 'formatter': lambda x: f"{x:.2%}"},
@@ -404,10 +728,20 @@ class ResultsComponent:
                 return
                 
             st.title("📊 Relatório de Resultados")
-            self._display_main_result()
+            sequential_mode = st.toggle(
+                "Modo sequencial (monitoramento contínuo)",
+                key="sequential_mode",
+                help="Use quando o resultado for consultado várias vezes durante o teste. Troca o teste de horizonte fixo por um teste sequencial sempre válido (mSPRT)."
+            )
+            if sequential_mode:
+                self.results["sequential_monitor"] = self._update_sequential_monitor()
+            self._display_main_result(sequential_mode)
+            if sequential_mode:
+                self._display_sequential_analysis()
             st.divider()
             self._display_confidence_intervals()
             self._display_test_validity()
             self._display_temporal_and_planning_analysis()
+            self._display_daily_trajectories()
             self._display_full_results_table()
             
\ No newline at end of file
@@ -0,0 +1,100 @@
+import io
+import pandas as pd
+import streamlit as st
+from datetime import date
+from typing import Any, Dict, Tuple
+from logic.segment_analysis import SEGMENT_COLUMNS, analyze_segments
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _analyze_uploaded_segments(data: bytes, tail_numbers: int, confidence_level: float, estimated_uplift: float,
+                               start_date: date, end_date: date | None, control_arm: Any,
+                               today: date) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """ Lê o CSV enviado e calcula todos os segmentos (memorizado pelo conteúdo do arquivo). """
+    frame = pd.read_csv(io.BytesIO(data))
+    return analyze_segments(
+        frame,
+        tail_numbers=tail_numbers,
+        confidence_level=confidence_level,
+        estimated_uplift=estimated_uplift,
+        start_date=start_date,
+        end_date=end_date,
+        control_arm=control_arm,
+        today=today,
+    )
+
+
+class SegmentAnalysisComponent:
+    """
+    Quebra do resultado por segmentos a partir de um CSV em formato longo
+    (segment, arm, visitors, conversions), sem digitar cada segmento na barra lateral.
+    """
+    def render(self):
+        with st.expander("🔎 Análise por Segmento"):
+            st.markdown(
+                "Envie um CSV com uma linha por segmento e braço, com as colunas "
+                f"`{'`, `'.join(SEGMENT_COLUMNS)}`. Os parâmetros do teste (caudas, confiança, MDE e datas) "
+                "são os da barra lateral."
+            )
+            uploaded = st.file_uploader("Tabela de segmentos (CSV)", type=["csv"], key="segment_upload")
+            if uploaded is None:
+                return
+
+            data = uploaded.getvalue()
+            try:
+                arms = pd.read_csv(io.BytesIO(data), usecols=["arm"])["arm"].drop_duplicates().tolist()
+                control_arm = st.selectbox("Braço de Controle", options=arms, key="segment_control_arm")
+                segments, heterogeneity = _analyze_uploaded_segments(
+                    data,
+                    tail_numbers=st.session_state.get("var_tail_numbers", 2),
+                    confidence_level=st.session_state.get("ab_tester_confidence", 95.0),
+                    estimated_uplift=st.session_state.get("var_estimated_uplift", 10.0),
+                    start_date=st.session_state.get("ab_tester_start_date", date.today()),
+                    end_date=st.session_state.get("ab_tester_end_date"),
+                    control_arm=control_arm,
+                    today=date.today(),
+                )
+            except ValueError as error:
+                st.error(str(error))
+                return
+
+            self._display_heterogeneity(heterogeneity)
+            self._display_segments_table(segments)
+
+    def _display_heterogeneity(self, heterogeneity: Dict[str, Any]):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Segmentos", f"{heterogeneity['segments']:,}")
+        col2.metric(
+            "Heterogeneidade (I²)",
+            f"{heterogeneity['i_squared']:.1%}",
+            help="Fração da variação do efeito entre segmentos que não é explicada pelo acaso (teste Q de Cochran)."
+        )
+        col3.metric("P-Valor da Heterogeneidade", f"{heterogeneity['heterogeneity_p_value']:.4f}")
+
+        if heterogeneity["heterogeneity_p_value"] < 0.05:
+            st.warning("⚠️ O efeito varia entre os segmentos: analise os segmentos separadamente antes de decidir.")
+        else:
+            st.info("O efeito é consistente entre os segmentos: as diferenças observadas são compatíveis com o acaso.")
+
+    def _display_segments_table(self, segments: pd.DataFrame):
+        table = pd.DataFrame({
+            "Segmento": segments["segment"],
+            "Visitantes (A)": segments["variation_a_visitors"],
+            "Visitantes (B)": segments["variation_b_visitors"],
+            "Taxa (A)": segments["conversion_rate_a"],
+            "Taxa (B)": segments["conversion_rate_b"],
+            "Uplift": segments["conversion_rate_uplift"],
+            "P-Valor": segments["p_value"],
+            "SRM": segments["has_srm"],
+        })
+        st.dataframe(
+            table,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "Taxa (A)": st.column_config.NumberColumn(format="percent"),
+                "Taxa (B)": st.column_config.NumberColumn(format="percent"),
+                "Uplift": st.column_config.NumberColumn(format="percent"),
+                "P-Valor": st.column_config.NumberColumn(format="%.4f"),
+            },
+        )
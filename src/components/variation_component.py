@@ -1,5 +1,26 @@
+import pandas as pd
 import streamlit as st
+from pathlib import Path
+from domain.entities.multi_arm_variation import MultiArmVariation
 from domain.entities.variation import Variation # Mantenha a importação da sua entidade
+from domain.use_cases.multi_arm_validator import CORRECTIONS
+from logic.event_ingestion import detect_event_format, ingest_event_log
+
+# Limite de braços aceitos no formulário A/B/n
+MAX_ARMS = 8
+
+CORRECTION_LABELS = {
+    "holm": "Holm",
+    "bonferroni": "Bonferroni",
+    "dunnett": "Dunnett",
+    "none": "Sem correção",
+}
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _ingest_uploaded_log(data: bytes, name: str, counting: str = "exact") -> dict:
+    """ Contagens por braço do log enviado (memorizado pelo conteúdo do arquivo). """
+    return ingest_event_log(data, file_format=detect_event_format(Path(name)), counting=counting)
+
 
 class VariationComponent:
     """
@@ -28,6 +49,69 @@ class VariationComponent:
         if 'var_estimated_uplift' not in st.session_state:
             st.session_state.var_estimated_uplift = 10.0
 
+        # Teste A/B/n: número de braços, tabela de braços e opções de comparação
+        if 'var_arm_count' not in st.session_state:
+            st.session_state.var_arm_count = 2
+        if 'var_arms_table' not in st.session_state:
+            st.session_state.var_arms_table = pd.DataFrame({
+                "Braço": ["Controle", "B", "C"],
+                "Visitantes": [10000, 10000, 10000],
+                "Conversões": [500, 550, 520],
+                "Peso (%)": [1.0, 1.0, 1.0],
+            })
+        if 'var_correction' not in st.session_state:
+            st.session_state.var_correction = "holm"
+        if 'var_all_pairs' not in st.session_state:
+            st.session_state.var_all_pairs = False
+
+    @property
+    def is_multi_arm(self) -> bool:
+        return st.session_state.var_arm_count > 2
+
+    @staticmethod
+    def _resize_arms_table(table: pd.DataFrame, arm_count: int) -> pd.DataFrame:
+        """ Ajusta a tabela de braços ao número de braços escolhido, preservando os valores. """
+        if len(table) < arm_count:
+            extra = pd.DataFrame({
+                "Braço": [chr(ord("A") + i) for i in range(len(table), arm_count)],
+                "Visitantes": 10000,
+                "Conversões": 500,
+                "Peso (%)": 1.0,
+            })
+            table = pd.concat([table, extra], ignore_index=True)
+        return table.iloc[:arm_count].reset_index(drop=True)
+
+    def _render_arms_table(self):
+        # Os dados de entrada do editor só mudam com o número de braços; as edições
+        # ficam no estado do próprio widget e o resultado editado em var_arms_values.
+        arm_count = st.session_state.var_arm_count
+        if len(st.session_state.var_arms_table) != arm_count:
+            latest = st.session_state.get('var_arms_values', st.session_state.var_arms_table)
+            st.session_state.var_arms_table = self._resize_arms_table(latest, arm_count)
+
+        st.caption("O primeiro braço da tabela é o controle. Os pesos indicam a divisão de tráfego planejada.")
+        st.session_state.var_arms_values = st.data_editor(
+            st.session_state.var_arms_table,
+            hide_index=True,
+            num_rows="fixed",
+            column_config={
+                "Visitantes": st.column_config.NumberColumn(min_value=1, step=1),
+                "Conversões": st.column_config.NumberColumn(min_value=0, step=1),
+                "Peso (%)": st.column_config.NumberColumn(min_value=0.01),
+            },
+            key="var_arms_editor",
+            on_change=self._clear_count_relative_error,
+        )
+        st.selectbox(
+            "Correção de Múltiplas Comparações",
+            options=list(CORRECTIONS),
+            format_func=CORRECTION_LABELS.get,
+            key='var_correction',
+            help="Controla a chance de falso positivo ao comparar várias variações. Holm é sempre válida e mais poderosa que Bonferroni; Dunnett aproveita a correlação das comparações com o mesmo controle."
+        )
+        st.checkbox("Comparar todos os pares", key='var_all_pairs',
+                    help="Além de cada variação contra o controle, compara as variações entre si.")
+
     def render_inputs(self):
         """
         Renderiza os inputs dentro de um st.expander. Usa st.tabs para os dados
@@ -36,16 +120,27 @@ class VariationComponent:
         
         with st.expander("Variações e Parâmetros", expanded=True):
             st.subheader(" ")
-            
-            tab_control, tab_variant = st.tabs(["Controle (H0)", "Variação (H1)"])
+            self._render_event_log_import()
+
+            st.number_input("Número de Braços (Controle + Variações)", min_value=2, max_value=MAX_ARMS,
+                            step=1, key='var_arm_count')
 
-            with tab_control:
-                st.number_input("Número de Visitantes", min_value=1, step=1, key='var_control_visitors')
-                st.number_input("Número de Conversões", min_value=0, step=1, key='var_control_conversions')
+            if self.is_multi_arm:
+                self._render_arms_table()
+            else:
+                tab_control, tab_variant = st.tabs(["Controle (H0)", "Variação (H1)"])
 
-            with tab_variant:
-                st.number_input("Número de Visitantes", min_value=1, step=1, key='var_variant_visitors')
-                st.number_input("Número de Conversões", min_value=0, step=1, key='var_variant_conversions')
+                with tab_control:
+                    st.number_input("Número de Visitantes", min_value=1, step=1, key='var_control_visitors',
+                                    on_change=self._clear_count_relative_error)
+                    st.number_input("Número de Conversões", min_value=0, step=1, key='var_control_conversions',
+                                    on_change=self._clear_count_relative_error)
+
+                with tab_variant:
+                    st.number_input("Número de Visitantes", min_value=1, step=1, key='var_variant_visitors',
+                                    on_change=self._clear_count_relative_error)
+                    st.number_input("Número de Conversões", min_value=0, step=1, key='var_variant_conversions',
+                                    on_change=self._clear_count_relative_error)
             
             st.divider()
             
@@ -70,6 +165,93 @@ class VariationComponent:
                 help="O menor aumento percentual que você considera relevante para o negócio."
             )
 
+    def _render_event_log_import(self):
+        """ Preenche visitantes e conversões a partir de um log bruto de eventos. """
+        with st.popover("Importar Log de Eventos", use_container_width=True):
+            st.caption("Log com as colunas `user_id`, `event` (exposure/conversion), `arm` e `timestamp`. "
+                       "Cada visitante conta uma vez e só conversões após a exposição são atribuídas.")
+            st.file_uploader("Log de eventos", type=["csv", "ndjson", "jsonl", "json", "parquet"],
+                             key="var_event_log")
+            st.checkbox("Contagem aproximada (HyperLogLog)", key="var_event_log_approximate",
+                        help="Memória constante para logs muito grandes. O erro relativo das contagens "
+                             "(±0,8%) é incorporado ao erro padrão; as conversões não são checadas contra "
+                             "o momento da exposição.")
+            st.button("Preencher com o Log", on_click=self._fill_from_event_log, use_container_width=True,
+                      disabled=st.session_state.get("var_event_log") is None)
+        if st.session_state.get("var_event_log_message"):
+            st.caption(st.session_state.var_event_log_message)
+
+    @staticmethod
+    def _fill_from_event_log():
+        """ Callback do botão: roda antes dos widgets, então pode alterar as suas chaves. """
+        uploaded = st.session_state.get("var_event_log")
+        if uploaded is None:
+            return
+        try:
+            counting = "sketch" if st.session_state.get("var_event_log_approximate") else "exact"
+            summary = _ingest_uploaded_log(uploaded.getvalue(), uploaded.name, counting)
+        except (ValueError, KeyError) as error:
+            st.session_state.var_event_log_message = f"⚠️ Não foi possível ler o log: {error}"
+            return
+
+        arms = summary["arms"]
+        if not 2 <= len(arms) <= MAX_ARMS:
+            st.session_state.var_event_log_message = f"⚠️ O log deve ter de 2 a {MAX_ARMS} braços; encontrados: {len(arms)}."
+            return
+        st.session_state.var_arm_count = len(arms)
+        if len(arms) == 2:
+            control, variant = arms
+            st.session_state.var_control_visitors = max(summary["visitors"][control], 1)
+            st.session_state.var_control_conversions = summary["conversions"][control]
+            st.session_state.var_variant_visitors = max(summary["visitors"][variant], 1)
+            st.session_state.var_variant_conversions = summary["conversions"][variant]
+        else:
+            st.session_state.var_arms_table = pd.DataFrame({
+                "Braço": arms,
+                "Visitantes": [summary["visitors"][arm] for arm in arms],
+                "Conversões": [summary["conversions"][arm] for arm in arms],
+                "Peso (%)": 1.0,
+            })
+            for key in ("var_arms_editor", "var_arms_values"):
+                st.session_state.pop(key, None)
+        # O erro das contagens aproximadas vale só para estas contagens importadas
+        st.session_state.var_count_relative_error = summary["relative_error"]
+        st.session_state.var_imported_counts = VariationComponent._current_counts()
+        if summary["daily"] is not None:
+            # Alimenta também os gráficos de evolução diária do relatório
+            st.session_state.daily_paste = summary["daily"].to_csv(index=False)
+        st.session_state.var_event_log_message = f"Log importado: {summary['events']:,} eventos, controle = {arms[0]}."
+        if summary["events_without_user_id"]:
+            st.session_state.var_event_log_message += (
+                f" {summary['events_without_user_id']:,} eventos sem user_id foram descartados.")
+        if summary["counting"] == "sketch":
+            st.session_state.var_event_log_message += (
+                f" Contagens aproximadas: erro relativo de ±{summary['relative_error']:.2%}. Usuários em mais "
+                "de um braço não são detectados e contam em cada braço em que aparecem.")
+        else:
+            st.session_state.var_event_log_message += (
+                f" {summary['users_in_multiple_arms']:,} usuários em mais de um braço foram descartados.")
+
+    @staticmethod
+    def _current_counts() -> tuple:
+        if st.session_state.var_arm_count > 2:
+            table = st.session_state.get('var_arms_values', st.session_state.var_arms_table)
+            return (tuple(table["Visitantes"].tolist()), tuple(table["Conversões"].tolist()))
+        return (st.session_state.var_control_visitors, st.session_state.var_control_conversions,
+                st.session_state.var_variant_visitors, st.session_state.var_variant_conversions)
+
+    @staticmethod
+    def _clear_count_relative_error():
+        """ Callback dos inputs de contagem: números digitados são exatos. """
+        st.session_state.var_count_relative_error = 0.0
+        st.session_state.pop("var_imported_counts", None)
+
+    def _count_relative_error(self) -> float:
+        """ Erro relativo do log importado, enquanto os inputs ainda têm as contagens importadas. """
+        if st.session_state.get("var_imported_counts") != self._current_counts():
+            return 0.0
+        return st.session_state.get("var_count_relative_error", 0.0)
+
     def get_variation_entity(self) -> Variation | None:
         """
         Cria a entidade a partir dos dados no st.session_state.
@@ -94,5 +276,38 @@ class VariationComponent:
             tail_numbers=st.session_state.var_tail_numbers,
             # Pega o nível de confiança do outro componente através do session_state
             confidence_level=st.session_state.get('ab_tester_confidence', 95.0),
-            estimated_uplift=st.session_state.var_estimated_uplift
-        )
\ No newline at end of file
+            estimated_uplift=st.session_state.var_estimated_uplift,
+            # Erro relativo das contagens quando vieram de sketches HyperLogLog
+            count_relative_error=self._count_relative_error(),
+        )
+
+    def get_multi_arm_entity(self) -> MultiArmVariation | None:
+        """
+        Cria a entidade A/B/n a partir da tabela de braços no st.session_state.
+        """
+        table = st.session_state.get('var_arms_values', st.session_state.var_arms_table)
+        if table[["Visitantes", "Conversões", "Peso (%)"]].isna().any().any():
+            st.error("Preencha visitantes, conversões e peso de todos os braços.")
+            return None
+        if (table["Conversões"] > table["Visitantes"]).any():
+            st.error("O número de conversões não pode ser maior que o de visitantes em nenhum braço.")
+            return None
+        if table["Braço"].duplicated().any():
+            st.error("Os nomes dos braços devem ser diferentes.")
+            return None
+
+        try:
+            return MultiArmVariation(
+                arm_names=table["Braço"].tolist(),
+                visitors=table["Visitantes"].astype(int).tolist(),
+                conversions=table["Conversões"].astype(int).tolist(),
+                tail_numbers=st.session_state.var_tail_numbers,
+                confidence_level=st.session_state.get('ab_tester_confidence', 95.0),
+                estimated_uplift=st.session_state.var_estimated_uplift,
+                expected_weights=table["Peso (%)"].astype(float).tolist(),
+                # Erro relativo das contagens quando vieram de sketches HyperLogLog
+                count_relative_error=self._count_relative_error(),
+            )
+        except ValueError as error:
+            st.error(str(error))
+            return None
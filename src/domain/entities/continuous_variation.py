@@ -0,0 +1,259 @@
+"""
+Variações de um teste A/B com métrica contínua (ex: receita por visitante, ticket médio).
+
+Cada braço é resumido pelas estatísticas suficientes da métrica: número de usuários,
+média e soma dos quadrados dos desvios (M2). Os valores brutos são acumulados em blocos
+pelo algoritmo de Welford/Chan, numericamente estável: a variância não sai da diferença
+entre a soma dos quadrados e o quadrado da soma, que perde precisão com milhões de
+valores grandes. StreamingCovariance estende a mesma ideia aos pares (covariável,
+métrica), com o co-momento cruzado usado pelo CUPED.
+"""
+import math
+from typing import Iterable
+import numpy as np
+
+
+class StreamingMoments:
+    """
+    Contagem, média e M2 de uma sequência de valores, atualizados em blocos e
+    combináveis entre shards (a combinação é exata e associativa).
+    """
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0) -> None:
+        self.count = int(count)
+        self.mean = float(mean)
+        self.m2 = float(m2)
+
+    @classmethod
+    def from_sums(cls, count: int, total: float, sum_squares: float) -> "StreamingMoments":
+        """ A partir de n, soma e soma dos quadrados (ex: vindos de um GROUP BY no banco). """
+        if count <= 0:
+            return cls()
+        mean = total / count
+        return cls(count, mean, max(sum_squares - total * mean, 0.0))
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> "StreamingMoments":
+        return cls().update(values)
+
+    def update(self, values: Iterable[float]) -> "StreamingMoments":
+        """
+        Incorpora um bloco de valores: média e M2 do bloco com NumPy e combinação de Chan
+        com o estado atual. Retorna o próprio acumulador.
+        """
+        chunk = np.asarray(values, dtype=np.float64).ravel()
+        if chunk.size == 0:
+            return self
+        mean = chunk.mean()
+        return self.merge(StreamingMoments(chunk.size, mean, np.square(chunk - mean).sum()))
+
+    def merge(self, other: "StreamingMoments") -> "StreamingMoments":
+        """
+        Combina os momentos de outro acumulador (Chan et al.). Retorna o próprio acumulador,
+        de modo que functools.reduce(merge, shards) funciona.
+        """
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.count = total
+        return self
+
+    @property
+    def variance(self) -> float:
+        """ Variância amostral (n - 1 no denominador). """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def total(self) -> float:
+        return self.count * self.mean
+
+    @property
+    def sum_squares(self) -> float:
+        return self.m2 + self.count * self.mean ** 2
+
+    def __repr__(self) -> str:
+        return f"StreamingMoments(count={self.count}, mean={self.mean!r}, m2={self.m2!r})"
+
+
+class StreamingCovariance:
+    """
+    Contagem, médias, M2 de cada variável e co-momento C = Σ (x - média_x)(y - média_y)
+    de pares (x, y), atualizados em blocos e combináveis entre shards como
+    StreamingMoments. No CUPED, x é a covariável pré-experimento e y a métrica.
+    """
+    def __init__(self, count: int = 0, mean_x: float = 0.0, mean_y: float = 0.0,
+                 m2_x: float = 0.0, m2_y: float = 0.0, comoment: float = 0.0) -> None:
+        self.count = int(count)
+        self.mean_x = float(mean_x)
+        self.mean_y = float(mean_y)
+        self.m2_x = float(m2_x)
+        self.m2_y = float(m2_y)
+        self.comoment = float(comoment)
+
+    @classmethod
+    def from_sums(cls, count: int, sum_x: float, sum_y: float, sum_squares_x: float,
+                  sum_squares_y: float, sum_products: float) -> "StreamingCovariance":
+        """ A partir de n, Σx, Σy, Σx², Σy² e Σxy (ex: vindos de um GROUP BY no banco). """
+        if count <= 0:
+            return cls()
+        mean_x = sum_x / count
+        mean_y = sum_y / count
+        return cls(count, mean_x, mean_y,
+                   max(sum_squares_x - sum_x * mean_x, 0.0),
+                   max(sum_squares_y - sum_y * mean_y, 0.0),
+                   sum_products - sum_x * mean_y)
+
+    @classmethod
+    def from_values(cls, x: Iterable[float], y: Iterable[float]) -> "StreamingCovariance":
+        return cls().update(x, y)
+
+    def update(self, x: Iterable[float], y: Iterable[float]) -> "StreamingCovariance":
+        """ Incorpora um bloco de pares (x, y) de mesmo tamanho. Retorna o próprio acumulador. """
+        chunk_x = np.asarray(x, dtype=np.float64).ravel()
+        chunk_y = np.asarray(y, dtype=np.float64).ravel()
+        if chunk_x.shape != chunk_y.shape:
+            raise ValueError("Covariável e métrica devem ter o mesmo número de valores.")
+        if chunk_x.size == 0:
+            return self
+        deviation_x = chunk_x - chunk_x.mean()
+        deviation_y = chunk_y - chunk_y.mean()
+        return self.merge(StreamingCovariance(
+            chunk_x.size, chunk_x.mean(), chunk_y.mean(),
+            deviation_x @ deviation_x, deviation_y @ deviation_y, deviation_x @ deviation_y,
+        ))
+
+    def merge(self, other: "StreamingCovariance") -> "StreamingCovariance":
+        """ Combina outro acumulador (Chan et al., com o termo cruzado). Retorna o próprio acumulador. """
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        weight = self.count * other.count / total
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+        self.mean_x += delta_x * other.count / total
+        self.mean_y += delta_y * other.count / total
+        self.m2_x += other.m2_x + delta_x ** 2 * weight
+        self.m2_y += other.m2_y + delta_y ** 2 * weight
+        self.comoment += other.comoment + delta_x * delta_y * weight
+        self.count = total
+        return self
+
+    @property
+    def moments_x(self) -> StreamingMoments:
+        return StreamingMoments(self.count, self.mean_x, self.m2_x)
+
+    @property
+    def moments_y(self) -> StreamingMoments:
+        return StreamingMoments(self.count, self.mean_y, self.m2_y)
+
+    @property
+    def covariance(self) -> float:
+        """ Covariância amostral (n - 1 no denominador). """
+        return self.comoment / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def correlation(self) -> float:
+        if self.m2_x <= 0 or self.m2_y <= 0:
+            return 0.0
+        return self.comoment / math.sqrt(self.m2_x * self.m2_y)
+
+    def __repr__(self) -> str:
+        return (f"StreamingCovariance(count={self.count}, mean_x={self.mean_x!r}, mean_y={self.mean_y!r}, "
+                f"m2_x={self.m2_x!r}, m2_y={self.m2_y!r}, comoment={self.comoment!r})")
+
+
+class ContinuousVariation:
+    """
+    Representa as variações de um teste A/B com métrica contínua.
+
+    Expõe a mesma interface de Variation (visitantes, "taxas" e erros padrão por braço),
+    com a média da métrica no lugar da taxa de conversão, para que o grafo de métricas
+    do validador seja reaproveitado.
+    """
+    def __init__(self,
+                 variation_a_visitors: int,
+                 variation_b_visitors: int,
+                 mean_a: float,
+                 mean_b: float,
+                 variance_a: float,
+                 variance_b: float,
+                 tail_numbers: int,
+                 confidence_level: float,
+                 estimated_uplift: float) -> None:
+        """
+        Args:
+            variation_a_visitors, variation_b_visitors: Usuários de cada braço.
+            mean_a, mean_b: Média da métrica por usuário.
+            variance_a, variance_b: Variância amostral da métrica por usuário.
+            confidence_level: Nível de confiança em porcentagem (ex: 95.0).
+            estimated_uplift: MDE relativo em porcentagem (ex: 10.0).
+        """
+        if variation_a_visitors < 0 or variation_b_visitors < 0 or variance_a < 0 or variance_b < 0:
+            raise ValueError("Usuários e variâncias não podem ser negativos.")
+        self.variation_a_visitors = int(variation_a_visitors)
+        self.variation_b_visitors = int(variation_b_visitors)
+        self.mean_a = float(mean_a)
+        self.mean_b = float(mean_b)
+        self.variance_a = float(variance_a)
+        self.variance_b = float(variance_b)
+        self.tail_numbers = tail_numbers
+        self.confidence_level = confidence_level / 100
+        self.estimated_uplift = estimated_uplift / 100
+
+        # Interface compartilhada com Variation
+        self.conversion_rate_a = self.mean_a
+        self.conversion_rate_b = self.mean_b
+        self.obs_power_on = self.mean_b > self.mean_a
+        self.default_error_a = self.calculate_default_error(self.variance_a, self.variation_a_visitors)
+        self.default_error_b = self.calculate_default_error(self.variance_b, self.variation_b_visitors)
+
+    @classmethod
+    def from_moments(cls, moments_a: StreamingMoments, moments_b: StreamingMoments,
+                     tail_numbers: int, confidence_level: float, estimated_uplift: float) -> "ContinuousVariation":
+        return cls(
+            variation_a_visitors=moments_a.count,
+            variation_b_visitors=moments_b.count,
+            mean_a=moments_a.mean,
+            mean_b=moments_b.mean,
+            variance_a=moments_a.variance,
+            variance_b=moments_b.variance,
+            tail_numbers=tail_numbers,
+            confidence_level=confidence_level,
+            estimated_uplift=estimated_uplift,
+        )
+
+    @classmethod
+    def from_sums(cls, variation_a_visitors: int, variation_b_visitors: int,
+                  sum_a: float, sum_b: float, sum_squares_a: float, sum_squares_b: float,
+                  tail_numbers: int, confidence_level: float, estimated_uplift: float) -> "ContinuousVariation":
+        """ A partir das estatísticas suficientes (n, soma, soma dos quadrados) de cada braço. """
+        return cls.from_moments(
+            StreamingMoments.from_sums(variation_a_visitors, sum_a, sum_squares_a),
+            StreamingMoments.from_sums(variation_b_visitors, sum_b, sum_squares_b),
+            tail_numbers, confidence_level, estimated_uplift,
+        )
+
+    @classmethod
+    def from_values(cls, values_a: Iterable[float], values_b: Iterable[float],
+                    tail_numbers: int, confidence_level: float, estimated_uplift: float) -> "ContinuousVariation":
+        """ A partir dos valores brutos por usuário de cada braço. """
+        return cls.from_moments(
+            StreamingMoments.from_values(values_a), StreamingMoments.from_values(values_b),
+            tail_numbers, confidence_level, estimated_uplift,
+        )
+
+    @property
+    def standard_deviation_a(self) -> float:
+        return math.sqrt(self.variance_a)
+
+    @property
+    def standard_deviation_b(self) -> float:
+        return math.sqrt(self.variance_b)
+
+    def calculate_default_error(self, variance: float, visitors: int) -> float:
+        """ Calcula o ERRO PADRÃO da média de um braço. """
+        if visitors == 0:
+            return 0.0
+        return math.sqrt(variance / visitors)
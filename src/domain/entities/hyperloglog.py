@@ -0,0 +1,161 @@
+"""
+Sketch HyperLogLog para contar usuários distintos com memória constante.
+
+Cada usuário entra como um hash de 64 bits: os `precision` bits mais altos escolhem um
+dos m = 2^precision registradores e o registrador guarda o maior número de zeros à
+esquerda (+1) visto no restante do hash. A cardinalidade sai do estimador melhorado de
+Ertl (2017) sobre o histograma dos registradores: a média harmônica de Flajolet et al.
+(2007) com as correções exatas para registradores vazios e saturados, sem a troca por
+contagem linear. O estimador original, com a troca em 2,5 m, tem viés de 1 a 2% entre
+cerca de 2,5 m e 3,5 m (35 mil a 55 mil usuários com precision = 14), um tamanho comum
+de braço; o melhorado não tem viés relevante em nenhuma faixa e dispensa as tabelas
+empíricas de viés do HyperLogLog++.
+
+O erro relativo (desvio padrão) é 1,04 / sqrt(m): 0,81% com precision = 14, em 16 KB.
+Sketches com a mesma precisão são combinados pelo máximo de cada registrador, de modo
+que partições por dia ou por shard podem ser unidas depois sem reler os logs.
+"""
+import math
+import struct
+import zlib
+from typing import Iterable
+import numpy as np
+
+DEFAULT_PRECISION = 14
+MIN_PRECISION = 4
+MAX_PRECISION = 18
+
+# Cabeçalho da serialização: assinatura, versão do formato e precisão
+_MAGIC = b"HLL"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<3sBB")
+
+
+def _leading_zeros(values: np.ndarray) -> np.ndarray:
+    """ Zeros à esquerda de cada uint64 (64 para zero), pelas metades de 32 bits. """
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    # Metades de 32 bits são exatas em float64, então floor(log2) não sofre arredondamento
+    with np.errstate(divide="ignore"):
+        high_bits = np.floor(np.log2(high))
+        low_bits = np.floor(np.log2(low))
+    zeros = np.where(high > 0, 31 - high_bits, np.where(low > 0, 63 - low_bits, 64))
+    return zeros.astype(np.int64)
+
+
+def _sigma(x: float) -> float:
+    """ Correção dos registradores vazios: x + Σ x^(2^k) 2^(k-1) (Ertl, 2017). """
+    if x == 1.0:
+        return math.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        previous = z
+        z += x * y
+        y += y
+        if z == previous:
+            return z
+
+
+def _tau(x: float) -> float:
+    """ Correção dos registradores saturados: (1 - x - Σ (1 - x^(2^-k))^2 2^-k) / 3 (Ertl, 2017). """
+    if x == 0.0 or x == 1.0:
+        return 0.0
+    y, z = 1.0, 1 - x
+    while True:
+        x = math.sqrt(x)
+        previous = z
+        y *= 0.5
+        z -= (1 - x) ** 2 * y
+        if z == previous:
+            return z / 3
+
+
+class HyperLogLog:
+    """
+    Sketch HyperLogLog de usuários distintos, combinável e serializável.
+    """
+    def __init__(self, precision: int = DEFAULT_PRECISION, registers: np.ndarray | None = None) -> None:
+        """
+        Args:
+            precision: Bits do hash usados para escolher o registrador (4 a 18).
+            registers: Registradores já preenchidos (ex: vindos de from_bytes).
+        """
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(f"A precisão do HyperLogLog deve estar entre {MIN_PRECISION} e {MAX_PRECISION}.")
+        self.precision = int(precision)
+        size = 1 << self.precision
+        if registers is None:
+            registers = np.zeros(size, dtype=np.uint8)
+        elif registers.shape != (size,):
+            raise ValueError("Número de registradores incompatível com a precisão.")
+        self.registers = np.asarray(registers, dtype=np.uint8)
+
+    @property
+    def size(self) -> int:
+        return self.registers.shape[0]
+
+    @property
+    def relative_error(self) -> float:
+        """ Erro relativo (desvio padrão) da estimativa: 1,04 / sqrt(m). """
+        return 1.04 / math.sqrt(self.size)
+
+    def add_hashes(self, hashes: Iterable[int]) -> "HyperLogLog":
+        """
+        Incorpora um bloco de hashes uint64 (um por evento; repetições não mudam o sketch).
+        Retorna o próprio sketch.
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64).ravel()
+        if hashes.size == 0:
+            return self
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        remainder = hashes << np.uint64(self.precision)
+        rank = np.minimum(_leading_zeros(remainder), 64 - self.precision) + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """ União com outro sketch de mesma precisão. Retorna o próprio sketch. """
+        if other.precision != self.precision:
+            raise ValueError("Só é possível combinar sketches HyperLogLog com a mesma precisão.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def copy(self) -> "HyperLogLog":
+        return HyperLogLog(self.precision, self.registers.copy())
+
+    def estimate(self) -> float:
+        """ Número estimado de usuários distintos. """
+        size = self.size
+        # Histograma dos registradores: valores de 0 (vazio) a q + 1 (saturado)
+        q = 64 - self.precision
+        histogram = np.bincount(self.registers, minlength=q + 2)
+        z = size * _tau(1 - histogram[q + 1] / size)
+        for rank in range(q, 0, -1):
+            z = 0.5 * (z + histogram[rank])
+        z += size * _sigma(histogram[0] / size)
+        return float(size ** 2 / (2 * math.log(2) * z))
+
+    def __len__(self) -> int:
+        return int(round(self.estimate()))
+
+    def to_bytes(self) -> bytes:
+        """ Serialização compacta: cabeçalho de 5 bytes e registradores comprimidos (zlib). """
+        return _HEADER.pack(_MAGIC, _FORMAT_VERSION, self.precision) + zlib.compress(self.registers.tobytes(), 6)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        try:
+            magic, version, precision = _HEADER.unpack_from(data)
+        except struct.error as error:
+            raise ValueError("Sketch HyperLogLog inválido.") from error
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Sketch HyperLogLog inválido ou de versão não suportada.")
+        try:
+            registers = np.frombuffer(zlib.decompress(data[_HEADER.size:]), dtype=np.uint8).copy()
+        except zlib.error as error:
+            raise ValueError("Sketch HyperLogLog corrompido.") from error
+        return cls(precision, registers)
+
+    def __repr__(self) -> str:
+        return f"HyperLogLog(precision={self.precision}, estimate={self.estimate():.0f})"
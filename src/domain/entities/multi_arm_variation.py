@@ -0,0 +1,98 @@
+from typing import Sequence
+import numpy as np
+from domain.entities.variation import Variation
+
+
+class MultiArmVariation:
+    """
+    Representa as variações de um teste A/B/n: um controle e N-1 variações.
+
+    As contagens ficam em arrays (um elemento por braço), de modo que taxas e erros
+    padrão de todos os braços são calculados de uma vez, com as mesmas fórmulas de Variation.
+    """
+    def __init__(self,
+                 arm_names: Sequence[str],
+                 visitors: Sequence[int],
+                 conversions: Sequence[int],
+                 tail_numbers: int,
+                 confidence_level: float,
+                 estimated_uplift: float,
+                 expected_weights: Sequence[float] | None = None,
+                 control_index: int = 0,
+                 count_relative_error: float = 0.0) -> None:
+        """
+        Args:
+            arm_names: Nome de cada braço (ex: ["Controle", "B", "C"]).
+            visitors, conversions: Contagens de cada braço, na mesma ordem dos nomes.
+            confidence_level: Nível de confiança em porcentagem (ex: 95.0).
+            estimated_uplift: MDE em porcentagem (ex: 10.0).
+            expected_weights: Divisão de tráfego planejada (ex: [50, 25, 25]).
+                Se omitida, a divisão é igual entre os braços.
+            control_index: Posição do controle em `arm_names`.
+            count_relative_error: Erro relativo das contagens aproximadas (ex: sketches
+                HyperLogLog), como em Variation. Zero para contagens exatas.
+        """
+        self.arm_names = [str(name) for name in arm_names]
+        self.visitors = np.asarray(visitors, dtype=np.int64)
+        self.conversions = np.asarray(conversions, dtype=np.int64)
+        arm_count = len(self.arm_names)
+        if arm_count < 2:
+            raise ValueError("O teste deve ter pelo menos dois braços.")
+        if self.visitors.shape != (arm_count,) or self.conversions.shape != (arm_count,):
+            raise ValueError("Visitantes e conversões devem ter um valor por braço.")
+        if not 0 <= control_index < arm_count:
+            raise ValueError("Índice do controle fora do intervalo de braços.")
+
+        weights = np.ones(arm_count) if expected_weights is None else np.asarray(expected_weights, dtype=np.float64)
+        if weights.shape != (arm_count,) or (weights <= 0).any():
+            raise ValueError("Os pesos esperados devem ser positivos, um por braço.")
+        if count_relative_error < 0:
+            raise ValueError("O erro relativo das contagens não pode ser negativo.")
+
+        self.expected_weights = weights / weights.sum()
+        self.control_index = control_index
+        self.count_relative_error = count_relative_error
+        self.tail_numbers = tail_numbers
+        self.confidence_level = confidence_level / 100
+        self.estimated_uplift = estimated_uplift / 100
+
+        safe_visitors = np.where(self.visitors != 0, self.visitors, 1)
+        self.conversion_rates = np.where(self.visitors != 0, self.conversions / safe_visitors, 0.0)
+        variance = self.conversion_rates * (1 - self.conversion_rates) / safe_visitors
+        # Mesmo termo de Variation para visitantes e conversões aproximados
+        variance += 2 * (count_relative_error * self.conversion_rates) ** 2
+        self.default_errors = np.where(self.visitors != 0, np.sqrt(variance), 0.0)
+
+    @classmethod
+    def from_variation(cls, variation: Variation, arm_names: Sequence[str] = ("Controle", "Variação")) -> "MultiArmVariation":
+        """ Converte uma Variation de dois braços (A = controle). """
+        return cls(
+            arm_names=arm_names,
+            visitors=[variation.variation_a_visitors, variation.variation_b_visitors],
+            conversions=[variation.conversions_a, variation.conversions_b],
+            tail_numbers=variation.tail_numbers,
+            confidence_level=variation.confidence_level * 100,
+            estimated_uplift=variation.estimated_uplift * 100,
+            count_relative_error=variation.count_relative_error,
+        )
+
+    def __len__(self) -> int:
+        return len(self.arm_names)
+
+    @property
+    def control_name(self) -> str:
+        return self.arm_names[self.control_index]
+
+    def to_variation(self, arm: int) -> Variation:
+        """ Variation de dois braços com o controle e o braço informado. """
+        control = self.control_index
+        return Variation(
+            variation_a_visitors=int(self.visitors[control]),
+            variation_b_visitors=int(self.visitors[arm]),
+            conversions_a=int(self.conversions[control]),
+            conversions_b=int(self.conversions[arm]),
+            tail_numbers=self.tail_numbers,
+            confidence_level=self.confidence_level * 100,
+            estimated_uplift=self.estimated_uplift * 100,
+            count_relative_error=self.count_relative_error,
+        )
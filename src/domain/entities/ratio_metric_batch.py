@@ -0,0 +1,175 @@
+"""
+Métricas de razão (ex: cliques por sessão, CTR por pageview) em formato colunar.
+
+Quando a unidade de randomização (o usuário) é diferente da unidade de análise (a
+sessão ou o pageview), a métrica é a razão R = ΣN / ΣD de duas somas por usuário, e os
+denominadores de um mesmo usuário não são independentes: tratar R como uma proporção
+binomial subestima a variância. Pelo método delta, R se comporta como a média da
+variável linearizada L = (N - R D) / média_D, com variância por usuário
+
+    σ²_L = (Var(N) - 2 R Cov(N, D) + R² Var(D)) / média_D²
+
+e erro padrão sqrt(σ²_L / n). Tudo sai de seis estatísticas suficientes por braço
+(n, ΣN, ΣD, ΣN², ΣD² e ΣND), que um GROUP BY no banco entrega sem exportar usuários.
+"""
+from functools import cached_property
+from typing import Any
+import numpy as np
+
+
+class RatioMetricBatch:
+    """
+    Lote de métricas de razão (uma linha por métrica de um experimento) com a mesma
+    interface de VariationBatch: a razão ocupa o lugar da taxa de conversão e o erro
+    padrão vem do método delta, para que o BatchStatisticalValidator seja reaproveitado.
+    """
+    COLUMNS = (
+        "variation_a_visitors",
+        "variation_b_visitors",
+        "numerator_a",
+        "numerator_b",
+        "denominator_a",
+        "denominator_b",
+        "numerator_squares_a",
+        "numerator_squares_b",
+        "denominator_squares_a",
+        "denominator_squares_b",
+        "cross_products_a",
+        "cross_products_b",
+        "tail_numbers",
+        "confidence_level",
+        "estimated_uplift",
+    )
+
+    def __init__(self,
+                 variation_a_visitors: Any,
+                 variation_b_visitors: Any,
+                 numerator_a: Any,
+                 numerator_b: Any,
+                 denominator_a: Any,
+                 denominator_b: Any,
+                 numerator_squares_a: Any,
+                 numerator_squares_b: Any,
+                 denominator_squares_a: Any,
+                 denominator_squares_b: Any,
+                 cross_products_a: Any,
+                 cross_products_b: Any,
+                 tail_numbers: Any,
+                 confidence_level: Any,
+                 estimated_uplift: Any) -> None:
+        """
+        Args:
+            variation_a_visitors, variation_b_visitors: Unidades de randomização (usuários) por braço.
+            numerator_*, denominator_*: Somas por braço do numerador e do denominador (ΣN, ΣD).
+            numerator_squares_*, denominator_squares_*: Somas dos quadrados por usuário (ΣN², ΣD²).
+            cross_products_*: Soma dos produtos por usuário (ΣND).
+            confidence_level: Nível de confiança em porcentagem (ex: 95.0).
+            estimated_uplift: MDE relativo em porcentagem (ex: 10.0).
+        """
+        self.variation_a_visitors = np.ascontiguousarray(variation_a_visitors, dtype=np.int64)
+        size = self.variation_a_visitors.shape[0]
+        self.variation_b_visitors = self._column(variation_b_visitors, np.int64, size)
+        self.numerator_a = self._column(numerator_a, np.float64, size)
+        self.numerator_b = self._column(numerator_b, np.float64, size)
+        self.denominator_a = self._column(denominator_a, np.float64, size)
+        self.denominator_b = self._column(denominator_b, np.float64, size)
+        self.numerator_squares_a = self._column(numerator_squares_a, np.float64, size)
+        self.numerator_squares_b = self._column(numerator_squares_b, np.float64, size)
+        self.denominator_squares_a = self._column(denominator_squares_a, np.float64, size)
+        self.denominator_squares_b = self._column(denominator_squares_b, np.float64, size)
+        self.cross_products_a = self._column(cross_products_a, np.float64, size)
+        self.cross_products_b = self._column(cross_products_b, np.float64, size)
+        self.tail_numbers = self._column(tail_numbers, np.int64, size)
+        self.confidence_level = self._column(confidence_level, np.float64, size) / 100
+        self.estimated_uplift = self._column(estimated_uplift, np.float64, size) / 100
+        if (self.variation_a_visitors < 0).any() or (self.variation_b_visitors < 0).any():
+            raise ValueError("O número de unidades não pode ser negativo.")
+
+    @staticmethod
+    def _column(values: Any, dtype: type, size: int) -> np.ndarray:
+        array = np.asarray(values, dtype=dtype)
+        if array.ndim == 0:
+            return np.full(size, array, dtype=dtype)
+        if array.shape != (size,):
+            raise ValueError("Todas as colunas do lote devem ter o mesmo tamanho.")
+        return np.ascontiguousarray(array)
+
+    @classmethod
+    def from_columns(cls, columns: dict) -> "RatioMetricBatch":
+        """ Cria o lote a partir de colunas já normalizadas (sem reescalar as porcentagens). """
+        batch = cls.__new__(cls)
+        for name in cls.COLUMNS:
+            setattr(batch, name, columns[name])
+        return batch
+
+    def __len__(self) -> int:
+        return self.variation_a_visitors.shape[0]
+
+    def __getitem__(self, index: Any) -> "RatioMetricBatch":
+        """ Seleciona linhas por fatia, máscara booleana ou array de índices. """
+        if isinstance(index, (int, np.integer)):
+            index = slice(index, index + 1 if index != -1 else None)
+        return self.from_columns({name: getattr(self, name)[index] for name in self.COLUMNS})
+
+    # --- Colunas derivadas (calculadas sob demanda e memorizadas) ---
+
+    @cached_property
+    def conversion_rate_a(self) -> np.ndarray:
+        """ Razão do controle, ΣN / ΣD (o nome mantém a interface de VariationBatch). """
+        return self._ratio(self.numerator_a, self.denominator_a)
+
+    @cached_property
+    def conversion_rate_b(self) -> np.ndarray:
+        return self._ratio(self.numerator_b, self.denominator_b)
+
+    @cached_property
+    def obs_power_on(self) -> np.ndarray:
+        return self.conversion_rate_b > self.conversion_rate_a
+
+    @cached_property
+    def unit_variance_a(self) -> np.ndarray:
+        """ Variância por usuário da métrica linearizada no controle (σ²_L). """
+        return self.calculate_unit_variance(
+            self.variation_a_visitors, self.numerator_a, self.denominator_a, self.numerator_squares_a,
+            self.denominator_squares_a, self.cross_products_a, self.conversion_rate_a)
+
+    @cached_property
+    def unit_variance_b(self) -> np.ndarray:
+        return self.calculate_unit_variance(
+            self.variation_b_visitors, self.numerator_b, self.denominator_b, self.numerator_squares_b,
+            self.denominator_squares_b, self.cross_products_b, self.conversion_rate_b)
+
+    @cached_property
+    def default_error_a(self) -> np.ndarray:
+        return self._standard_error(self.unit_variance_a, self.variation_a_visitors)
+
+    @cached_property
+    def default_error_b(self) -> np.ndarray:
+        return self._standard_error(self.unit_variance_b, self.variation_b_visitors)
+
+    @staticmethod
+    def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        safe_denominator = np.where(denominator != 0, denominator, 1.0)
+        return np.where(denominator != 0, numerator / safe_denominator, 0.0)
+
+    @staticmethod
+    def _standard_error(unit_variance: np.ndarray, units: np.ndarray) -> np.ndarray:
+        safe_units = np.where(units != 0, units, 1)
+        return np.where(units != 0, np.sqrt(unit_variance / safe_units), 0.0)
+
+    @staticmethod
+    def calculate_unit_variance(units: np.ndarray, numerator: np.ndarray, denominator: np.ndarray,
+                                numerator_squares: np.ndarray, denominator_squares: np.ndarray,
+                                cross_products: np.ndarray, ratio: np.ndarray) -> np.ndarray:
+        """
+        σ²_L = (Var(N) - 2 R Cov(N, D) + R² Var(D)) / média_D², com variâncias e
+        covariância amostrais (n - 1) a partir das somas. Zero com menos de 2 unidades.
+        """
+        valid = (units > 1) & (denominator != 0)
+        safe_units = np.where(valid, units, 2).astype(np.float64)
+        variance_numerator = (numerator_squares - numerator ** 2 / safe_units) / (safe_units - 1)
+        variance_denominator = (denominator_squares - denominator ** 2 / safe_units) / (safe_units - 1)
+        covariance = (cross_products - numerator * denominator / safe_units) / (safe_units - 1)
+        mean_denominator = np.where(valid, denominator, 1.0) / safe_units
+        variance = (variance_numerator - 2 * ratio * covariance + ratio ** 2 * variance_denominator) / mean_denominator ** 2
+        return np.where(valid, np.maximum(variance, 0.0), 0.0)
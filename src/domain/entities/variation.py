@@ -9,8 +9,17 @@ class Variation:
                  conversions_b: int,
                  tail_numbers: int,
                  confidence_level: float,
-                 estimated_uplift: float) -> None:
-
+                 estimated_uplift: float,
+                 count_relative_error: float = 0.0) -> None:
+        """
+        Args:
+            count_relative_error: Erro relativo (desvio padrão) de visitantes e conversões
+                quando as contagens são aproximadas (ex: sketches HyperLogLog). Zero para
+                contagens exatas.
+        """
+        if count_relative_error < 0:
+            raise ValueError("O erro relativo das contagens não pode ser negativo.")
+        self.count_relative_error = count_relative_error
         self.variation_a_visitors = variation_a_visitors
         self.variation_b_visitors = variation_b_visitors
         self.conversions_a = conversions_a
@@ -31,5 +40,9 @@ class Variation:
             return 0.0
         # A fórmula da variância de uma proporção
         variance = (conversion_rate * (1 - conversion_rate)) / visitors
+        # Contagens aproximadas: visitantes e conversões com erro relativo ε independente
+        # somam (ε p)² cada à variância da taxa
+        if self.count_relative_error:
+            variance += 2 * (self.count_relative_error * conversion_rate) ** 2
         # CORREÇÃO: Usa math.sqrt para calcular a raiz quadrada (Erro Padrão)
         return math.sqrt(variance)
\ No newline at end of file
@@ -0,0 +1,162 @@
+from functools import cached_property
+from typing import Any, Iterable, Sequence
+import numpy as np
+from domain.entities.variation import Variation
+
+
+class VariationBatch:
+    """
+    Representa um conjunto de variações de testes A/B em formato colunar (struct-of-arrays).
+
+    Guarda apenas as contagens e os parâmetros em arrays contíguos int64/float64.
+    As colunas derivadas (taxas, erros padrão e direção do poder) só são calculadas
+    no primeiro acesso, ao contrário de Variation, que as calcula no construtor.
+    """
+    COLUMNS = (
+        "variation_a_visitors",
+        "variation_b_visitors",
+        "conversions_a",
+        "conversions_b",
+        "tail_numbers",
+        "confidence_level",
+        "estimated_uplift",
+        "count_relative_error",
+    )
+
+    def __init__(self,
+                 variation_a_visitors: Any,
+                 variation_b_visitors: Any,
+                 conversions_a: Any,
+                 conversions_b: Any,
+                 tail_numbers: Any,
+                 confidence_level: Any,
+                 estimated_uplift: Any,
+                 count_relative_error: Any = 0.0) -> None:
+        """
+        Recebe os mesmos campos de Variation, mas como arrays (uma linha por teste).
+        Parâmetros escalares são replicados para todas as linhas.
+
+        Args:
+            confidence_level: Nível de confiança em porcentagem (ex: 95.0).
+            estimated_uplift: MDE em porcentagem (ex: 10.0).
+            count_relative_error: Erro relativo das contagens aproximadas (0 = exatas).
+        """
+        self.variation_a_visitors = np.ascontiguousarray(variation_a_visitors, dtype=np.int64)
+        size = self.variation_a_visitors.shape[0]
+        self.variation_b_visitors = self._column(variation_b_visitors, np.int64, size)
+        self.conversions_a = self._column(conversions_a, np.int64, size)
+        self.conversions_b = self._column(conversions_b, np.int64, size)
+        self.tail_numbers = self._column(tail_numbers, np.int64, size)
+        self.confidence_level = self._column(confidence_level, np.float64, size) / 100
+        self.estimated_uplift = self._column(estimated_uplift, np.float64, size) / 100
+        self.count_relative_error = self._column(count_relative_error, np.float64, size)
+        if (self.count_relative_error < 0).any():
+            raise ValueError("O erro relativo das contagens não pode ser negativo.")
+
+    @staticmethod
+    def _column(values: Any, dtype: type, size: int) -> np.ndarray:
+        array = np.asarray(values, dtype=dtype)
+        if array.ndim == 0:
+            return np.full(size, array, dtype=dtype)
+        if array.shape != (size,):
+            raise ValueError("Todas as colunas do lote devem ter o mesmo tamanho.")
+        return np.ascontiguousarray(array)
+
+    @classmethod
+    def from_columns(cls, columns: dict) -> "VariationBatch":
+        """ Cria o lote a partir de colunas já normalizadas (sem reescalar as porcentagens). """
+        batch = cls.__new__(cls)
+        for name in cls.COLUMNS:
+            setattr(batch, name, columns[name])
+        return batch
+
+    @classmethod
+    def from_variations(cls, variations: Iterable[Variation]) -> "VariationBatch":
+        """ Converte uma sequência de entidades Variation em um lote colunar. """
+        variations = list(variations)
+        return cls.from_columns({
+            name: np.array([getattr(v, name) for v in variations],
+                           dtype=np.float64 if name in ("confidence_level", "estimated_uplift", "count_relative_error")
+                           else np.int64)
+            for name in cls.COLUMNS
+        })
+
+    @classmethod
+    def concat(cls, batches: Sequence["VariationBatch"]) -> "VariationBatch":
+        """ Concatena vários lotes em um único lote, preservando a ordem das linhas. """
+        return cls.from_columns({
+            name: np.concatenate([getattr(batch, name) for batch in batches])
+            for name in cls.COLUMNS
+        })
+
+    def __len__(self) -> int:
+        return self.variation_a_visitors.shape[0]
+
+    def __getitem__(self, index: Any) -> "VariationBatch":
+        """
+        Seleciona linhas por fatia, máscara booleana ou array de índices.
+        Fatias devolvem views dos arrays originais, sem cópia.
+        """
+        if isinstance(index, (int, np.integer)):
+            index = slice(index, index + 1 if index != -1 else None)
+        return self.from_columns({name: getattr(self, name)[index] for name in self.COLUMNS})
+
+    def filter(self, mask: Any) -> "VariationBatch":
+        """ Mantém apenas as linhas em que a máscara booleana é verdadeira. """
+        return self[np.asarray(mask, dtype=bool)]
+
+    def to_variation(self, row: int) -> Variation:
+        """ Reconstrói a entidade Variation de uma linha do lote. """
+        return Variation(
+            variation_a_visitors=int(self.variation_a_visitors[row]),
+            variation_b_visitors=int(self.variation_b_visitors[row]),
+            conversions_a=int(self.conversions_a[row]),
+            conversions_b=int(self.conversions_b[row]),
+            tail_numbers=int(self.tail_numbers[row]),
+            confidence_level=float(self.confidence_level[row] * 100),
+            estimated_uplift=float(self.estimated_uplift[row] * 100),
+            count_relative_error=float(self.count_relative_error[row]),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """ Memória ocupada pelas colunas armazenadas e pelas derivadas já calculadas. """
+        return sum(value.nbytes for value in vars(self).values() if isinstance(value, np.ndarray))
+
+    # --- Colunas derivadas (calculadas sob demanda e memorizadas) ---
+
+    @cached_property
+    def conversion_rate_a(self) -> np.ndarray:
+        return self._rate(self.conversions_a, self.variation_a_visitors)
+
+    @cached_property
+    def conversion_rate_b(self) -> np.ndarray:
+        return self._rate(self.conversions_b, self.variation_b_visitors)
+
+    @cached_property
+    def obs_power_on(self) -> np.ndarray:
+        return self.conversion_rate_b > self.conversion_rate_a
+
+    @cached_property
+    def default_error_a(self) -> np.ndarray:
+        return self.calculate_default_error(self.conversion_rate_a, self.variation_a_visitors,
+                                            self.count_relative_error)
+
+    @cached_property
+    def default_error_b(self) -> np.ndarray:
+        return self.calculate_default_error(self.conversion_rate_b, self.variation_b_visitors,
+                                            self.count_relative_error)
+
+    @staticmethod
+    def _rate(conversions: np.ndarray, visitors: np.ndarray) -> np.ndarray:
+        safe_visitors = np.where(visitors != 0, visitors, 1)
+        return np.where(visitors != 0, conversions / safe_visitors, 0.0)
+
+    @staticmethod
+    def calculate_default_error(conversion_rate: np.ndarray, visitors: np.ndarray,
+                                relative_error: np.ndarray | float = 0.0) -> np.ndarray:
+        """ Calcula o ERRO PADRÃO de cada linha, com a mesma fórmula de Variation. """
+        safe_visitors = np.where(visitors != 0, visitors, 1)
+        variance = (conversion_rate * (1 - conversion_rate)) / safe_visitors
+        variance = variance + 2 * (relative_error * conversion_rate) ** 2
+        return np.where(visitors != 0, np.sqrt(variance), 0.0)
@@ -1,72 +1,94 @@
-from scipy.stats import norm, chisquare
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterable, Tuple
 import math
 from datetime import date, timedelta
 import numpy as np
 from domain.entities.ab_tester import ABTester
 from domain.entities.variation import Variation
+from domain.use_cases.bayesian_analysis import DEFAULT_PRIOR, calculate_bayesian_results
+from domain.use_cases.bootstrap_intervals import BootstrapEngine
+from domain.use_cases.group_sequential import GroupSequentialDesign
+from domain.use_cases.power_analysis import required_total_users
+from domain.use_cases.sequential_testing import calculate_sequential_results
+from domain.use_cases.statistics_backend import get_statistics_backend
 
 class ABStatisticalValidator:
-    def __init__(self, variation: Variation, tester: ABTester) -> None:
-        self.variation = variation
-        self.tester = tester
-
-    def get_statistical_results(self) -> Dict[str, Any]:
-        """
-        Orquestra os cálculos e retorna um dicionário com todas as métricas.
-        """
-        
-        std_err_diff = self._calculate_standard_error_difference()
-        z_score = self._calculate_z_score(std_err_diff)
-        z_critical = self._calculate_z_table_value_critical()
-        p_value = self._calculate_p_value(z_score)
-        conversion_rate_uplift = self._calculate_conversion_rate_uplift()
-        observed_test_power = self._calculate_observed_test_power(z_critical)
-        current_confidence = float(1.00 - p_value)
-
-        control_upper_bound = self._calculate_upper_bound(
+    # Grafo de dependências das métricas: nome -> (dependências, função de cálculo).
+    # Cada função recebe o validador e os valores já calculados das suas dependências,
+    # de modo que pedir uma métrica avalia apenas o subgrafo necessário.
+    METRIC_GRAPH: Dict[str, Tuple[Tuple[str, ...], Callable[..., Any]]] = {
+        "standard_error_difference": ((), lambda self: self._calculate_standard_error_difference()),
+        "z_score": (("standard_error_difference",), lambda self, std_err_diff: self._calculate_z_score(std_err_diff)),
+        "z_critical": ((), lambda self: self._calculate_z_table_value_critical()),
+        "p_value": (("z_score",), lambda self, z_score: self._calculate_p_value(z_score)),
+        "conversion_rate_uplift": ((), lambda self: self._calculate_conversion_rate_uplift()),
+        "observed_test_power": (("z_critical",), lambda self, z_critical: self._calculate_observed_test_power(z_critical)),
+        "current_confidence": (("p_value",), lambda self, p_value: float(1.00 - p_value)),
+        "control_upper_bound": (("z_critical",), lambda self, z_critical: self._calculate_upper_bound(
             conversion_rate=self.variation.conversion_rate_a,
             standard_error=self.variation.default_error_a,
-            z_critical=z_critical
-        )
-        control_lower_bound = self._calculate_lower_bound(
+            z_critical=z_critical)),
+        "control_lower_bound": (("z_critical",), lambda self, z_critical: self._calculate_lower_bound(
             conversion_rate=self.variation.conversion_rate_a,
             standard_error=self.variation.default_error_a,
-            z_critical=z_critical
-        )
-       
-        variation_upper_bound = self._calculate_upper_bound(
+            z_critical=z_critical)),
+        "variation_upper_bound": (("z_critical",), lambda self, z_critical: self._calculate_upper_bound(
             conversion_rate=self.variation.conversion_rate_b,
             standard_error=self.variation.default_error_b,
-            z_critical=z_critical
-        )
-        variation_lower_bound = self._calculate_lower_bound(
+            z_critical=z_critical)),
+        "variation_lower_bound": (("z_critical",), lambda self, z_critical: self._calculate_lower_bound(
             conversion_rate=self.variation.conversion_rate_b,
             standard_error=self.variation.default_error_b,
-            z_critical=z_critical
-        )
+            z_critical=z_critical)),
+        "srm_results": ((), lambda self: self._calculate_sample_ratio_mismatch()),
+        "temporal_validation_results": ((), lambda self: self._calculate_temporal_validation_results()),
+        "planning_results": (("temporal_validation_results",), lambda self, temporal: self._calculate_test_planning_metrics(
+            mde=self.variation.estimated_uplift, temporal_results=temporal)),
+        "sequential_results": ((), lambda self: calculate_sequential_results(self.variation)),
+        "bayesian_results": ((), lambda self: self._calculate_bayesian_results(*DEFAULT_PRIOR)),
+    }
 
-        srm_results = self.check_sample_ratio_mismatch()
-        temporal_validation_results = self.get_temporal_validation_results()
-        planning_results = self.get_test_planning_metrics(mde=self.variation.estimated_uplift)
+    # Métricas devolvidas por get_statistical_results() quando nenhuma é pedida.
+    DEFAULT_METRICS: Tuple[str, ...] = tuple(METRIC_GRAPH)
 
-        # --- Retornar todos os resultados ---
-        return {
-            "standard_error_difference": std_err_diff,
-            "z_score": z_score,
-            "z_critical": z_critical,
-            "p_value": p_value,
-            "conversion_rate_uplift": conversion_rate_uplift,
-            "observed_test_power": observed_test_power,
-            "current_confidence": current_confidence,
-            "control_upper_bound": control_upper_bound,
-            "control_lower_bound": control_lower_bound,
-            "variation_upper_bound": variation_upper_bound,
-            "variation_lower_bound": variation_lower_bound,
-            "srm_results": srm_results,
-            "temporal_validation_results": temporal_validation_results,
-            "planning_results": planning_results  # Combina o dicionário de planejamento ao resultado final
-        }
+    def __init__(self, variation: Variation, tester: ABTester, today: date | None = None,
+                 backend: str | None = None) -> None:
+        """
+        Args:
+            variation: Entidade com as contagens do teste.
+            tester: Entidade com as datas e a configuração do teste.
+            today: Data de referência usada quando o teste não tem encerramento.
+                Lida uma única vez (padrão: date.today()).
+            backend: Backend estatístico: "fast" (padrão) ou "scipy" (referência).
+        """
+        self.variation = variation
+        self.tester = tester
+        self.backend = get_statistics_backend(backend)
+        self.today = today or date.today()
+        self._metric_cache: Dict[str, Any] = {}
+
+    def get_metric(self, name: str) -> Any:
+        """
+        Retorna uma métrica do grafo, calculando-a (e às suas dependências) apenas
+        na primeira vez. Chamadas seguintes no mesmo validador usam o valor memorizado.
+        """
+        if name not in self._metric_cache:
+            if name not in self.METRIC_GRAPH:
+                raise KeyError(f"Métrica desconhecida: {name}")
+            dependencies, compute = self.METRIC_GRAPH[name]
+            values = [self.get_metric(dependency) for dependency in dependencies]
+            self._metric_cache[name] = compute(self, *values)
+        return self._metric_cache[name]
+
+    def get_statistical_results(self, metrics: Iterable[str] | None = None) -> Dict[str, Any]:
+        """
+        Orquestra os cálculos e retorna um dicionário com as métricas.
+
+        Args:
+            metrics: Nomes das métricas desejadas (ex: ["p_value", "srm_results"]).
+                Se omitido, retorna todas as métricas de DEFAULT_METRICS.
+        """
+        names = self.DEFAULT_METRICS if metrics is None else tuple(metrics)
+        return {name: self.get_metric(name) for name in names}
 
     def _calculate_standard_error_difference(self) -> float:
         """ 
@@ -89,11 +111,9 @@ class ABStatisticalValidator:
 
     def _calculate_z_table_value_critical(self) -> float:
         """
-        Calcula o valor crítico Z com a biblioteca scipy. 
+        Calcula o valor crítico Z com o backend estatístico configurado.
         """
-
-        prob = (self.variation.tail_numbers - self.variation.confidence_level) / self.variation.tail_numbers
-        return abs(float(norm.ppf(prob))) 
+        return self.backend.z_critical(self.variation.tail_numbers, self.variation.confidence_level)
     
     def _calculate_p_value(self, z_score: float) -> float:
         """
@@ -101,11 +121,11 @@ class ABStatisticalValidator:
         """
         tail = int(self.variation.tail_numbers)
         if tail == 1:
-            p_value = 1 - norm.cdf(z_score)
+            p_value = 1 - self.backend.norm_cdf(z_score)
             return float(p_value)
         elif tail == 2:
             # Para testes bicaudais, o p-value é 2 * (área na cauda)
-            p_value = 2 * (1 - norm.cdf(abs(z_score)))
+            p_value = 2 * (1 - self.backend.norm_cdf(abs(z_score)))
             return float(p_value)
         else:
             raise ValueError("Número de caudas deve ser 1 ou 2.")
@@ -148,7 +168,7 @@ class ABStatisticalValidator:
                 numerador = rate_a + (std_err_a * z_crit_abs) - rate_b
                 denominador = std_err_b
                 x = numerador / denominador
-                return float(norm.sf(x)) # norm.sf(x) é 1 - norm.cdf(x)
+                return float(self.backend.norm_sf(x)) # sf(x) é 1 - cdf(x)
             else:
                 # Parte FALSA da fórmula: (E7 + E8*H4 - D7) / D8
                 if std_err_a == 0:
@@ -157,7 +177,7 @@ class ABStatisticalValidator:
                 numerador = rate_b + (std_err_b * z_crit_abs) - rate_a
                 denominador = std_err_a
                 y = numerador / denominador
-                return float(norm.sf(y))
+                return float(self.backend.norm_sf(y))
             """
             Calcula o Poder do Teste Observado (Power) conforme a fórmula da planilha.
             
@@ -181,7 +201,7 @@ class ABStatisticalValidator:
                 denominador = rate_b
                 x = numerador / denominador
                 # norm.sf(x) é a Survival Function, equivalente a 1 - norm.cdf(x)
-                return float(norm.sf(x))
+                return float(self.backend.norm_sf(x))
             else:
                 # Parte FALSA da fórmula: 1-NORM.DIST(((E7+E8*H4-D7)/D8),0,1,TRUE())
                 if rate_a == 0:
@@ -190,7 +210,7 @@ class ABStatisticalValidator:
                 numerador = conv_b + (rate_b * z_critical) - conv_a
                 denominador = rate_a
                 y = numerador / denominador
-                return float(norm.sf(y))
+                return float(self.backend.norm_sf(y))
 
     def _calculate_upper_bound(self, conversion_rate: float, standard_error: float, z_critical: float) -> float:
         """
@@ -225,8 +245,10 @@ class ABStatisticalValidator:
         return float(lower_bound)
     
     def check_sample_ratio_mismatch(self) -> Dict[str, Any]:
+        """ Retorna o resultado (memorizado) da verificação de SRM. """
+        return self.get_metric("srm_results")
 
-
+    def _calculate_sample_ratio_mismatch(self) -> Dict[str, Any]:
         """
         Verifica a existência de Sample Ratio Mismatch (SRM) usando um Teste Qui-Quadrado.
 
@@ -258,7 +280,7 @@ class ABStatisticalValidator:
 
         # Calcula o p-valor do Teste Qui-Quadrado
         # Excel: =TESTE.QUIQUA(D5:E5;H19:I19)
-        _, p_value = chisquare(f_obs=observed_visitors, f_exp=expected_visitors)
+        p_value = self.backend.chisquare_p_value(observed_visitors, expected_visitors)
 
         # Verifica se há SRM com base no p-valor (nível de significância de 1%)
         # Excel: =SE(H20<=0,01;"SIM";"NÃO")
@@ -270,12 +292,53 @@ class ABStatisticalValidator:
             "srm_expected_per_variation": float(expected_value)
         }
     
+    def get_sequential_results(self) -> Dict[str, Any]:
+        """
+        Retorna o resultado (memorizado) do teste sequencial sempre válido (mSPRT),
+        adequado para consultas repetidas durante o teste.
+        """
+        return self.get_metric("sequential_results")
+
+    def get_bayesian_results(self, prior_alpha: float = DEFAULT_PRIOR[0],
+                             prior_beta: float = DEFAULT_PRIOR[1]) -> Dict[str, Any]:
+        """
+        Probabilidade de B superar A e perda esperada de cada decisão (Beta-Binomial).
+        Com a priori uniforme padrão, usa o valor memorizado do grafo de métricas.
+        """
+        if (prior_alpha, prior_beta) == DEFAULT_PRIOR:
+            return self.get_metric("bayesian_results")
+        return self._calculate_bayesian_results(prior_alpha, prior_beta)
+
+    def _calculate_bayesian_results(self, prior_alpha: float, prior_beta: float) -> Dict[str, Any]:
+        variation = self.variation
+        return dict(calculate_bayesian_results(
+            int(variation.variation_a_visitors), int(variation.conversions_a),
+            int(variation.variation_b_visitors), int(variation.conversions_b),
+            float(prior_alpha), float(prior_beta),
+        ))
+
+    def get_bootstrap_intervals(self, replicates: int = 10_000, seed: int | None = None,
+                                method: str = "binomial", workers: int = 1) -> Dict[str, Any]:
+        """
+        Intervalos percentil e BCa do uplift absoluto e relativo por bootstrap, uma
+        alternativa aos intervalos de Wald quando as taxas de conversão são baixas.
+        Não faz parte das métricas padrão por ser mais custoso.
+        """
+        engine = BootstrapEngine(replicates=replicates, seed=seed, method=method, workers=workers)
+        return engine.run(self.variation)
+
     def get_temporal_validation_results(self) -> dict:
         """
-        Orquestra e retorna um dicionário com todas as métricas de validação temporal.
+        Retorna o dicionário (memorizado) com todas as métricas de validação temporal.
+        """
+        return self.get_metric("temporal_validation_results")
+
+    def _calculate_temporal_validation_results(self) -> dict:
+        """
+        Orquestra e calcula as métricas de validação temporal.
         """
-        # Define a data final a ser usada: a data de término do teste ou a data de hoje.
-        effective_end_date = self.tester.end_date if self.tester.end_date else date.today()
+        # Define a data final a ser usada: a data de término do teste ou a data de referência.
+        effective_end_date = self.tester.end_date if self.tester.end_date else self.today
         
         # Calcula cada métrica temporal
         total_duration = self._calculate_total_duration_days(effective_end_date)
@@ -283,7 +346,7 @@ class ABStatisticalValidator:
         daily_visitors = self._calculate_average_daily_visitors(total_duration)
         
         return {
-            "current_date": date.today().strftime("%d/%m/%Y"),
+            "current_date": self.today.strftime("%d/%m/%Y"),
             "total_duration_days": total_duration,
             "business_days_duration": business_days,
             "average_daily_visitors": daily_visitors,
@@ -320,20 +383,23 @@ class ABStatisticalValidator:
     def get_test_planning_metrics(self, mde: float) -> dict:
         """
         Orquestra os cálculos de planejamento do teste (usuários e dias necessários).
+        Reaproveita a validação temporal já calculada por este validador.
         """
-        p_control = self.variation.conversion_rate_a
+        if mde == self.variation.estimated_uplift:
+            return self.get_metric("planning_results")
+        return self._calculate_test_planning_metrics(mde, self.get_temporal_validation_results())
 
+    def _calculate_test_planning_metrics(self, mde: float, temporal_results: dict) -> dict:
+        """
+        Calcula usuários e dias necessários a partir da validação temporal.
+        """
+        p_control = self.variation.conversion_rate_a
 
-        required_users_80_power = self._calculate_required_users(
-            p_control=p_control, mde=mde, power_constant=16
-        )
 
-        required_users_95_power = self._calculate_required_users(
-            p_control=p_control, mde=mde, power_constant=26
-        )
+        required_users_80_power = self._calculate_required_users(p_control=p_control, mde=mde, power=0.80)
 
+        required_users_95_power = self._calculate_required_users(p_control=p_control, mde=mde, power=0.95)
 
-        temporal_results = self.get_temporal_validation_results()
         daily_visitors = temporal_results.get("average_daily_visitors", 0)
 
 
@@ -352,31 +418,79 @@ class ABStatisticalValidator:
             "required_days_95_power": required_days_95_power,
         }
 
-    def _calculate_required_users(self, p_control: float, mde: float, power_constant: float) -> int:
-        """
-        Calcula o número total de usuários necessários com base na fórmula da planilha.
+    def _group_sequential_design(self, looks: int, spending: str) -> GroupSequentialDesign:
+        return GroupSequentialDesign(
+            looks=looks,
+            alpha=1 - self.variation.confidence_level,
+            spending=spending,
+            tails=int(self.variation.tail_numbers),
+        )
 
-        Fórmula Excel: =2*(CONSTANTE*POTÊNCIA(RAIZ(D7*(1-D7))/(D7*D17);2))
-        Onde:
-        - D7 = p_control
-        - D17 = mde
-        - CONSTANTE = 16 (para 80% de poder) ou 26 (para 95% de poder)
+    def get_group_sequential_plan(self, looks: int, spending: str = "obrien_fleming") -> dict:
         """
-        if p_control <= 0 or mde <= 0:
-            return 0
-
+        Planejamento com K análises interinas igualmente espaçadas (ex: semanais),
+        a partir do planejamento de horizonte fixo deste teste.
 
-        absolute_uplift = p_control * mde
+        As fronteiras vêm da tabela pré-computada de group_sequential; a economia é a
+        redução da amostra esperada (com efeito igual ao MDE) em relação ao desenho fixo.
 
-        if absolute_uplift <= 0:
-            return 0
-
-
-        variance = p_control * (1 - p_control)
+        Args:
+            looks: Número de análises, incluindo a final.
+            spending: Função de gasto de alfa: "obrien_fleming" ou "pocock".
+        """
+        design = self._group_sequential_design(looks, spending)
+        planning = self.get_metric("planning_results")
+        daily_visitors = self.get_temporal_validation_results().get("average_daily_visitors", 0)
+
+        plan = {
+            "looks": design.looks,
+            "spending": design.spending,
+            "boundaries": list(design.boundaries),
+            "nominal_p_values": design.nominal_p_values(),
+        }
+        for power, suffix in ((0.80, "80_power"), (0.95, "95_power")):
+            fixed_users = planning[f"required_users_{suffix}"]
+            factors = design.expected_sample_fraction(power)
+            max_users = math.ceil(fixed_users * factors["inflation"])
+            expected_users = math.ceil(fixed_users * factors["alternative"])
+            plan.update({
+                f"max_users_{suffix}": max_users,
+                f"expected_users_{suffix}": expected_users,
+                f"expected_savings_{suffix}": 1 - factors["alternative"] if fixed_users else 0.0,
+                f"users_per_look_{suffix}": [math.ceil(max_users * fraction) for fraction in design.fractions],
+                f"max_days_{suffix}": self._calculate_required_days(max_users, daily_visitors),
+            })
+        return plan
+
+    def check_interim_look(self, look: int, looks: int, spending: str = "obrien_fleming") -> dict:
+        """
+        Análise interina do desenho sequencial: compara o z-score atual com a fronteira
+        (consultada na tabela) da análise `look` de `looks`.
+        """
+        design = self._group_sequential_design(looks, spending)
+        z_score = self.get_metric("z_score")
+        return {
+            "look": look,
+            "z_score": z_score,
+            "boundary": design.boundaries[look - 1],
+            "crossed_boundary": design.crosses_boundary(look, z_score),
+        }
 
-        required_users = 2 * (power_constant * (variance / (absolute_uplift**2)))
+    def _calculate_required_users(self, p_control: float, mde: float, power: float) -> int:
+        """
+        Calcula o número total de usuários necessários (divisão 50/50) pelo solver de
+        poder de duas proporções, com o alfa e o número de caudas configurados no teste.
 
-        return math.ceil(required_users)
+        Substitui a fórmula da planilha (=2*(CONSTANTE*POTÊNCIA(RAIZ(D7*(1-D7))/(D7*D17);2)),
+        com CONSTANTE = 16 ou 26), que só valia para 80%/95% de poder no bicaudal a 5%.
+        """
+        return required_total_users(
+            p_control=p_control,
+            mde=mde,
+            alpha=1 - self.variation.confidence_level,
+            power=power,
+            tails=int(self.variation.tail_numbers),
+        )
 
     def _calculate_required_days(self, required_users: int, daily_visitors: float) -> int:
         """
@@ -0,0 +1,286 @@
+from scipy.stats import norm, chi2
+from typing import Dict, Any, Iterable, Tuple
+from datetime import date
+import numpy as np
+from domain.entities.ab_tester import ABTester
+from domain.entities.variation import Variation
+from domain.entities.variation_batch import VariationBatch
+from domain.use_cases.bayesian_analysis import DEFAULT_PRIOR, calculate_bayesian_arrays
+from domain.use_cases.power_analysis import required_sample_size
+from domain.use_cases.sequential_testing import FALLBACK_MIXING_VARIANCE
+
+
+class BatchStatisticalValidator:
+    """
+    Versão vetorizada do ABStatisticalValidator para avaliar milhares de testes de uma vez.
+
+    Recebe um VariationBatch (uma linha por teste) e todas as fórmulas da planilha
+    são calculadas em uma única passada com NumPy. Os resultados são devolvidos em
+    formato colunar: um dicionário de nome da métrica -> array.
+    """
+    def __init__(self,
+                 variations: VariationBatch,
+                 start_dates: Any,
+                 end_dates: Any,
+                 today: date | None = None) -> None:
+        """
+        Args:
+            variations: Lote colunar com as contagens e parâmetros de cada teste.
+            start_dates, end_dates: Datas de início e encerramento (NaT/None = hoje).
+            today: Data de referência usada quando não há encerramento (padrão: hoje).
+        """
+        self.variations = variations
+        if not np.isin(variations.tail_numbers, (1, 2)).all():
+            raise ValueError("Número de caudas deve ser 1 ou 2.")
+
+        size = len(variations)
+        self.today = np.datetime64(today or date.today(), "D")
+        self.start_dates = np.broadcast_to(np.asarray(start_dates, dtype="datetime64[D]"), (size,))
+        end_dates = np.broadcast_to(np.asarray(end_dates, dtype="datetime64[D]"), (size,))
+        self.end_dates = np.where(np.isnat(end_dates), self.today, end_dates)
+
+    @classmethod
+    def from_arrays(cls,
+                    variation_a_visitors: Any,
+                    variation_b_visitors: Any,
+                    conversions_a: Any,
+                    conversions_b: Any,
+                    tail_numbers: Any,
+                    confidence_level: Any,
+                    estimated_uplift: Any,
+                    start_dates: Any,
+                    end_dates: Any,
+                    today: date | None = None) -> "BatchStatisticalValidator":
+        """
+        Monta o validador diretamente a partir de arrays (uma linha por teste).
+
+        Args:
+            confidence_level: Nível de confiança em porcentagem (ex: 95.0), como em Variation.
+            estimated_uplift: MDE em porcentagem (ex: 10.0), como em Variation.
+        """
+        variations = VariationBatch(
+            variation_a_visitors=variation_a_visitors,
+            variation_b_visitors=variation_b_visitors,
+            conversions_a=conversions_a,
+            conversions_b=conversions_b,
+            tail_numbers=tail_numbers,
+            confidence_level=confidence_level,
+            estimated_uplift=estimated_uplift,
+        )
+        return cls(variations, start_dates=start_dates, end_dates=end_dates, today=today)
+
+    @classmethod
+    def from_entities(cls, experiments: Iterable[Tuple[Variation, ABTester]],
+                      today: date | None = None) -> "BatchStatisticalValidator":
+        """ Monta o validador em lote a partir de pares (Variation, ABTester) já existentes. """
+        pairs = list(experiments)
+        return cls(
+            VariationBatch.from_variations(v for v, _ in pairs),
+            start_dates=[t.start_date for _, t in pairs],
+            end_dates=[t.end_date if t.end_date else np.datetime64("NaT") for _, t in pairs],
+            today=today,
+        )
+
+    def __len__(self) -> int:
+        return len(self.variations)
+
+    def get_statistical_results(self) -> Dict[str, np.ndarray]:
+        """
+        Calcula todas as métricas do ABStatisticalValidator para o lote inteiro.
+
+        Os dicionários aninhados do validador escalar (SRM, validação temporal e
+        planejamento) são achatados em colunas com os mesmos nomes das chaves internas.
+        """
+        results = self.get_frequentist_results()
+        results.update(self.get_sequential_results())
+        results.update(self.get_bayesian_results())
+        results.update(self.check_sample_ratio_mismatch())
+        temporal_results = self.get_temporal_validation_results()
+        results.update(temporal_results)
+        results.update(self.get_test_planning_metrics(temporal_results["average_daily_visitors"]))
+        return results
+
+    def get_frequentist_results(self) -> Dict[str, np.ndarray]:
+        """
+        Teste z, p-valor, poder observado e intervalos de cada braço, sem as análises
+        mais caras (bayesiana, SRM e planejamento). Usado pelas simulações.
+        """
+        std_err_diff = self._calculate_standard_error_difference()
+        z_score = self._calculate_z_score(std_err_diff)
+        z_critical = self._calculate_z_table_value_critical()
+        p_value = self._calculate_p_value(z_score)
+        variations = self.variations
+        return {
+            "standard_error_difference": std_err_diff,
+            "z_score": z_score,
+            "z_critical": z_critical,
+            "p_value": p_value,
+            "conversion_rate_uplift": self._calculate_conversion_rate_uplift(),
+            "observed_test_power": self._calculate_observed_test_power(z_critical),
+            "current_confidence": 1.00 - p_value,
+            "control_upper_bound": variations.conversion_rate_a + variations.default_error_a * z_critical,
+            "control_lower_bound": variations.conversion_rate_a - variations.default_error_a * z_critical,
+            "variation_upper_bound": variations.conversion_rate_b + variations.default_error_b * z_critical,
+            "variation_lower_bound": variations.conversion_rate_b - variations.default_error_b * z_critical,
+        }
+
+    def _calculate_standard_error_difference(self) -> np.ndarray:
+        return np.sqrt(self.variations.default_error_a**2 + self.variations.default_error_b**2)
+
+    def _calculate_z_score(self, std_err_diff: np.ndarray) -> np.ndarray:
+        safe_std_err = np.where(std_err_diff != 0, std_err_diff, 1.0)
+        z_score = (self.variations.conversion_rate_b - self.variations.conversion_rate_a) / safe_std_err
+        return np.where(std_err_diff != 0, z_score, 0.0)
+
+    def _calculate_z_table_value_critical(self) -> np.ndarray:
+        prob = (self.variations.tail_numbers - self.variations.confidence_level) / self.variations.tail_numbers
+        return np.abs(norm.ppf(prob))
+
+    def _calculate_p_value(self, z_score: np.ndarray) -> np.ndarray:
+        one_tailed = 1 - norm.cdf(z_score)
+        two_tailed = 2 * (1 - norm.cdf(np.abs(z_score)))
+        return np.where(self.variations.tail_numbers == 1, one_tailed, two_tailed)
+
+    def _calculate_conversion_rate_uplift(self) -> np.ndarray:
+        rate_a = self.variations.conversion_rate_a
+        safe_rate_a = np.where(rate_a != 0, rate_a, 1.0)
+        uplift = (self.variations.conversion_rate_b - rate_a) / safe_rate_a
+        return np.where(rate_a != 0, uplift, np.inf)
+
+    def _calculate_observed_test_power(self, z_critical: np.ndarray) -> np.ndarray:
+        """
+        Poder do Teste Observado, com os dois ramos da fórmula da planilha avaliados
+        de uma vez e selecionados pela coluna obs_power_on (célula D15).
+        """
+        rate_a, std_err_a = self.variations.conversion_rate_a, self.variations.default_error_a
+        rate_b, std_err_b = self.variations.conversion_rate_b, self.variations.default_error_b
+        safe_err_a = np.where(std_err_a != 0, std_err_a, 1.0)
+        safe_err_b = np.where(std_err_b != 0, std_err_b, 1.0)
+
+        power_on = norm.sf((rate_a + (std_err_a * z_critical) - rate_b) / safe_err_b)
+        power_on = np.where(std_err_b != 0, power_on, 0.0)
+        power_off = norm.sf((rate_b + (std_err_b * z_critical) - rate_a) / safe_err_a)
+        power_off = np.where(std_err_a != 0, power_off, 0.0)
+        return np.where(self.variations.obs_power_on, power_on, power_off)
+
+    def get_sequential_results(self, mixing_variance: Any = None) -> Dict[str, np.ndarray]:
+        """
+        Teste sequencial sempre válido (mSPRT) para todas as linhas.
+
+        Args:
+            mixing_variance: τ² fixo (escalar ou um por linha). Se omitido, usa a mesma
+                variância de mistura padrão do validador escalar, derivada da taxa
+                observada do controle de cada linha: adequada para testes consultados uma
+                única vez, não para combinar várias consultas do mesmo teste (trajetórias
+                diárias, simulações com olhadas), que precisam do τ² do planejamento.
+        """
+        variations = self.variations
+        alpha = 1 - variations.confidence_level
+        difference = variations.conversion_rate_b - variations.conversion_rate_a
+        variance = variations.default_error_a**2 + variations.default_error_b**2
+        if mixing_variance is None:
+            absolute_effect = variations.conversion_rate_a * variations.estimated_uplift
+            mixing_variance = np.where(absolute_effect > 0, absolute_effect**2, FALLBACK_MIXING_VARIANCE)
+        else:
+            mixing_variance = np.broadcast_to(mixing_variance, (len(self),)).astype(np.float64)
+            if (mixing_variance <= 0).any():
+                raise ValueError("A variância da mistura (τ²) deve ser positiva.")
+
+        valid = variance > 0
+        safe_variance = np.where(valid, variance, 1.0)
+        total_variance = safe_variance + mixing_variance
+        log_likelihood_ratio = np.where(
+            valid,
+            0.5 * np.log(safe_variance / total_variance)
+            + mixing_variance * difference**2 / (2 * safe_variance * total_variance),
+            0.0,
+        )
+        p_value = np.where(log_likelihood_ratio > 0, np.exp(-np.maximum(log_likelihood_ratio, 0.0)), 1.0)
+        half_width = np.sqrt(
+            safe_variance * total_variance / mixing_variance
+            * (2 * np.log(1 / alpha) + np.log(total_variance / safe_variance))
+        )
+        half_width = np.where(valid, half_width, np.inf)
+        return {
+            "sequential_p_value": p_value,
+            "sequential_lower_bound": difference - half_width,
+            "sequential_upper_bound": difference + half_width,
+            "likelihood_ratio": np.exp(np.minimum(log_likelihood_ratio, 700.0)),
+            "mixing_variance": mixing_variance,
+            "is_significant": p_value < alpha,
+        }
+
+    def get_bayesian_results(self, prior_alpha: float = DEFAULT_PRIOR[0],
+                             prior_beta: float = DEFAULT_PRIOR[1]) -> Dict[str, np.ndarray]:
+        """
+        Análise bayesiana Beta-Binomial de todas as linhas (mesmas fórmulas do validador escalar).
+        """
+        variations = self.variations
+        results = calculate_bayesian_arrays(
+            variations.variation_a_visitors, variations.conversions_a,
+            variations.variation_b_visitors, variations.conversions_b,
+            prior_alpha, prior_beta,
+        )
+        results["prior_alpha"] = np.full(len(self), float(prior_alpha))
+        results["prior_beta"] = np.full(len(self), float(prior_beta))
+        return results
+
+    def check_sample_ratio_mismatch(self) -> Dict[str, np.ndarray]:
+        """
+        Teste Qui-Quadrado de SRM (divisão 50/50) para todas as linhas.
+        Com duas células o teste tem 1 grau de liberdade.
+        """
+        visitors_a = self.variations.variation_a_visitors.astype(np.float64)
+        visitors_b = self.variations.variation_b_visitors.astype(np.float64)
+        total_visitors = visitors_a + visitors_b
+        expected_value = total_visitors / 2.0
+        safe_expected = np.where(total_visitors != 0, expected_value, 1.0)
+
+        statistic = ((visitors_a - expected_value)**2 + (visitors_b - expected_value)**2) / safe_expected
+        p_value = np.where(total_visitors != 0, chi2.sf(statistic, 1), 1.0)
+
+        return {
+            "has_srm": p_value <= 0.01,
+            "srm_p_value": p_value,
+            "srm_expected_per_variation": expected_value,
+        }
+
+    def get_temporal_validation_results(self) -> Dict[str, np.ndarray]:
+        variations = self.variations
+        total_visitors = (variations.variation_a_visitors + variations.variation_b_visitors).astype(np.float64)
+        total_duration = (self.end_dates - self.start_dates).astype(np.int64)
+        business_days = np.busday_count(self.start_dates, self.end_dates + np.timedelta64(1, "D"))
+
+        safe_duration = np.where(total_duration > 0, total_duration, 1)
+        daily_visitors = np.where(
+            total_duration > 0, np.round(total_visitors / safe_duration, 2), total_visitors
+        )
+        return {
+            "total_duration_days": total_duration,
+            "business_days_duration": business_days,
+            "average_daily_visitors": daily_visitors,
+        }
+
+    def get_test_planning_metrics(self, daily_visitors: np.ndarray) -> Dict[str, np.ndarray]:
+        required_users_80_power = self._calculate_required_users(power=0.80)
+        required_users_95_power = self._calculate_required_users(power=0.95)
+        return {
+            "required_users_80_power": required_users_80_power,
+            "required_users_95_power": required_users_95_power,
+            "required_days_80_power": self._calculate_required_days(required_users_80_power, daily_visitors),
+            "required_days_95_power": self._calculate_required_days(required_users_95_power, daily_visitors),
+        }
+
+    def _calculate_required_users(self, power: float) -> np.ndarray:
+        return required_sample_size(
+            p_control=self.variations.conversion_rate_a,
+            mde=self.variations.estimated_uplift,
+            alpha=1 - self.variations.confidence_level,
+            power=power,
+            tails=self.variations.tail_numbers,
+        )["total_users"]
+
+    def _calculate_required_days(self, required_users: np.ndarray, daily_visitors: np.ndarray) -> np.ndarray:
+        valid = daily_visitors > 0
+        safe_daily = np.where(valid, daily_visitors, 1.0)
+        return np.where(valid, np.ceil(required_users / safe_daily), 0).astype(np.int64)
@@ -0,0 +1,247 @@
+"""
+Análise bayesiana Beta-Binomial: probabilidade de a variação superar o controle e
+perda esperada de cada decisão.
+
+Com uma priori Beta(α, β), a posteriori da taxa de conversão de cada braço é
+Beta(α + conversões, β + visitantes - conversões). A probabilidade P(B > A) é escolhida
+por faixa de contagens:
+
+- "exact": soma fechada (Evan Miller, "Formulas for Bayesian A/B Testing"), que exige
+  um parâmetro α inteiro e tem tantos termos quanto esse α;
+- "normal": aproximação normal das posterioris, usada quando as contagens são grandes
+  demais para a soma exata. Com todos os parâmetros acima de 500, a diferença para a
+  soma exata fica abaixo de 1e-4;
+- "monte_carlo": sorteios vetorizados das posterioris, para prioris não inteiras com
+  poucas contagens. A semente é fixa, então o resultado é reproduzível.
+
+Perda esperada de escolher B: E[max(p_A - p_B, 0)] (e simetricamente para A). No caso
+exato, E[p_A · 1(p_A > p_B)] = E[p_A] · P(A⁺ > B), com A⁺ ~ Beta(α_A + 1, β_A), de modo
+que a perda também sai da soma fechada.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+import numpy as np
+from scipy.special import betaln
+from scipy.stats import norm
+
+DEFAULT_PRIOR = (1.0, 1.0)
+
+# Número máximo de termos da soma exata por teste
+EXACT_MAX_TERMS = 500
+# Menor parâmetro das posterioris a partir do qual a aproximação normal é usada
+NORMAL_MIN_PARAMETER = 500
+# Limite de termos avaliados de uma vez (memória da soma exata em lote)
+_EXACT_CHUNK_TERMS = 1_000_000
+
+MONTE_CARLO_SAMPLES = 20_000
+MONTE_CARLO_SEED = 0
+
+
+def posterior_parameters(visitors: np.ndarray, conversions: np.ndarray,
+                         prior_alpha: float = DEFAULT_PRIOR[0],
+                         prior_beta: float = DEFAULT_PRIOR[1]) -> Tuple[np.ndarray, np.ndarray]:
+    """ Parâmetros (α, β) da posteriori Beta de cada braço. """
+    if prior_alpha <= 0 or prior_beta <= 0:
+        raise ValueError("Os parâmetros da priori Beta devem ser positivos.")
+    visitors = np.asarray(visitors, dtype=np.float64)
+    conversions = np.asarray(conversions, dtype=np.float64)
+    return prior_alpha + conversions, prior_beta + visitors - conversions
+
+
+def _beta_moments(alpha: np.ndarray, beta: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    total = alpha + beta
+    return alpha / total, alpha * beta / (total ** 2 * (total + 1))
+
+
+def _is_integer(values: np.ndarray) -> np.ndarray:
+    return values == np.round(values)
+
+
+def _exact_sum(alpha_a: np.ndarray, beta_a: np.ndarray, alpha_b: np.ndarray, beta_b: np.ndarray) -> np.ndarray:
+    """
+    P(B > A) pela soma fechada, com α_B inteiro:
+
+        Σ_{i=0}^{α_B-1} B(α_A + i, β_A + β_B) / ((β_B + i) B(1 + i, β_B) B(α_A, β_A))
+
+    A razão entre termos consecutivos é (α_A + i)(β_B + i) / ((α_A + β_A + β_B + i)(1 + i)),
+    então cada termo custa alguns logaritmos (soma acumulada) em vez de três funções Beta.
+    Cada teste ocupa uma linha de uma matriz (preenchida com zeros até o maior número de
+    termos do bloco) e as somas acumuladas correm ao longo das linhas, de modo que o
+    resultado de um teste não depende dos outros testes do lote.
+    """
+    terms = alpha_b.astype(np.int64)
+    result = np.empty(terms.shape[0])
+    log_first = betaln(alpha_a, beta_a + beta_b) - betaln(alpha_a, beta_a)
+    # Ordena por número de termos para que cada bloco tenha pouco preenchimento
+    order = np.argsort(terms, kind="stable")
+    rows_per_chunk = max(1, _EXACT_CHUNK_TERMS // (EXACT_MAX_TERMS + 1))
+    for start in range(0, order.shape[0], rows_per_chunk):
+        rows = order[start:start + rows_per_chunk]
+        counts = terms[rows]
+        a, b, d = (values[rows, None] for values in (alpha_a, beta_a, beta_b))
+        # log da razão entre o termo i + 1 e o termo i
+        i = np.arange(int(counts.max()) - 1)[None, :]
+        log_ratio = np.log((a + i) * (d + i)) - np.log((a + b + d + i) * (1 + i))
+        log_terms = np.concatenate([np.zeros((counts.shape[0], 1)), np.cumsum(log_ratio, axis=1)], axis=1)
+        terms_values = np.where(np.arange(log_terms.shape[1])[None, :] < counts[:, None],
+                                np.exp(log_first[rows, None] + log_terms), 0.0)
+        result[rows] = np.cumsum(terms_values, axis=1)[np.arange(counts.shape[0]), counts - 1]
+    return result
+
+
+def _exact_probability(alpha_a: np.ndarray, beta_a: np.ndarray,
+                       alpha_b: np.ndarray, beta_b: np.ndarray) -> np.ndarray:
+    """
+    P(B > A) exata, somando sobre o menor α inteiro (pela simetria P(B > A) = 1 - P(A > B)).
+    """
+    use_b = _is_integer(alpha_b) & (~_is_integer(alpha_a) | (alpha_b <= alpha_a))
+    probability = np.empty(alpha_a.shape[0])
+    if use_b.any():
+        probability[use_b] = _exact_sum(alpha_a[use_b], beta_a[use_b], alpha_b[use_b], beta_b[use_b])
+    if (~use_b).any():
+        swapped = ~use_b
+        probability[swapped] = 1 - _exact_sum(alpha_b[swapped], beta_b[swapped], alpha_a[swapped], beta_a[swapped])
+    return np.clip(probability, 0.0, 1.0)
+
+
+def _select_methods(alpha_a: np.ndarray, beta_a: np.ndarray,
+                    alpha_b: np.ndarray, beta_b: np.ndarray) -> np.ndarray:
+    integer_a, integer_b = _is_integer(alpha_a), _is_integer(alpha_b)
+    exact_terms = np.minimum(np.where(integer_a, alpha_a, np.inf), np.where(integer_b, alpha_b, np.inf))
+    smallest = np.minimum.reduce([alpha_a, beta_a, alpha_b, beta_b])
+    return np.where(exact_terms <= EXACT_MAX_TERMS, "exact",
+                    np.where(smallest >= NORMAL_MIN_PARAMETER, "normal", "monte_carlo"))
+
+
+def _normal_results(alpha_a, beta_a, alpha_b, beta_b) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    mean_a, variance_a = _beta_moments(alpha_a, beta_a)
+    mean_b, variance_b = _beta_moments(alpha_b, beta_b)
+    difference = mean_b - mean_a
+    scale = np.sqrt(variance_a + variance_b)
+    standardized = difference / scale
+    # E[max(D, 0)] para D ~ N(m, s²) = m Φ(m/s) + s φ(m/s)
+    loss_a = difference * norm.cdf(standardized) + scale * norm.pdf(standardized)
+    loss_b = -difference * norm.cdf(-standardized) + scale * norm.pdf(standardized)
+    return norm.cdf(standardized), loss_a, loss_b
+
+
+def _monte_carlo_results(alpha_a, beta_a, alpha_b, beta_b) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    probability, loss_a, loss_b = (np.empty(alpha_a.shape[0]) for _ in range(3))
+    for row in range(alpha_a.shape[0]):
+        rng = np.random.default_rng(MONTE_CARLO_SEED)
+        draws_a = rng.beta(alpha_a[row], beta_a[row], MONTE_CARLO_SAMPLES)
+        draws_b = rng.beta(alpha_b[row], beta_b[row], MONTE_CARLO_SAMPLES)
+        difference = draws_b - draws_a
+        probability[row] = np.mean(difference > 0)
+        loss_a[row] = np.mean(np.maximum(difference, 0.0))
+        loss_b[row] = np.mean(np.maximum(-difference, 0.0))
+    return probability, loss_a, loss_b
+
+
+def calculate_bayesian_arrays(visitors_a: np.ndarray, conversions_a: np.ndarray,
+                              visitors_b: np.ndarray, conversions_b: np.ndarray,
+                              prior_alpha: float = DEFAULT_PRIOR[0],
+                              prior_beta: float = DEFAULT_PRIOR[1]) -> Dict[str, np.ndarray]:
+    """
+    Versão vetorizada (uma linha por teste), usada também pelo validador em lote.
+
+    Returns:
+        'probability_b_beats_a', 'expected_loss_a' (perda esperada de ficar com o controle),
+        'expected_loss_b' (perda esperada de escolher a variação) e 'bayesian_method'.
+    """
+    alpha_a, beta_a = posterior_parameters(visitors_a, conversions_a, prior_alpha, prior_beta)
+    alpha_b, beta_b = posterior_parameters(visitors_b, conversions_b, prior_alpha, prior_beta)
+    alpha_a, beta_a, alpha_b, beta_b = np.broadcast_arrays(
+        np.atleast_1d(alpha_a), np.atleast_1d(beta_a), np.atleast_1d(alpha_b), np.atleast_1d(beta_b))
+    methods = _select_methods(alpha_a, beta_a, alpha_b, beta_b)
+    probability, loss_a, loss_b = (np.empty(alpha_a.shape[0]) for _ in range(3))
+
+    exact = methods == "exact"
+    if exact.any():
+        a, b, c, d = alpha_a[exact], beta_a[exact], alpha_b[exact], beta_b[exact]
+        # P(B > A), P(B > A⁺) e P(B⁺ > A) em uma única avaliação
+        stacked = _exact_probability(np.concatenate([a, a + 1, a]), np.concatenate([b, b, b]),
+                                     np.concatenate([c, c, c + 1]), np.concatenate([d, d, d]))
+        base, a_shifted, b_shifted = np.split(stacked, 3)
+        mean_a, _ = _beta_moments(a, b)
+        mean_b, _ = _beta_moments(c, d)
+        probability[exact] = base
+        loss_a[exact] = np.maximum(mean_b * b_shifted - mean_a * a_shifted, 0.0)
+        loss_b[exact] = np.maximum(mean_a * (1 - a_shifted) - mean_b * (1 - b_shifted), 0.0)
+
+    for method, compute in (("normal", _normal_results), ("monte_carlo", _monte_carlo_results)):
+        rows = methods == method
+        if rows.any():
+            probability[rows], loss_a[rows], loss_b[rows] = compute(
+                alpha_a[rows], beta_a[rows], alpha_b[rows], beta_b[rows])
+
+    return {
+        "probability_b_beats_a": probability,
+        "expected_loss_a": loss_a,
+        "expected_loss_b": loss_b,
+        "bayesian_method": methods,
+    }
+
+
+@lru_cache(maxsize=1024)
+def calculate_bayesian_results(visitors_a: int, conversions_a: int, visitors_b: int, conversions_b: int,
+                               prior_alpha: float = DEFAULT_PRIOR[0],
+                               prior_beta: float = DEFAULT_PRIOR[1]) -> Dict[str, Any]:
+    """
+    Análise bayesiana de um teste A/B, memorizada por (contagens, priori).
+
+    Returns:
+        O mesmo dicionário de calculate_bayesian_arrays com valores escalares, mais
+        'prior_alpha' e 'prior_beta'.
+    """
+    arrays = calculate_bayesian_arrays(visitors_a, conversions_a, visitors_b, conversions_b,
+                                       prior_alpha, prior_beta)
+    results: Dict[str, Any] = {
+        "probability_b_beats_a": float(arrays["probability_b_beats_a"][0]),
+        "expected_loss_a": float(arrays["expected_loss_a"][0]),
+        "expected_loss_b": float(arrays["expected_loss_b"][0]),
+        "bayesian_method": str(arrays["bayesian_method"][0]),
+    }
+    results.update({"prior_alpha": float(prior_alpha), "prior_beta": float(prior_beta)})
+    return results
+
+
+@lru_cache(maxsize=256)
+def calculate_multi_arm_bayesian(visitors: Tuple[int, ...], conversions: Tuple[int, ...],
+                                 control_index: int = 0,
+                                 prior_alpha: float = DEFAULT_PRIOR[0],
+                                 prior_beta: float = DEFAULT_PRIOR[1]) -> Dict[str, Any]:
+    """
+    Análise bayesiana de um teste A/B/n, memorizada por (contagens, priori).
+
+    A probabilidade de cada braço superar o controle usa o mesmo cálculo do teste A/B.
+    A probabilidade de ser o melhor braço e a perda esperada (E[max_j p_j - p_i]) vêm de
+    uma matriz de sorteios (amostras x braços) gerada de uma vez.
+
+    Returns:
+        Tuplas por braço: 'probability_beats_control', 'probability_best' e 'expected_loss'.
+        São imutáveis porque o mesmo resultado é devolvido a todos os chamadores pelo cache.
+    """
+    visitors_array = np.asarray(visitors, dtype=np.float64)
+    conversions_array = np.asarray(conversions, dtype=np.float64)
+    against_control = calculate_bayesian_arrays(
+        np.full(visitors_array.shape, visitors_array[control_index]),
+        np.full(conversions_array.shape, conversions_array[control_index]),
+        visitors_array, conversions_array, prior_alpha, prior_beta,
+    )
+    beats_control = against_control["probability_b_beats_a"]
+    beats_control[control_index] = np.nan
+
+    alpha, beta = posterior_parameters(visitors_array, conversions_array, prior_alpha, prior_beta)
+    rng = np.random.default_rng(MONTE_CARLO_SEED)
+    draws = rng.beta(alpha, beta, size=(MONTE_CARLO_SAMPLES, alpha.shape[0]))
+    best = draws.max(axis=1, keepdims=True)
+    probability_best = np.bincount(draws.argmax(axis=1), minlength=alpha.shape[0]) / MONTE_CARLO_SAMPLES
+    return {
+        "probability_beats_control": tuple(beats_control.tolist()),
+        "probability_best": tuple(probability_best.tolist()),
+        "expected_loss": tuple((best - draws).mean(axis=0).tolist()),
+        "prior_alpha": float(prior_alpha),
+        "prior_beta": float(prior_beta),
+    }
+
@@ -0,0 +1,320 @@
+"""
+Intervalos de confiança por bootstrap para o uplift (absoluto e relativo).
+
+Os intervalos de Wald (_calculate_upper_bound/_calculate_lower_bound) se comportam mal
+com taxas de conversão baixas. Aqui as réplicas são sorteadas diretamente a partir das
+contagens agregadas, sem laço em Python:
+
+- "binomial": bootstrap paramétrico, conversões* ~ Binomial(visitantes, taxa observada);
+- "poisson": bootstrap de Poisson, cada visitante recebe peso Poisson(1), o que equivale
+  a conversões* ~ Poisson(c) e não conversões* ~ Poisson(n - c).
+
+As réplicas são geradas em blocos que respeitam um orçamento fixo de memória, e nenhum
+bloco é guardado: cada um é reduzido assim que sorteado (contagens, mínimo e máximo
+para a correção de viés do BCa, depois histogramas para localizar os quantis) e as
+reduções são somadas. Cada bloco tem a sua semente derivada (SeedSequence.spawn), então
+os passes seguintes sorteiam exatamente as mesmas réplicas, e o resultado é o mesmo com
+ou sem paralelismo e com qualquer número de processos. Os quantis são exatos (iguais ao
+np.quantile sobre todas as réplicas), ao custo de alguns passes de sorteio.
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple
+import numpy as np
+from scipy.stats import norm
+from domain.entities.variation import Variation
+
+BOOTSTRAP_METHODS = ("binomial", "poisson")
+
+# Bytes de trabalho por réplica (sorteios, taxas, estatísticas e chaves de ordenação em 64 bits)
+_BYTES_PER_REPLICATE = 32 * 8
+# Bins dos histogramas que localizam os quantis a cada passe
+_HISTOGRAM_BINS = 4096
+
+
+def _draw_chunk(method: str, seed: np.random.SeedSequence, size: int,
+                counts: Tuple[int, int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sorteia `size` réplicas e devolve o uplift absoluto e relativo de cada uma
+    (NaN no relativo quando a taxa do controle sorteada é zero).
+    """
+    visitors_a, conversions_a, visitors_b, conversions_b = counts
+    rng = np.random.default_rng(seed)
+    if method == "binomial":
+        rate_a = conversions_a / visitors_a
+        rate_b = conversions_b / visitors_b
+        draws = rng.binomial([visitors_a, visitors_b], [rate_a, rate_b], size=(size, 2))
+        rates = draws / np.array([visitors_a, visitors_b])
+    else:
+        means = [conversions_a, visitors_a - conversions_a, conversions_b, visitors_b - conversions_b]
+        draws = rng.poisson(means, size=(size, 4))
+        converted = draws[:, [0, 2]]
+        totals = converted + draws[:, [1, 3]]
+        rates = np.divide(converted, totals, out=np.zeros(converted.shape), where=totals != 0)
+
+    absolute = rates[:, 1] - rates[:, 0]
+    relative = np.divide(absolute, rates[:, 0], out=np.full(size, np.nan), where=rates[:, 0] != 0)
+    return absolute, relative
+
+
+def _lift(visitors_a: float, conversions_a: float, visitors_b: float, conversions_b: float) -> Tuple[float, float]:
+    rate_a = conversions_a / visitors_a if visitors_a else 0.0
+    rate_b = conversions_b / visitors_b if visitors_b else 0.0
+    absolute = rate_b - rate_a
+    return absolute, (absolute / rate_a if rate_a else math.nan)
+
+
+def _jackknife_acceleration(counts: Tuple[int, int, int, int]) -> Tuple[float, float]:
+    """
+    Aceleração do BCa pelo jackknife sobre os visitantes. Com dados agregados só existem
+    quatro valores leave-one-out distintos (remover um convertido ou um não convertido de
+    cada braço), ponderados pelas suas multiplicidades.
+
+    Returns:
+        A aceleração do uplift absoluto e do relativo.
+    """
+    visitors_a, conversions_a, visitors_b, conversions_b = counts
+    cases = [
+        (conversions_a, (visitors_a - 1, conversions_a - 1, visitors_b, conversions_b)),
+        (visitors_a - conversions_a, (visitors_a - 1, conversions_a, visitors_b, conversions_b)),
+        (conversions_b, (visitors_a, conversions_a, visitors_b - 1, conversions_b - 1)),
+        (visitors_b - conversions_b, (visitors_a, conversions_a, visitors_b - 1, conversions_b)),
+    ]
+    weights = np.array([weight for weight, _ in cases], dtype=np.float64)
+    values = np.array([_lift(*leave_one_out) if weight > 0 else (0.0, 0.0) for weight, leave_one_out in cases])
+
+    accelerations = []
+    for column in range(2):
+        estimates = values[:, column]
+        if not np.isfinite(estimates[weights > 0]).all():
+            accelerations.append(0.0)
+            continue
+        mean = np.sum(weights * estimates) / weights.sum()
+        deviations = mean - estimates
+        denominator = 6 * np.sum(weights * deviations ** 2) ** 1.5
+        accelerations.append(float(np.sum(weights * deviations ** 3) / denominator) if denominator > 0 else 0.0)
+    return accelerations[0], accelerations[1]
+
+
+def _sort_keys(values: np.ndarray) -> np.ndarray:
+    """ Chaves inteiras com a mesma ordem dos floats (finitos), para bins exatos. """
+    bits = values.view(np.int64)
+    return np.where(bits < 0, -(bits & np.int64(0x7FFF_FFFF_FFFF_FFFF)), bits)
+
+
+def _from_key(key: int) -> float:
+    """ Inverso de _sort_keys para uma chave. """
+    bits = key if key >= 0 else (-key) | (1 << 63)
+    return float(np.array([bits], dtype=np.uint64).view(np.float64)[0])
+
+
+def _reduce_chunk(method: str, seed: np.random.SeedSequence, size: int, counts: Tuple[int, int, int, int],
+                  estimates: Tuple[float, float], requests: List[tuple] | None) -> List[Any]:
+    """
+    Sorteia um bloco e devolve apenas a sua redução (o bloco é descartado).
+
+    Sem `requests`: para cada estatística, (réplicas finitas, abaixo da estimativa,
+    iguais à estimativa, menor chave, maior chave). Com `requests`, cada pedido
+    (estatística, menor chave, maior chave, largura do bin, coletar) devolve o
+    histograma das réplicas no intervalo ou, se `coletar`, as próprias réplicas.
+    """
+    statistics = [values[np.isfinite(values)] for values in _draw_chunk(method, seed, size, counts)]
+    if requests is None:
+        summary = []
+        for values, estimate in zip(statistics, estimates):
+            keys = _sort_keys(values)
+            summary.append((
+                values.size,
+                int(np.count_nonzero(values < estimate)),
+                int(np.count_nonzero(values == estimate)),
+                int(keys.min()) if keys.size else None,
+                int(keys.max()) if keys.size else None,
+            ))
+        return summary
+
+    keys = [_sort_keys(values) for values in statistics]
+    results = []
+    for statistic, low, high, width, collect in requests:
+        inside = (keys[statistic] >= low) & (keys[statistic] <= high)
+        if collect:
+            results.append(statistics[statistic][inside])
+        else:
+            # Diferença em uint64: o intervalo de chaves pode passar de 2^63
+            offsets = (keys[statistic][inside] - np.int64(low)).view(np.uint64)
+            results.append(np.bincount((offsets // np.uint64(width)).astype(np.int64), minlength=_HISTOGRAM_BINS))
+    return results
+
+
+def _quantile_ranks(size: int, levels: np.ndarray) -> List[Tuple[int, int, float]]:
+    """ Posições vizinhas e peso da interpolação linear de cada quantil (como o np.quantile). """
+    positions = (size - 1) * np.asarray(levels, dtype=np.float64)
+    lower = np.floor(positions).astype(np.int64)
+    return [(int(k), int(min(k + 1, size - 1)), float(h - k)) for k, h in zip(lower, positions)]
+
+
+class BootstrapEngine:
+    """
+    Gera as réplicas do bootstrap em blocos (memória fixa) e calcula os intervalos
+    percentil e BCa do uplift absoluto e relativo.
+    """
+    def __init__(self,
+                 replicates: int = 10_000,
+                 seed: int | None = None,
+                 method: str = "binomial",
+                 max_bytes: int = 32 * 1024 * 1024,
+                 workers: int = 1) -> None:
+        """
+        Args:
+            replicates: Número de réplicas do bootstrap.
+            seed: Semente para resultados reproduzíveis (None = aleatória).
+            method: "binomial" (paramétrico) ou "poisson".
+            max_bytes: Orçamento de memória de trabalho (por processo), independente
+                do número de réplicas.
+            workers: Número de processos usados para sortear os blocos (1 = sem paralelismo).
+        """
+        if method not in BOOTSTRAP_METHODS:
+            raise ValueError(f"Método de bootstrap desconhecido: {method}. Use {', '.join(BOOTSTRAP_METHODS)}.")
+        if replicates < 1 or workers < 1:
+            raise ValueError("O número de réplicas e de workers deve ser pelo menos 1.")
+        self.replicates = replicates
+        self.seed = seed
+        self.method = method
+        self.chunk_size = max(1, max_bytes // _BYTES_PER_REPLICATE)
+        self.workers = workers
+
+    def _chunk_sizes(self) -> List[int]:
+        full_chunks, remainder = divmod(self.replicates, self.chunk_size)
+        return [self.chunk_size] * full_chunks + ([remainder] if remainder else [])
+
+    def _reduce(self, executor: ProcessPoolExecutor | None, counts: Tuple[int, int, int, int],
+                estimates: Tuple[float, float], requests: List[tuple] | None) -> Iterator[List[Any]]:
+        """
+        Um passe sobre todos os blocos (as mesmas réplicas a cada passe), entregando a
+        redução de cada bloco à medida que fica pronta, para ser somada e descartada.
+        """
+        sizes = self._chunk_sizes()
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        arguments = [(self.method, seed, size, counts, estimates, requests) for seed, size in zip(seeds, sizes)]
+        if executor is not None:
+            return executor.map(_reduce_chunk, *zip(*arguments))
+        return (_reduce_chunk(*argument) for argument in arguments)
+
+    def _select(self, executor: ProcessPoolExecutor | None, counts: Tuple[int, int, int, int],
+                estimates: Tuple[float, float], bounds: List[tuple], targets: set) -> Dict[Tuple[int, int], float]:
+        """
+        Valor de cada (estatística, posição) na ordem das réplicas finitas. Cada passe
+        estreita o intervalo de chaves de cada posição ao bin que a contém, até que as
+        réplicas do intervalo caibam no orçamento e possam ser coletadas e ordenadas.
+        """
+        # (estatística, posição) -> [menor chave, maior chave, réplicas abaixo do intervalo, réplicas no intervalo]
+        pending = {target: [bounds[target[0]][0], bounds[target[0]][1], 0, bounds[target[0]][2]] for target in targets}
+        selected: Dict[Tuple[int, int], float] = {}
+        collect_limit = max(1, self.chunk_size // max(1, len(pending)))
+        while pending:
+            requests = sorted({(statistic, low, high, max(1, (high - low) // _HISTOGRAM_BINS + 1),
+                                inside <= collect_limit)
+                               for (statistic, _), (low, high, _, inside) in pending.items()})
+            reductions = {request: [] if request[4] else np.zeros(_HISTOGRAM_BINS, dtype=np.int64)
+                          for request in requests}
+            for chunk in self._reduce(executor, counts, estimates, requests):
+                for request, part in zip(requests, chunk):
+                    if request[4]:
+                        reductions[request].append(part)
+                    else:
+                        reductions[request] += part
+            for request in requests:
+                if request[4]:
+                    reductions[request] = np.sort(np.concatenate(reductions[request]))
+
+            for target in list(pending):
+                low, high, below, inside = pending[target]
+                width = max(1, (high - low) // _HISTOGRAM_BINS + 1)
+                reduction = reductions[(target[0], low, high, width, inside <= collect_limit)]
+                if inside <= collect_limit:
+                    selected[target] = float(reduction[target[1] - below])
+                    del pending[target]
+                    continue
+                cumulative = np.cumsum(reduction)
+                bin_index = int(np.searchsorted(cumulative, target[1] - below, side="right"))
+                new_low = low + bin_index * width
+                new_high = min(high, new_low + width - 1)
+                if new_low == new_high:
+                    # Bin de uma única chave: todas as réplicas dele são iguais (empates)
+                    selected[target] = _from_key(new_low)
+                    del pending[target]
+                    continue
+                pending[target] = [
+                    new_low,
+                    new_high,
+                    below + (int(cumulative[bin_index - 1]) if bin_index else 0),
+                    int(reduction[bin_index]),
+                ]
+        return selected
+
+    def run(self, variation: Variation) -> Dict[str, Any]:
+        """
+        Calcula os intervalos no nível de confiança da variação.
+
+        Returns:
+            'absolute_lift' e 'relative_lift', cada um com 'estimate', 'percentile' e 'bca'
+            ({'lower', 'upper'}), além de 'replicates' e 'method'.
+        """
+        counts = (int(variation.variation_a_visitors), int(variation.conversions_a),
+                  int(variation.variation_b_visitors), int(variation.conversions_b))
+        if counts[0] <= 0 or counts[2] <= 0:
+            raise ValueError("Os dois braços precisam de visitantes para o bootstrap.")
+        estimates = _lift(*counts)
+        accelerations = _jackknife_acceleration(counts)
+        alpha = 1 - variation.confidence_level
+        z_limits = norm.ppf([alpha / 2, 1 - alpha / 2])
+
+        executor = (ProcessPoolExecutor(max_workers=min(self.workers, len(self._chunk_sizes())))
+                    if self.workers > 1 and len(self._chunk_sizes()) > 1 else None)
+        try:
+            # Passe 1: contagens para a correção de viés e o intervalo de chaves de cada estatística
+            # (réplicas finitas, abaixo, iguais, menor chave, maior chave) de cada estatística
+            totals = [[0, 0, 0, None, None], [0, 0, 0, None, None]]
+            for chunk in self._reduce(executor, counts, estimates, None):
+                for total, (size, below, equal, low, high) in zip(totals, chunk):
+                    if size:
+                        total[:3] = total[0] + size, total[1] + below, total[2] + equal
+                        total[3] = low if total[3] is None else min(total[3], low)
+                        total[4] = high if total[4] is None else max(total[4], high)
+            bounds, levels = [], []
+            for statistic, (size, below, equal, low, high) in enumerate(totals):
+                bounds.append((low, high, size))
+                if not size or not math.isfinite(estimates[statistic]):
+                    levels.append(None)
+                    continue
+                # Correção de viés: fração das réplicas abaixo da estimativa (empates contam metade)
+                below = (below + 0.5 * equal) / size
+                bias = norm.ppf(np.clip(below, 1 / (size + 1), size / (size + 1)))
+                acceleration = accelerations[statistic]
+                adjusted = norm.cdf(bias + (bias + z_limits) / (1 - acceleration * (bias + z_limits)))
+                levels.append(_quantile_ranks(size, [alpha / 2, 1 - alpha / 2, *np.clip(adjusted, 0, 1)]))
+
+            # Passes seguintes: as réplicas nas posições dos quantis
+            targets = {(statistic, rank) for statistic, ranks in enumerate(levels) if ranks
+                       for lower, upper, _ in ranks for rank in (lower, upper)}
+            selected = self._select(executor, counts, estimates, bounds, targets)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        results = {}
+        for statistic, name in enumerate(("absolute_lift", "relative_lift")):
+            if levels[statistic] is None:
+                nan_interval = {"lower": math.nan, "upper": math.nan}
+                results[name] = {"estimate": estimates[statistic], "percentile": nan_interval,
+                                 "bca": dict(nan_interval)}
+                continue
+            values = [selected[(statistic, lower)] + weight * (selected[(statistic, upper)] - selected[(statistic, lower)])
+                      for lower, upper, weight in levels[statistic]]
+            results[name] = {
+                "estimate": float(estimates[statistic]),
+                "percentile": {"lower": values[0], "upper": values[1]},
+                "bca": {"lower": values[2], "upper": values[3]},
+            }
+        results["replicates"] = self.replicates
+        results["method"] = self.method
+        return results
@@ -0,0 +1,114 @@
+"""
+Validador de testes A/B com métrica contínua (ex: receita por visitante, ticket médio).
+
+Herda o grafo de métricas do ABStatisticalValidator e troca apenas os nós que dependem
+da distribuição: o z-score vira a estatística t de Welch, o p-valor e o valor crítico
+vêm da distribuição t com os graus de liberdade de Welch-Satterthwaite, o planejamento
+usa o tamanho de amostra para diferença de médias e a leitura bayesiana usa a
+aproximação normal da diferença (priori plana). SRM, análise temporal e teste
+sequencial são os mesmos, e o dicionário de resultados tem as mesmas chaves.
+"""
+import math
+from datetime import date
+from typing import Any, Dict
+from scipy.special import ndtr, stdtr, stdtrit
+from domain.entities.ab_tester import ABTester
+from domain.entities.continuous_variation import ContinuousVariation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.power_analysis import required_sample_size_means
+
+
+class ContinuousStatisticalValidator(ABStatisticalValidator):
+    METRIC_GRAPH = {
+        **ABStatisticalValidator.METRIC_GRAPH,
+        "degrees_of_freedom": ((), lambda self: self._calculate_degrees_of_freedom()),
+        "z_critical": (("degrees_of_freedom",), lambda self, df: self._calculate_t_critical(df)),
+        "p_value": (("z_score", "degrees_of_freedom"), lambda self, t_score, df: self._calculate_t_p_value(t_score, df)),
+        "bayesian_results": ((), lambda self: self._calculate_normal_bayesian_results()),
+    }
+
+    # Mesmas chaves do validador binomial; os graus de liberdade ficam em get_metric()
+    DEFAULT_METRICS = ABStatisticalValidator.DEFAULT_METRICS
+
+    def __init__(self, variation: ContinuousVariation, tester: ABTester, today: date | None = None,
+                 backend: str | None = None) -> None:
+        super().__init__(variation=variation, tester=tester, today=today, backend=backend)
+
+    def _calculate_degrees_of_freedom(self) -> float:
+        """
+        Graus de liberdade de Welch-Satterthwaite:
+        (s_A² + s_B²)² / (s_A⁴ / (n_A - 1) + s_B⁴ / (n_B - 1)), com s² = variância / n.
+        """
+        variation = self.variation
+        squared_a = variation.default_error_a ** 2
+        squared_b = variation.default_error_b ** 2
+        denominator = 0.0
+        if variation.variation_a_visitors > 1:
+            denominator += squared_a ** 2 / (variation.variation_a_visitors - 1)
+        if variation.variation_b_visitors > 1:
+            denominator += squared_b ** 2 / (variation.variation_b_visitors - 1)
+        if denominator == 0:
+            return math.inf
+        return float((squared_a + squared_b) ** 2 / denominator)
+
+    def _calculate_t_critical(self, degrees_of_freedom: float) -> float:
+        """ Quantil 1 - α / caudas da distribuição t (normal com infinitos graus de liberdade). """
+        tail = int(self.variation.tail_numbers)
+        if tail not in (1, 2):
+            raise ValueError("Número de caudas deve ser 1 ou 2.")
+        alpha = 1 - self.variation.confidence_level
+        return float(stdtrit(degrees_of_freedom, 1 - alpha / tail))
+
+    def _calculate_t_p_value(self, t_score: float, degrees_of_freedom: float) -> float:
+        """ P-valor do teste t de Welch. """
+        tail = int(self.variation.tail_numbers)
+        if tail == 1:
+            return float(stdtr(degrees_of_freedom, -t_score))
+        elif tail == 2:
+            return float(2 * stdtr(degrees_of_freedom, -abs(t_score)))
+        raise ValueError("Número de caudas deve ser 1 ou 2.")
+
+    def _calculate_normal_bayesian_results(self) -> Dict[str, Any]:
+        """
+        Probabilidade de B superar A e perdas esperadas com a posteriori normal da
+        diferença de médias, N(média_B - média_A, erro padrão²).
+        """
+        difference = self.variation.mean_b - self.variation.mean_a
+        scale = self.get_metric("standard_error_difference")
+        if scale == 0:
+            return {
+                "probability_b_beats_a": 0.5 if difference == 0 else float(difference > 0),
+                "expected_loss_a": max(difference, 0.0),
+                "expected_loss_b": max(-difference, 0.0),
+                "bayesian_method": "normal",
+            }
+        standardized = difference / scale
+        density = math.exp(-0.5 * standardized ** 2) / math.sqrt(2 * math.pi)
+        return {
+            "probability_b_beats_a": float(ndtr(standardized)),
+            "expected_loss_a": float(difference * ndtr(standardized) + scale * density),
+            "expected_loss_b": float(-difference * ndtr(-standardized) + scale * density),
+            "bayesian_method": "normal",
+        }
+
+    def get_bayesian_results(self, prior_alpha: float = 1.0, prior_beta: float = 1.0) -> Dict[str, Any]:
+        """ Leitura bayesiana com priori plana (a priori Beta não se aplica a médias). """
+        return self.get_metric("bayesian_results")
+
+    def get_bootstrap_intervals(self, *args, **kwargs) -> Dict[str, Any]:
+        raise ValueError("O bootstrap paramétrico de conversões não se aplica a métricas contínuas.")
+
+    def _calculate_required_users(self, p_control: float, mde: float, power: float) -> int:
+        """
+        Total de usuários (divisão 50/50) para detectar o MDE na média do controle,
+        com os desvios padrão observados em cada braço.
+        """
+        return int(required_sample_size_means(
+            mean_control=p_control,
+            standard_deviation_control=self.variation.standard_deviation_a,
+            standard_deviation_variant=self.variation.standard_deviation_b,
+            mde=mde,
+            alpha=1 - self.variation.confidence_level,
+            power=power,
+            tails=int(self.variation.tail_numbers),
+        )["total_users"])
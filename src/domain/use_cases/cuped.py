@@ -0,0 +1,133 @@
+"""
+Redução de variância com covariável pré-experimento (CUPED, Deng et al., 2013).
+
+A métrica de cada usuário é ajustada por Y' = Y - θ (X - média_X), em que X é o mesmo
+comportamento medido antes do teste (ex: compras do mês anterior) e
+θ = Cov(X, Y) / Var(X). Como X não é afetado pelo tratamento, o ajuste não muda o
+efeito esperado e reduz a variância por um fator (1 - ρ²), com ρ a correlação entre
+X e Y. Menos variância significa intervalos mais estreitos e menos usuários (e dias)
+para atingir o mesmo poder.
+
+Tudo sai das estatísticas suficientes de cada braço (StreamingCovariance): θ usa os
+co-momentos dentro de cada braço somados, para que o efeito do tratamento em Y não
+contamine a estimativa, e a análise ajustada reaproveita o ContinuousStatisticalValidator.
+"""
+from datetime import date
+from functools import cached_property
+from typing import Any, Dict
+from domain.entities.ab_tester import ABTester
+from domain.entities.continuous_variation import ContinuousVariation, StreamingCovariance
+from domain.use_cases.continuous_validator import ContinuousStatisticalValidator
+
+
+class CupedAnalysis:
+    """
+    Compara a análise da métrica bruta com a análise ajustada pelo CUPED.
+    """
+    def __init__(self, covariance_a: StreamingCovariance, covariance_b: StreamingCovariance,
+                 tester: ABTester, tail_numbers: int, confidence_level: float, estimated_uplift: float,
+                 today: date | None = None) -> None:
+        """
+        Args:
+            covariance_a, covariance_b: Pares (covariável, métrica) do controle e da variação.
+            confidence_level: Nível de confiança em porcentagem (ex: 95.0).
+            estimated_uplift: MDE relativo em porcentagem (ex: 10.0).
+        """
+        self.covariance_a = covariance_a
+        self.covariance_b = covariance_b
+        self.tester = tester
+        self.tail_numbers = tail_numbers
+        self.confidence_level = confidence_level
+        self.estimated_uplift = estimated_uplift
+        self.today = today
+
+    @cached_property
+    def theta(self) -> float:
+        """ θ = Σ co-momentos / Σ M2 da covariável, dentro de cada braço. """
+        m2_x = self.covariance_a.m2_x + self.covariance_b.m2_x
+        if m2_x <= 0:
+            return 0.0
+        return (self.covariance_a.comoment + self.covariance_b.comoment) / m2_x
+
+    def _adjusted_moments(self, covariance: StreamingCovariance, pooled_mean_x: float) -> tuple:
+        """ Média e variância de Y - θ (X - média_X) em um braço. """
+        theta = self.theta
+        mean = covariance.mean_y - theta * (covariance.mean_x - pooled_mean_x)
+        m2 = max(covariance.m2_y - 2 * theta * covariance.comoment + theta ** 2 * covariance.m2_x, 0.0)
+        variance = m2 / (covariance.count - 1) if covariance.count > 1 else 0.0
+        return mean, variance
+
+    def _variation(self, mean_a: float, mean_b: float, variance_a: float, variance_b: float) -> ContinuousVariation:
+        return ContinuousVariation(
+            variation_a_visitors=self.covariance_a.count,
+            variation_b_visitors=self.covariance_b.count,
+            mean_a=mean_a,
+            mean_b=mean_b,
+            variance_a=variance_a,
+            variance_b=variance_b,
+            tail_numbers=self.tail_numbers,
+            confidence_level=self.confidence_level,
+            estimated_uplift=self.estimated_uplift,
+        )
+
+    @cached_property
+    def unadjusted_variation(self) -> ContinuousVariation:
+        moments_a = self.covariance_a.moments_y
+        moments_b = self.covariance_b.moments_y
+        return self._variation(moments_a.mean, moments_b.mean, moments_a.variance, moments_b.variance)
+
+    @cached_property
+    def adjusted_variation(self) -> ContinuousVariation:
+        pooled_mean_x = StreamingCovariance().merge(self.covariance_a).merge(self.covariance_b).mean_x
+        mean_a, variance_a = self._adjusted_moments(self.covariance_a, pooled_mean_x)
+        mean_b, variance_b = self._adjusted_moments(self.covariance_b, pooled_mean_x)
+        return self._variation(mean_a, mean_b, variance_a, variance_b)
+
+    def _summarize(self, variation: ContinuousVariation, planning_variation: ContinuousVariation) -> Dict[str, Any]:
+        validator = ContinuousStatisticalValidator(variation, self.tester, today=self.today)
+        planning = ContinuousStatisticalValidator(planning_variation, self.tester, today=self.today)
+        standard_error = validator.get_metric("standard_error_difference")
+        z_critical = validator.get_metric("z_critical")
+        effect = variation.mean_b - variation.mean_a
+        return {
+            "mean_a": variation.mean_a,
+            "mean_b": variation.mean_b,
+            "effect": effect,
+            "uplift": validator.get_metric("conversion_rate_uplift"),
+            "standard_error": standard_error,
+            "effect_lower_bound": effect - z_critical * standard_error,
+            "effect_upper_bound": effect + z_critical * standard_error,
+            "t_score": validator.get_metric("z_score"),
+            "p_value": validator.get_metric("p_value"),
+            "planning_results": planning.get_metric("planning_results"),
+        }
+
+    def get_results(self) -> Dict[str, Any]:
+        """
+        Returns:
+            θ, correlação agrupada, redução da variância do efeito (1 - EP² ajustado /
+            EP² bruto), os resultados 'unadjusted' e 'adjusted' (efeito, EP, IC, t,
+            p-valor e planejamento) e os dias economizados para 80% e 95% de poder.
+        """
+        raw = self.unadjusted_variation
+        cuped = self.adjusted_variation
+        unadjusted = self._summarize(raw, raw)
+        # O MDE relativo continua ancorado na média bruta do controle: o ajuste muda a
+        # variância, não a linha de base do negócio
+        adjusted = self._summarize(cuped, self._variation(raw.mean_a, raw.mean_b, cuped.variance_a, cuped.variance_b))
+        raw_variance = unadjusted["standard_error"] ** 2
+        variance_reduction = 1 - adjusted["standard_error"] ** 2 / raw_variance if raw_variance > 0 else 0.0
+        m2_x = self.covariance_a.m2_x + self.covariance_b.m2_x
+        m2_y = self.covariance_a.m2_y + self.covariance_b.m2_y
+        comoment = self.covariance_a.comoment + self.covariance_b.comoment
+        return {
+            "theta": self.theta,
+            "correlation": comoment / (m2_x * m2_y) ** 0.5 if m2_x > 0 and m2_y > 0 else 0.0,
+            "variance_reduction": variance_reduction,
+            "unadjusted": unadjusted,
+            "adjusted": adjusted,
+            "days_saved_80_power": (unadjusted["planning_results"]["required_days_80_power"]
+                                    - adjusted["planning_results"]["required_days_80_power"]),
+            "days_saved_95_power": (unadjusted["planning_results"]["required_days_95_power"]
+                                    - adjusted["planning_results"]["required_days_95_power"]),
+        }
@@ -0,0 +1,289 @@
+"""
+Desenho sequencial em grupos (group-sequential) com gasto de alfa (Lan-DeMets).
+
+O teste é planejado com K análises interinas igualmente espaçadas (ex: uma por semana
+durante 6 semanas). As fronteiras de cada análise dependem da distribuição conjunta
+das estatísticas Z acumuladas, calculada aqui pela recursão numérica de Armitage,
+McPherson e Rowe sobre uma grade (equivalente à integração normal multivariada).
+
+Esse cálculo é caro, então as fronteiras e os fatores de tamanho de amostra ficam em
+tabelas pré-computadas indexadas por (K, alfa, função de gasto, caudas). A grade
+padrão vem gerada em group_sequential_table (cerca de 100 s de cálculo, regenerada
+com `python -m domain.use_cases.group_sequential`), e outras chaves são calculadas
+na primeira consulta. Uma análise interina passa a ser apenas uma consulta à tabela
+seguida de uma comparação.
+"""
+import math
+import pprint
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+from scipy.optimize import brentq
+from scipy.stats import norm
+from domain.use_cases import group_sequential_table
+
+SPENDING_FUNCTIONS = ("obrien_fleming", "pocock")
+
+# Pontos da grade usada na integração numérica em cada análise
+GRID_POINTS = 401
+# Extensão da grade (em desvios padrão) no lado sem fronteira dos testes unicaudais
+_GRID_EXTENT = 8.0
+
+BoundaryKey = Tuple[int, float, str, int]
+
+# Tabela pré-computada: (K, alfa, gasto, caudas) -> fronteiras Z de cada análise
+BOUNDARY_TABLE: Dict[BoundaryKey, Tuple[float, ...]] = dict(group_sequential_table.BOUNDARIES)
+# Fatores de tamanho de amostra: (K, alfa, gasto, caudas) -> {poder: fatores}
+SAMPLE_SIZE_TABLE: Dict[BoundaryKey, Dict[float, Dict[str, float]]] = {
+    key: {power: dict(factors) for power, factors in by_power.items()}
+    for key, by_power in group_sequential_table.SAMPLE_SIZE_FACTORS.items()
+}
+# Poderes usados no planejamento (80% e 95%, como no desenho fixo)
+PLANNING_POWERS = (0.80, 0.95)
+_TABLE_LOCK = threading.Lock()
+
+
+def _boundary_key(looks: int, alpha: float, spending: str, tails: int) -> BoundaryKey:
+    if looks < 1:
+        raise ValueError("O número de análises deve ser pelo menos 1.")
+    if not 0 < alpha < 1:
+        raise ValueError("Alfa deve estar entre 0 e 1.")
+    if spending not in SPENDING_FUNCTIONS:
+        raise ValueError(f"Função de gasto desconhecida: {spending}. Use {', '.join(SPENDING_FUNCTIONS)}.")
+    if tails not in (1, 2):
+        raise ValueError("Número de caudas deve ser 1 ou 2.")
+    return int(looks), round(float(alpha), 6), spending, int(tails)
+
+
+def information_fractions(looks: int) -> np.ndarray:
+    """ Frações de informação das análises igualmente espaçadas: 1/K, 2/K, ..., 1. """
+    return np.arange(1, looks + 1) / looks
+
+
+def cumulative_alpha_spent(fractions: np.ndarray, alpha: float, spending: str) -> np.ndarray:
+    """
+    Alfa acumulado gasto até cada fração de informação (funções de Lan-DeMets).
+    `alpha` é o alfa total do teste, seja ele uni ou bicaudal.
+    """
+    if spending == "obrien_fleming":
+        return 2 * norm.sf(norm.isf(alpha / 2) / np.sqrt(fractions))
+    return alpha * np.log(1 + (math.e - 1) * fractions)
+
+
+def _crossing_probability(grid: np.ndarray, density: np.ndarray, bound: float, mean_shift: float,
+                          step_sd: float, tails: int) -> float:
+    """
+    Probabilidade de continuar até a análise anterior e cruzar a fronteira (escala da soma S) agora.
+    """
+    upper = norm.sf((bound - grid - mean_shift) / step_sd)
+    if tails == 2:
+        upper = upper + norm.cdf((-bound - grid - mean_shift) / step_sd)
+    return float(np.trapezoid(density * upper, grid))
+
+
+def _sequential_recursion(fractions: np.ndarray, tails: int, drift: float = 0.0,
+                          bounds: Iterable[float] | None = None,
+                          alpha_increments: Iterable[float] | None = None) -> Tuple[List[float], List[float]]:
+    """
+    Recursão numérica sobre a soma acumulada S_k = Z_k * sqrt(t_k), cujos incrementos são
+    independentes N(drift * Δt, Δt).
+
+    Se `bounds` for omitido, cada fronteira é resolvida para gastar `alpha_increments[k]`.
+
+    Returns:
+        As fronteiras na escala Z e a probabilidade de parar em cada análise.
+    """
+    bounds = list(bounds) if bounds is not None else None
+    increments = list(alpha_increments) if alpha_increments is not None else None
+    solved: List[float] = []
+    stopping: List[float] = []
+    grid = density = None
+    previous_fraction = 0.0
+
+    for look, fraction in enumerate(fractions):
+        step = fraction - previous_fraction
+        step_sd = math.sqrt(step)
+        mean_shift = drift * step
+
+        if look == 0:
+            def crossing(z: float) -> float:
+                probability = norm.sf((z * step_sd - mean_shift) / step_sd)
+                if tails == 2:
+                    probability += norm.cdf((-z * step_sd - mean_shift) / step_sd)
+                return float(probability)
+        else:
+            def crossing(z: float, grid=grid, density=density) -> float:
+                return _crossing_probability(grid, density, z * math.sqrt(fraction), mean_shift, step_sd, tails)
+
+        if bounds is not None:
+            z_bound = bounds[look]
+        elif increments[look] <= 0:
+            z_bound = math.inf
+        else:
+            z_bound = brentq(lambda z: crossing(z) - increments[look], 1e-6, 40.0, xtol=1e-10)
+        solved.append(z_bound)
+        stopping.append(crossing(z_bound) if math.isfinite(z_bound) else 0.0)
+
+        # Densidade (não normalizada) de S_k na região de continuação
+        upper = min(z_bound, 40.0) * math.sqrt(fraction)
+        lower = -upper if tails == 2 else drift * fraction - _GRID_EXTENT * math.sqrt(fraction)
+        new_grid = np.linspace(lower, upper, GRID_POINTS)
+        if look == 0:
+            density = norm.pdf((new_grid - mean_shift) / step_sd) / step_sd
+        else:
+            kernel = norm.pdf((new_grid[:, None] - grid[None, :] - mean_shift) / step_sd) / step_sd
+            density = np.trapezoid(kernel * density[None, :], grid, axis=1)
+        grid = new_grid
+        previous_fraction = fraction
+
+    return solved, stopping
+
+
+def get_boundaries(looks: int, alpha: float, spending: str = "obrien_fleming", tails: int = 2) -> Tuple[float, ...]:
+    """
+    Fronteiras Z de eficácia de cada análise, lidas da tabela pré-computada
+    (e calculadas apenas na primeira vez para cada chave).
+    """
+    key = _boundary_key(looks, alpha, spending, tails)
+    boundaries = BOUNDARY_TABLE.get(key)
+    if boundaries is None:
+        boundaries = _compute_boundaries(key)
+        with _TABLE_LOCK:
+            boundaries = BOUNDARY_TABLE.setdefault(key, boundaries)
+    return boundaries
+
+
+def _compute_boundaries(key: BoundaryKey) -> Tuple[float, ...]:
+    looks, alpha, spending, tails = key
+    fractions = information_fractions(looks)
+    increments = np.diff(cumulative_alpha_spent(fractions, alpha, spending), prepend=0.0)
+    return tuple(_sequential_recursion(fractions, tails, alpha_increments=increments)[0])
+
+
+def get_sample_size_factors(looks: int, alpha: float, spending: str, tails: int, power: float) -> Dict[str, float]:
+    """
+    Fatores de tamanho de amostra do desenho em relação ao desenho fixo, lidos da
+    tabela pré-computada (e calculados apenas na primeira vez para cada chave e poder).
+    """
+    key = _boundary_key(looks, alpha, spending, tails)
+    if not 0 < power < 1:
+        raise ValueError("O poder deve estar entre 0 e 1.")
+    power = round(float(power), 6)
+    factors = SAMPLE_SIZE_TABLE.get(key, {}).get(power)
+    if factors is None:
+        factors = _sample_size_factors(key, power)
+        with _TABLE_LOCK:
+            factors = SAMPLE_SIZE_TABLE.setdefault(key, {}).setdefault(power, factors)
+    return dict(factors)
+
+
+def precompute_boundary_table(looks: Iterable[int] = range(2, 11),
+                              alphas: Iterable[float] = (0.01, 0.05, 0.10),
+                              spendings: Iterable[str] = SPENDING_FUNCTIONS,
+                              tails: Iterable[int] = (1, 2),
+                              powers: Iterable[float] = PLANNING_POWERS) -> int:
+    """
+    Garante nas tabelas as combinações mais usadas (fronteiras e fatores de tamanho de
+    amostra de cada poder). Chamado na inicialização do app e da API: com a grade
+    padrão já gerada, só calcula o que faltar.
+
+    Returns:
+        O número de entradas da tabela de fronteiras.
+    """
+    powers = tuple(powers)
+    for looks_count in looks:
+        for alpha in alphas:
+            for spending in spendings:
+                for tail in tails:
+                    get_boundaries(looks_count, alpha, spending, tail)
+                    for power in powers:
+                        get_sample_size_factors(looks_count, alpha, spending, tail, power)
+    return len(BOUNDARY_TABLE)
+
+
+def write_table_module(path: str | Path = Path(__file__).with_name("group_sequential_table.py")) -> int:
+    """
+    Recalcula a grade padrão (sem usar as tabelas carregadas) e grava o módulo
+    group_sequential_table. Rodar novamente ao mudar GRID_POINTS ou as funções de gasto.
+    """
+    with _TABLE_LOCK:
+        BOUNDARY_TABLE.clear()
+        SAMPLE_SIZE_TABLE.clear()
+    entries = precompute_boundary_table()
+    Path(path).write_text(
+        '"""\n'
+        "Tabelas pré-computadas do desenho sequencial em grupos (grade padrão de\n"
+        "precompute_boundary_table). Arquivo gerado por\n"
+        "`python -m domain.use_cases.group_sequential`; não edite à mão.\n"
+        '"""\n'
+        f"BOUNDARIES = {pprint.pformat(BOUNDARY_TABLE, width=110)}\n\n"
+        f"SAMPLE_SIZE_FACTORS = {pprint.pformat(SAMPLE_SIZE_TABLE, width=110)}\n",
+        encoding="utf-8",
+    )
+    return entries
+
+
+class GroupSequentialDesign:
+    """
+    Desenho com K análises interinas igualmente espaçadas e fronteiras de eficácia.
+    """
+    def __init__(self, looks: int, alpha: float = 0.05, spending: str = "obrien_fleming", tails: int = 2) -> None:
+        self.looks, self.alpha, self.spending, self.tails = _boundary_key(looks, alpha, spending, tails)
+        self.fractions = information_fractions(self.looks)
+        self.boundaries = get_boundaries(self.looks, self.alpha, self.spending, self.tails)
+
+    def crosses_boundary(self, look: int, z_score: float) -> bool:
+        """
+        Análise interina: compara o z-score acumulado com a fronteira da análise `look` (1..K).
+        """
+        if not 1 <= look <= self.looks:
+            raise ValueError(f"A análise deve estar entre 1 e {self.looks}.")
+        statistic = abs(z_score) if self.tails == 2 else z_score
+        return bool(statistic >= self.boundaries[look - 1])
+
+    def nominal_p_values(self) -> List[float]:
+        """ P-valor nominal equivalente a cada fronteira. """
+        return [float(self.tails * norm.sf(bound)) for bound in self.boundaries]
+
+    def stopping_probabilities(self, drift: float) -> List[float]:
+        """
+        Probabilidade de parar em cada análise quando o efeito padronizado (no tamanho
+        máximo da amostra) é `drift`.
+        """
+        return _sequential_recursion(self.fractions, self.tails, drift=drift, bounds=self.boundaries)[1]
+
+    def expected_sample_fraction(self, power: float) -> Dict[str, float]:
+        """
+        Tamanho da amostra em relação ao desenho fixo com o mesmo alfa e poder:
+        máximo ('inflation') e esperado sob a hipótese alternativa (efeito igual ao MDE)
+        e sob a hipótese nula, lidos da tabela pré-computada.
+        """
+        return get_sample_size_factors(self.looks, self.alpha, self.spending, self.tails, power)
+
+
+def _sample_size_factors(key: BoundaryKey, power: float) -> Dict[str, float]:
+    looks, alpha, spending, tails = key
+    fractions = information_fractions(looks)
+    boundaries = get_boundaries(*key)
+
+    def stopping_probabilities(drift: float) -> List[float]:
+        return _sequential_recursion(fractions, tails, drift=drift, bounds=boundaries)[1]
+
+    def expected(stopping: List[float]) -> float:
+        stopped_early = sum(stopping[:-1])
+        return float(sum(t * p for t, p in zip(fractions[:-1], stopping[:-1])) + (1 - stopped_early))
+
+    fixed_drift = norm.isf(alpha / tails) + norm.ppf(power)
+    drift = brentq(lambda value: sum(stopping_probabilities(value)) - power,
+                   fixed_drift * 0.5, fixed_drift * 2.0, xtol=1e-8)
+    inflation = float((drift / fixed_drift) ** 2)
+    return {
+        "inflation": inflation,
+        "alternative": inflation * expected(stopping_probabilities(drift)),
+        "null": inflation * expected(stopping_probabilities(0.0)),
+    }
+
+
+if __name__ == "__main__":
+    print(f"{write_table_module()} entradas gravadas em group_sequential_table.py")
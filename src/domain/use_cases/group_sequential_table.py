@@ -0,0 +1,1242 @@
+"""
+Tabelas pré-computadas do desenho sequencial em grupos (grade padrão de
+precompute_boundary_table). Arquivo gerado por
+`python -m domain.use_cases.group_sequential`; não edite à mão.
+"""
+BOUNDARIES = {(2, 0.01, 'obrien_fleming', 1): (3.4603698571586894, 2.32982598099935),
+ (2, 0.01, 'obrien_fleming', 2): (3.6427727354237995, 2.5796647379876645),
+ (2, 0.01, 'pocock', 1): (2.5004863813065614, 2.565032004717419),
+ (2, 0.01, 'pocock', 2): (2.7369514150069207, 2.8112673054055537),
+ (2, 0.05, 'obrien_fleming', 1): (2.5379876034436735, 1.662096515300539),
+ (2, 0.05, 'obrien_fleming', 2): (2.77180764870081, 1.9793089491886007),
+ (2, 0.05, 'pocock', 1): (1.8662138601353377, 1.8848681420673108),
+ (2, 0.05, 'pocock', 2): (2.1569992183446822, 2.200975450021842),
+ (2, 0.1, 'obrien_fleming', 1): (2.053557827262489, 1.3164477755618829),
+ (2, 0.1, 'obrien_fleming', 2): (2.3261743073533507, 1.684507492748995),
+ (2, 0.1, 'pocock', 1): (1.5381051729514454, 1.5160822662794),
+ (2, 0.1, 'pocock', 2): (1.8662138601353377, 1.8848737220190852),
+ (3, 0.01, 'obrien_fleming', 1): (4.310615464540515, 2.9471702393538584, 2.3460523177991677),
+ (3, 0.01, 'obrien_fleming', 2): (4.461467225380411, 3.155356367778781, 2.5972413998135164),
+ (3, 0.01, 'pocock', 1): (2.609908342005266, 2.645463355946899, 2.6585539311404522),
+ (3, 0.01, 'pocock', 2): (2.838802024530216, 2.884321318935332, 2.90344904609226),
+ (3, 0.05, 'obrien_fleming', 1): (3.20010197162677, 2.1408096877543183, 1.6947947195409243),
+ (3, 0.05, 'obrien_fleming', 2): (3.3947572022285284, 2.4067308396353733, 2.0152428995481206),
+ (3, 0.05, 'pocock', 1): (2.002013844829956, 1.9937885741532708, 1.9802844661427352),
+ (3, 0.05, 'pocock', 2): (2.279428238917659, 2.294909355124264, 2.2959343621409913),
+ (3, 0.1, 'obrien_fleming', 1): (2.6208065737516066, 1.7216833443319262, 1.3594407942716178),
+ (3, 0.1, 'obrien_fleming', 2): (2.84897005289451, 2.0314902249070648, 1.732236667879197),
+ (3, 0.1, 'pocock', 1): (1.6924170430457253, 1.6476757125256636, 1.6107818407721672),
+ (3, 0.1, 'pocock', 2): (2.002013844829956, 1.9937953720348738, 1.9802842893790067),
+ (4, 0.01, 'obrien_fleming', 1): (5.020122470014583, 3.46046750016899, 2.764914819923229, 2.3625263691528833),
+ (4, 0.01, 'obrien_fleming', 2): (5.1516586070978025,
+                                  3.642878422229908,
+                                  2.9852206885483192,
+                                  2.614834876886633),
+ (4, 0.01, 'pocock', 1): (2.689893599619457, 2.708541900311775, 2.7113700220319514, 2.7118372903788326),
+ (4, 0.01, 'pocock', 2): (2.913524302168197, 2.9420817546125875, 2.9511970635564477, 2.9560527065185536),
+ (4, 0.05, 'obrien_fleming', 1): (3.7495518372081302,
+                                  2.539939816843596,
+                                  2.016053905222893,
+                                  1.7201513354821925),
+ (4, 0.05, 'obrien_fleming', 2): (3.919927969068825,
+                                  2.7739514666268383,
+                                  2.2982383345501893,
+                                  2.0426328050274596),
+ (4, 0.05, 'pocock', 1): (2.0999026915557333, 2.076703008694332, 2.0531426829032853, 2.034734371736737),
+ (4, 0.05, 'pocock', 2): (2.368327703523308, 2.3675223357271817, 2.3581634904724558, 2.3500225267803607),
+ (4, 0.1, 'obrien_fleming', 1): (3.089367235985375,
+                                 2.0604708033439887,
+                                 1.6303726012576572,
+                                 1.3901363321005133),
+ (4, 0.1, 'obrien_fleming', 2): (3.28970725390295, 2.333844039901703, 1.9597380160970008, 1.7656570497202821),
+ (4, 0.1, 'pocock', 1): (1.8024489230547678, 1.7456505550454096, 1.7000242900837312, 1.6650872670566554),
+ (4, 0.1, 'pocock', 2): (2.0999026915557333, 2.076710257286119, 2.0531516313828053, 2.0347065865855094),
+ (5, 0.01, 'obrien_fleming', 1): (5.64157893791187,
+                                  3.908376265513939,
+                                  3.1323580835431537,
+                                  2.6786606156472343,
+                                  2.3766295059106297),
+ (5, 0.01, 'obrien_fleming', 2): (5.759729421173191,
+                                  4.072762094303507,
+                                  3.331114837480007,
+                                  2.906396805873402,
+                                  2.6297581344409866),
+ (5, 0.01, 'pocock', 1): (2.7528502905710655,
+                          2.7605273683122022,
+                          2.756066969481218,
+                          2.7512404517205513,
+                          2.7472823225461513),
+ (5, 0.01, 'pocock', 2): (2.9724903154371436,
+                          2.989934188267981,
+                          2.991879576008357,
+                          2.9916022918374168,
+                          2.991093862946225),
+ (5, 0.05, 'obrien_fleming', 1): (4.229195059299924,
+                                  2.8881352534503484,
+                                  2.2980760595118235,
+                                  1.9617969509784088,
+                                  1.7396684470917043),
+ (5, 0.05, 'obrien_fleming', 2): (4.382612702882926,
+                                  3.099726887112865,
+                                  2.55335069085458,
+                                  2.2538417622046465,
+                                  2.06349318234105),
+ (5, 0.05, 'pocock', 1): (2.1762114530886802,
+                          2.143738557947214,
+                          2.113264934144691,
+                          2.089564996547416,
+                          2.070948160452462),
+ (5, 0.05, 'pocock', 2): (2.437976688056303,
+                          2.42681176640698,
+                          2.4101894049241617,
+                          2.3966381635142766,
+                          2.3859741570411246),
+ (5, 0.1, 'obrien_fleming', 1): (3.4972213417233253,
+                                 2.356600690815532,
+                                 1.868224073907083,
+                                 1.5936024182095179,
+                                 1.4128034875578708),
+ (5, 0.1, 'obrien_fleming', 2): (3.6780045229005727,
+                                 2.6043106653968264,
+                                 2.166846422415468,
+                                 1.9346106602743172,
+                                 1.7900521239074445),
+ (5, 0.1, 'pocock', 1): (1.8876056886873644,
+                         1.823750727415118,
+                         1.7722872621912165,
+                         1.732712346072666,
+                         1.7012903636284742),
+ (5, 0.1, 'pocock', 2): (2.1762114530886802,
+                         2.143746023762119,
+                         2.1132774905168397,
+                         2.0895594327019587,
+                         2.070885201388899),
+ (6, 0.01, 'obrien_fleming', 1): (6.201297767871555,
+                                  4.310618486381371,
+                                  3.463246160349266,
+                                  2.9639439938664722,
+                                  2.6303921980769327,
+                                  2.3884701429430146),
+ (6, 0.01, 'obrien_fleming', 2): (6.309467458203283,
+                                  4.461470463478389,
+                                  3.6458417464434967,
+                                  3.1732242526301446,
+                                  2.8631261755726687,
+                                  2.6422094301362886),
+ (6, 0.01, 'pocock', 1): (2.8046806040448624,
+                          2.804742414500555,
+                          2.794865226893602,
+                          2.7859260232768035,
+                          2.7787297817881043,
+                          2.7730055585219877),
+ (6, 0.01, 'pocock', 2): (3.021131086315961,
+                          3.0307869994404153,
+                          3.027364326892732,
+                          3.023072707511927,
+                          3.019434140852913,
+                          3.0165526556383613),
+ (6, 0.05, 'obrien_fleming', 1): (4.660208100238293,
+                                  3.200348392182054,
+                                  2.552290776815977,
+                                  2.1798921855922395,
+                                  1.9333644636621377,
+                                  1.7551288319421678),
+ (6, 0.05, 'obrien_fleming', 2): (4.800911676364077,
+                                  3.395024886298052,
+                                  2.787283216777419,
+                                  2.448913080459846,
+                                  2.231946780123415,
+                                  2.079900179869936),
+ (6, 0.05, 'pocock', 1): (2.2385803972228278,
+                          2.1999783023361936,
+                          2.164523212396231,
+                          2.1368142290630714,
+                          2.1149280259811127,
+                          2.097212979908718),
+ (6, 0.05, 'pocock', 2): (2.4951154505014275,
+                          2.4769044791040664,
+                          2.4549591075823187,
+                          2.437254218915629,
+                          2.42326553382567,
+                          2.4120445708824563),
+ (6, 0.1, 'obrien_fleming', 1): (3.8629969210295543,
+                                 2.6223470450233193,
+                                 2.0826503512757037,
+                                 1.7771860738967653,
+                                 1.5757604887946732,
+                                 1.4303239430534072),
+ (6, 0.1, 'obrien_fleming', 2): (4.029052087603132,
+                                 2.8506591427159136,
+                                 2.3579931410006076,
+                                 2.0919416834411084,
+                                 1.924408375382012,
+                                 1.80876211286847),
+ (6, 0.1, 'pocock', 1): (1.9568384764056472,
+                         1.888621147680439,
+                         1.8330777748662557,
+                         1.7900574877116593,
+                         1.7557572970879378,
+                         1.727583015052572),
+ (6, 0.1, 'pocock', 2): (2.2385803972228278,
+                         2.1999858836318955,
+                         2.1645374174087904,
+                         2.1368202049850367,
+                         2.114897547689435,
+                         2.0971161111056746),
+ (7, 0.01, 'obrien_fleming', 1): (6.71464656429056,
+                                  4.678733854845288,
+                                  3.766426878994625,
+                                  3.2258462784464914,
+                                  2.863525825657371,
+                                  2.6004047930917196,
+                                  2.398482572513179),
+ (7, 0.01, 'obrien_fleming', 2): (6.815003756932062,
+                                  4.818935947321594,
+                                  3.936306619791733,
+                                  3.420598062725738,
+                                  3.080176009091833,
+                                  2.8367180160309373,
+                                  2.652690985094905),
+ (7, 0.01, 'pocock', 1): (2.848669893255317,
+                          2.8431926359194213,
+                          2.829154595792734,
+                          2.816937150879662,
+                          2.8070909449566828,
+                          2.7991793585596305,
+                          2.7927514197591408),
+ (7, 0.01, 'pocock', 2): (3.062478789757725,
+                          3.066415557262593,
+                          3.058840967129797,
+                          3.051330449471621,
+                          3.0451160821560515,
+                          3.040123966880932,
+                          3.0361139592003368),
+ (7, 0.05, 'obrien_fleming', 1): (5.054865792421754,
+                                  3.485548650451823,
+                                  2.7854504358617502,
+                                  2.380176742463231,
+                                  2.111307071716116,
+                                  1.9167770370354171,
+                                  1.7677208272197524),
+ (7, 0.05, 'obrien_fleming', 2): (5.185577281734647,
+                                  3.66685316448061,
+                                  3.0044324633860455,
+                                  2.63097729295291,
+                                  2.389858825842519,
+                                  2.2199948239385865,
+                                  2.0931945656279747),
+ (7, 0.05, 'pocock', 1): (2.2912111716894192,
+                          2.2483772772362727,
+                          2.209210565423073,
+                          2.1783804073028565,
+                          2.1538727877283974,
+                          2.1339361290946064,
+                          2.1173601781597213),
+ (7, 0.05, 'pocock', 2): (2.5434746661646277,
+                          2.520245090219924,
+                          2.4942656670111765,
+                          2.473285788239505,
+                          2.4566023404559756,
+                          2.443129955602496,
+                          2.432043540610339),
+ (7, 0.1, 'obrien_fleming', 1): (4.1974324818765645,
+                                 2.8650987518258897,
+                                 2.279367130372671,
+                                 1.9457569236665841,
+                                 1.7254254986767068,
+                                 1.5662544177281126,
+                                 1.4443661032593595),
+ (7, 0.1, 'obrien_fleming', 2): (4.351873640025482,
+                                 3.078047743957411,
+                                 2.5362704072538786,
+                                 2.2396475164674645,
+                                 2.0512705110918956,
+                                 1.9202856538484936,
+                                 1.8236736828126503),
+ (7, 0.1, 'pocock', 1): (2.0150214054533055,
+                         1.9440272755356758,
+                         1.8855436944293673,
+                         1.8398964275029448,
+                         1.8033229938571567,
+                         1.773188020987931,
+                         1.7477687402609434),
+ (7, 0.1, 'pocock', 2): (2.2912111716894192,
+                         2.248384921028256,
+                         2.2092255915381043,
+                         2.1783929408318086,
+                         2.153861853385264,
+                         2.1338782411009465,
+                         2.117233616961171),
+ (8, 0.01, 'obrien_fleming', 1): (7.191519291178118,
+                                  5.020122567379412,
+                                  4.047692781719858,
+                                  3.4692298223015348,
+                                  3.0803314311121923,
+                                  2.7975532949516038,
+                                  2.5804289681848354,
+                                  2.407053601792368),
+ (8, 0.01, 'obrien_fleming', 2): (7.285545470873778,
+                                  5.151658710703773,
+                                  4.207219505127043,
+                                  3.6521536060798327,
+                                  3.2838707416637316,
+                                  3.019640490972538,
+                                  2.8194279414415564,
+                                  2.661633188290643),
+ (8, 0.01, 'pocock', 1): (2.8868379539529045,
+                          2.8771902120103787,
+                          2.8598741840219075,
+                          2.8449907693546823,
+                          2.832939523024624,
+                          2.823175788630608,
+                          2.815170381681311,
+                          2.8085164595713934),
+ (8, 0.01, 'pocock', 2): (3.0984020203559592,
+                          3.0979907085193115,
+                          3.0871234382882724,
+                          3.076980804577436,
+                          3.068612411210863,
+                          3.061824667901449,
+                          3.0562943159042995,
+                          3.051744372506713),
+ (8, 0.05, 'obrien_fleming', 1): (5.421026168559404,
+                                  3.7495842050384836,
+                                  3.0019373678833934,
+                                  2.5663733952282857,
+                                  2.276796922980333,
+                                  2.067132749945682,
+                                  1.9064329723517377,
+                                  1.7782180255715994),
+ (8, 0.05, 'obrien_fleming', 2): (5.543615297398625,
+                                  3.919962874643103,
+                                  3.2078545572392936,
+                                  2.8022802893480514,
+                                  2.5389402611079395,
+                                  2.3526593181851436,
+                                  2.213105063968369,
+                                  2.1042342747764033),
+ (8, 0.05, 'pocock', 1): (2.3366627002521745,
+                          2.2908169531182003,
+                          2.2488146519017924,
+                          2.2155034054998963,
+                          2.1888559624587547,
+                          2.1670702835339757,
+                          2.1488859431205913,
+                          2.1334342360249297),
+ (8, 0.05, 'pocock', 2): (2.585337751701785,
+                          2.5584115236086413,
+                          2.529295976919164,
+                          2.5056801574735044,
+                          2.4867742833356243,
+                          2.4714108029214388,
+                          2.458698299220838,
+                          2.4480019425402415),
+ (8, 0.1, 'obrien_fleming', 1): (4.50737320016693,
+                                 3.0897255864048887,
+                                 2.4620839020204603,
+                                 2.1024704659627895,
+                                 1.8645963623742183,
+                                 1.6926630852913291,
+                                 1.56097417294694,
+                                 1.4559388119947276),
+ (8, 0.1, 'obrien_fleming', 2): (4.652348614706705,
+                                 3.2900971618623585,
+                                 2.7039018075791037,
+                                 2.379247079323236,
+                                 2.1716903583621363,
+                                 2.0265789968042673,
+                                 1.9190005306416722,
+                                 1.8359107793593903),
+ (8, 0.1, 'pocock', 1): (2.065100851244518,
+                         1.9923221077331843,
+                         1.9316736399505523,
+                         1.8839839114015224,
+                         1.8455840024314438,
+                         1.8138369603938331,
+                         1.7869959971375942,
+                         1.763882647225301),
+ (8, 0.1, 'pocock', 2): (2.3366627002521745,
+                         2.290824628865652,
+                         2.2488301055290347,
+                         2.2155199118774713,
+                         2.1888575319688632,
+                         2.1670380976011256,
+                         2.1488020885341363,
+                         2.133282816207736),
+ (9, 0.01, 'obrien_fleming', 1): (7.638727440455015,
+                                  5.339854435438721,
+                                  4.311086970063106,
+                                  3.6974713977077234,
+                                  3.283792435911838,
+                                  2.9826222355314376,
+                                  2.7512498699116668,
+                                  2.566449619677312,
+                                  2.414482468108904),
+ (9, 0.01, 'obrien_fleming', 2): (7.727487910646702,
+                                  5.464159121871514,
+                                  4.461966019599808,
+                                  3.8705188006222144,
+                                  3.476374530449673,
+                                  3.1928064632881865,
+                                  2.9775083219965577,
+                                  2.8075373037042723,
+                                  2.669363265969066),
+ (9, 0.01, 'pocock', 1): (2.920515711218393,
+                          2.9076434600097367,
+                          2.8876926407005463,
+                          2.870605840345483,
+                          2.856694747652086,
+                          2.8453442565156624,
+                          2.835970521377022,
+                          2.828124809781477,
+                          2.821474645362852),
+ (9, 0.01, 'pocock', 2): (3.1301344905622903,
+                          3.126327811646446,
+                          3.1127967125884624,
+                          3.100467336778891,
+                          3.0902737396954856,
+                          3.0819410440287704,
+                          3.075086477027564,
+                          3.0693888461243333,
+                          3.064601197445707),
+ (9, 0.05, 'obrien_fleming', 1): (5.764075052687052,
+                                  3.9964954382541475,
+                                  3.204790858511184,
+                                  2.741060739308109,
+                                  2.432119705790337,
+                                  2.20827144605392,
+                                  2.0366491575202366,
+                                  1.8997011853575676,
+                                  1.787137382650366),
+ (9, 0.05, 'obrien_fleming', 2): (5.879891953620164,
+                                  4.157724196769551,
+                                  3.3997767328111945,
+                                  2.964492167164458,
+                                  2.680495303676963,
+                                  2.4789295562530307,
+                                  2.3274958048829304,
+                                  2.2090462833541133,
+                                  2.1135861440244224),
+ (9, 0.05, 'pocock', 1): (2.376608353892407,
+                          2.328572991845353,
+                          2.284362152006201,
+                          2.2490458161786107,
+                          2.220626475623125,
+                          2.197282226007274,
+                          2.1777233506849636,
+                          2.1610531987793573,
+                          2.1466375247375287),
+ (9, 0.05, 'pocock', 2): (2.6222039063440987,
+                          2.592484890764497,
+                          2.5608819629303077,
+                          2.53510926499782,
+                          2.5143446299816703,
+                          2.4973731704951905,
+                          2.4832598829789796,
+                          2.4713338111594694,
+                          2.461113358154259),
+ (9, 0.1, 'obrien_fleming', 1): (4.797494559163125,
+                                 3.2996332298235047,
+                                 2.633367105409756,
+                                 2.2495083847857917,
+                                 1.9952074031681517,
+                                 1.811306449475123,
+                                 1.6704219364022939,
+                                 1.55804152155393,
+                                 1.4656869302377593),
+ (9, 0.1, 'obrien_fleming', 2): (4.9345608808560355,
+                                 3.4894506165880994,
+                                 2.8625390469959995,
+                                 2.5119097291372614,
+                                 2.2865180391697684,
+                                 2.128258687352348,
+                                 2.0104711287515284,
+                                 1.9191503299525876,
+                                 1.8461843438852426),
+ (9, 0.1, 'pocock', 1): (2.108992168210617,
+                         2.0350782320002363,
+                         1.9728118518762832,
+                         1.923510138795848,
+                         1.8836226945746555,
+                         1.850534000871393,
+                         1.8224904268670954,
+                         1.798298971333051,
+                         1.7771238157468336),
+ (9, 0.1, 'pocock', 2): (2.376608353892407,
+                         2.3285806807822476,
+                         2.284377829206559,
+                         2.2490648452011883,
+                         2.2206364249781485,
+                         2.197267759074702,
+                         2.1776694790500444,
+                         2.1609463798318047,
+                         2.146465872100806),
+ (10, 0.01, 'obrien_fleming', 1): (8.061196294268095,
+                                   5.641578941122107,
+                                   4.559563647081183,
+                                   3.913030612072867,
+                                   3.476079166803554,
+                                   3.1575798851415056,
+                                   2.9127602040531713,
+                                   2.71716782156806,
+                                   2.556304241603913,
+                                   2.4209947839588857),
+ (10, 0.01, 'obrien_fleming', 2): (8.145487463020066,
+                                   5.759729424570277,
+                                   4.703074679733163,
+                                   4.0776666339409395,
+                                   3.659323854055523,
+                                   3.35761143657895,
+                                   3.1281412370021044,
+                                   2.9467260237718724,
+                                   2.7990627314409693,
+                                   2.676125315738316),
+ (10, 0.01, 'pocock', 1): (2.9506264943661327,
+                           2.935208226305293,
+                           2.9131047568881296,
+                           2.8941723777600803,
+                           2.8786747536307398,
+                           2.865951470025595,
+                           2.8553804676061825,
+                           2.8464822168736506,
+                           2.8388997405887104,
+                           2.8323670014117814),
+ (10, 0.01, 'pocock', 2): (3.158533509789343,
+                           3.152018369796391,
+                           3.1362968282690846,
+                           3.1221266192623816,
+                           3.1103692668386493,
+                           3.100694609517765,
+                           3.092676991444125,
+                           3.085962067823907,
+                           3.08027715080254,
+                           3.075415463093788),
+ (10, 0.05, 'obrien_fleming', 1): (6.087892874588699,
+                                   4.229199403427985,
+                                   3.3962250773563056,
+                                   2.906113119272708,
+                                   2.578936106025442,
+                                   2.3417008625541342,
+                                   2.1597602237551037,
+                                   2.014558697099308,
+                                   1.8952029051950186,
+                                   1.7948358511558296),
+ (10, 0.05, 'obrien_fleming', 2): (6.197950323045665,
+                                   4.38261736194396,
+                                   3.5818841923857674,
+                                   3.118893038797788,
+                                   2.81554068294908,
+                                   2.599629415312189,
+                                   2.437040753836453,
+                                   2.309596012134176,
+                                   2.206678187663968,
+                                   2.121638351574604),
+ (10, 0.05, 'pocock', 1): (2.4122016754818216,
+                           2.362551476544707,
+                           2.3165942416169822,
+                           2.279635659997226,
+                           2.2497317238579098,
+                           2.2250598849783656,
+                           2.2043151336541076,
+                           2.186582911821,
+                           2.1712121807432143,
+                           2.157728924930604),
+ (10, 0.05, 'pocock', 2): (2.6551100479467027,
+                           2.6232394978785014,
+                           2.5896316776665613,
+                           2.562070034351529,
+                           2.5397326181867648,
+                           2.5213799082799335,
+                           2.50604890452097,
+                           2.4930433497643376,
+                           2.481860271625087,
+                           2.4721307807823045),
+ (10, 0.1, 'obrien_fleming', 1): (5.071155628195045,
+                                  3.4973065458078785,
+                                  2.7950792891908485,
+                                  2.388453446465008,
+                                  2.118661969283483,
+                                  1.9234588927264338,
+                                  1.7738850878701091,
+                                  1.654562250446249,
+                                  1.556497877366554,
+                                  1.4740430104021034),
+ (10, 0.1, 'obrien_fleming', 2): (5.201483878755573,
+                                  3.6780967011756576,
+                                  3.0134459291038524,
+                                  2.6385529432047052,
+                                  2.3964420684580023,
+                                  2.2258454072508123,
+                                  2.0984760626812684,
+                                  1.99942979027511,
+                                  1.9200577829805967,
+                                  1.854967474367118),
+ (10, 0.1, 'pocock', 1): (2.148009311595131,
+                          2.0733999266363594,
+                          2.009912747684609,
+                          1.959323934380355,
+                          1.9182116880271474,
+                          1.8839952154519048,
+                          1.8549250632811338,
+                          1.8298020942540438,
+                          1.8077812838242893,
+                          1.7882500702304518),
+ (10, 0.1, 'pocock', 2): (2.4122016754818216,
+                          2.3625591666378374,
+                          2.316610029789919,
+                          2.2796563476236438,
+                          2.2497474962006168,
+                          2.225058069351175,
+                          2.204283037383092,
+                          2.1865088781098567,
+                          2.1710858501682586,
+                          2.157541203156411)}
+
+SAMPLE_SIZE_FACTORS = {(2, 0.01, 'obrien_fleming', 1): {0.8: {'alternative': 0.9456089150628986,
+                                        'inflation': 1.001430468601635,
+                                        'null': 1.0012954172125004},
+                                  0.95: {'alternative': 0.8722604690130604,
+                                         'inflation': 1.0012584825689799,
+                                         'null': 1.0011234543736198}},
+ (2, 0.01, 'obrien_fleming', 2): {0.8: {'alternative': 0.9462602198767612,
+                                        'inflation': 1.001545535648681,
+                                        'null': 1.0014104687417726},
+                                  0.95: {'alternative': 0.8732704295308816,
+                                         'inflation': 1.00135512683305,
+                                         'null': 1.0012200856043847}},
+ (2, 0.01, 'pocock', 1): {0.8: {'alternative': 0.8668226570762622,
+                                'inflation': 1.1161378160547755,
+                                'null': 1.1126771497972738},
+                          0.95: {'alternative': 0.7298042463453916,
+                                 'inflation': 1.0981013723036512,
+                                 'null': 1.0946966293482698}},
+ (2, 0.01, 'pocock', 2): {0.8: {'alternative': 0.8750796187544988,
+                                'inflation': 1.1110100351213053,
+                                'null': 1.1075652679205386},
+                          0.95: {'alternative': 0.7386462391689219,
+                                 'inflation': 1.0941524459003322,
+                                 'null': 1.0907599468777067}},
+ (2, 0.05, 'obrien_fleming', 1): {0.8: {'alternative': 0.8971191155575893,
+                                        'inflation': 1.007886400010014,
+                                        'null': 1.0050771199199693},
+                                  0.95: {'alternative': 0.7957247261403154,
+                                         'inflation': 1.006719078964938,
+                                         'null': 1.003913052546905}},
+ (2, 0.05, 'obrien_fleming', 2): {0.8: {'alternative': 0.8992057878189738,
+                                        'inflation': 1.008668242064523,
+                                        'null': 1.0058567827474227},
+                                  0.95: {'alternative': 0.7981144453603123,
+                                         'inflation': 1.0074092946056519,
+                                         'null': 1.0046013443507142}},
+ (2, 0.05, 'pocock', 1): {0.8: {'alternative': 0.844856451673409,
+                                'inflation': 1.1264213271047085,
+                                'null': 1.108958571957597},
+                          0.95: {'alternative': 0.7082175814154524,
+                                 'inflation': 1.105711845917236,
+                                 'null': 1.0885701470130225}},
+ (2, 0.05, 'pocock', 2): {0.8: {'alternative': 0.8548914100164279,
+                                'inflation': 1.1225185841749215,
+                                'null': 1.1051163327154931},
+                          0.95: {'alternative': 0.7177662696317839,
+                                 'inflation': 1.1029547590527555,
+                                 'null': 1.0858558028875733}},
+ (2, 0.1, 'obrien_fleming', 1): {0.8: {'alternative': 0.8671134246560459,
+                                       'inflation': 1.016996307051164,
+                                       'null': 1.0068216384830935},
+                                 0.95: {'alternative': 0.7545868464247624,
+                                        'inflation': 1.014346398063243,
+                                        'null': 1.0041982408458043}},
+ (2, 0.1, 'obrien_fleming', 2): {0.8: {'alternative': 0.8707327697545179,
+                                       'inflation': 1.0187920493274898,
+                                       'null': 1.008599415028011},
+                                 0.95: {'alternative': 0.7582394180224392,
+                                        'inflation': 1.0159930305796998,
+                                        'null': 1.0058283994183614}},
+ (2, 0.1, 'pocock', 1): {0.8: {'alternative': 0.8334448084762187,
+                               'inflation': 1.1282197077648775,
+                               'null': 1.0932384373738162},
+                         0.95: {'alternative': 0.6980401582572119,
+                                'inflation': 1.1066945468132097,
+                                'null': 1.0723806796506854}},
+ (2, 0.1, 'pocock', 2): {0.8: {'alternative': 0.8446384687696294,
+                               'inflation': 1.126129635989816,
+                               'null': 1.0912131697901875},
+                         0.95: {'alternative': 0.7082054597263343,
+                                'inflation': 1.1056942214814995,
+                                'null': 1.0714113701314862}},
+ (3, 0.01, 'obrien_fleming', 1): {0.8: {'alternative': 0.8831837581216373,
+                                        'inflation': 1.007228752672658,
+                                        'null': 1.0066866666916376},
+                                  0.95: {'alternative': 0.7908894577305331,
+                                         'inflation': 1.006343972500802,
+                                         'null': 1.0058023627044876}},
+ (3, 0.01, 'obrien_fleming', 2): {0.8: {'alternative': 0.8840666505860094,
+                                        'inflation': 1.0077622128117953,
+                                        'null': 1.007219839724933},
+                                  0.95: {'alternative': 0.7917545216374193,
+                                         'inflation': 1.0068246957388427,
+                                         'null': 1.0062828272194493}},
+ (3, 0.01, 'pocock', 1): {0.8: {'alternative': 0.8348077026626036,
+                                'inflation': 1.1607002835614506,
+                                'null': 1.1559947468064877},
+                          0.95: {'alternative': 0.6664508517960934,
+                                 'inflation': 1.1356099756316609,
+                                 'null': 1.1310061562345974}},
+ (3, 0.01, 'pocock', 2): {0.8: {'alternative': 0.8449520888552828,
+                                'inflation': 1.1531949744190642,
+                                'null': 1.1485198645611248},
+                          0.95: {'alternative': 0.6791735373201109,
+                                 'inflation': 1.1298770638261173,
+                                 'null': 1.1252964859390049}},
+ (3, 0.05, 'obrien_fleming', 1): {0.8: {'alternative': 0.8484806006357403,
+                                        'inflation': 1.020310672290128,
+                                        'null': 1.0145079745904728},
+                                  0.95: {'alternative': 0.7409857272540199,
+                                         'inflation': 1.0176385001954327,
+                                         'null': 1.0118509996384595}},
+ (3, 0.05, 'obrien_fleming', 2): {0.8: {'alternative': 0.8508173940159173,
+                                        'inflation': 1.022134141257011,
+                                        'null': 1.0163210731481591},
+                                  0.95: {'alternative': 0.743190089647769,
+                                         'inflation': 1.0192546658884742,
+                                         'null': 1.0134579738948104}},
+ (3, 0.05, 'pocock', 1): {0.8: {'alternative': 0.8058531938085502,
+                                'inflation': 1.1767325810872926,
+                                'null': 1.1528799186490974},
+                          0.95: {'alternative': 0.6335056798444726,
+                                 'inflation': 1.1473872417692035,
+                                 'null': 1.1241294166663032}},
+ (3, 0.05, 'pocock', 2): {0.8: {'alternative': 0.8193568266140502,
+                                'inflation': 1.1703375974385213,
+                                'null': 1.1466145629119098},
+                          0.95: {'alternative': 0.648329682618439,
+                                 'inflation': 1.1428753250580839,
+                                 'null': 1.1197089576310222}},
+ (3, 0.1, 'obrien_fleming', 1): {0.8: {'alternative': 0.8255896073329378,
+                                       'inflation': 1.0337675004169857,
+                                       'null': 1.0171099104616808},
+                                 0.95: {'alternative': 0.705597045741381,
+                                        'inflation': 1.0290861576324486,
+                                        'null': 1.012504000391476}},
+ (3, 0.1, 'obrien_fleming', 2): {0.8: {'alternative': 0.8296141631587338,
+                                       'inflation': 1.037104466359497,
+                                       'null': 1.0203931062766192},
+                                 0.95: {'alternative': 0.7093442974628676,
+                                        'inflation': 1.0321005037032647,
+                                        'null': 1.0154697748629493}},
+ (3, 0.1, 'pocock', 1): {0.8: {'alternative': 0.7900593302535716,
+                               'inflation': 1.1804691658304587,
+                               'null': 1.1326123579483132},
+                         0.95: {'alternative': 0.6175359467983211,
+                                'inflation': 1.1496635086410865,
+                                'null': 1.1030555774432869}},
+ (3, 0.1, 'pocock', 2): {0.8: {'alternative': 0.8054236630822579,
+                               'inflation': 1.1761166452843321,
+                               'null': 1.128436290752146},
+                         0.95: {'alternative': 0.6334468312082159,
+                                'inflation': 1.1472554094787408,
+                                'null': 1.1007451038196534}},
+ (4, 0.01, 'obrien_fleming', 1): {0.8: {'alternative': 0.85695291460691,
+                                        'inflation': 1.0124006638824419,
+                                        'null': 1.011589112519723},
+                                  0.95: {'alternative': 0.7530754221260365,
+                                         'inflation': 1.0109813629783984,
+                                         'null': 1.010170949342692}},
+ (4, 0.01, 'obrien_fleming', 2): {0.8: {'alternative': 0.8580237743536026,
+                                        'inflation': 1.0132316852972154,
+                                        'null': 1.0124194677786806},
+                                  0.95: {'alternative': 0.754100437605977,
+                                         'inflation': 1.0117318787649168,
+                                         'null': 1.0109208635075801}},
+ (4, 0.01, 'pocock', 1): {0.8: {'alternative': 0.8206084968658239,
+                                'inflation': 1.1846654548397684,
+                                'null': 1.1793182378819478},
+                          0.95: {'alternative': 0.6392631778871215,
+                                 'inflation': 1.1558682893508865,
+                                 'null': 1.1506510539764827}},
+ (4, 0.01, 'pocock', 2): {0.8: {'alternative': 0.831160018779568,
+                                'inflation': 1.1758324831826534,
+                                'null': 1.1705251355530755},
+                          0.95: {'alternative': 0.6531806458199034,
+                                 'inflation': 1.1491447716820333,
+                                 'null': 1.1439578842067695}},
+ (4, 0.05, 'obrien_fleming', 1): {0.8: {'alternative': 0.8218699225337535,
+                                        'inflation': 1.028876344455952,
+                                        'null': 1.0213428363844181},
+                                  0.95: {'alternative': 0.703039475444868,
+                                         'inflation': 1.0252536482617047,
+                                         'null': 1.0177466658374628}},
+ (4, 0.05, 'obrien_fleming', 2): {0.8: {'alternative': 0.824543093768692,
+                                        'inflation': 1.0312790586646683,
+                                        'null': 1.0237279577433833},
+                                  0.95: {'alternative': 0.7053821255099446,
+                                         'inflation': 1.0274031485956385,
+                                         'null': 1.0198804273722124}},
+ (4, 0.05, 'pocock', 1): {0.8: {'alternative': 0.7892450229390064,
+                                'inflation': 1.2041484934485058,
+                                'null': 1.1769727063203264},
+                          0.95: {'alternative': 0.6018010757000597,
+                                 'inflation': 1.1701206289442776,
+                                 'null': 1.1437127985981932}},
+ (4, 0.05, 'pocock', 2): {0.8: {'alternative': 0.8040395636116617,
+                                'inflation': 1.196167473597313,
+                                'null': 1.1691718058623537},
+                          0.95: {'alternative': 0.6188782675575354,
+                                 'inflation': 1.1644977425441203,
+                                 'null': 1.138216812131182}},
+ (4, 0.1, 'obrien_fleming', 1): {0.8: {'alternative': 0.8008386181653696,
+                                       'inflation': 1.0446971682227117,
+                                       'null': 1.024185725952028},
+                                 0.95: {'alternative': 0.67209258490229,
+                                        'inflation': 1.0387633263053726,
+                                        'null': 1.0183683882807355}},
+ (4, 0.1, 'obrien_fleming', 2): {0.8: {'alternative': 0.805234191046632,
+                                       'inflation': 1.048849091955685,
+                                       'null': 1.0282561313786271},
+                                 0.95: {'alternative': 0.6758834237186628,
+                                        'inflation': 1.042522205772465,
+                                        'null': 1.0220534664191712}},
+ (4, 0.1, 'pocock', 1): {0.8: {'alternative': 0.7715426502834928,
+                               'inflation': 1.2092503553835385,
+                               'null': 1.1546684987073979},
+                         0.95: {'alternative': 0.5830665193722052,
+                                'inflation': 1.1733168869308326,
+                                'null': 1.1203569569435952}},
+ (4, 0.1, 'pocock', 2): {0.8: {'alternative': 0.7886178120182795,
+                               'inflation': 1.2032334814761443,
+                               'null': 1.1489232080572063},
+                         0.95: {'alternative': 0.6016892207769241,
+                                'inflation': 1.169847059964788,
+                                'null': 1.1170437473383117}},
+ (5, 0.01, 'obrien_fleming', 1): {0.8: {'alternative': 0.8414633138670258,
+                                        'inflation': 1.016473929435505,
+                                        'null': 1.0154761776834598},
+                                  0.95: {'alternative': 0.7325892828835341,
+                                         'inflation': 1.014673378224172,
+                                         'null': 1.0136773938594388}},
+ (5, 0.01, 'obrien_fleming', 2): {0.8: {'alternative': 0.8426455263789754,
+                                        'inflation': 1.0175053956720923,
+                                        'null': 1.0165066314521312},
+                                  0.95: {'alternative': 0.7336740553551075,
+                                         'inflation': 1.0156066187290886,
+                                         'null': 1.014609718312976}},
+ (5, 0.01, 'pocock', 1): {0.8: {'alternative': 0.812561387064983,
+                                'inflation': 1.1997270442942094,
+                                'null': 1.1939878272878375},
+                          0.95: {'alternative': 0.6240591055781274,
+                                 'inflation': 1.168663240499758,
+                                 'null': 1.1630726255540527}},
+ (5, 0.01, 'pocock', 2): {0.8: {'alternative': 0.823173260608287,
+                                'inflation': 1.1900489941706724,
+                                'null': 1.1843560747201902},
+                          0.95: {'alternative': 0.6384101450830336,
+                                 'inflation': 1.1613092401514353,
+                                 'null': 1.155753805044421}},
+ (5, 0.05, 'obrien_fleming', 1): {0.8: {'alternative': 0.806876279334603,
+                                        'inflation': 1.0349782763396629,
+                                        'null': 1.0263300623082001},
+                                  0.95: {'alternative': 0.6816215749993214,
+                                         'inflation': 1.030740072820194,
+                                         'null': 1.0221272729534372}},
+ (5, 0.05, 'obrien_fleming', 2): {0.8: {'alternative': 0.8097608169343855,
+                                        'inflation': 1.037732152795257,
+                                        'null': 1.02906092754344},
+                                  0.95: {'alternative': 0.6841019245677982,
+                                         'inflation': 1.0332075992353513,
+                                         'null': 1.0245741808713484}},
+ (5, 0.05, 'pocock', 1): {0.8: {'alternative': 0.7802244481419106,
+                                'inflation': 1.2214983555246997,
+                                'null': 1.192281525877592},
+                          0.95: {'alternative': 0.5845244624917987,
+                                 'inflation': 1.184548791217819,
+                                 'null': 1.1562157524665453}},
+ (5, 0.05, 'pocock', 2): {0.8: {'alternative': 0.7955720679678444,
+                                'inflation': 1.2124225706118155,
+                                'null': 1.1834228232558825},
+                          0.95: {'alternative': 0.6026888625934218,
+                                 'inflation': 1.178158447144735,
+                                 'null': 1.149978258041843}},
+ (5, 0.1, 'obrien_fleming', 1): {0.8: {'alternative': 0.7859984219972929,
+                                       'inflation': 1.0522101118284048,
+                                       'null': 1.0292373359600966},
+                                 0.95: {'alternative': 0.6506693682918678,
+                                        'inflation': 1.0454673889450328,
+                                        'null': 1.022641826128377}},
+ (5, 0.1, 'obrien_fleming', 2): {0.8: {'alternative': 0.7906753723894895,
+                                       'inflation': 1.0568397299795345,
+                                       'null': 1.033765876219446},
+                                 0.95: {'alternative': 0.6546055038808882,
+                                        'inflation': 1.0496637009776673,
+                                        'null': 1.0267465205892077}},
+ (5, 0.1, 'pocock', 1): {0.8: {'alternative': 0.7615524495477338,
+                               'inflation': 1.227583636081705,
+                               'null': 1.1688588710240213},
+                         0.95: {'alternative': 0.564325053190605,
+                                'inflation': 1.188409471447188,
+                                'null': 1.131558707921356}},
+ (5, 0.1, 'pocock', 2): {0.8: {'alternative': 0.7794253535647342,
+                               'inflation': 1.2203300355291937,
+                               'null': 1.1619522659643946},
+                         0.95: {'alternative': 0.5843608638060712,
+                                'inflation': 1.1841389309870103,
+                                'null': 1.1274924602510095}},
+ (6, 0.01, 'obrien_fleming', 1): {0.8: {'alternative': 0.831165376933707,
+                                        'inflation': 1.0196803383657924,
+                                        'null': 1.0185482227623124},
+                                  0.95: {'alternative': 0.7186516720779434,
+                                         'inflation': 1.017596241277028,
+                                         'null': 1.0164664395740368}},
+ (6, 0.01, 'obrien_fleming', 2): {0.8: {'alternative': 0.83243116822638,
+                                        'inflation': 1.0208505016897997,
+                                        'null': 1.0197170868946874},
+                                  0.95: {'alternative': 0.719783219398011,
+                                         'inflation': 1.018657311899167,
+                                         'null': 1.0175263321263748}},
+ (6, 0.01, 'pocock', 1): {0.8: {'alternative': 0.8073784350390636,
+                                'inflation': 1.2101036763742128,
+                                'null': 1.2040998776187075},
+                          0.95: {'alternative': 0.6143232350102128,
+                                 'inflation': 1.1775208167964013,
+                                 'null': 1.1716786743812604}},
+ (6, 0.01, 'pocock', 2): {0.8: {'alternative': 0.8179553928739881,
+                                'inflation': 1.1998401021857046,
+                                'null': 1.1938872250454684},
+                          0.95: {'alternative': 0.6288526348150845,
+                                 'inflation': 1.1697285612002335,
+                                 'null': 1.163925079219955}},
+ (6, 0.05, 'obrien_fleming', 1): {0.8: {'alternative': 0.797186691301203,
+                                        'inflation': 1.0395262281929016,
+                                        'null': 1.030096270976831},
+                                  0.95: {'alternative': 0.6681196115146036,
+                                         'inflation': 1.0348614521463204,
+                                         'null': 1.0254738109751451}},
+ (6, 0.05, 'obrien_fleming', 2): {0.8: {'alternative': 0.8002084676026907,
+                                        'inflation': 1.042510889896985,
+                                        'null': 1.0330538576237875},
+                                  0.95: {'alternative': 0.6706817059972949,
+                                         'inflation': 1.0375355860864295,
+                                         'null': 1.0281236867793826}},
+ (6, 0.05, 'pocock', 1): {0.8: {'alternative': 0.7746121138016722,
+                                'inflation': 1.2335027864283112,
+                                'null': 1.202903331857994},
+                          0.95: {'alternative': 0.5737039085503094,
+                                 'inflation': 1.1945652407137828,
+                                 'null': 1.1649317082915795}},
+ (6, 0.05, 'pocock', 2): {0.8: {'alternative': 0.7902158281743872,
+                                'inflation': 1.2236236232462,
+                                'null': 1.1932692406845455},
+                          0.95: {'alternative': 0.5924577531340649,
+                                 'inflation': 1.1876090816978873,
+                                 'null': 1.1581481104362203}},
+ (6, 0.1, 'obrien_fleming', 1): {0.8: {'alternative': 0.7764348119517978,
+                                       'inflation': 1.0576842756187965,
+                                       'null': 1.0330093491501837},
+                                 0.95: {'alternative': 0.6368600852254187,
+                                        'inflation': 1.0503907390634928,
+                                        'null': 1.0258859649573069}},
+ (6, 0.1, 'obrien_fleming', 2): {0.8: {'alternative': 0.7813020433401184,
+                                       'inflation': 1.0626199730317127,
+                                       'null': 1.0378299006981895},
+                                 0.95: {'alternative': 0.6409138027923489,
+                                        'inflation': 1.0548620396781225,
+                                        'null': 1.030252953712139}},
+ (6, 0.1, 'pocock', 1): {0.8: {'alternative': 0.7553898020022983,
+                               'inflation': 1.240325774927198,
+                               'null': 1.1787883505780452},
+                         0.95: {'alternative': 0.5526430460466831,
+                                'inflation': 1.1989251594674273,
+                                'null': 1.1394417819609386}},
+ (6, 0.1, 'pocock', 2): {0.8: {'alternative': 0.7736654501189903,
+                               'inflation': 1.23212208165796,
+                               'null': 1.1709916746939835},
+                         0.95: {'alternative': 0.5734917930866599,
+                                'inflation': 1.1940314578911557,
+                                'null': 1.1347908761052516}},
+ (7, 0.01, 'obrien_fleming', 1): {0.8: {'alternative': 0.8239314120902829,
+                                        'inflation': 1.0222509713334706,
+                                        'null': 1.0210177221262733},
+                                  0.95: {'alternative': 0.7087807925231778,
+                                         'inflation': 1.0199549396916132,
+                                         'null': 1.018724460429646}},
+ (7, 0.01, 'obrien_fleming', 2): {0.8: {'alternative': 0.825260238092059,
+                                        'inflation': 1.0235207786221825,
+                                        'null': 1.0222859975125047},
+                                  0.95: {'alternative': 0.7099513394199086,
+                                         'inflation': 1.0211071829975285,
+                                         'null': 1.0198753136629175}},
+ (7, 0.01, 'pocock', 1): {0.8: {'alternative': 0.8037647984699345,
+                                'inflation': 1.217702800743177,
+                                'null': 1.2115082686218654},
+                          0.95: {'alternative': 0.6075535695045845,
+                                 'inflation': 1.1840374843450412,
+                                 'null': 1.1780142098439594}},
+ (7, 0.01, 'pocock', 2): {0.8: {'alternative': 0.8142807426677154,
+                                'inflation': 1.2070089635838026,
+                                'null': 1.2008688316969516},
+                          0.95: {'alternative': 0.6221602970606691,
+                                 'inflation': 1.1759212915519923,
+                                 'null': 1.1699393046434219}},
+ (7, 0.05, 'obrien_fleming', 1): {0.8: {'alternative': 0.7903545634114177,
+                                        'inflation': 1.0430442036933527,
+                                        'null': 1.0330351910077096},
+                                  0.95: {'alternative': 0.6586113958431582,
+                                         'inflation': 1.038067647356263,
+                                         'null': 1.028106389516802}},
+ (7, 0.05, 'obrien_fleming', 2): {0.8: {'alternative': 0.7934753353070536,
+                                        'inflation': 1.0461889705046759,
+                                        'null': 1.0361497807561273},
+                                  0.95: {'alternative': 0.6612305336027218,
+                                         'inflation': 1.0408839305349575,
+                                         'null': 1.0308956477490907}},
+ (7, 0.05, 'pocock', 1): {0.8: {'alternative': 0.7708060118019859,
+                                'inflation': 1.242319698105079,
+                                'null': 1.2107208988328242},
+                          0.95: {'alternative': 0.5663089731633709,
+                                 'inflation': 1.2019478141070152,
+                                 'null': 1.1713758866300346}},
+ (7, 0.05, 'pocock', 2): {0.8: {'alternative': 0.786529755425121,
+                                'inflation': 1.2318237778422407,
+                                'null': 1.2004919456620788},
+                          0.95: {'alternative': 0.5854111174706994,
+                                 'inflation': 1.1945539771617213,
+                                 'null': 1.1641701142944716}},
+ (7, 0.1, 'obrien_fleming', 1): {0.8: {'alternative': 0.7697704694427254,
+                                       'inflation': 1.0618558621488814,
+                                       'null': 1.0359307835075875},
+                                 0.95: {'alternative': 0.6273234501357545,
+                                        'inflation': 1.0541672972855718,
+                                        'null': 1.0284299339979575}},
+ (7, 0.1, 'obrien_fleming', 2): {0.8: {'alternative': 0.7747705549925784,
+                                       'inflation': 1.0670004395098616,
+                                       'null': 1.0409497566530654},
+                                 0.95: {'alternative': 0.6314584262306192,
+                                        'inflation': 1.0588220707157765,
+                                        'null': 1.0329710617146335}},
+ (7, 0.1, 'pocock', 1): {0.8: {'alternative': 0.7512459564835937,
+                               'inflation': 1.2497159241160745,
+                               'null': 1.1861420748183762},
+                         0.95: {'alternative': 0.5446989291172172,
+                                'inflation': 1.2066962700606987,
+                                'null': 1.1453108581118243}},
+ (7, 0.1, 'pocock', 2): {0.8: {'alternative': 0.7697321817405395,
+                               'inflation': 1.2407593565101505,
+                               'null': 1.1776411335417243},
+                         0.95: {'alternative': 0.5660519553415134,
+                                'inflation': 1.2013022589696685,
+                                'null': 1.1401912438189226}},
+ (8, 0.01, 'obrien_fleming', 1): {0.8: {'alternative': 0.8185923775060704,
+                                        'inflation': 1.0243527268792685,
+                                        'null': 1.0230407080995354},
+                                  0.95: {'alternative': 0.7014934188577105,
+                                         'inflation': 1.0218951454424943,
+                                         'null': 1.0205862743997791}},
+ (8, 0.01, 'obrien_fleming', 2): {0.8: {'alternative': 0.8199696660145916,
+                                        'inflation': 1.0256965454626252,
+                                        'null': 1.024382805483529},
+                                  0.95: {'alternative': 0.7026948349713601,
+                                         'inflation': 1.023114413516374,
+                                         'null': 1.0218039808019694}},
+ (8, 0.01, 'pocock', 1): {0.8: {'alternative': 0.8011045676366372,
+                                'inflation': 1.2235165074395435,
+                                'null': 1.2171778885698026},
+                          0.95: {'alternative': 0.60257594234849,
+                                 'inflation': 1.1890453413134636,
+                                 'null': 1.1828853057180309}},
+ (8, 0.01, 'pocock', 2): {0.8: {'alternative': 0.8115551883468956,
+                                'inflation': 1.2124925671752707,
+                                'null': 1.2062110595544344},
+                          0.95: {'alternative': 0.6172149156924349,
+                                 'inflation': 1.1806785887651923,
+                                 'null': 1.174561898441585}},
+ (8, 0.05, 'obrien_fleming', 1): {0.8: {'alternative': 0.7852873575874602,
+                                        'inflation': 1.0458479376131784,
+                                        'null': 1.0353929310331849},
+                                  0.95: {'alternative': 0.6515172648295834,
+                                         'inflation': 1.040636752902216,
+                                         'null': 1.030233840865304}},
+ (8, 0.05, 'obrien_fleming', 2): {0.8: {'alternative': 0.7884832234331762,
+                                        'inflation': 1.0491080165825217,
+                                        'null': 1.0386204200382292},
+                                  0.95: {'alternative': 0.6541812053104353,
+                                         'inflation': 1.0435533584005638,
+                                         'null': 1.0331212899935394}},
+ (8, 0.05, 'pocock', 1): {0.8: {'alternative': 0.7680666423710846,
+                                'inflation': 1.2490793700951661,
+                                'null': 1.2167241136816596},
+                          0.95: {'alternative': 0.5609447069841894,
+                                 'inflation': 1.2076280225040834,
+                                 'null': 1.1763464920779756}},
+ (8, 0.05, 'pocock', 2): {0.8: {'alternative': 0.7838422094790783,
+                                'inflation': 1.2380934450081327,
+                                'null': 1.2060227601205311},
+                          0.95: {'alternative': 0.5802657675519787,
+                                 'inflation': 1.1998829700219575,
+                                 'null': 1.1688020618815216}},
+ (8, 0.1, 'obrien_fleming', 1): {0.8: {'alternative': 0.764847160013958,
+                                       'inflation': 1.065145163386905,
+                                       'null': 1.0382614228274782},
+                                 0.95: {'alternative': 0.6202981272421713,
+                                        'inflation': 1.0571618109509988,
+                                        'null': 1.030479566284394}},
+ (8, 0.1, 'obrien_fleming', 2): {0.8: {'alternative': 0.7699453209026619,
+                                       'inflation': 1.070438508286992,
+                                       'null': 1.0434211663028738},
+                                 0.95: {'alternative': 0.6244919201729149,
+                                        'inflation': 1.0619438033398132,
+                                        'null': 1.0351408635346482}},
+ (8, 0.1, 'pocock', 1): {0.8: {'alternative': 0.7482872175926881,
+                               'inflation': 1.2569339648632194,
+                               'null': 1.1918165324529442},
+                         0.95: {'alternative': 0.5389625062279237,
+                                'inflation': 1.212687674776806,
+                                'null': 1.1498624907142163}},
+ (8, 0.1, 'pocock', 2): {0.8: {'alternative': 0.766882297881313,
+                               'inflation': 1.2473650749300889,
+                               'null': 1.1827433738486757},
+                         0.95: {'alternative': 0.5606462594648005,
+                                'inflation': 1.206881084598359,
+                                'null': 1.144356720034041}},
+ (9, 0.01, 'obrien_fleming', 1): {0.8: {'alternative': 0.8144972461400983,
+                                        'inflation': 1.0261021872841856,
+                                        'null': 1.02472712410222},
+                                  0.95: {'alternative': 0.6958953336945842,
+                                         'inflation': 1.0235190952786481,
+                                         'null': 1.0221474936570967}},
+ (9, 0.01, 'obrien_fleming', 2): {0.8: {'alternative': 0.8159127323796616,
+                                        'inflation': 1.0275024091499736,
+                                        'null': 1.0261254695530144},
+                                  0.95: {'alternative': 0.6971215066187219,
+                                         'inflation': 1.024788747411445,
+                                         'null': 1.0234154443493175}},
+ (9, 0.01, 'pocock', 1): {0.8: {'alternative': 0.7990667674587331,
+                                'inflation': 1.2281130821417523,
+                                'null': 1.2216617338639064},
+                          0.95: {'alternative': 0.5987643206542448,
+                                 'inflation': 1.1930221094198288,
+                                 'null': 1.1867550960291602}},
+ (9, 0.01, 'pocock', 2): {0.8: {'alternative': 0.8094549402008696,
+                                'inflation': 1.216827383201002,
+                                'null': 1.2104353193452708},
+                          0.95: {'alternative': 0.6134137177765844,
+                                 'inflation': 1.1844546455574165,
+                                 'null': 1.178232637544494}},
+ (9, 0.05, 'obrien_fleming', 1): {0.8: {'alternative': 0.7813932879163493,
+                                        'inflation': 1.0481370613683758,
+                                        'null': 1.037328053244694},
+                                  0.95: {'alternative': 0.6460410039095216,
+                                         'inflation': 1.0427460865107272,
+                                         'null': 1.0319926733022322}},
+ (9, 0.05, 'obrien_fleming', 2): {0.8: {'alternative': 0.7846474278196912,
+                                        'inflation': 1.051482492410691,
+                                        'null': 1.0406389842271584},
+                                  0.95: {'alternative': 0.6487407960715058,
+                                         'inflation': 1.0457342639879386,
+                                         'null': 1.0349500349292537}},
+ (9, 0.05, 'pocock', 1): {0.8: {'alternative': 0.766007333782195,
+                                'inflation': 1.2544324450374262,
+                                'null': 1.2214844180533464},
+                          0.95: {'alternative': 0.5568812857574785,
+                                 'inflation': 1.2121425760533726,
+                                 'null': 1.1803053045746625}},
+ (9, 0.05, 'pocock', 2): {0.8: {'alternative': 0.7817983798695531,
+                                'inflation': 1.243046605389903,
+                                'null': 1.2103976307409936},
+                          0.95: {'alternative': 0.5763461524118587,
+                                 'inflation': 1.2041074068836495,
+                                 'null': 1.1724811814215905}},
+ (9, 0.1, 'obrien_fleming', 1): {0.8: {'alternative': 0.7610597412008311,
+                                       'inflation': 1.0678089025634991,
+                                       'null': 1.0401661836866452},
+                                 0.95: {'alternative': 0.6148843368951105,
+                                        'inflation': 1.0595997166496216,
+                                        'null': 1.0321695116578646}},
+ (9, 0.1, 'obrien_fleming', 2): {0.8: {'alternative': 0.7662332652380304,
+                                       'inflation': 1.0732113119787354,
+                                       'null': 1.045428739160076},
+                                 0.95: {'alternative': 0.6191234107007133,
+                                        'inflation': 1.0644713632277845,
+                                        'null': 1.03691504432566}},
+ (9, 0.1, 'pocock', 1): {0.8: {'alternative': 0.7460792981094941,
+                               'inflation': 1.2626621676443996,
+                               'null': 1.1963338016398355},
+                         0.95: {'alternative': 0.534634776041242,
+                                'inflation': 1.2174573788056278,
+                                'null': 1.1535036462193204}},
+ (9, 0.1, 'pocock', 2): {0.8: {'alternative': 0.764726028884874,
+                               'inflation': 1.2525844120013179,
+                               'null': 1.186785436265759},
+                         0.95: {'alternative': 0.5565445664372505,
+                                'inflation': 1.211302799393692,
+                                'null': 1.14767237038462}},
+ (10, 0.01, 'obrien_fleming', 1): {0.8: {'alternative': 0.811262845651224,
+                                         'inflation': 1.027581438481969,
+                                         'null': 1.0261547916166176},
+                                   0.95: {'alternative': 0.6914634574422566,
+                                          'inflation': 1.024899731443651,
+                                          'null': 1.0234768077371623}},
+ (10, 0.01, 'obrien_fleming', 2): {0.8: {'alternative': 0.8127090115110981,
+                                         'inflation': 1.0290254990218635,
+                                         'null': 1.0275968472892187},
+                                   0.95: {'alternative': 0.692709812168961,
+                                          'inflation': 1.0262077311530924,
+                                          'null': 1.0247829914799174}},
+ (10, 0.01, 'pocock', 1): {0.8: {'alternative': 0.7974575649174496,
+                                 'inflation': 1.23184199194728,
+                                 'null': 1.2253000129573461},
+                           0.95: {'alternative': 0.5957538835440886,
+                                  'inflation': 1.1962622211372287,
+                                  'null': 1.1899091966679456}},
+ (10, 0.01, 'pocock', 2): {0.8: {'alternative': 0.8077883321197139,
+                                 'inflation': 1.2203432362284743,
+                                 'null': 1.2138623240140365},
+                           0.95: {'alternative': 0.6104025795207517,
+                                  'inflation': 1.1875294237882668,
+                                  'null': 1.1812227768391517}},
+ (10, 0.05, 'obrien_fleming', 1): {0.8: {'alternative': 0.7783151683618618,
+                                         'inflation': 1.0500433814285886,
+                                         'null': 1.0389465553102997},
+                                   0.95: {'alternative': 0.641700983225558,
+                                          'inflation': 1.044512772964983,
+                                          'null': 1.0334743941466196}},
+ (10, 0.05, 'obrien_fleming', 2): {0.8: {'alternative': 0.7816152323163269,
+                                         'inflation': 1.0534532434884325,
+                                         'null': 1.0423203820528635},
+                                   0.95: {'alternative': 0.6444293064360358,
+                                          'inflation': 1.04755207432535,
+                                          'null': 1.036481576263767}},
+ (10, 0.05, 'pocock', 1): {0.8: {'alternative': 0.764406973964778,
+                                 'inflation': 1.2587805022387095,
+                                 'null': 1.2253552916499624},
+                           0.95: {'alternative': 0.5537003486720128,
+                                  'inflation': 1.2158231135737272,
+                                  'null': 1.1835385782336958}},
+ (10, 0.05, 'pocock', 2): {0.8: {'alternative': 0.7801933610578342,
+                                 'inflation': 1.2470611247681078,
+                                 'null': 1.2139471063678442},
+                           0.95: {'alternative': 0.5732626659563906,
+                                  'inflation': 1.2075426043180353,
+                                  'null': 1.1754779466807241}},
+ (10, 0.1, 'obrien_fleming', 1): {0.8: {'alternative': 0.7580595005322581,
+                                        'inflation': 1.0700127914834128,
+                                        'null': 1.0417541317163919},
+                                  0.95: {'alternative': 0.6105830618838067,
+                                         'inflation': 1.0616277035025707,
+                                         'null': 1.0335904909465112}},
+ (10, 0.1, 'obrien_fleming', 2): {0.8: {'alternative': 0.7632923226202241,
+                                        'inflation': 1.0754967303753873,
+                                        'null': 1.0470932417196122},
+                                  0.95: {'alternative': 0.6148580376534377,
+                                         'inflation': 1.066562393461334,
+                                         'null': 1.0383948574867878}},
+ (10, 0.1, 'pocock', 1): {0.8: {'alternative': 0.7443750065072869,
+                                'inflation': 1.2673231368812956,
+                                'null': 1.200019039529545},
+                          0.95: {'alternative': 0.5312590856797588,
+                                 'inflation': 1.221351182678174,
+                                 'null': 1.1564885312300714}},
+ (10, 0.1, 'pocock', 2): {0.8: {'alternative': 0.763039805046106,
+                                'inflation': 1.2568148148010319,
+                                'null': 1.1900687859563286},
+                          0.95: {'alternative': 0.5533281638866185,
+                                 'inflation': 1.2148974572631703,
+                                 'null': 1.1503775456812229}}}
@@ -0,0 +1,188 @@
+from typing import Any, Dict, Tuple
+import numpy as np
+from scipy.stats import chi2, multivariate_normal, norm
+from domain.entities.multi_arm_variation import MultiArmVariation
+from domain.use_cases.bayesian_analysis import DEFAULT_PRIOR, calculate_multi_arm_bayesian
+from domain.use_cases.statistics_backend import get_statistics_backend
+
+CORRECTIONS = ("bonferroni", "holm", "dunnett", "none")
+
+
+class MultiArmStatisticalValidator:
+    """
+    Validador de testes A/B/n.
+
+    Todas as comparações são calculadas em uma única operação matricial: para taxas r e
+    erros padrão s, a diferença entre os braços i (base) e j é D[i, j] = r[j] - r[i] e o
+    erro padrão é sqrt(s[i]² + s[j]²). As comparações de interesse (cada variação contra o
+    controle, ou todos os pares) são lidas dessas matrizes e os p-valores são corrigidos
+    para múltiplas comparações.
+    """
+    def __init__(self, variation: MultiArmVariation, correction: str = "holm",
+                 all_pairs: bool = False, backend: str | None = None) -> None:
+        """
+        Args:
+            variation: Entidade com as contagens de todos os braços.
+            correction: "bonferroni", "holm", "dunnett" (só contra o controle) ou "none".
+            all_pairs: Compara todos os pares de braços, não só cada variação com o controle.
+            backend: Backend estatístico usado no valor Z crítico ("fast" ou "scipy").
+        """
+        if correction not in CORRECTIONS:
+            raise ValueError(f"Correção desconhecida: {correction}. Use {', '.join(CORRECTIONS)}.")
+        if correction == "dunnett" and all_pairs:
+            raise ValueError("A correção de Dunnett só se aplica às comparações com o controle.")
+        if variation.tail_numbers not in (1, 2):
+            raise ValueError("Número de caudas deve ser 1 ou 2.")
+        self.variation = variation
+        self.correction = correction
+        self.all_pairs = all_pairs
+        self.backend = get_statistics_backend(backend)
+
+    def get_statistical_results(self) -> Dict[str, Any]:
+        """
+        Orquestra os cálculos e retorna um dicionário com as métricas dos braços,
+        as comparações corrigidas, o SRM com k células e a análise bayesiana.
+        """
+        difference, standard_error, z_score, p_value = self.calculate_pairwise_matrices()
+        baselines, arms = self._comparison_indices()
+        adjusted = self._adjust_p_values(p_value[baselines, arms], z_score[baselines, arms], arms)
+        alpha = 1 - self.variation.confidence_level
+
+        rates = self.variation.conversion_rates
+        safe_base_rates = np.where(rates[baselines] != 0, rates[baselines], 1.0)
+        uplift = np.where(rates[baselines] != 0, difference[baselines, arms] / safe_base_rates, np.inf)
+
+        z_critical = abs(self.backend.z_critical(self.variation.tail_numbers, self.variation.confidence_level))
+        names = self.variation.arm_names
+        return {
+            "arms": [
+                {
+                    "arm": names[i],
+                    "visitors": int(self.variation.visitors[i]),
+                    "conversions": int(self.variation.conversions[i]),
+                    "conversion_rate": float(rates[i]),
+                    "lower_bound": float(rates[i] - self.variation.default_errors[i] * z_critical),
+                    "upper_bound": float(rates[i] + self.variation.default_errors[i] * z_critical),
+                }
+                for i in range(len(names))
+            ],
+            "comparisons": [
+                {
+                    "baseline": names[base],
+                    "arm": names[arm],
+                    "difference": float(difference[base, arm]),
+                    "conversion_rate_uplift": float(uplift[position]),
+                    "standard_error_difference": float(standard_error[base, arm]),
+                    "z_score": float(z_score[base, arm]),
+                    "p_value": float(p_value[base, arm]),
+                    "adjusted_p_value": float(adjusted[position]),
+                    "is_significant": bool(adjusted[position] < alpha),
+                }
+                for position, (base, arm) in enumerate(zip(baselines, arms))
+            ],
+            "correction": self.correction,
+            "srm_results": self.check_sample_ratio_mismatch(),
+            "bayesian_results": self.get_bayesian_results(),
+        }
+
+    def get_bayesian_results(self, prior_alpha: float = DEFAULT_PRIOR[0],
+                             prior_beta: float = DEFAULT_PRIOR[1]) -> Dict[str, Any]:
+        """
+        Probabilidade de cada braço superar o controle, de ser o melhor braço e a perda
+        esperada de escolhê-lo (Beta-Binomial, memorizado por contagens e priori).
+        """
+        return dict(calculate_multi_arm_bayesian(
+            tuple(int(value) for value in self.variation.visitors),
+            tuple(int(value) for value in self.variation.conversions),
+            self.variation.control_index,
+            float(prior_alpha),
+            float(prior_beta),
+        ))
+
+    def calculate_pairwise_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Matrizes k x k de diferença, erro padrão, z-score e p-valor (linha = braço base).
+        """
+        rates = self.variation.conversion_rates
+        variances = self.variation.default_errors ** 2
+
+        difference = rates[None, :] - rates[:, None]
+        standard_error = np.sqrt(variances[None, :] + variances[:, None])
+        safe_error = np.where(standard_error != 0, standard_error, 1.0)
+        z_score = np.where(standard_error != 0, difference / safe_error, 0.0)
+
+        if self.variation.tail_numbers == 1:
+            p_value = norm.sf(z_score)
+        else:
+            p_value = 2 * norm.sf(np.abs(z_score))
+        return difference, standard_error, z_score, p_value
+
+    def _comparison_indices(self) -> Tuple[np.ndarray, np.ndarray]:
+        arm_count = len(self.variation)
+        if self.all_pairs:
+            return np.triu_indices(arm_count, k=1)
+        arms = np.array([i for i in range(arm_count) if i != self.variation.control_index])
+        return np.full(arms.shape, self.variation.control_index), arms
+
+    def _adjust_p_values(self, p_values: np.ndarray, z_scores: np.ndarray, arms: np.ndarray) -> np.ndarray:
+        comparisons = p_values.shape[0]
+        if self.correction == "none":
+            return p_values
+        if self.correction == "bonferroni":
+            return np.minimum(1.0, p_values * comparisons)
+        if self.correction == "holm":
+            order = np.argsort(p_values, kind="stable")
+            stepped = np.maximum.accumulate(p_values[order] * (comparisons - np.arange(comparisons)))
+            adjusted = np.empty_like(p_values)
+            adjusted[order] = np.minimum(1.0, stepped)
+            return adjusted
+        return self._dunnett_adjusted_p_values(z_scores, arms)
+
+    def _dunnett_adjusted_p_values(self, z_scores: np.ndarray, arms: np.ndarray) -> np.ndarray:
+        """
+        Ajuste de Dunnett (single-step) com a correlação entre as comparações com o
+        controle: corr(i, j) = s_c² / sqrt((s_c² + s_i²) (s_c² + s_j²)).
+
+        O p-valor ajustado de cada comparação é P(max |Z| >= |z_observado|) sob a normal
+        multivariada com essa correlação (P(max Z >= z) no teste unicaudal).
+        """
+        control = self.variation.control_index
+        variances = self.variation.default_errors ** 2
+        control_variance = variances[control]
+        totals = control_variance + variances[arms]
+        safe_totals = np.where(totals != 0, totals, 1.0)
+        correlation = control_variance / np.sqrt(np.outer(safe_totals, safe_totals))
+        np.fill_diagonal(correlation, 1.0)
+
+        distribution = multivariate_normal(mean=np.zeros(len(arms)), cov=correlation, allow_singular=True, seed=0)
+        adjusted = []
+        for z in z_scores:
+            if self.variation.tail_numbers == 1:
+                upper = np.full(len(arms), z)
+                inside = distribution.cdf(upper)
+            else:
+                bound = np.full(len(arms), abs(z))
+                inside = distribution.cdf(bound, lower_limit=-bound)
+            adjusted.append(min(1.0, max(0.0, 1.0 - float(inside))))
+        return np.array(adjusted)
+
+    def check_sample_ratio_mismatch(self) -> Dict[str, Any]:
+        """
+        Teste Qui-Quadrado de SRM com k células, contra a divisão de tráfego planejada.
+
+        Returns:
+            'has_srm' (p-valor <= 0.01), 'srm_p_value' e 'srm_expected_per_arm'.
+        """
+        observed = self.variation.visitors.astype(np.float64)
+        total_visitors = observed.sum()
+        expected = total_visitors * self.variation.expected_weights
+        if total_visitors == 0:
+            return {"has_srm": False, "srm_p_value": 1.0, "srm_expected_per_arm": expected.tolist()}
+
+        statistic = float(((observed - expected) ** 2 / expected).sum())
+        p_value = float(chi2.sf(statistic, len(observed) - 1))
+        return {
+            "has_srm": bool(p_value <= 0.01),
+            "srm_p_value": p_value,
+            "srm_expected_per_arm": expected.tolist(),
+        }
@@ -0,0 +1,149 @@
+"""
+Acumulador incremental (online) das contagens de um teste A/B.
+
+Os eventos chegam continuamente; em vez de recriar a Variation e recalcular tudo a cada
+evento, o acumulador guarda apenas as estatísticas suficientes (visitantes e conversões
+por braço). Cada atualização é O(1) e as métricas são calculadas sob demanda, uma única
+vez por estado, pelo mesmo grafo de métricas do ABStatisticalValidator.
+
+Acumuladores de vários shards/processos podem ser combinados com merge() (map-reduce):
+como as contagens são somas, o resultado é idêntico ao de um único acumulador.
+"""
+from datetime import date
+from typing import Any, Dict, Iterable
+from domain.entities.ab_tester import ABTester
+from domain.entities.variation import Variation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+
+ARMS = ("A", "B")
+
+
+class OnlineExperimentAccumulator:
+    """
+    Contagens acumuladas de um teste A/B com atualização e combinação em O(1).
+    """
+    def __init__(self,
+                 tester: ABTester,
+                 tail_numbers: int = 2,
+                 confidence_level: float = 95.0,
+                 estimated_uplift: float = 10.0,
+                 backend: str | None = None) -> None:
+        """
+        Args:
+            tester: Entidade com as datas e a configuração do teste.
+            tail_numbers: Número de caudas do teste (1 ou 2).
+            confidence_level: Nível de confiança em % (ex: 95.0).
+            estimated_uplift: MDE em % (ex: 10.0).
+            backend: Backend estatístico repassado ao validador ("fast" ou "scipy").
+        """
+        self.tester = tester
+        self.tail_numbers = tail_numbers
+        self.confidence_level = confidence_level
+        self.estimated_uplift = estimated_uplift
+        self.backend = backend
+        self.visitors = {arm: 0 for arm in ARMS}
+        self.conversions = {arm: 0 for arm in ARMS}
+        self._validator: ABStatisticalValidator | None = None
+
+    @staticmethod
+    def _arm(arm: str) -> str:
+        normalized = str(arm).upper()
+        if normalized not in ARMS:
+            raise ValueError(f"Braço inválido: {arm}. Use 'A' (controle) ou 'B' (variação).")
+        return normalized
+
+    def add(self, arm: str, visitors: int = 0, conversions: int = 0) -> "OnlineExperimentAccumulator":
+        """
+        Soma visitantes e conversões a um braço ("A" ou "B").
+        """
+        if visitors < 0 or conversions < 0:
+            raise ValueError("Visitantes e conversões não podem ser negativos.")
+        arm = self._arm(arm)
+        self.visitors[arm] += int(visitors)
+        self.conversions[arm] += int(conversions)
+        self._validator = None
+        return self
+
+    def add_events(self, events: Iterable[tuple]) -> "OnlineExperimentAccumulator":
+        """
+        Soma uma sequência de eventos (arm, visitors, conversions).
+        """
+        for arm, visitors, conversions in events:
+            self.add(arm, visitors, conversions)
+        return self
+
+    def _check_compatible(self, other: "OnlineExperimentAccumulator") -> None:
+        own = (self.tester.start_date, self.tester.end_date, self.tail_numbers,
+               self.confidence_level, self.estimated_uplift)
+        others = (other.tester.start_date, other.tester.end_date, other.tail_numbers,
+                  other.confidence_level, other.estimated_uplift)
+        if own != others:
+            raise ValueError("Só é possível combinar acumuladores do mesmo teste (datas e parâmetros iguais).")
+
+    def merge(self, other: "OnlineExperimentAccumulator") -> "OnlineExperimentAccumulator":
+        """
+        Incorpora as contagens de outro acumulador do mesmo teste (ex: de outro shard).
+        Retorna o próprio acumulador, de modo que functools.reduce(merge, shards) funciona.
+        """
+        self._check_compatible(other)
+        for arm in ARMS:
+            self.visitors[arm] += other.visitors[arm]
+            self.conversions[arm] += other.conversions[arm]
+        self._validator = None
+        return self
+
+    def to_variation(self) -> Variation:
+        """ Retorna a Variation com os totais atuais. """
+        return Variation(
+            variation_a_visitors=self.visitors["A"],
+            variation_b_visitors=self.visitors["B"],
+            conversions_a=self.conversions["A"],
+            conversions_b=self.conversions["B"],
+            tail_numbers=self.tail_numbers,
+            confidence_level=self.confidence_level,
+            estimated_uplift=self.estimated_uplift,
+        )
+
+    def validator(self, today: date | None = None) -> ABStatisticalValidator:
+        """
+        Validador do estado atual. É reaproveitado (com as métricas já memorizadas)
+        até a próxima atualização das contagens.
+        """
+        if self._validator is None or (today is not None and today != self._validator.today):
+            self._validator = ABStatisticalValidator(
+                variation=self.to_variation(), tester=self.tester, today=today, backend=self.backend
+            )
+        return self._validator
+
+    @property
+    def conversion_rate_a(self) -> float:
+        return self.validator().variation.conversion_rate_a
+
+    @property
+    def conversion_rate_b(self) -> float:
+        return self.validator().variation.conversion_rate_b
+
+    @property
+    def standard_error_difference(self) -> float:
+        return self.validator().get_metric("standard_error_difference")
+
+    @property
+    def z_score(self) -> float:
+        return self.validator().get_metric("z_score")
+
+    @property
+    def p_value(self) -> float:
+        return self.validator().get_metric("p_value")
+
+    def get_statistical_results(self, metrics: Iterable[str] | None = None,
+                                today: date | None = None) -> Dict[str, Any]:
+        """
+        Mesmo formato de ABStatisticalValidator.get_statistical_results() para os totais atuais.
+        """
+        return self.validator(today).get_statistical_results(metrics)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # O validador memorizado é descartável; só as contagens viajam entre processos
+        state = self.__dict__.copy()
+        state["_validator"] = None
+        return state
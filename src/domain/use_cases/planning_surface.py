@@ -0,0 +1,154 @@
+"""
+Superfície pré-computada de tamanho de amostra (taxa base x MDE x poder).
+
+O explorador de planejamento muda a taxa base, o MDE e o poder a cada interação. Em vez
+de resolver o tamanho de amostra a cada mudança, a grade inteira é resolvida uma única
+vez por (alfa, caudas) pelo solver vetorizado de power_analysis e guardada em memória.
+As consultas são interpolações trilineares no logaritmo do número de usuários, que
+varia de forma quase linear com log(taxa base), log(MDE) e o quantil normal do poder
+(z_β); a partir de mil usuários o erro fica abaixo de 0,5% do valor exato.
+
+Consultas fora da grade são resolvidas pelo solver exato.
+"""
+import threading
+import time
+from typing import Dict, Tuple
+import numpy as np
+from domain.use_cases.power_analysis import required_sample_size, z_quantiles
+
+# Eixos padrão da grade
+BASELINE_RANGE = (0.001, 0.45)
+MDE_RANGE = (0.01, 1.0)
+POWER_RANGE = (0.50, 0.99)
+BASELINE_POINTS = 160
+MDE_POINTS = 160
+POWER_STEP = 0.01
+
+SurfaceKey = Tuple[float, int]
+
+# Superfícies já construídas: (alfa, caudas) -> PlanningSurface
+PLANNING_SURFACES: Dict[SurfaceKey, "PlanningSurface"] = {}
+_SURFACES_LOCK = threading.Lock()
+
+
+def _locate(axis: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ Índice da célula e peso da interpolação linear de cada valor no eixo. """
+    index = np.clip(np.searchsorted(axis, values, side="right") - 1, 0, axis.shape[0] - 2)
+    weight = (values - axis[index]) / (axis[index + 1] - axis[index])
+    return index, weight
+
+
+class PlanningSurface:
+    """
+    Grade de usuários necessários (total dos dois braços, divisão 50/50) para um alfa e
+    um número de caudas, com consultas interpoladas.
+    """
+    def __init__(self, alpha: float = 0.05, tails: int = 2,
+                 baseline_points: int = BASELINE_POINTS, mde_points: int = MDE_POINTS,
+                 power_step: float = POWER_STEP) -> None:
+        """
+        Args:
+            alpha: Nível de significância.
+            tails: 1 (unicaudal) ou 2 (bicaudal).
+            baseline_points, mde_points: Pontos (em escala log) dos eixos de taxa base e MDE.
+            power_step: Espaçamento do eixo de poder.
+        """
+        if tails not in (1, 2):
+            raise ValueError("Número de caudas deve ser 1 ou 2.")
+        self.alpha = alpha
+        self.tails = tails
+        self.log_baselines = np.linspace(np.log(BASELINE_RANGE[0]), np.log(BASELINE_RANGE[1]), baseline_points)
+        self.log_mdes = np.linspace(np.log(MDE_RANGE[0]), np.log(MDE_RANGE[1]), mde_points)
+        self.powers = np.round(np.arange(POWER_RANGE[0], POWER_RANGE[1] + power_step / 2, power_step), 6)
+        self.power_quantiles = z_quantiles(self.powers)
+
+        start = time.perf_counter()
+        users = required_sample_size(
+            np.exp(self.log_baselines)[:, None, None],
+            np.exp(self.log_mdes)[None, :, None],
+            alpha=alpha,
+            power=self.powers[None, None, :],
+            tails=tails,
+        )["total_users"]
+        self.log_users = np.log(users).astype(np.float32)
+        self.build_seconds = time.perf_counter() - start
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.log_users.shape
+
+    @property
+    def nbytes(self) -> int:
+        """ Memória ocupada pela grade e pelos eixos. """
+        axes = (self.log_baselines, self.log_mdes, self.powers, self.power_quantiles)
+        return int(self.log_users.nbytes + sum(axis.nbytes for axis in axes))
+
+    def _in_range(self, log_baseline: np.ndarray, log_mde: np.ndarray, power: np.ndarray) -> np.ndarray:
+        return ((log_baseline >= self.log_baselines[0]) & (log_baseline <= self.log_baselines[-1])
+                & (log_mde >= self.log_mdes[0]) & (log_mde <= self.log_mdes[-1])
+                & (power >= self.powers[0]) & (power <= self.powers[-1]))
+
+    def lookup(self, baseline: np.ndarray, mde: np.ndarray, power: np.ndarray) -> np.ndarray:
+        """
+        Usuários necessários (total) para cada combinação, no formato do broadcasting
+        das entradas. Valores fora da grade são resolvidos pelo solver exato.
+        """
+        baseline, mde, power = np.broadcast_arrays(
+            *(np.asarray(value, dtype=np.float64) for value in (baseline, mde, power)))
+        valid = (baseline > 0) & (mde > 0)
+        log_baseline = np.log(np.where(valid, baseline, 1.0))
+        log_mde = np.log(np.where(valid, mde, 1.0))
+        inside = valid & self._in_range(log_baseline, log_mde, power)
+
+        i, wi = _locate(self.log_baselines, log_baseline)
+        j, wj = _locate(self.log_mdes, log_mde)
+        k, wk = _locate(self.power_quantiles, z_quantiles(np.clip(power, self.powers[0], self.powers[-1])))
+        grid = self.log_users
+        interpolated = 0.0
+        for di, weight_i in ((0, 1 - wi), (1, wi)):
+            for dj, weight_j in ((0, 1 - wj), (1, wj)):
+                for dk, weight_k in ((0, 1 - wk), (1, wk)):
+                    interpolated = interpolated + weight_i * weight_j * weight_k * grid[i + di, j + dj, k + dk]
+        users = np.where(inside, np.ceil(np.exp(interpolated)), 0).astype(np.int64)
+
+        outside = valid & ~inside
+        if outside.any():
+            users[outside] = required_sample_size(
+                baseline[outside], mde[outside], alpha=self.alpha, power=power[outside], tails=self.tails,
+            )["total_users"]
+        return users
+
+    def lookup_days(self, baseline: np.ndarray, mde: np.ndarray, power: np.ndarray,
+                    daily_visitors: float) -> np.ndarray:
+        """ Dias necessários com o tráfego diário informado (0 sem tráfego). """
+        users = self.lookup(baseline, mde, power)
+        if daily_visitors <= 0:
+            return np.zeros_like(users)
+        return np.ceil(users / daily_visitors).astype(np.int64)
+
+    def heatmap(self, power: float, points: int = 40) -> Dict[str, np.ndarray]:
+        """
+        Fatia da superfície em um poder, reamostrada em `points` x `points` células para
+        o gráfico.
+
+        Returns:
+            Arrays achatados 'baseline', 'mde' e 'users', um elemento por célula.
+        """
+        baselines = np.exp(np.linspace(self.log_baselines[0], self.log_baselines[-1], points))
+        mdes = np.exp(np.linspace(self.log_mdes[0], self.log_mdes[-1], points))
+        baseline_grid, mde_grid = np.meshgrid(baselines, mdes, indexing="ij")
+        users = self.lookup(baseline_grid, mde_grid, power)
+        return {"baseline": baseline_grid.ravel(), "mde": mde_grid.ravel(), "users": users.ravel()}
+
+
+def get_planning_surface(alpha: float, tails: int) -> PlanningSurface:
+    """
+    Superfície de (alfa, caudas), construída apenas na primeira vez e mantida em memória.
+    """
+    key = (round(float(alpha), 6), int(tails))
+    surface = PLANNING_SURFACES.get(key)
+    if surface is None:
+        surface = PlanningSurface(alpha=key[0], tails=key[1])
+        with _SURFACES_LOCK:
+            surface = PLANNING_SURFACES.setdefault(key, surface)
+    return surface
@@ -0,0 +1,235 @@
+"""
+Poder e tamanho de amostra para a comparação de duas proporções.
+
+Substitui as constantes de Lehr (16 para 80% de poder e 26 para 95%), que valem apenas
+para um teste bicaudal com alfa de 5%, pela fórmula da aproximação normal com variância
+combinada sob H0 e separada sob H1 (Fleiss), válida para qualquer alfa, poder, número de
+caudas e divisão de tráfego. Para k = n_B / n_A e Δ = p_B - p_A:
+
+    n_A = (z_α sqrt(p̄ q̄ (1 + 1/k)) + z_β sqrt(p_A q_A + p_B q_B / k))² / Δ²
+
+com p̄ = (p_A + k p_B) / (1 + k) e z_α = Φ⁻¹(1 - α / caudas). No bicaudal, a solução é
+refinada para incluir a (pequena) probabilidade de rejeição na cauda oposta.
+
+Para métricas contínuas (ex: receita por visitante), a diferença de médias tem a mesma
+variância sob H0 e H1, e o tamanho de amostra usa σ² = σ_A² + σ_B² / k nos dois termos.
+
+Todas as funções aceitam arrays e seguem as regras de broadcasting do NumPy, de modo que
+uma grade inteira (taxas base x MDEs x níveis de poder) é resolvida em uma única chamada.
+Os quantis da normal vêm de uma tabela memorizada: uma grade usa poucos valores
+distintos de alfa e poder.
+"""
+import math
+from functools import lru_cache
+from typing import Dict
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+# Passos de Newton que incluem a cauda oposta no poder do teste bicaudal
+_NEWTON_STEPS = 3
+_SQRT_2PI = np.sqrt(2 * np.pi)
+
+
+def _normal_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x ** 2) / _SQRT_2PI
+
+
+@lru_cache(maxsize=4096)
+def _z_quantile(probability: float) -> float:
+    return float(ndtri(probability))
+
+
+def z_quantiles(probabilities: np.ndarray) -> np.ndarray:
+    """ Φ⁻¹ de cada probabilidade, calculado uma única vez por valor distinto. """
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    if probabilities.size == 1:
+        return np.full(probabilities.shape, _z_quantile(float(probabilities.reshape(-1)[0])))
+    values, inverse = np.unique(probabilities, return_inverse=True)
+    table = np.array([_z_quantile(value) for value in values.tolist()])
+    return table[inverse].reshape(probabilities.shape)
+
+
+def _standard_deviations(p_control: np.ndarray, p_variant: np.ndarray, allocation_ratio: np.ndarray):
+    """ Desvios padrão (por raiz de n_A) da diferença sob H0 (combinado) e sob H1. """
+    pooled = (p_control + allocation_ratio * p_variant) / (1 + allocation_ratio)
+    null = np.sqrt(pooled * (1 - pooled) * (1 + 1 / allocation_ratio))
+    alternative = np.sqrt(p_control * (1 - p_control) + p_variant * (1 - p_variant) / allocation_ratio)
+    return null, alternative
+
+
+def _newton_terms(root, difference, null, alternative, z_alpha, power):
+    """ Excesso de poder do bicaudal em sqrt(n_A) = root e a sua derivada. """
+    upper = (difference * root - z_alpha * null) / alternative
+    lower = (-difference * root - z_alpha * null) / alternative
+    excess = ndtr(upper) + ndtr(lower) - power
+    slope = difference / alternative * (_normal_pdf(upper) - _normal_pdf(lower))
+    return excess, slope
+
+
+def required_total_users(p_control: float, mde: float, alpha: float = 0.05,
+                         power: float = 0.80, tails: int = 2) -> int:
+    """
+    Versão escalar de required_sample_size para a divisão 50/50 (total dos dois braços).
+
+    Faz as mesmas operações em floats, sem o custo de criar arrays a cada chamada, e
+    por isso devolve exatamente o mesmo valor.
+    """
+    p_variant = p_control * (1 + mde)
+    if p_control <= 0 or mde <= 0 or p_variant >= 1:
+        return 0
+    null, alternative = _standard_deviations(p_control, p_variant, 1.0)
+    z_alpha = _z_quantile(1 - alpha / tails)
+    difference = abs(p_variant - p_control)
+    root = (z_alpha * null + _z_quantile(power) * alternative) / difference
+    if tails == 2:
+        for _ in range(_NEWTON_STEPS):
+            excess, slope = _newton_terms(root, difference, null, alternative, z_alpha, power)
+            if slope > 0:
+                root = root - excess / slope
+    return 2 * math.ceil(root ** 2)
+
+
+def required_sample_size(p_control: np.ndarray, mde: np.ndarray, alpha: np.ndarray = 0.05,
+                         power: np.ndarray = 0.80, tails: np.ndarray = 2,
+                         allocation_ratio: np.ndarray = 1.0) -> Dict[str, np.ndarray]:
+    """
+    Tamanho de amostra para detectar um uplift relativo `mde` sobre a taxa `p_control`.
+
+    Args:
+        p_control: Taxa de conversão do controle.
+        mde: Efeito mínimo detectável relativo (0.10 = +10%).
+        alpha: Nível de significância.
+        power: Poder desejado (ex: 0.80).
+        tails: 1 (unicaudal) ou 2 (bicaudal).
+        allocation_ratio: Visitantes da variação por visitante do controle (1 = 50/50).
+
+    Returns:
+        'control_users', 'variant_users' e 'total_users' (arrays inteiros no formato
+        resultante do broadcasting). Combinações inválidas (taxa ou MDE não positivos,
+        ou taxa da variação fora de (0, 1)) retornam 0.
+    """
+    p_control, mde, alpha, power, tails, allocation_ratio = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in (p_control, mde, alpha, power, tails, allocation_ratio))
+    )
+    p_variant = p_control * (1 + mde)
+    valid = (p_control > 0) & (mde > 0) & (p_variant < 1) & (allocation_ratio > 0)
+
+    safe_control = np.where(valid, p_control, 0.5)
+    safe_variant = np.where(valid, p_variant, 0.75)
+    safe_ratio = np.where(valid, allocation_ratio, 1.0)
+    null, alternative = _standard_deviations(safe_control, safe_variant, safe_ratio)
+
+    z_alpha = z_quantiles(1 - alpha / tails)
+    z_beta = z_quantiles(power)
+    difference = np.abs(safe_variant - safe_control)
+    root = (z_alpha * null + z_beta * alternative) / difference
+
+    # No bicaudal a fórmula ignora a rejeição na cauda oposta; alguns passos de Newton em
+    # sqrt(n_A) resolvem a equação de poder completa (a solução só pode diminuir)
+    two_tailed = valid & (tails == 2)
+    if two_tailed.any():
+        for _ in range(_NEWTON_STEPS):
+            excess, slope = _newton_terms(root, difference, null, alternative, z_alpha, power)
+            root = np.where(two_tailed & (slope > 0), root - excess / np.where(slope > 0, slope, 1.0), root)
+    control = root ** 2
+
+    control_users = np.where(valid, np.ceil(control), 0).astype(np.int64)
+    variant_users = np.where(valid, np.ceil(control * safe_ratio), 0).astype(np.int64)
+    return {
+        "control_users": control_users,
+        "variant_users": variant_users,
+        "total_users": control_users + variant_users,
+    }
+
+
+def required_sample_size_means(mean_control: np.ndarray, standard_deviation_control: np.ndarray, mde: np.ndarray,
+                               alpha: np.ndarray = 0.05, power: np.ndarray = 0.80, tails: np.ndarray = 2,
+                               allocation_ratio: np.ndarray = 1.0,
+                               standard_deviation_variant: np.ndarray | None = None) -> Dict[str, np.ndarray]:
+    """
+    Tamanho de amostra para detectar um uplift relativo `mde` na média de uma métrica contínua.
+
+    Args:
+        mean_control: Média da métrica no controle.
+        standard_deviation_control: Desvio padrão da métrica por usuário no controle.
+        standard_deviation_variant: Desvio padrão na variação (padrão: o mesmo do controle).
+        Demais argumentos como em required_sample_size.
+
+    Returns:
+        'control_users', 'variant_users' e 'total_users'. Combinações sem efeito
+        (média ou MDE nulos) ou sem variância retornam 0.
+    """
+    if standard_deviation_variant is None:
+        standard_deviation_variant = standard_deviation_control
+    mean_control, deviation_a, deviation_b, mde, alpha, power, tails, allocation_ratio = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in (
+            mean_control, standard_deviation_control, standard_deviation_variant, mde, alpha, power, tails,
+            allocation_ratio))
+    )
+    difference = np.abs(mean_control * mde)
+    deviation = np.sqrt(deviation_a ** 2 + deviation_b ** 2 / np.where(allocation_ratio > 0, allocation_ratio, 1.0))
+    valid = (difference > 0) & (deviation > 0) & (allocation_ratio > 0)
+
+    safe_difference = np.where(valid, difference, 1.0)
+    safe_deviation = np.where(valid, deviation, 1.0)
+    z_alpha = z_quantiles(1 - alpha / tails)
+    root = (z_alpha + z_quantiles(power)) * safe_deviation / safe_difference
+
+    two_tailed = valid & (tails == 2)
+    if two_tailed.any():
+        for _ in range(_NEWTON_STEPS):
+            excess, slope = _newton_terms(root, safe_difference, safe_deviation, safe_deviation, z_alpha, power)
+            root = np.where(two_tailed & (slope > 0), root - excess / np.where(slope > 0, slope, 1.0), root)
+    control = root ** 2
+
+    safe_ratio = np.where(valid, allocation_ratio, 1.0)
+    control_users = np.where(valid, np.ceil(control), 0).astype(np.int64)
+    variant_users = np.where(valid, np.ceil(control * safe_ratio), 0).astype(np.int64)
+    return {
+        "control_users": control_users,
+        "variant_users": variant_users,
+        "total_users": control_users + variant_users,
+    }
+
+
+def calculate_power(p_control: np.ndarray, mde: np.ndarray, control_users: np.ndarray,
+                    alpha: np.ndarray = 0.05, tails: np.ndarray = 2,
+                    allocation_ratio: np.ndarray = 1.0) -> np.ndarray:
+    """
+    Poder do teste com `control_users` visitantes no controle (e allocation_ratio vezes
+    isso na variação). No bicaudal inclui a probabilidade de rejeitar na cauda oposta.
+    """
+    p_control, mde, control_users, alpha, tails, allocation_ratio = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64)
+          for value in (p_control, mde, control_users, alpha, tails, allocation_ratio))
+    )
+    p_variant = p_control * (1 + mde)
+    valid = (p_control > 0) & (mde > 0) & (p_variant < 1) & (allocation_ratio > 0) & (control_users > 0)
+
+    safe_control = np.where(valid, p_control, 0.5)
+    safe_variant = np.where(valid, p_variant, 0.75)
+    null, alternative = _standard_deviations(safe_control, safe_variant, np.where(valid, allocation_ratio, 1.0))
+
+    z_alpha = z_quantiles(1 - alpha / tails)
+    shift = np.abs(safe_variant - safe_control) * np.sqrt(np.where(valid, control_users, 1.0))
+    power = ndtr((shift - z_alpha * null) / alternative)
+    opposite = np.where(tails == 2, ndtr((-shift - z_alpha * null) / alternative), 0.0)
+    return np.where(valid, power + opposite, 0.0)
+
+
+def solve_planning_grid(baselines: np.ndarray, mdes: np.ndarray, powers: np.ndarray,
+                        alpha: float = 0.05, tails: int = 2, allocation_ratio: float = 1.0) -> np.ndarray:
+    """
+    Total de usuários para cada combinação (taxa base, MDE, poder).
+
+    Returns:
+        Um array inteiro com formato (len(baselines), len(mdes), len(powers)).
+    """
+    return required_sample_size(
+        np.asarray(baselines, dtype=np.float64)[:, None, None],
+        np.asarray(mdes, dtype=np.float64)[None, :, None],
+        alpha=alpha,
+        power=np.asarray(powers, dtype=np.float64)[None, None, :],
+        tails=tails,
+        allocation_ratio=allocation_ratio,
+    )["total_users"]
@@ -0,0 +1,63 @@
+"""
+Validador em lote de métricas de razão pelo método delta.
+
+Reaproveita o BatchStatisticalValidator: com a razão no lugar da taxa e o erro padrão
+do método delta (RatioMetricBatch), o teste z, o p-valor, os intervalos, o poder
+observado, o teste sequencial, o SRM e a validação temporal são as mesmas fórmulas. O
+planejamento usa o tamanho de amostra para diferença de médias com a variância por
+usuário da métrica linearizada, e a análise bayesiana Beta-Binomial não se aplica.
+"""
+from datetime import date
+from typing import Any, Dict
+import numpy as np
+from domain.entities.ratio_metric_batch import RatioMetricBatch
+from domain.use_cases.batch_statistical_validator import BatchStatisticalValidator
+from domain.use_cases.power_analysis import required_sample_size_means
+
+
+class RatioMetricValidator(BatchStatisticalValidator):
+    """
+    Avalia todas as métricas de razão do lote (de um ou vários experimentos) de uma vez.
+    """
+    def __init__(self,
+                 variations: RatioMetricBatch,
+                 start_dates: Any,
+                 end_dates: Any,
+                 today: date | None = None) -> None:
+        super().__init__(variations, start_dates=start_dates, end_dates=end_dates, today=today)
+
+    def get_statistical_results(self) -> Dict[str, np.ndarray]:
+        """
+        Mesmas colunas de BatchStatisticalValidator.get_statistical_results, exceto as
+        da análise bayesiana, mais as razões e a variância por usuário de cada braço.
+        """
+        variations = self.variations
+        results = {
+            "control_ratio": variations.conversion_rate_a,
+            "variation_ratio": variations.conversion_rate_b,
+            "control_unit_variance": variations.unit_variance_a,
+            "variation_unit_variance": variations.unit_variance_b,
+        }
+        results.update(self.get_frequentist_results())
+        results.update(self.get_sequential_results())
+        results.update(self.check_sample_ratio_mismatch())
+        temporal_results = self.get_temporal_validation_results()
+        results.update(temporal_results)
+        results.update(self.get_test_planning_metrics(temporal_results["average_daily_visitors"]))
+        return results
+
+    def get_bayesian_results(self, *args, **kwargs) -> Dict[str, np.ndarray]:
+        raise ValueError("A análise bayesiana Beta-Binomial não se aplica a métricas de razão.")
+
+    def _calculate_required_users(self, power: float) -> np.ndarray:
+        """ Usuários (divisão 50/50) para detectar o MDE relativo na razão do controle. """
+        variations = self.variations
+        return required_sample_size_means(
+            mean_control=variations.conversion_rate_a,
+            standard_deviation_control=np.sqrt(variations.unit_variance_a),
+            standard_deviation_variant=np.sqrt(variations.unit_variance_b),
+            mde=variations.estimated_uplift,
+            alpha=1 - variations.confidence_level,
+            power=power,
+            tails=variations.tail_numbers,
+        )["total_users"]
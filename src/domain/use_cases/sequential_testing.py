@@ -0,0 +1,155 @@
+"""
+Teste sequencial sempre válido (mSPRT) para monitoramento contínuo.
+
+O teste z de horizonte fixo só é válido se o resultado for olhado uma única vez; ao
+consultar o painel todo dia, a taxa de falsos positivos cresce. O mSPRT (mixture
+Sequential Probability Ratio Test) compara a diferença observada entre as taxas com
+uma mistura normal N(0, τ²) de efeitos possíveis e produz:
+
+- um p-valor sempre válido (pode ser consultado a qualquer momento);
+- uma sequência de confiança para a diferença absoluta (B - A).
+
+Com a aproximação normal, a razão de verossimilhança depende apenas da diferença
+observada θ e da sua variância V (erro padrão da diferença ao quadrado):
+
+    Λ = sqrt(V / (V + τ²)) * exp(τ² θ² / (2 V (V + τ²)))
+
+A garantia vale para um τ² fixo durante todo o teste. Por isso τ² vem do planejamento
+(taxa base configurada × MDE) ou é fixado na primeira consulta e guardado com o teste,
+como faz o SequentialMonitor; derivá-lo da taxa observada em cada consulta só é
+adequado para uma consulta única.
+
+Referência: Johari, Pekelis e Walsh, "Always Valid Inference" (2017).
+"""
+import math
+from typing import Any, Dict
+from domain.entities.variation import Variation
+
+# Usado quando a taxa do controle ainda é zero e não há como derivar τ² do MDE
+FALLBACK_MIXING_VARIANCE = 1e-4
+
+
+def default_mixing_variance(p_control: float, mde: float) -> float:
+    """
+    Variância da mistura (τ²): o quadrado do efeito absoluto esperado (taxa do controle * MDE).
+
+    Em consultas repetidas, `p_control` deve ser a taxa base do planejamento (ou a da
+    primeira consulta, mantida): com a taxa observada a cada consulta, τ² muda entre as
+    olhadas e o mínimo acumulado dos p-valores deixa de ser sempre válido.
+    """
+    absolute_effect = p_control * mde
+    if absolute_effect <= 0:
+        return FALLBACK_MIXING_VARIANCE
+    return absolute_effect ** 2
+
+
+def msprt_statistics(difference: float, variance: float, mixing_variance: float,
+                     alpha: float) -> Dict[str, float]:
+    """
+    Calcula a estatística do mSPRT para um único instante.
+
+    Args:
+        difference: Diferença observada entre as taxas (B - A).
+        variance: Variância da diferença (erro padrão da diferença ao quadrado).
+        mixing_variance: Variância da mistura de efeitos (τ²).
+        alpha: Nível de significância (ex: 0.05).
+
+    Returns:
+        'log_likelihood_ratio', 'p_value' (1/Λ limitado a 1) e 'half_width' da sequência de confiança.
+    """
+    if variance <= 0:
+        return {"log_likelihood_ratio": 0.0, "p_value": 1.0, "half_width": float("inf")}
+
+    total_variance = variance + mixing_variance
+    log_likelihood_ratio = (0.5 * math.log(variance / total_variance)
+                            + mixing_variance * difference ** 2 / (2 * variance * total_variance))
+    p_value = math.exp(-log_likelihood_ratio) if log_likelihood_ratio > 0 else 1.0
+
+    # Valores de θ para os quais Λ < 1/α
+    half_width = math.sqrt(
+        variance * total_variance / mixing_variance
+        * (2 * math.log(1 / alpha) + math.log(total_variance / variance))
+    )
+    return {"log_likelihood_ratio": log_likelihood_ratio, "p_value": p_value, "half_width": half_width}
+
+
+def _difference_and_variance(variation: Variation) -> tuple:
+    difference = variation.conversion_rate_b - variation.conversion_rate_a
+    variance = variation.default_error_a ** 2 + variation.default_error_b ** 2
+    return difference, variance
+
+
+def calculate_sequential_results(variation: Variation, mixing_variance: float | None = None) -> Dict[str, Any]:
+    """
+    Resultado sequencial a partir das contagens acumuladas de um único instante.
+
+    1/Λ no instante atual já é um p-valor válido a qualquer momento; o SequentialMonitor
+    acrescenta o mínimo acumulado entre as consultas e a interseção das sequências.
+
+    Args:
+        mixing_variance: τ² fixo do teste. Se omitido, é derivado da taxa observada do
+            controle, o que só vale para uma consulta única: para combinar consultas,
+            informe o τ² do planejamento ou use o SequentialMonitor.
+    """
+    alpha = 1 - variation.confidence_level
+    if mixing_variance is None:
+        mixing_variance = default_mixing_variance(variation.conversion_rate_a, variation.estimated_uplift)
+    difference, variance = _difference_and_variance(variation)
+    statistics = msprt_statistics(difference, variance, mixing_variance, alpha)
+    return {
+        "sequential_p_value": statistics["p_value"],
+        "sequential_lower_bound": difference - statistics["half_width"],
+        "sequential_upper_bound": difference + statistics["half_width"],
+        "likelihood_ratio": math.exp(min(statistics["log_likelihood_ratio"], 700.0)),
+        "mixing_variance": mixing_variance,
+        "is_significant": statistics["p_value"] < alpha,
+    }
+
+
+class SequentialMonitor:
+    """
+    Monitor contínuo de um teste: recebe as contagens acumuladas a cada consulta
+    e mantém o p-valor sempre válido e a sequência de confiança em O(1) de tempo e memória,
+    sem recalcular o histórico.
+    """
+    def __init__(self, mixing_variance: float | None = None) -> None:
+        """
+        Args:
+            mixing_variance: τ² fixo. Se omitido, é derivado do MDE e da taxa do controle
+                na primeira consulta com conversões, e mantido a partir daí.
+        """
+        self.mixing_variance = mixing_variance
+        self.looks = 0
+        self.p_value = 1.0
+        self.lower_bound = -math.inf
+        self.upper_bound = math.inf
+        self._last_counts: tuple | None = None
+
+    def observe(self, variation: Variation) -> Dict[str, Any]:
+        """
+        Incorpora as contagens acumuladas atuais e devolve o estado do monitor.
+        Consultas repetidas com as mesmas contagens não alteram o estado.
+        """
+        counts = (variation.variation_a_visitors, variation.conversions_a,
+                  variation.variation_b_visitors, variation.conversions_b)
+        if counts != self._last_counts:
+            if self.mixing_variance is None and variation.conversion_rate_a > 0:
+                self.mixing_variance = default_mixing_variance(
+                    variation.conversion_rate_a, variation.estimated_uplift
+                )
+            current = calculate_sequential_results(variation, self.mixing_variance)
+            self.looks += 1
+            self.p_value = min(self.p_value, current["sequential_p_value"])
+            self.lower_bound = max(self.lower_bound, current["sequential_lower_bound"])
+            self.upper_bound = min(self.upper_bound, current["sequential_upper_bound"])
+            self._last_counts = counts
+        return self.results(1 - variation.confidence_level)
+
+    def results(self, alpha: float) -> Dict[str, Any]:
+        return {
+            "sequential_p_value": self.p_value,
+            "sequential_lower_bound": self.lower_bound,
+            "sequential_upper_bound": self.upper_bound,
+            "looks": self.looks,
+            "is_significant": self.p_value < alpha,
+        }
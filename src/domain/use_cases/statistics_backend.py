@@ -0,0 +1,132 @@
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+import math
+from scipy.stats import norm, chisquare
+
+SQRT2 = math.sqrt(2.0)
+
+# Valores críticos exatos (|norm.ppf((caudas - confiança) / caudas)|, como calculado pelo
+# validador) para as combinações de caudas e confiança oferecidas na interface.
+Z_CRITICAL_TABLE: Dict[Tuple[int, float], float] = {
+    (1, 0.90): 1.2815515655446004,
+    (1, 0.95): 1.6448536269514722,
+    (1, 0.99): 2.3263478740408408,
+    (2, 0.90): 0.12566134685507416,
+    (2, 0.95): 0.06270677794321385,
+    (2, 0.99): 0.012533469508069276,
+}
+
+
+class ScipyStatisticsBackend:
+    """
+    Backend de referência: delega todas as distribuições ao scipy.stats.
+    """
+    name = "scipy"
+
+    def norm_cdf(self, x: float) -> float:
+        return float(norm.cdf(x))
+
+    def norm_sf(self, x: float) -> float:
+        return float(norm.sf(x))
+
+    def norm_ppf(self, probability: float) -> float:
+        return float(norm.ppf(probability))
+
+    def z_critical(self, tail_numbers: int, confidence_level: float) -> float:
+        prob = (tail_numbers - confidence_level) / tail_numbers
+        return abs(self.norm_ppf(prob))
+
+    def chisquare_p_value(self, observed: Sequence[float], expected: Sequence[float]) -> float:
+        _, p_value = chisquare(f_obs=observed, f_exp=expected)
+        return float(p_value)
+
+
+class FastStatisticsBackend:
+    """
+    Backend escalar rápido, sem o despacho genérico do scipy a cada chamada.
+
+    - CDF/SF normais via math.erfc.
+    - Qui-quadrado de 2 células (1 grau de liberdade) em forma fechada: P = erfc(sqrt(X²/2)).
+    - Valores críticos lidos da tabela Z_CRITICAL_TABLE; demais probabilidades usam a
+      aproximação de Acklam refinada por um passo de Halley (erro ~1e-15).
+    """
+    name = "fast"
+
+    def norm_cdf(self, x: float) -> float:
+        return 0.5 * math.erfc(-x / SQRT2)
+
+    def norm_sf(self, x: float) -> float:
+        return 0.5 * math.erfc(x / SQRT2)
+
+    def norm_ppf(self, probability: float) -> float:
+        return _norm_ppf(float(probability))
+
+    def z_critical(self, tail_numbers: int, confidence_level: float) -> float:
+        key = (int(tail_numbers), round(confidence_level, 10))
+        if key in Z_CRITICAL_TABLE:
+            return Z_CRITICAL_TABLE[key]
+        prob = (tail_numbers - confidence_level) / tail_numbers
+        return abs(self.norm_ppf(prob))
+
+    def chisquare_p_value(self, observed: Sequence[float], expected: Sequence[float]) -> float:
+        if len(observed) != 2 or len(expected) != 2:
+            raise ValueError("O backend rápido suporta apenas o qui-quadrado de 2 células.")
+        statistic = sum((o - e)**2 / e for o, e in zip(observed, expected))
+        return math.erfc(math.sqrt(statistic / 2.0))
+
+
+# Coeficientes da aproximação racional de Acklam para a inversa da normal
+_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+      1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+      6.680131188771972e+01, -1.328068155288572e+01)
+_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+      -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+      3.754408661907416e+00)
+_P_LOW = 0.02425
+
+
+@lru_cache(maxsize=1024)
+def _norm_ppf(p: float) -> float:
+    """ Inversa da CDF normal padrão (Acklam + refinamento de Halley). """
+    if p <= 0.0:
+        return -math.inf if p == 0.0 else math.nan
+    if p >= 1.0:
+        return math.inf if p == 1.0 else math.nan
+    if p > 0.5:
+        # Usa a simetria para não perder precisão no refinamento perto de 1 (1 - p é exato aqui)
+        return -_norm_ppf(1.0 - p)
+
+    if p < _P_LOW:
+        q = math.sqrt(-2 * math.log(p))
+        x = (((((_C[0]*q + _C[1])*q + _C[2])*q + _C[3])*q + _C[4])*q + _C[5]) / \
+            ((((_D[0]*q + _D[1])*q + _D[2])*q + _D[3])*q + 1)
+    else:
+        q = p - 0.5
+        r = q * q
+        x = (((((_A[0]*r + _A[1])*r + _A[2])*r + _A[3])*r + _A[4])*r + _A[5])*q / \
+            (((((_B[0]*r + _B[1])*r + _B[2])*r + _B[3])*r + _B[4])*r + 1)
+
+    # Um passo de Halley usando a CDF exata via erfc
+    e = 0.5 * math.erfc(-x / SQRT2) - p
+    u = e * math.sqrt(2 * math.pi) * math.exp(x * x / 2)
+    return x - u / (1 + x * u / 2)
+
+
+_BACKENDS = {
+    ScipyStatisticsBackend.name: ScipyStatisticsBackend(),
+    FastStatisticsBackend.name: FastStatisticsBackend(),
+}
+
+DEFAULT_BACKEND = FastStatisticsBackend.name
+
+
+def get_statistics_backend(name: str | None = None):
+    """
+    Retorna o backend estatístico pelo nome ("fast" ou "scipy").
+    """
+    key = name or DEFAULT_BACKEND
+    if key not in _BACKENDS:
+        raise ValueError(f"Backend estatístico desconhecido: {key}")
+    return _BACKENDS[key]
@@ -1,40 +1,65 @@
+import os
 import streamlit as st
-from components.results_component import ResultsComponent
+from datetime import date
+from typing import Any, Dict
 from domain.entities.ab_tester import ABTester
 from domain.entities.variation import Variation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.group_sequential import precompute_boundary_table
+from logic.result_cache import ResultCache, canonical_input_key
+from logic.sqlite_result_cache import SQLiteResultCache
 
-# --- Funções de Hash Corrigidas ---
-def _hash_ab_tester_entity(tester: ABTester) -> tuple:
-    """Cria um hash para a entidade ABTester."""
-    # CORRIGIDO: Usa os nomes de atributos corretos da classe ABTester
-    return (
-        tester.confidence_level,
-        tester.power_level,
-    )
-
-def _hash_variation_entity(variation: Variation) -> tuple:
-    """Cria um hash para a entidade Variation."""
-    return (
-        variation.variation_a_visitors,
-        variation.conversions_a,
-        variation.variation_b_visitors,
-        variation.conversions_b,
-        variation.tail_numbers,
-        variation.confidence_level,
-        variation.estimated_uplift
-    )
-
-# --- Função de Análise com Cache ---
-@st.cache_data(
-    ttl=3600,
-    hash_funcs={
-        ABTester: _hash_ab_tester_entity,
-        Variation: _hash_variation_entity
-    }
-)
-def perform_statistical_analysis(tester_entity: ABTester, variation_entity: Variation) -> ResultsComponent:
-    """
-    Executa a análise estatística e retorna o componente de resultados.
-    """
-    print("Executando a análise estatística (sem cache)...") # Para debug
-    return ResultsComponent(tester=tester_entity, variation=variation_entity)
\ No newline at end of file
+# Caminho do cache em disco (opcional) e o seu tamanho máximo em MB
+DISK_CACHE_PATH_ENV = "AB_CALC_CACHE_PATH"
+DISK_CACHE_MAX_MB_ENV = "AB_CALC_CACHE_MAX_MB"
+
+
+@st.cache_resource
+def get_result_cache() -> ResultCache:
+    """
+    Retorna o cache de resultados do processo.
+
+    st.cache_resource cria uma única instância por processo, compartilhada por
+    todas as sessões (usuários) do dyno.
+    """
+    return ResultCache(max_entries=4096, ttl_seconds=3600)
+
+
+@st.cache_resource
+def get_disk_cache() -> SQLiteResultCache | None:
+    """
+    Retorna o cache persistente em SQLite, se AB_CALC_CACHE_PATH estiver definido.
+    Ele sobrevive ao reinício diário do dyno, ao contrário do cache em memória.
+    """
+    path = os.environ.get(DISK_CACHE_PATH_ENV)
+    if not path:
+        return None
+    max_megabytes = float(os.environ.get(DISK_CACHE_MAX_MB_ENV, "64"))
+    return SQLiteResultCache(path, max_bytes=int(max_megabytes * 1024 * 1024))
+
+
+@st.cache_resource
+def precompute_group_sequential_tables() -> int:
+    """
+    Garante, uma única vez por processo, as tabelas do desenho sequencial em grupos
+    (fronteiras e fatores de amostra) antes da primeira sessão usá-las.
+    """
+    return precompute_boundary_table()
+
+
+def perform_statistical_analysis(tester_entity: ABTester, variation_entity: Variation) -> Dict[str, Any]:
+    """
+    Executa a análise estatística e retorna o dicionário de resultados,
+    reaproveitando o resultado de qualquer sessão que já tenha feito o mesmo cálculo.
+
+    A busca segue a ordem: cache em memória -> cache em disco (se configurado) -> cálculo.
+    """
+    today = date.today()
+    key = canonical_input_key(tester_entity, variation_entity, today=today)
+    validator = ABStatisticalValidator(variation=variation_entity, tester=tester_entity, today=today)
+
+    compute = validator.get_statistical_results
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        compute = lambda: disk_cache.get_or_compute(key, validator.get_statistical_results)
+    return get_result_cache().get_or_compute(key, compute)
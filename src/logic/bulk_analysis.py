@@ -0,0 +1,175 @@
+"""
+Análise em massa de experimentos a partir de arquivos CSV/Parquet.
+
+Os arquivos são lidos e escritos em blocos de tamanho fixo, de modo que o uso de
+memória não cresce com o tamanho da entrada. Este módulo não importa o Streamlit.
+"""
+from datetime import date
+from pathlib import Path
+from typing import Iterator, Tuple
+import numpy as np
+import pandas as pd
+from domain.entities.variation_batch import VariationBatch
+from domain.use_cases.batch_statistical_validator import BatchStatisticalValidator
+from logic.parallel_analysis import ParallelBatchRunner
+
+# Colunas esperadas em cada linha do arquivo de entrada (um experimento por linha)
+EXPERIMENT_COLUMNS = (
+    "name",
+    "start_date",
+    "end_date",
+    "variation_a_visitors",
+    "conversions_a",
+    "variation_b_visitors",
+    "conversions_b",
+    "tail_numbers",
+    "confidence_level",
+    "estimated_uplift",
+)
+
+# Valores usados quando a coluna correspondente não existe no arquivo
+DEFAULT_PARAMETERS = {
+    "tail_numbers": 2,
+    "confidence_level": 95.0,
+    "estimated_uplift": 10.0,
+    "count_relative_error": 0.0,
+}
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def _file_format(path: str | Path) -> str:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".parquet", ".pq"):
+        return "parquet"
+    raise ValueError(f"Formato de arquivo não suportado: {suffix or path}")
+
+
+def iter_experiment_chunks(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Lê o arquivo de experimentos em blocos de até `chunk_size` linhas.
+    """
+    if _file_format(path) == "csv":
+        yield from pd.read_csv(path, chunksize=chunk_size)
+        return
+
+    import pyarrow.parquet as pq
+    parquet_file = pq.ParquetFile(path)
+    for record_batch in parquet_file.iter_batches(batch_size=chunk_size):
+        yield record_batch.to_pandas()
+
+
+def _date_column(frame: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in frame:
+        return np.full(len(frame), np.datetime64("NaT"), dtype="datetime64[D]")
+    return pd.to_datetime(frame[column]).to_numpy().astype("datetime64[D]")
+
+
+def batch_from_frame(frame: pd.DataFrame) -> Tuple[VariationBatch, np.ndarray, np.ndarray]:
+    """
+    Converte um bloco de experimentos no lote colunar e nas colunas de datas.
+    """
+    parameters = {
+        column: frame[column].to_numpy() if column in frame else default
+        for column, default in DEFAULT_PARAMETERS.items()
+    }
+    variations = VariationBatch(
+        variation_a_visitors=frame["variation_a_visitors"].to_numpy(),
+        variation_b_visitors=frame["variation_b_visitors"].to_numpy(),
+        conversions_a=frame["conversions_a"].to_numpy(),
+        conversions_b=frame["conversions_b"].to_numpy(),
+        **parameters,
+    )
+    return variations, _date_column(frame, "start_date"), _date_column(frame, "end_date")
+
+
+def validator_from_frame(frame: pd.DataFrame, today: date | None = None) -> BatchStatisticalValidator:
+    """
+    Monta o validador em lote a partir de um bloco de experimentos.
+    """
+    variations, start_dates, end_dates = batch_from_frame(frame)
+    return BatchStatisticalValidator(variations, start_dates=start_dates, end_dates=end_dates, today=today)
+
+
+def analyze_frame(frame: pd.DataFrame, today: date | None = None,
+                  runner: ParallelBatchRunner | None = None) -> pd.DataFrame:
+    """
+    Calcula as métricas de um bloco e devolve um DataFrame de resultados
+    (uma linha por experimento, na mesma ordem da entrada).
+
+    Args:
+        runner: Pool de processos opcional; sem ele o bloco é calculado no processo atual.
+    """
+    if runner is None:
+        results = validator_from_frame(frame, today=today).get_statistical_results()
+    else:
+        results = runner.run(*batch_from_frame(frame))
+    output = pd.DataFrame(results, index=frame.index)
+    if "name" in frame:
+        output.insert(0, "name", frame["name"].to_numpy())
+    return output.reset_index(drop=True)
+
+
+class ResultWriter:
+    """
+    Escreve os resultados de forma incremental, bloco a bloco, em CSV ou Parquet.
+    """
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.format = _file_format(path)
+        self._parquet_writer = None
+        self._wrote_header = False
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self.format == "csv":
+            frame.to_csv(self.path, mode="a" if self._wrote_header else "w",
+                         header=not self._wrote_header, index=False)
+            self._wrote_header = True
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+        self._parquet_writer.write_table(table)
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def analyze_file(input_path: str | Path,
+                 output_path: str | Path,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 today: date | None = None,
+                 workers: int = 1) -> int:
+    """
+    Processa o arquivo de entrada em blocos e grava os resultados incrementalmente.
+
+    Args:
+        workers: Número de processos usados para calcular cada bloco (1 = sem paralelismo).
+
+    Returns:
+        O número de experimentos analisados.
+    """
+    processed = 0
+    runner = ParallelBatchRunner(workers=workers, today=today) if workers > 1 else None
+    try:
+        with ResultWriter(output_path) as writer:
+            for chunk in iter_experiment_chunks(input_path, chunk_size=chunk_size):
+                writer.write(analyze_frame(chunk, today=today, runner=runner))
+                processed += len(chunk)
+    finally:
+        if runner is not None:
+            runner.close()
+    return processed
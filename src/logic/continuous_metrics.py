@@ -0,0 +1,160 @@
+"""
+Leitura de métricas contínuas (uma linha por usuário) em blocos.
+
+Arquivos com milhões de linhas (ex: arm, value = receita do usuário) nunca são
+carregados inteiros: cada bloco é resumido por braço (contagem, média e M2) com um
+groupby e combinado aos momentos acumulados pelo algoritmo de Chan. O uso de memória
+depende apenas do tamanho do bloco. Com uma coluna de covariável pré-experimento, os
+pares (covariável, métrica) são resumidos da mesma forma (StreamingCovariance) para a
+análise CUPED. Este módulo não importa o Streamlit.
+"""
+from datetime import date
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Tuple
+import pandas as pd
+from domain.entities.ab_tester import ABTester
+from domain.entities.continuous_variation import ContinuousVariation, StreamingCovariance, StreamingMoments
+from domain.use_cases.cuped import CupedAnalysis
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def iter_value_chunks(source: str | Path | IO, arm_column: str = "arm", value_column: str = "value",
+                      chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      covariate_column: str | None = None) -> Iterator[pd.DataFrame]:
+    """
+    Lê apenas as colunas de braço e valor (e da covariável, se informada), em blocos de
+    até `chunk_size` linhas. Aceita CSV (caminho ou arquivo aberto) e Parquet (caminho).
+    """
+    columns = [arm_column, value_column] + ([covariate_column] if covariate_column else [])
+    if isinstance(source, (str, Path)) and Path(source).suffix.lower() in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+        for record_batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size, columns=columns):
+            yield record_batch.to_pandas()
+        return
+    try:
+        yield from pd.read_csv(source, usecols=columns, chunksize=chunk_size)
+    except ValueError as error:
+        raise ValueError(f"O arquivo deve ter as colunas {', '.join(map(repr, columns))}: {error}") from error
+
+
+def accumulate_values(source: str | Path | IO, arm_column: str = "arm", value_column: str = "value",
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[Any, StreamingMoments]:
+    """
+    Momentos da métrica por braço. Valores ausentes são ignorados; usuários sem compra
+    devem aparecer com valor 0 para que a média seja por visitante.
+    """
+    moments: Dict[Any, StreamingMoments] = {}
+    for chunk in iter_value_chunks(source, arm_column, value_column, chunk_size):
+        values = pd.to_numeric(chunk[value_column], errors="coerce")
+        summary = values.groupby(chunk[arm_column], sort=False).agg(["count", "mean", "var"])
+        for arm, row in summary.iterrows():
+            count = int(row["count"])
+            if count == 0:
+                continue
+            m2 = row["var"] * (count - 1) if count > 1 else 0.0
+            moments.setdefault(arm, StreamingMoments()).merge(StreamingMoments(count, row["mean"], m2))
+    return moments
+
+
+def accumulate_covariances(source: str | Path | IO, arm_column: str = "arm", value_column: str = "value",
+                           covariate_column: str = "covariate",
+                           chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[Any, StreamingCovariance]:
+    """
+    Pares (covariável, métrica) por braço. Cada bloco é resumido em uma passada
+    vetorizada: médias por braço, desvios de cada linha e somas dos desvios ao quadrado
+    e cruzados com groupby. Linhas com métrica ou covariável ausente são ignoradas;
+    usuários novos, sem histórico, devem aparecer com covariável 0.
+    """
+    covariances: Dict[Any, StreamingCovariance] = {}
+    for chunk in iter_value_chunks(source, arm_column, value_column, chunk_size, covariate_column):
+        frame = pd.DataFrame({
+            "arm": chunk[arm_column],
+            "x": pd.to_numeric(chunk[covariate_column], errors="coerce"),
+            "y": pd.to_numeric(chunk[value_column], errors="coerce"),
+        }).dropna()
+        if frame.empty:
+            continue
+        groups = frame.groupby("arm", sort=False)
+        means = groups[["x", "y"]].transform("mean")
+        deviation_x = frame["x"] - means["x"]
+        deviation_y = frame["y"] - means["y"]
+        summary = pd.DataFrame({
+            "arm": frame["arm"],
+            "m2_x": deviation_x ** 2,
+            "m2_y": deviation_y ** 2,
+            "comoment": deviation_x * deviation_y,
+        }).groupby("arm", sort=False).sum()
+        counts = groups.size()
+        group_means = groups[["x", "y"]].mean()
+        for arm, row in summary.iterrows():
+            covariances.setdefault(arm, StreamingCovariance()).merge(StreamingCovariance(
+                counts[arm], group_means.at[arm, "x"], group_means.at[arm, "y"],
+                row["m2_x"], row["m2_y"], row["comoment"],
+            ))
+    return covariances
+
+
+def _split_arms(accumulators: Dict[Any, Any], control_arm: Any) -> Tuple[Any, Any]:
+    """ Controle e variação de um arquivo com exatamente dois braços. """
+    arms = list(accumulators)
+    if len(arms) != 2:
+        raise ValueError(f"O arquivo deve ter exatamente dois braços; encontrados: {len(arms)}.")
+    control_arm = arms[0] if control_arm is None else control_arm
+    if control_arm not in accumulators:
+        raise ValueError(f"Braço de controle não encontrado: {control_arm}")
+    variant_arm = arms[1] if arms[0] == control_arm else arms[0]
+    return accumulators[control_arm], accumulators[variant_arm]
+
+
+def cuped_analysis_from_file(source: str | Path | IO,
+                             tester: ABTester,
+                             tail_numbers: int = 2,
+                             confidence_level: float = 95.0,
+                             estimated_uplift: float = 10.0,
+                             control_arm: Any = None,
+                             arm_column: str = "arm",
+                             value_column: str = "value",
+                             covariate_column: str = "covariate",
+                             chunk_size: int = DEFAULT_CHUNK_SIZE,
+                             today: date | None = None) -> CupedAnalysis:
+    """
+    CupedAnalysis de um arquivo com uma linha por usuário (braço, métrica e covariável
+    pré-experimento) e exatamente dois braços.
+
+    Args:
+        control_arm: Rótulo do braço de controle. Se omitido, usa o primeiro braço do arquivo.
+    """
+    covariance_a, covariance_b = _split_arms(
+        accumulate_covariances(source, arm_column, value_column, covariate_column, chunk_size), control_arm)
+    return CupedAnalysis(
+        covariance_a, covariance_b, tester,
+        tail_numbers=tail_numbers,
+        confidence_level=confidence_level,
+        estimated_uplift=estimated_uplift,
+        today=today,
+    )
+
+
+def continuous_variation_from_file(source: str | Path | IO,
+                                   tail_numbers: int = 2,
+                                   confidence_level: float = 95.0,
+                                   estimated_uplift: float = 10.0,
+                                   control_arm: Any = None,
+                                   arm_column: str = "arm",
+                                   value_column: str = "value",
+                                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> ContinuousVariation:
+    """
+    ContinuousVariation de um arquivo com uma linha por usuário e exatamente dois braços.
+
+    Args:
+        control_arm: Rótulo do braço de controle. Se omitido, usa o primeiro braço do arquivo.
+    """
+    moments_a, moments_b = _split_arms(accumulate_values(source, arm_column, value_column, chunk_size),
+                                       control_arm)
+    return ContinuousVariation.from_moments(
+        moments_a, moments_b,
+        tail_numbers=tail_numbers,
+        confidence_level=confidence_level,
+        estimated_uplift=estimated_uplift,
+    )
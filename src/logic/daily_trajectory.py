@@ -0,0 +1,147 @@
+"""
+Trajetórias diárias das métricas de um teste A/B.
+
+A entrada é uma tabela em formato longo, com uma linha por (dia, braço):
+
+    date, arm, visitors, conversions
+
+As contagens são pivotadas por dia (dias sem dados entram com zero) e acumuladas com
+cumsum. Cada dia acumulado vira uma linha do validador em lote, de modo que taxas,
+z-scores, p-valores e intervalos de todos os dias saem de uma única passada vetorizada,
+sem um validador por dia. O SRM é calculado tanto no acumulado quanto nas contagens
+de cada dia isolado. Este módulo não importa o Streamlit.
+"""
+import io
+from datetime import date
+from typing import Any
+import numpy as np
+import pandas as pd
+from domain.entities.variation_batch import VariationBatch
+from domain.use_cases.batch_statistical_validator import BatchStatisticalValidator
+from domain.use_cases.sequential_testing import default_mixing_variance
+
+DAILY_COLUMNS = ("date", "arm", "visitors", "conversions")
+
+
+def read_daily_table(data: str | bytes) -> pd.DataFrame:
+    """
+    Lê a tabela diária a partir do conteúdo de um CSV (arquivo enviado ou texto colado).
+    Aceita vírgula, ponto e vírgula ou tabulação como separador.
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf-8-sig")
+    frame = pd.read_csv(io.StringIO(data.strip()), sep=None, engine="python")
+    frame.columns = [str(column).strip().lower() for column in frame.columns]
+    return frame
+
+
+def pivot_daily(frame: pd.DataFrame, control_arm: Any = None) -> pd.DataFrame:
+    """
+    Agrega a tabela longa em uma linha por dia com as contagens dos dois braços.
+
+    Args:
+        control_arm: Rótulo do braço de controle. Se omitido, usa o primeiro braço da tabela.
+
+    Returns:
+        O DataFrame (índice = dia, todos os dias do intervalo) com variation_a_visitors,
+        conversions_a, variation_b_visitors e conversions_b do dia.
+    """
+    missing = [column for column in DAILY_COLUMNS if column not in frame]
+    if missing:
+        raise ValueError(f"Colunas ausentes na tabela diária: {', '.join(missing)}")
+
+    arms = pd.unique(frame["arm"])
+    if len(arms) != 2:
+        raise ValueError(f"A tabela diária espera exatamente dois braços; encontrados: {len(arms)}.")
+    control_arm = arms[0] if control_arm is None else control_arm
+    if control_arm not in arms:
+        raise ValueError(f"Braço de controle não encontrado: {control_arm}")
+    variant_arm = arms[1] if arms[0] == control_arm else arms[0]
+
+    try:
+        days = pd.to_datetime(frame["date"]).dt.normalize()
+    except (ValueError, TypeError) as error:
+        raise ValueError(f"Datas inválidas na tabela diária: {error}") from error
+
+    totals = (
+        frame.assign(date=days)
+        .groupby(["date", "arm"])[["visitors", "conversions"]]
+        .sum()
+        .unstack("arm", fill_value=0)
+    )
+    calendar = pd.date_range(totals.index.min(), totals.index.max(), freq="D", name="date")
+    totals = totals.reindex(calendar, fill_value=0)
+    daily = pd.DataFrame({
+        "variation_a_visitors": totals[("visitors", control_arm)],
+        "conversions_a": totals[("conversions", control_arm)],
+        "variation_b_visitors": totals[("visitors", variant_arm)],
+        "conversions_b": totals[("conversions", variant_arm)],
+    })
+    if (daily < 0).any().any() or (daily["conversions_a"] > daily["variation_a_visitors"]).any() \
+            or (daily["conversions_b"] > daily["variation_b_visitors"]).any():
+        raise ValueError("Cada dia deve ter contagens não negativas e no máximo uma conversão por visitante.")
+    return daily.astype(np.int64)
+
+
+def calculate_trajectories(frame: pd.DataFrame,
+                           tail_numbers: int = 2,
+                           confidence_level: float = 95.0,
+                           estimated_uplift: float = 10.0,
+                           control_arm: Any = None,
+                           baseline_rate: float | None = None) -> pd.DataFrame:
+    """
+    Calcula as métricas acumuladas ao fim de cada dia.
+
+    Args:
+        confidence_level, estimated_uplift: Em porcentagem, como em Variation.
+        baseline_rate: Taxa de conversão base do planejamento, em porcentagem. Com o MDE,
+            fixa o τ² do teste sequencial em todos os dias; se omitida, τ² vem da taxa do
+            controle no primeiro dia com conversões e é mantido, como no SequentialMonitor.
+
+    Returns:
+        Um DataFrame com uma linha por dia: as contagens do dia e acumuladas, as taxas
+        acumuladas e as colunas do validador em lote (z_score, p_value, limites dos
+        intervalos, SRM acumulado...; as colunas sequential_* acumulam as consultas
+        diárias), mais 'daily_srm_p_value' e 'daily_has_srm'
+        (SRM apenas com as contagens do dia).
+    """
+    daily = pivot_daily(frame, control_arm=control_arm)
+    cumulative = daily.cumsum()
+    dates = daily.index.to_numpy(dtype="datetime64[D]")
+
+    def batch(counts: pd.DataFrame) -> VariationBatch:
+        return VariationBatch(
+            variation_a_visitors=counts["variation_a_visitors"].to_numpy(),
+            variation_b_visitors=counts["variation_b_visitors"].to_numpy(),
+            conversions_a=counts["conversions_a"].to_numpy(),
+            conversions_b=counts["conversions_b"].to_numpy(),
+            tail_numbers=tail_numbers,
+            confidence_level=confidence_level,
+            estimated_uplift=estimated_uplift,
+        )
+
+    variations = batch(cumulative)
+    validator = BatchStatisticalValidator(variations, start_dates=dates[0], end_dates=dates, today=dates[-1])
+    results = validator.get_statistical_results()
+    if baseline_rate is None:
+        with_conversions = np.flatnonzero(variations.conversion_rate_a > 0)
+        baseline = variations.conversion_rate_a[with_conversions[0]] if len(with_conversions) else 0.0
+    else:
+        baseline = baseline_rate / 100
+    # O mesmo τ² em todos os dias, para que as consultas diárias possam ser combinadas
+    results.update(validator.get_sequential_results(default_mixing_variance(baseline, estimated_uplift / 100)))
+
+    daily_validator = BatchStatisticalValidator(batch(daily), start_dates=dates, end_dates=dates)
+    daily_srm = daily_validator.check_sample_ratio_mismatch()
+
+    trajectory = pd.DataFrame(results, index=daily.index)
+    # Como no SequentialMonitor, cada dia é uma consulta: o p-valor sempre válido é o
+    # menor já observado e a sequência de confiança é a interseção das anteriores
+    trajectory["sequential_p_value"] = np.minimum.accumulate(trajectory["sequential_p_value"].to_numpy())
+    trajectory["sequential_lower_bound"] = np.maximum.accumulate(trajectory["sequential_lower_bound"].to_numpy())
+    trajectory["sequential_upper_bound"] = np.minimum.accumulate(trajectory["sequential_upper_bound"].to_numpy())
+    trajectory.insert(0, "conversion_rate_b", variations.conversion_rate_b)
+    trajectory.insert(0, "conversion_rate_a", variations.conversion_rate_a)
+    trajectory["daily_srm_p_value"] = daily_srm["srm_p_value"]
+    trajectory["daily_has_srm"] = daily_srm["has_srm"]
+    return pd.concat([daily.add_prefix("daily_"), cumulative, trajectory], axis=1).reset_index()
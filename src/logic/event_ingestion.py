@@ -0,0 +1,567 @@
+"""
+Ingestão de logs brutos de eventos (exposições e conversões) em contagens por braço.
+
+Cada linha do log é um evento com as colunas:
+
+    user_id, event, arm, timestamp
+
+em que `event` é "exposure" (o usuário viu o braço `arm`) ou "conversion" (o braço das
+conversões é ignorado). Logs de dezenas de GB são lidos em blocos, sem carregar o
+arquivo inteiro: CSV pelo leitor do pandas com memory_map, NDJSON fatiado em faixas de
+bytes de um mmap (cada faixa termina em uma quebra de linha) e Parquet por lotes do
+pyarrow com memory_map.
+
+A leitura é feita em duas passadas:
+
+1. Exposições: cada usuário (identificado por um hash de 64 bits do user_id) fica com a
+   primeira exposição (braço e instante). Os blocos já reduzidos são compactados sempre
+   que dobram de tamanho, de modo que a memória cresce com o número de usuários
+   distintos e não com o número de eventos.
+2. Conversões: cada conversão é atribuída ao usuário por busca binária na tabela de
+   exposições e só conta se ocorreu depois da primeira exposição. Um usuário conta no
+   máximo uma conversão.
+
+Usuários expostos a mais de um braço são descartados por padrão e sempre contados no
+resumo, assim como os eventos sem user_id.
+
+Para logs com centenas de milhões de usuários, o modo "sketch" troca a tabela de
+exposições por sketches HyperLogLog por (dia, braço), em uma única passada e com
+memória constante. As contagens passam a ser aproximadas (o erro relativo vai para a
+Variation, que alarga o erro padrão), as conversões precisam trazer o braço e a ordem
+exposição -> conversão não é verificada. Os sketches de cada dia podem ser gravados e
+combinados depois, sem reler os logs. Este módulo não importa o Streamlit.
+"""
+import base64
+import io
+import json
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple
+import numpy as np
+import pandas as pd
+from domain.entities.hyperloglog import DEFAULT_PRECISION, HyperLogLog
+from domain.entities.variation import Variation
+from logic.daily_trajectory import DAILY_COLUMNS
+
+EVENT_COLUMNS = ("user_id", "event", "arm", "timestamp")
+EXPOSURE_EVENT = "exposure"
+CONVERSION_EVENT = "conversion"
+EVENT_FORMATS = ("csv", "ndjson", "parquet")
+COUNTING_MODES = ("exact", "sketch")
+
+DEFAULT_CHUNK_ROWS = 1_000_000
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+EventSource = str | Path | bytes | IO[bytes]
+
+# Chave de cada sketch: (dia ou None sem timestamp, braço, "visitors" ou "conversions")
+SketchKey = Tuple[Any, str, str]
+
+_SUFFIX_FORMATS = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".txt": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".json": "ndjson",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def detect_event_format(source: EventSource, file_format: str | None = None) -> str:
+    """ Formato do log: o informado ou o deduzido pela extensão do arquivo. """
+    if file_format is not None:
+        if file_format not in EVENT_FORMATS:
+            raise ValueError(f"Formato de log não suportado: {file_format}")
+        return file_format
+    name = source if isinstance(source, (str, Path)) else getattr(source, "name", "")
+    suffix = Path(str(name)).suffix.lower()
+    if suffix not in _SUFFIX_FORMATS:
+        raise ValueError(f"Não foi possível deduzir o formato do log ({suffix or 'sem extensão'}); "
+                         f"use um de: {', '.join(EVENT_FORMATS)}.")
+    return _SUFFIX_FORMATS[suffix]
+
+
+@contextmanager
+def _mapped_bytes(source: str | Path | bytes):
+    """ O conteúdo do arquivo mapeado em memória (ou os próprios bytes enviados). """
+    if not isinstance(source, (str, Path)):
+        yield source
+        return
+    with open(source, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _iter_ndjson(source: str | Path | bytes, chunk_bytes: int) -> Iterator[pd.DataFrame]:
+    with _mapped_bytes(source) as content:
+        size = len(content)
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                newline = content.find(b"\n", end)
+                end = size if newline == -1 else newline + 1
+            block = content[start:end]
+            start = end
+            if block.strip():
+                yield pd.read_json(io.BytesIO(block), lines=True, dtype=False)
+
+
+def _normalize_column(column: Any) -> str:
+    return str(column).strip().lower()
+
+
+def _normalize_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    frame.columns = [_normalize_column(column) for column in frame.columns]
+    return frame
+
+
+def _json_number_as_text(value: Any) -> str:
+    return str(int(value)) if isinstance(value, float) and value.is_integer() else str(value)
+
+
+def _json_user_ids(user_ids: pd.Series) -> pd.Series:
+    """
+    user_id do NDJSON como texto. Um bloco só com números e nulos chega como float, então
+    os números inteiros são escritos sem casa decimal ("2" e não "2.0"), como nos blocos
+    em que o pandas os manteve inteiros. Os nulos continuam nulos.
+    """
+    if pd.api.types.is_integer_dtype(user_ids):
+        return user_ids.astype(str)
+    return user_ids.map(_json_number_as_text, na_action="ignore")
+
+
+def iter_event_chunks(source: EventSource, file_format: str | None = None,
+                      chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                      chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[pd.DataFrame]:
+    """
+    Lê o log em blocos de eventos, com os nomes das colunas em minúsculas e o user_id
+    como texto: o tipo não depende do que o pandas deduziria em cada bloco (um id em
+    branco tornaria float os ids do bloco e "2" viraria "2.0").
+
+    Args:
+        source: Caminho do arquivo, bytes ou arquivo aberto (ex: upload do Streamlit).
+        chunk_rows: Linhas por bloco (CSV e Parquet).
+        chunk_bytes: Bytes por bloco (NDJSON).
+    """
+    file_format = detect_event_format(source, file_format)
+    if not isinstance(source, (str, Path, bytes)):
+        source = source.getvalue() if hasattr(source, "getvalue") else source.read()
+
+    if file_format == "ndjson":
+        for chunk in _iter_ndjson(source, chunk_bytes):
+            chunk = _normalize_columns(chunk)
+            if "user_id" in chunk:
+                chunk["user_id"] = _json_user_ids(chunk["user_id"])
+            yield chunk
+        return
+
+    if file_format == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        parquet = pq.ParquetFile(source if isinstance(source, (str, Path)) else io.BytesIO(source), memory_map=True)
+        names = parquet.schema_arrow.names
+        user_id = next((i for i, name in enumerate(names) if _normalize_column(name) == "user_id"), None)
+        for batch in parquet.iter_batches(batch_size=chunk_rows):
+            if user_id is not None:
+                batch = batch.set_column(user_id, names[user_id], batch.column(user_id).cast(pa.string()))
+            # Os metadados do pandas no arquivo trariam de volta o tipo original do user_id
+            yield _normalize_columns(batch.to_pandas(ignore_metadata=user_id is not None))
+        return
+
+    # O cabeçalho diz qual coluna é o user_id, que é lido como texto
+    header = pd.read_csv(source if isinstance(source, (str, Path)) else io.BytesIO(source), nrows=0).columns
+    dtype = {column: str for column in header if _normalize_column(column) == "user_id"}
+    if isinstance(source, (str, Path)):
+        chunks = pd.read_csv(source, chunksize=chunk_rows, memory_map=True, dtype=dtype)
+    else:
+        chunks = pd.read_csv(io.BytesIO(source), chunksize=chunk_rows, dtype=dtype)
+    for chunk in chunks:
+        yield _normalize_columns(chunk)
+
+
+def _user_keys(user_ids: pd.Series) -> np.ndarray:
+    """ Hash de 64 bits do user_id (como texto, para que 42 e "42" sejam o mesmo usuário). """
+    return pd.util.hash_array(user_ids.astype(str).to_numpy(dtype=object), categorize=False)
+
+
+def _missing_user_ids(chunk: pd.DataFrame) -> pd.Series:
+    """ Eventos sem user_id (nulo ou em branco), que não podem ser atribuídos a um usuário. """
+    user_ids = chunk["user_id"]
+    return user_ids.isna() | (user_ids.astype(str).str.strip() == "")
+
+
+def _timestamps(chunk: pd.DataFrame) -> np.ndarray:
+    """ Instantes dos eventos em nanossegundos (zero quando o log não tem timestamp). """
+    if "timestamp" not in chunk:
+        return np.zeros(len(chunk), dtype=np.int64)
+    values = chunk["timestamp"]
+    try:
+        if pd.api.types.is_numeric_dtype(values):
+            parsed = pd.to_datetime(values, unit="s", utc=True)
+        else:
+            parsed = pd.to_datetime(values, utc=True, format="mixed")
+    except (ValueError, TypeError) as error:
+        raise ValueError(f"Timestamps inválidos no log de eventos: {error}") from error
+    if parsed.isna().any():
+        raise ValueError("Timestamps ausentes no log de eventos.")
+    return parsed.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+
+def _check_columns(chunk: pd.DataFrame) -> None:
+    missing = [column for column in ("user_id", "event", "arm") if column not in chunk]
+    if missing:
+        raise ValueError(f"Colunas ausentes no log de eventos: {', '.join(missing)}")
+
+
+def _first_exposures(user: np.ndarray, arm: np.ndarray, time: np.ndarray, mixed: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Reduz as exposições a uma linha por usuário: braço e instante da primeira exposição
+    e se o usuário aparece em mais de um braço. O resultado fica ordenado por usuário.
+    """
+    order = np.lexsort((time, user))
+    user, arm, time, mixed = user[order], arm[order], time[order], mixed[order]
+    starts = np.flatnonzero(np.r_[True, user[1:] != user[:-1]]) if len(user) else np.array([], dtype=np.intp)
+    if len(starts) == 0:
+        return {"user": user, "arm": arm, "time": time, "mixed": mixed}
+    mixed = (np.logical_or.reduceat(mixed, starts)
+             | (np.minimum.reduceat(arm, starts) != np.maximum.reduceat(arm, starts)))
+    return {"user": user[starts], "arm": arm[starts], "time": time[starts], "mixed": mixed}
+
+
+def _concat_exposures(tables: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    return _first_exposures(*(np.concatenate([table[column] for table in tables])
+                              for column in ("user", "arm", "time", "mixed")))
+
+
+def _event_types(chunk: pd.DataFrame) -> pd.Series:
+    return chunk["event"].astype(str).str.strip().str.lower()
+
+
+def ingest_event_log(source: EventSource,
+                     file_format: str | None = None,
+                     drop_multi_arm_users: bool = True,
+                     chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                     chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                     counting: str = "exact",
+                     precision: int = DEFAULT_PRECISION) -> Dict[str, Any]:
+    """
+    Visitantes únicos e conversões atribuídas por braço a partir do log de eventos.
+
+    Args:
+        drop_multi_arm_users: Descarta usuários expostos a mais de um braço. Se False,
+            o usuário fica no braço da primeira exposição.
+        counting: "exact" (tabela de exposições) ou "sketch" (HyperLogLog, aproximado).
+        precision: Precisão dos sketches no modo "sketch".
+
+    Returns:
+        'arms' (na ordem em que aparecem no log), 'visitors' e 'conversions' (dicionários
+        braço -> contagem), 'daily' (DataFrame com DAILY_COLUMNS, conversões no dia da
+        primeira exposição do usuário, ou None se o log não tem timestamp) e os contadores
+        'events', 'events_without_user_id' (eventos descartados por não terem user_id),
+        'users_in_multiple_arms', 'conversions_without_exposure' e
+        'conversions_before_exposure' (None no modo "sketch", que não os mede), mais
+        'counting' e 'relative_error' (erro relativo das contagens: zero no modo exato).
+    """
+    if counting not in COUNTING_MODES:
+        raise ValueError(f"Modo de contagem inválido: {counting}. Use um de: {', '.join(COUNTING_MODES)}.")
+    file_format = detect_event_format(source, file_format)
+    if not isinstance(source, (str, Path, bytes)):
+        source = source.getvalue() if hasattr(source, "getvalue") else source.read()
+    if counting == "sketch":
+        sketches, counters = sketch_event_log(source, file_format, precision=precision,
+                                              chunk_rows=chunk_rows, chunk_bytes=chunk_bytes)
+        return summarize_sketches(sketches, **counters)
+
+    def chunks() -> Iterator[pd.DataFrame]:
+        return iter_event_chunks(source, file_format, chunk_rows=chunk_rows, chunk_bytes=chunk_bytes)
+
+    # 1ª passada: primeira exposição de cada usuário
+    arm_codes: Dict[str, int] = {}
+    exposures = {"user": np.array([], dtype=np.uint64), "arm": np.array([], dtype=np.int64),
+                 "time": np.array([], dtype=np.int64), "mixed": np.array([], dtype=bool)}
+    pending: List[Dict[str, np.ndarray]] = []
+    pending_rows = 0
+    events = 0
+    without_user_id = 0
+    has_timestamps = False
+    for chunk in chunks():
+        _check_columns(chunk)
+        events += len(chunk)
+        has_timestamps = has_timestamps or "timestamp" in chunk
+        missing = _missing_user_ids(chunk)
+        without_user_id += int(missing.sum())
+        chunk = chunk[(_event_types(chunk) == EXPOSURE_EVENT) & ~missing]
+        if chunk.empty:
+            continue
+        labels = chunk["arm"].astype(str)
+        for label in pd.unique(labels):
+            arm_codes.setdefault(label, len(arm_codes))
+        reduced = _first_exposures(
+            _user_keys(chunk["user_id"]),
+            labels.map(arm_codes).to_numpy(dtype=np.int64),
+            _timestamps(chunk),
+            np.zeros(len(chunk), dtype=bool),
+        )
+        pending.append(reduced)
+        pending_rows += len(reduced["user"])
+        if pending_rows > max(len(exposures["user"]), chunk_rows):
+            exposures = _concat_exposures([exposures, *pending])
+            pending, pending_rows = [], 0
+    if pending:
+        exposures = _concat_exposures([exposures, *pending])
+
+    users = exposures["user"]
+    first_times = exposures["time"]
+
+    # 2ª passada: conversões atribuídas à exposição anterior
+    converted = np.zeros(len(users), dtype=bool)
+    without_exposure = 0
+    before_exposure = 0
+    for chunk in chunks():
+        chunk = chunk[(_event_types(chunk) == CONVERSION_EVENT) & ~_missing_user_ids(chunk)]
+        if chunk.empty:
+            continue
+        keys = _user_keys(chunk["user_id"])
+        times = _timestamps(chunk)
+        if len(users) == 0:
+            without_exposure += len(keys)
+            continue
+        position = np.minimum(np.searchsorted(users, keys), len(users) - 1)
+        found = users[position] == keys
+        attributed = found & (times >= first_times[position])
+        converted[position[attributed]] = True
+        without_exposure += int((~found).sum())
+        before_exposure += int((found & ~attributed).sum())
+
+    mixed = exposures["mixed"]
+    keep = ~mixed if drop_multi_arm_users else np.ones(len(users), dtype=bool)
+    codes = exposures["arm"][keep]
+    arms = list(arm_codes)
+    visitors = np.bincount(codes, minlength=len(arms))
+    conversions = np.bincount(codes, weights=converted[keep], minlength=len(arms)).astype(np.int64)
+
+    daily = None
+    if has_timestamps and len(arms):
+        daily = (
+            pd.DataFrame({
+                "date": pd.to_datetime(first_times[keep], utc=True).tz_localize(None).normalize(),
+                "arm": np.asarray(arms, dtype=object)[codes],
+                "visitors": 1,
+                "conversions": converted[keep].astype(np.int64),
+            })
+            .groupby(["date", "arm"], sort=True)[["visitors", "conversions"]].sum()
+            .reset_index()[list(DAILY_COLUMNS)]
+        )
+        daily["date"] = daily["date"].dt.date
+
+    return {
+        "arms": arms,
+        "visitors": {arm: int(count) for arm, count in zip(arms, visitors)},
+        "conversions": {arm: int(count) for arm, count in zip(arms, conversions)},
+        "daily": daily,
+        "events": events,
+        "events_without_user_id": without_user_id,
+        "users_in_multiple_arms": int(mixed.sum()),
+        "conversions_without_exposure": without_exposure,
+        "conversions_before_exposure": before_exposure,
+        "counting": "exact",
+        "relative_error": 0.0,
+    }
+
+
+def sketch_event_log(source: EventSource,
+                     file_format: str | None = None,
+                     precision: int = DEFAULT_PRECISION,
+                     chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                     chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Tuple[Dict[SketchKey, HyperLogLog], Dict[str, int]]:
+    """
+    Sketches HyperLogLog dos usuários expostos e dos que converteram, por dia e braço,
+    em uma única passada pelo log.
+
+    Returns:
+        Os sketches (chave: dia, braço e tipo) e os contadores 'events',
+        'events_without_user_id' (eventos descartados sem user_id) e
+        'conversions_without_exposure' (conversões sem braço, que não podem ser atribuídas).
+    """
+    sketches: Dict[SketchKey, HyperLogLog] = {}
+    events = 0
+    without_user_id = 0
+    without_arm = 0
+    for chunk in iter_event_chunks(source, file_format, chunk_rows=chunk_rows, chunk_bytes=chunk_bytes):
+        _check_columns(chunk)
+        events += len(chunk)
+        missing = _missing_user_ids(chunk)
+        without_user_id += int(missing.sum())
+        types = _event_types(chunk)
+        kinds = pd.Series(np.select([types == EXPOSURE_EVENT, types == CONVERSION_EVENT],
+                                    ["visitors", "conversions"], ""), index=chunk.index)
+        unassigned = (kinds == "conversions") & chunk["arm"].isna() & ~missing
+        without_arm += int(unassigned.sum())
+        chunk = chunk.assign(kind=kinds)[(kinds != "") & ~unassigned & ~missing]
+        if chunk.empty:
+            continue
+
+        keys = _user_keys(chunk["user_id"])
+        if "timestamp" in chunk:
+            days = pd.to_datetime(_timestamps(chunk), utc=True).tz_localize(None).normalize()
+            groups = pd.DataFrame({"day": days.date, "arm": chunk["arm"].astype(str).to_numpy(),
+                                   "kind": chunk["kind"].to_numpy()})
+        else:
+            groups = pd.DataFrame({"day": None, "arm": chunk["arm"].astype(str).to_numpy(),
+                                   "kind": chunk["kind"].to_numpy()})
+        for key, rows in groups.groupby(["day", "arm", "kind"], sort=False, dropna=False).indices.items():
+            day, arm, kind = key
+            key = (None if pd.isna(day) else day, arm, kind)
+            sketches.setdefault(key, HyperLogLog(precision)).add_hashes(keys[rows])
+    return sketches, {"events": events, "events_without_user_id": without_user_id,
+                      "conversions_without_exposure": without_arm}
+
+
+def _daily_from_sketches(sketches: Dict[SketchKey, HyperLogLog], arms: List[str]) -> pd.DataFrame | None:
+    """
+    Série diária (DAILY_COLUMNS) a partir dos sketches de cada dia: a união acumulada
+    até cada dia estima os usuários únicos acumulados, e as diferenças entre dias
+    consecutivos são as contagens do dia. Assim as somas acumuladas da série coincidem
+    com os totais do resumo. Diferente do modo exato, as conversões entram no dia da
+    conversão (e não no dia da primeira exposição do usuário).
+    """
+    days = sorted({day for day, _, _ in sketches if day is not None})
+    if not days:
+        return None
+    rows = []
+    for arm in arms:
+        cumulative = {}
+        for kind in ("visitors", "conversions"):
+            union = None
+            estimates = []
+            for day in days:
+                sketch = sketches.get((day, arm, kind))
+                if sketch is not None:
+                    union = sketch.copy() if union is None else union.merge(sketch)
+                estimates.append(len(union) if union is not None else 0)
+            # A estimativa da união não pode diminuir de um dia para o outro
+            cumulative[kind] = np.maximum.accumulate(np.asarray(estimates, dtype=np.int64))
+        cumulative["conversions"] = np.minimum(cumulative["conversions"], cumulative["visitors"])
+        rows.append(pd.DataFrame({
+            "date": days,
+            "arm": arm,
+            "visitors": np.diff(cumulative["visitors"], prepend=0),
+            "conversions": np.diff(cumulative["conversions"], prepend=0),
+        }))
+    daily = pd.concat(rows).sort_values(["date", "arm"], kind="stable").reset_index(drop=True)
+    return daily[list(DAILY_COLUMNS)]
+
+
+def summarize_sketches(sketches: Dict[SketchKey, HyperLogLog], events: int | None = None,
+                       conversions_without_exposure: int = 0,
+                       events_without_user_id: int | None = None) -> Dict[str, Any]:
+    """
+    Resumo no formato de ingest_event_log a partir dos sketches por (dia, braço): a
+    união de todos os dias de cada braço dá os visitantes e as conversões estimados, e
+    as uniões acumuladas dia a dia dão a série diária (None sem timestamps).
+    """
+    totals: Dict[Tuple[str, str], HyperLogLog] = {}
+    for (_, arm, kind), sketch in sketches.items():
+        if (arm, kind) in totals:
+            totals[(arm, kind)].merge(sketch)
+        else:
+            totals[(arm, kind)] = sketch.copy()
+
+    arms = list(dict.fromkeys(arm for arm, kind in totals if kind == "visitors"))
+    visitors = {arm: len(totals[(arm, "visitors")]) for arm in arms}
+    conversions = {
+        arm: min(len(totals[(arm, "conversions")]), visitors[arm]) if (arm, "conversions") in totals else 0
+        for arm in arms
+    }
+    relative_error = max((sketch.relative_error for sketch in totals.values()), default=0.0)
+    return {
+        "arms": arms,
+        "visitors": visitors,
+        "conversions": conversions,
+        "daily": _daily_from_sketches(sketches, arms),
+        "events": events,
+        "events_without_user_id": events_without_user_id,
+        # Os sketches não guardam os usuários: quem aparece em mais de um braço conta em
+        # cada um deles e conversões não são checadas contra a exposição
+        "users_in_multiple_arms": None,
+        "conversions_without_exposure": conversions_without_exposure,
+        "conversions_before_exposure": None,
+        "counting": "sketch",
+        "relative_error": relative_error,
+    }
+
+
+def write_sketches(sketches: Dict[SketchKey, HyperLogLog], path: str | Path) -> None:
+    """
+    Grava os sketches em NDJSON (uma linha por dia, braço e tipo, com o sketch em base64).
+    Arquivos de partições diferentes podem ser combinados por read_sketches.
+    """
+    with open(path, "w", encoding="utf-8") as handle:
+        for (day, arm, kind), sketch in sketches.items():
+            handle.write(json.dumps({
+                "date": day.isoformat() if day is not None else None,
+                "arm": arm,
+                "kind": kind,
+                "sketch": base64.b64encode(sketch.to_bytes()).decode("ascii"),
+            }) + "\n")
+
+
+def read_sketches(paths: Iterable[str | Path]) -> Dict[SketchKey, HyperLogLog]:
+    """ Lê e combina os sketches de uma ou mais partições gravadas por write_sketches. """
+    sketches: Dict[SketchKey, HyperLogLog] = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    day = pd.Timestamp(record["date"]).date() if record["date"] else None
+                    key = (day, str(record["arm"]), str(record["kind"]))
+                    sketch = HyperLogLog.from_bytes(base64.b64decode(record["sketch"]))
+                except (KeyError, TypeError, json.JSONDecodeError) as error:
+                    raise ValueError(f"Partição de sketches inválida em {path}: {error}") from error
+                if key in sketches:
+                    sketches[key].merge(sketch)
+                else:
+                    sketches[key] = sketch
+    return sketches
+
+
+def summary_to_variation(summary: Dict[str, Any],
+                         control_arm: Any = None,
+                         tail_numbers: int = 2,
+                         confidence_level: float = 95.0,
+                         estimated_uplift: float = 10.0) -> Variation:
+    """
+    Variation com as contagens de um log de dois braços. Contagens aproximadas levam o
+    erro relativo dos sketches, que alarga o erro padrão das taxas.
+
+    Args:
+        control_arm: Rótulo do braço de controle. Se omitido, usa o primeiro braço do log.
+    """
+    arms = summary["arms"]
+    if len(arms) != 2:
+        raise ValueError(f"O log deve ter exatamente dois braços; encontrados: {len(arms)}.")
+    control_arm = arms[0] if control_arm is None else str(control_arm)
+    if control_arm not in arms:
+        raise ValueError(f"Braço de controle não encontrado: {control_arm}")
+    variant_arm = arms[1] if arms[0] == control_arm else arms[0]
+    return Variation(
+        variation_a_visitors=summary["visitors"][control_arm],
+        variation_b_visitors=summary["visitors"][variant_arm],
+        conversions_a=summary["conversions"][control_arm],
+        conversions_b=summary["conversions"][variant_arm],
+        tail_numbers=tail_numbers,
+        confidence_level=confidence_level,
+        estimated_uplift=estimated_uplift,
+        count_relative_error=summary.get("relative_error", 0.0),
+    )
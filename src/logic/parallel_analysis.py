@@ -0,0 +1,127 @@
+"""
+Execução paralela do validador em lote com um pool de processos.
+
+As colunas de entrada são copiadas uma única vez para um bloco de memória
+compartilhada (multiprocessing.shared_memory). Cada processo recebe apenas o nome do
+bloco e o intervalo de linhas do seu shard, monta views NumPy sem cópia e devolve as
+colunas de resultado, que são reunidas na ordem original.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from domain.entities.variation_batch import VariationBatch
+from domain.use_cases.batch_statistical_validator import BatchStatisticalValidator
+
+# Colunas copiadas para a memória compartilhada: as do lote e as datas (em dias desde 1970)
+_SHARED_COLUMNS = VariationBatch.COLUMNS + ("start_dates", "end_dates")
+
+# (nome da coluna, dtype, deslocamento em bytes)
+Layout = List[Tuple[str, str, int]]
+
+
+def _attach_columns(buffer: memoryview, layout: Layout, size: int, start: int, stop: int) -> Dict[str, np.ndarray]:
+    return {
+        name: np.ndarray((size,), dtype=dtype, buffer=buffer, offset=offset)[start:stop]
+        for name, dtype, offset in layout
+    }
+
+
+def _copy_into_shared(shm: shared_memory.SharedMemory, layout: Layout, size: int,
+                      columns: Dict[str, np.ndarray]) -> None:
+    for name, values in _attach_columns(shm.buf, layout, size, 0, size).items():
+        values[:] = columns[name]
+
+
+def _analyze_columns(columns: Dict[str, np.ndarray], today: date | None) -> Dict[str, np.ndarray]:
+    validator = BatchStatisticalValidator(
+        VariationBatch.from_columns(columns),
+        start_dates=columns["start_dates"].view("datetime64[D]"),
+        end_dates=columns["end_dates"].view("datetime64[D]"),
+        today=today,
+    )
+    # Os resultados são copiados para não manter referências ao bloco compartilhado
+    return {name: np.array(values, copy=True) for name, values in validator.get_statistical_results().items()}
+
+
+def _analyze_shard(shm_name: str, layout: Layout, size: int, start: int, stop: int,
+                   today: date | None) -> Dict[str, np.ndarray]:
+    """ Executado no processo filho: calcula as métricas das linhas [start, stop). """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        return _analyze_columns(_attach_columns(shm.buf, layout, size, start, stop), today)
+    finally:
+        shm.close()
+
+
+class ParallelBatchRunner:
+    """
+    Distribui lotes de experimentos entre `workers` processos.
+
+    O pool é mantido aberto entre chamadas de run(), para que a CLI possa processar
+    vários blocos de um arquivo sem recriar os processos.
+    """
+    def __init__(self, workers: int, today: date | None = None) -> None:
+        if workers < 1:
+            raise ValueError("O número de workers deve ser pelo menos 1.")
+        self.workers = workers
+        # A data de referência é fixada aqui para que todos os shards usem a mesma
+        self.today = today or date.today()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "ParallelBatchRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def run(self, variations: VariationBatch, start_dates: Any, end_dates: Any) -> Dict[str, np.ndarray]:
+        """
+        Calcula as métricas do lote e devolve as colunas de resultado na ordem original.
+        """
+        size = len(variations)
+        if self.workers == 1 or size < 2 * self.workers:
+            return BatchStatisticalValidator(variations, start_dates, end_dates, today=self.today).get_statistical_results()
+
+        columns = {name: getattr(variations, name) for name in VariationBatch.COLUMNS}
+        columns["start_dates"] = np.broadcast_to(np.asarray(start_dates, dtype="datetime64[D]"), (size,)).view(np.int64)
+        columns["end_dates"] = np.broadcast_to(np.asarray(end_dates, dtype="datetime64[D]"), (size,)).view(np.int64)
+
+        layout: Layout = []
+        offset = 0
+        for name in _SHARED_COLUMNS:
+            layout.append((name, columns[name].dtype.str, offset))
+            offset += size * columns[name].dtype.itemsize
+
+        shm = shared_memory.SharedMemory(create=True, size=offset)
+        try:
+            _copy_into_shared(shm, layout, size, columns)
+
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            bounds = np.linspace(0, size, self.workers + 1, dtype=np.int64)
+            futures = [
+                self._executor.submit(_analyze_shard, shm.name, layout, size, int(start), int(stop), self.today)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            shards = [future.result() for future in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return {name: np.concatenate([shard[name] for shard in shards]) for name in shards[0]}
+
+
+def run_batch_parallel(variations: VariationBatch, start_dates: Any, end_dates: Any,
+                       workers: int, today: date | None = None) -> Dict[str, np.ndarray]:
+    """
+    Atalho para calcular um único lote em paralelo.
+    """
+    with ParallelBatchRunner(workers=workers, today=today) as runner:
+        return runner.run(variations, start_dates, end_dates)
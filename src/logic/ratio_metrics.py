@@ -0,0 +1,113 @@
+"""
+Análise de métricas de razão a partir das somas agregadas por braço.
+
+A tabela de entrada tem uma linha por experimento, métrica e braço, no formato que um
+GROUP BY no banco entrega: `units` (usuários), `numerator`, `denominator`,
+`numerator_squares`, `denominator_squares` e `cross_products` (ΣN, ΣD, ΣN², ΣD² e ΣND
+por usuário). As linhas são pareadas por (experimento, métrica), com o primeiro braço
+de cada par como controle, e todas as métricas passam pelo RatioMetricValidator de uma
+vez. Este módulo não importa o Streamlit.
+"""
+from datetime import date
+from pathlib import Path
+from typing import IO
+import numpy as np
+import pandas as pd
+from domain.entities.ratio_metric_batch import RatioMetricBatch
+from domain.use_cases.ratio_metric_validator import RatioMetricValidator
+
+SUM_COLUMNS = ("units", "numerator", "denominator", "numerator_squares", "denominator_squares", "cross_products")
+KEY_COLUMNS = ("experiment", "metric")
+
+# Colunas que dependem das datas do teste (omitidas quando a tabela não tem datas)
+_DATED_COLUMNS = (
+    "total_duration_days",
+    "business_days_duration",
+    "average_daily_visitors",
+    "required_days_80_power",
+    "required_days_95_power",
+)
+
+
+def _pair_arms(table: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """ Uma linha por (experimento, métrica), com as colunas do controle (_a) e da variação (_b). """
+    sizes = table.groupby(keys, sort=False)["arm"].transform("size")
+    if (sizes != 2).any():
+        invalid = table.loc[sizes != 2, keys].drop_duplicates().head(3).to_dict("records")
+        raise ValueError(f"Cada métrica deve ter exatamente dois braços; inválidas: {invalid}")
+    position = table.groupby(keys, sort=False).cumcount()
+    return table[position == 0].merge(table[position == 1], on=keys, suffixes=("_a", "_b"))
+
+
+def analyze_ratio_metrics(table: pd.DataFrame,
+                          tail_numbers: int = 2,
+                          confidence_level: float = 95.0,
+                          estimated_uplift: float = 10.0,
+                          today: date | None = None) -> pd.DataFrame:
+    """
+    Resultados do método delta para cada (experimento, métrica) da tabela de somas.
+
+    Args:
+        table: Colunas `metric`, `arm` e SUM_COLUMNS; `experiment`, `start_date` e
+            `end_date` são opcionais (sem datas, as colunas de duração e de dias
+            necessários são omitidas). `tail_numbers`, `confidence_level` e
+            `estimated_uplift` também podem vir como colunas.
+
+    Returns:
+        Uma linha por métrica, com as chaves, os braços comparados e as colunas de
+        RatioMetricValidator.get_statistical_results.
+    """
+    missing = [column for column in ("metric", "arm", *SUM_COLUMNS) if column not in table.columns]
+    if missing:
+        raise ValueError(f"Colunas ausentes na tabela de somas: {', '.join(missing)}")
+    keys = [column for column in KEY_COLUMNS if column in table.columns]
+    pairs = _pair_arms(table, keys)
+
+    def parameter(name: str, default):
+        return pairs[f"{name}_a"].to_numpy() if f"{name}_a" in pairs else default
+
+    variations = RatioMetricBatch(
+        variation_a_visitors=pairs["units_a"].to_numpy(),
+        variation_b_visitors=pairs["units_b"].to_numpy(),
+        numerator_a=pairs["numerator_a"].to_numpy(),
+        numerator_b=pairs["numerator_b"].to_numpy(),
+        denominator_a=pairs["denominator_a"].to_numpy(),
+        denominator_b=pairs["denominator_b"].to_numpy(),
+        numerator_squares_a=pairs["numerator_squares_a"].to_numpy(),
+        numerator_squares_b=pairs["numerator_squares_b"].to_numpy(),
+        denominator_squares_a=pairs["denominator_squares_a"].to_numpy(),
+        denominator_squares_b=pairs["denominator_squares_b"].to_numpy(),
+        cross_products_a=pairs["cross_products_a"].to_numpy(),
+        cross_products_b=pairs["cross_products_b"].to_numpy(),
+        tail_numbers=parameter("tail_numbers", tail_numbers),
+        confidence_level=parameter("confidence_level", confidence_level),
+        estimated_uplift=parameter("estimated_uplift", estimated_uplift),
+    )
+    dated = "start_date_a" in pairs
+    today = today or date.today()
+    start_dates = pd.to_datetime(pairs["start_date_a"]).to_numpy("datetime64[D]") if dated else np.datetime64(today)
+    end_dates = (pd.to_datetime(pairs["end_date_a"]).to_numpy("datetime64[D]")
+                 if dated and "end_date_a" in pairs else np.datetime64("NaT"))
+    results = RatioMetricValidator(variations, start_dates, end_dates, today=today).get_statistical_results()
+    if not dated:
+        results = {name: values for name, values in results.items() if name not in _DATED_COLUMNS}
+
+    output = pairs[keys].reset_index(drop=True)
+    output["control_arm"] = pairs["arm_a"].to_numpy()
+    output["variation_arm"] = pairs["arm_b"].to_numpy()
+    return pd.concat([output, pd.DataFrame(results)], axis=1)
+
+
+def analyze_ratio_file(source: str | Path | IO, out: str | Path, **options) -> int:
+    """
+    Lê a tabela de somas (CSV ou Parquet), grava os resultados no mesmo formato da
+    extensão de `out` e devolve o número de métricas analisadas.
+    """
+    is_parquet = lambda path: isinstance(path, (str, Path)) and Path(path).suffix.lower() in (".parquet", ".pq")
+    table = pd.read_parquet(source) if is_parquet(source) else pd.read_csv(source)
+    results = analyze_ratio_metrics(table, **options)
+    if is_parquet(out):
+        results.to_parquet(out, index=False)
+    else:
+        results.to_csv(out, index=False)
+    return len(results)
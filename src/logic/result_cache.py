@@ -0,0 +1,128 @@
+"""
+Cache de resultados do validador, endereçado pelo conteúdo das entradas.
+
+A chave é um hash canônico de tudo que afeta o cálculo (contagens, caudas, confiança,
+MDE e datas), então dois usuários que digitam o mesmo teste compartilham o resultado.
+O valor guardado é o dicionário puro de get_statistical_results(), nunca um componente
+de interface. Este módulo não depende do Streamlit.
+"""
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Tuple
+from domain.entities.ab_tester import ABTester
+from domain.entities.variation import Variation
+
+# Incrementar quando o formato dos resultados ou das chaves mudar
+CACHE_KEY_VERSION = 5
+
+
+def canonical_input_key(tester: ABTester, variation: Variation, today: date | None = None) -> str:
+    """
+    Gera a chave canônica (SHA-256) das entradas de uma análise.
+
+    A data de referência entra na chave porque os resultados temporais (e a data
+    exibida) dependem dela.
+    """
+    payload = {
+        "version": CACHE_KEY_VERSION,
+        "variation_a_visitors": int(variation.variation_a_visitors),
+        "variation_b_visitors": int(variation.variation_b_visitors),
+        "conversions_a": int(variation.conversions_a),
+        "conversions_b": int(variation.conversions_b),
+        "tail_numbers": int(variation.tail_numbers),
+        "confidence_level": float(variation.confidence_level),
+        "estimated_uplift": float(variation.estimated_uplift),
+        "count_relative_error": float(variation.count_relative_error),
+        "start_date": tester.start_date.isoformat(),
+        "end_date": tester.end_date.isoformat() if tester.end_date else None,
+        "today": (today or date.today()).isoformat(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResultCache:
+    """
+    Cache LRU com expiração (TTL), limite de entradas e contadores de acertos/falhas.
+
+    É seguro para uso concorrente entre threads (cada sessão do Streamlit roda em
+    uma thread do mesmo processo).
+    """
+    def __init__(self,
+                 max_entries: int = 4096,
+                 ttl_seconds: float = 3600.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Args:
+            max_entries: Número máximo de resultados guardados (os menos usados saem primeiro).
+            ttl_seconds: Tempo de vida de cada resultado, em segundos.
+            clock: Relógio monotônico (injetável nos testes).
+        """
+        if max_entries < 1:
+            raise ValueError("O cache deve comportar pelo menos uma entrada.")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        """ Retorna uma cópia do resultado guardado, ou None se ausente/expirado. """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def set(self, key: str, results: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, copy.deepcopy(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Retorna o resultado do cache ou o calcula (fora do lock) e o guarda.
+        """
+        results = self.get(key)
+        if results is None:
+            results = compute()
+            self.set(key, results)
+        return results
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """ Contadores de uso do cache. """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,150 @@
+"""
+Análise de um teste A/B quebrada por segmentos (dispositivo, país, canal...).
+
+A entrada é uma tabela em formato longo, com uma linha por (segmento, braço):
+
+    segment, arm, visitors, conversions
+
+As contagens são agregadas e pivotadas por segmento em uma única operação de group-by,
+e todas as métricas (incluindo o SRM) são calculadas de uma vez pelo validador em lote,
+que usa as mesmas fórmulas do ABStatisticalValidator. Este módulo não importa o Streamlit.
+"""
+from datetime import date
+from typing import Any, Dict, Tuple
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2
+from domain.entities.variation_batch import VariationBatch
+from domain.use_cases.batch_statistical_validator import BatchStatisticalValidator
+
+SEGMENT_COLUMNS = ("segment", "arm", "visitors", "conversions")
+
+
+def pivot_segments(frame: pd.DataFrame, control_arm: Any = None) -> Tuple[pd.DataFrame, Any, Any]:
+    """
+    Agrega a tabela longa em uma linha por segmento com as contagens dos dois braços.
+
+    Args:
+        control_arm: Rótulo do braço de controle. Se omitido, usa o primeiro braço da tabela.
+
+    Returns:
+        O DataFrame (índice = segmento) com variation_a_visitors, conversions_a,
+        variation_b_visitors e conversions_b, e os rótulos do controle e da variação.
+    """
+    missing = [column for column in SEGMENT_COLUMNS if column not in frame]
+    if missing:
+        raise ValueError(f"Colunas ausentes na tabela de segmentos: {', '.join(missing)}")
+
+    arms = pd.unique(frame["arm"])
+    if len(arms) != 2:
+        raise ValueError(f"A análise por segmento espera exatamente dois braços; encontrados: {len(arms)}.")
+    control_arm = arms[0] if control_arm is None else control_arm
+    if control_arm not in arms:
+        raise ValueError(f"Braço de controle não encontrado: {control_arm}")
+    variant_arm = arms[1] if arms[0] == control_arm else arms[0]
+
+    totals = (
+        frame.groupby(["segment", "arm"], sort=False)[["visitors", "conversions"]]
+        .sum()
+        .unstack("arm", fill_value=0)
+    )
+    wide = pd.DataFrame({
+        "variation_a_visitors": totals[("visitors", control_arm)],
+        "conversions_a": totals[("conversions", control_arm)],
+        "variation_b_visitors": totals[("visitors", variant_arm)],
+        "conversions_b": totals[("conversions", variant_arm)],
+    })
+    return wide.astype(np.int64), control_arm, variant_arm
+
+
+def heterogeneity_test(difference: np.ndarray, standard_error: np.ndarray) -> Dict[str, float]:
+    """
+    Teste de heterogeneidade de Cochran (Q) entre os efeitos dos segmentos.
+
+    Cada segmento contribui com a diferença absoluta entre as taxas (B - A), ponderada
+    pelo inverso da sua variância. Segmentos sem variância (sem visitantes ou sem
+    conversões) não entram no teste.
+
+    Returns:
+        'cochran_q', 'degrees_of_freedom', 'heterogeneity_p_value', 'i_squared'
+        (fração da variação entre segmentos que não é explicada pelo acaso) e o efeito
+        combinado ('pooled_difference' e 'pooled_standard_error').
+    """
+    valid = standard_error > 0
+    weights = 1 / standard_error[valid] ** 2
+    effects = difference[valid]
+    segments = int(valid.sum())
+    if segments == 0:
+        return {
+            "cochran_q": 0.0,
+            "degrees_of_freedom": 0,
+            "heterogeneity_p_value": 1.0,
+            "i_squared": 0.0,
+            "pooled_difference": 0.0,
+            "pooled_standard_error": 0.0,
+        }
+
+    pooled = float((weights * effects).sum() / weights.sum())
+    cochran_q = float((weights * (effects - pooled) ** 2).sum())
+    degrees_of_freedom = segments - 1
+    p_value = float(chi2.sf(cochran_q, degrees_of_freedom)) if degrees_of_freedom > 0 else 1.0
+    i_squared = max(0.0, (cochran_q - degrees_of_freedom) / cochran_q) if cochran_q > 0 else 0.0
+    return {
+        "cochran_q": cochran_q,
+        "degrees_of_freedom": degrees_of_freedom,
+        "heterogeneity_p_value": p_value,
+        "i_squared": i_squared,
+        "pooled_difference": pooled,
+        "pooled_standard_error": float(np.sqrt(1 / weights.sum())),
+    }
+
+
+def analyze_segments(frame: pd.DataFrame,
+                     tail_numbers: int = 2,
+                     confidence_level: float = 95.0,
+                     estimated_uplift: float = 10.0,
+                     start_date: date | None = None,
+                     end_date: date | None = None,
+                     control_arm: Any = None,
+                     today: date | None = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Calcula as métricas de todos os segmentos em uma única passada vetorizada.
+
+    Args:
+        confidence_level, estimated_uplift: Em porcentagem, como em Variation.
+        start_date, end_date: Datas do teste (usadas na validação temporal e no planejamento).
+
+    Returns:
+        Um DataFrame com uma linha por segmento (as colunas do validador em lote) e
+        o resultado do teste de heterogeneidade entre os segmentos.
+    """
+    wide, control_arm, variant_arm = pivot_segments(frame, control_arm=control_arm)
+    variations = VariationBatch(
+        variation_a_visitors=wide["variation_a_visitors"].to_numpy(),
+        variation_b_visitors=wide["variation_b_visitors"].to_numpy(),
+        conversions_a=wide["conversions_a"].to_numpy(),
+        conversions_b=wide["conversions_b"].to_numpy(),
+        tail_numbers=tail_numbers,
+        confidence_level=confidence_level,
+        estimated_uplift=estimated_uplift,
+    )
+    today = today or date.today()
+    validator = BatchStatisticalValidator(
+        variations,
+        start_dates=start_date or today,
+        end_dates=end_date if end_date else np.datetime64("NaT"),
+        today=today,
+    )
+    results = validator.get_statistical_results()
+
+    output = pd.DataFrame(results, index=wide.index)
+    output.insert(0, "conversion_rate_b", variations.conversion_rate_b)
+    output.insert(0, "conversion_rate_a", variations.conversion_rate_a)
+    output = pd.concat([wide, output], axis=1).reset_index()
+
+    heterogeneity = heterogeneity_test(
+        variations.conversion_rate_b - variations.conversion_rate_a,
+        results["standard_error_difference"],
+    )
+    heterogeneity.update({"segments": len(output), "control_arm": control_arm, "variant_arm": variant_arm})
+    return output, heterogeneity
@@ -0,0 +1,199 @@
+"""
+Simulação Monte Carlo de testes A/A e A/B para medir o erro tipo I, o poder e a
+cobertura dos intervalos que o validador realmente entrega.
+
+Cada experimento sintético recebe o tráfego de cada dia, dividido entre os braços por
+sorteio binomial, e conversões binomiais com a taxa verdadeira de cada braço. Só as
+contagens acumuladas em cada olhada (peeking) importam, então cada intervalo entre
+olhadas custa quatro sorteios binomiais vetorizados por experimento. Em cada olhada o
+bloco inteiro passa pelo BatchStatisticalValidator (as mesmas fórmulas da planilha,
+incluindo o valor crítico e o poder observado), e cada bloco devolve apenas contadores,
+de modo que a memória depende do tamanho do bloco e não do número de simulações. O
+teste sequencial usa o τ² do planejamento (taxa do controle × MDE), o mesmo em todas as
+olhadas.
+
+Os blocos são distribuídos entre processos. Cada bloco tem o seu próprio fluxo de
+números aleatórios, derivado da semente por SeedSequence.spawn: o resultado é o mesmo
+com qualquer número de workers.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Sequence
+import numpy as np
+from domain.use_cases.batch_statistical_validator import BatchStatisticalValidator
+from domain.use_cases.sequential_testing import default_mixing_variance
+
+DEFAULT_CHUNK_SIZE = 250_000
+
+# Datas fixas: as métricas simuladas não dependem da duração do teste
+_START_DATE = np.datetime64("2025-01-01", "D")
+
+# Taxas medidas em cada bloco (contadores somados entre os blocos)
+RATE_KEYS = (
+    "rejection_rate",
+    "peeking_rejection_rate",
+    "sequential_rejection_rate",
+    "control_ci_coverage",
+    "variation_ci_coverage",
+    "difference_ci_coverage",
+    "sequential_ci_coverage",
+)
+
+
+def _interval_traffic(daily_visitors: int | Sequence[int], days: int | None,
+                      looks: Iterable[int] | None) -> tuple:
+    """ Visitantes de cada intervalo entre olhadas e os dias das olhadas. """
+    if np.ndim(daily_visitors) == 0:
+        if days is None or days < 1:
+            raise ValueError("Informe a duração do teste em dias (pelo menos 1).")
+        traffic = np.full(days, int(daily_visitors), dtype=np.int64)
+    else:
+        traffic = np.asarray(daily_visitors, dtype=np.int64)
+        if days is not None and days != traffic.size:
+            raise ValueError("A duração deve coincidir com o número de dias do padrão de tráfego.")
+    if traffic.size == 0 or (traffic < 0).any():
+        raise ValueError("O tráfego diário deve ter pelo menos um dia e nenhum valor negativo.")
+
+    look_days = np.unique(np.asarray([traffic.size] if looks is None else list(looks), dtype=np.int64))
+    if look_days.size == 0 or look_days[0] < 1 or look_days[-1] > traffic.size:
+        raise ValueError(f"As olhadas devem estar entre o dia 1 e o dia {traffic.size}.")
+    cumulative = np.concatenate(([0], np.cumsum(traffic)))
+    return np.diff(cumulative[np.concatenate(([0], look_days))]), look_days
+
+
+def _simulate_chunk(size: int, seed: np.random.SeedSequence, interval_visitors: np.ndarray,
+                    control_rate: float, variant_rate: float, allocation: float, tail_numbers: int,
+                    confidence_level: float, estimated_uplift: float) -> Dict[str, float]:
+    """ Executado no processo filho: simula `size` experimentos e devolve os contadores. """
+    rng = np.random.default_rng(seed)
+    alpha = 1 - confidence_level / 100
+    true_difference = variant_rate - control_rate
+    mixing_variance = default_mixing_variance(control_rate, estimated_uplift / 100)
+    visitors_a = np.zeros(size, dtype=np.int64)
+    visitors_b = np.zeros(size, dtype=np.int64)
+    conversions_a = np.zeros(size, dtype=np.int64)
+    conversions_b = np.zeros(size, dtype=np.int64)
+    rejected_any = np.zeros(size, dtype=bool)
+    sequential_any = np.zeros(size, dtype=bool)
+    sequential_covered = np.ones(size, dtype=bool)
+
+    for visitors in interval_visitors:
+        new_a = rng.binomial(visitors, allocation, size)
+        new_b = visitors - new_a
+        visitors_a += new_a
+        visitors_b += new_b
+        conversions_a += rng.binomial(new_a, control_rate)
+        conversions_b += rng.binomial(new_b, variant_rate)
+
+        validator = BatchStatisticalValidator.from_arrays(
+            visitors_a, visitors_b, conversions_a, conversions_b,
+            tail_numbers=tail_numbers,
+            confidence_level=confidence_level,
+            estimated_uplift=estimated_uplift,
+            start_dates=_START_DATE,
+            end_dates=_START_DATE,
+        )
+        results = validator.get_frequentist_results()
+        sequential = validator.get_sequential_results(mixing_variance)
+        rejected_any |= results["p_value"] < alpha
+        sequential_any |= sequential["is_significant"]
+        sequential_covered &= ((sequential["sequential_lower_bound"] <= true_difference)
+                               & (true_difference <= sequential["sequential_upper_bound"]))
+
+    # Horizonte fixo: decisões e intervalos da última olhada
+    difference = validator.variations.conversion_rate_b - validator.variations.conversion_rate_a
+    half_width = results["z_critical"] * results["standard_error_difference"]
+    return {
+        "simulations": size,
+        "rejection_rate": int(np.count_nonzero(results["p_value"] < alpha)),
+        "peeking_rejection_rate": int(np.count_nonzero(rejected_any)),
+        "sequential_rejection_rate": int(np.count_nonzero(sequential_any)),
+        "control_ci_coverage": int(np.count_nonzero(
+            (results["control_lower_bound"] <= control_rate) & (control_rate <= results["control_upper_bound"]))),
+        "variation_ci_coverage": int(np.count_nonzero(
+            (results["variation_lower_bound"] <= variant_rate) & (variant_rate <= results["variation_upper_bound"]))),
+        "difference_ci_coverage": int(np.count_nonzero(np.abs(difference - true_difference) <= half_width)),
+        "sequential_ci_coverage": int(np.count_nonzero(sequential_covered)),
+        "observed_power_sum": float(results["observed_test_power"].sum()),
+    }
+
+
+def simulate_experiments(simulations: int,
+                         control_rate: float,
+                         true_uplift: float = 0.0,
+                         daily_visitors: int | Sequence[int] = 1_000,
+                         days: int | None = None,
+                         looks: Iterable[int] | None = None,
+                         allocation: float = 0.5,
+                         tail_numbers: int = 2,
+                         confidence_level: float = 95.0,
+                         estimated_uplift: float = 10.0,
+                         seed: int | None = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         workers: int = 1) -> Dict[str, Any]:
+    """
+    Simula testes A/A (true_uplift = 0) ou A/B e mede as taxas empíricas de decisão.
+
+    Args:
+        control_rate: Taxa de conversão verdadeira do controle (fração, ex: 0.03).
+        true_uplift: Uplift relativo verdadeiro da variação em porcentagem (0 = teste A/A).
+        daily_visitors: Visitantes por dia (total dos braços): um valor fixo, com `days`,
+            ou um padrão de tráfego com um valor por dia.
+        looks: Dias em que o resultado é olhado (padrão: só no último dia).
+        allocation: Fração do tráfego enviada ao controle.
+        confidence_level, estimated_uplift: Como em Variation, em porcentagem.
+        seed: Semente da simulação (None = aleatória).
+        chunk_size: Experimentos por bloco.
+        workers: Número de processos.
+
+    Returns:
+        Dicionário com a taxa de rejeição na última olhada ('type_i_error' no A/A,
+        'power' no A/B), a taxa com peeking (rejeita em qualquer olhada), a do teste
+        sequencial, a cobertura dos intervalos de cada braço, da diferença
+        (diferença ± valor crítico x erro padrão) e do sequencial (em todas as olhadas),
+        o poder observado médio e o erro padrão Monte Carlo de cada taxa.
+    """
+    if simulations < 1:
+        raise ValueError("O número de simulações deve ser pelo menos 1.")
+    if workers < 1:
+        raise ValueError("O número de workers deve ser pelo menos 1.")
+    if chunk_size < 1:
+        raise ValueError("O tamanho do bloco deve ser pelo menos 1.")
+    if not 0 < allocation < 1:
+        raise ValueError("A alocação do controle deve estar entre 0 e 1.")
+    variant_rate = control_rate * (1 + true_uplift / 100)
+    if not 0 <= control_rate <= 1 or not 0 <= variant_rate <= 1:
+        raise ValueError("As taxas de conversão verdadeiras devem estar entre 0 e 1.")
+    if tail_numbers not in (1, 2):
+        raise ValueError("Número de caudas deve ser 1 ou 2.")
+    interval_visitors, look_days = _interval_traffic(daily_visitors, days, looks)
+
+    sizes = [chunk_size] * (simulations // chunk_size)
+    if simulations % chunk_size:
+        sizes.append(simulations % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    arguments = (interval_visitors, control_rate, variant_rate, allocation, tail_numbers,
+                 confidence_level, estimated_uplift)
+
+    if workers == 1 or len(sizes) == 1:
+        chunks: List[Dict[str, float]] = [_simulate_chunk(size, s, *arguments) for size, s in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sizes))) as executor:
+            futures = [executor.submit(_simulate_chunk, size, s, *arguments) for size, s in zip(sizes, seeds)]
+            chunks = [future.result() for future in futures]
+
+    totals = {key: sum(chunk[key] for chunk in chunks) for key in chunks[0]}
+    rates = {key: totals[key] / simulations for key in RATE_KEYS}
+    is_aa = variant_rate == control_rate
+    return {
+        "simulations": simulations,
+        "hypothesis": "A/A" if is_aa else "A/B",
+        "control_rate": control_rate,
+        "variant_rate": variant_rate,
+        "look_days": look_days.tolist(),
+        "nominal_alpha": 1 - confidence_level / 100,
+        "type_i_error": rates["rejection_rate"] if is_aa else None,
+        "power": None if is_aa else rates["rejection_rate"],
+        **rates,
+        "mean_observed_power": totals["observed_power_sum"] / simulations,
+        "standard_errors": {key: float(np.sqrt(rate * (1 - rate) / simulations)) for key, rate in rates.items()},
+    }
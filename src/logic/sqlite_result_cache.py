@@ -0,0 +1,251 @@
+"""
+Cache persistente de resultados do validador em um arquivo SQLite local.
+
+Complementa o ResultCache em memória: sobrevive ao reinício do dyno e pode ser lido
+ao mesmo tempo por vários processos (modo WAL). As entradas são indexadas pela chave
+canônica das entradas (canonical_input_key) e pela versão da biblioteca, e o tamanho
+do arquivo em disco (banco + WAL) é limitado removendo primeiro as entradas acessadas
+há mais tempo.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Incrementar quando a estrutura das tabelas mudar; bancos antigos são recriados
+SCHEMA_VERSION = 1
+# Limite do arquivo WAL entre checkpoints (reservado dentro de max_bytes)
+MAX_WAL_BYTES = 4 * 1024 * 1024
+
+
+def _library_version() -> str:
+    try:
+        return version("ab-test-calculator")
+    except PackageNotFoundError:
+        return "dev"
+
+
+LIBRARY_VERSION = _library_version()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT NOT NULL,
+    library_version TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (key, library_version)
+);
+CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access);
+"""
+
+
+class SQLiteResultCache:
+    """
+    Cache em disco (SQLite + WAL) com limite de tamanho.
+
+    Cada thread usa a sua própria conexão; processos diferentes podem abrir o mesmo
+    arquivo simultaneamente.
+    """
+    def __init__(self,
+                 path: str | Path,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 library_version: str = LIBRARY_VERSION,
+                 timeout: float = 30.0,
+                 touch_interval: float = 60.0) -> None:
+        """
+        Args:
+            path: Caminho do arquivo SQLite (criado se não existir).
+            max_bytes: Tamanho máximo do arquivo em disco (páginas do banco mais o WAL).
+                Uma parte (1/4, no máximo MAX_WAL_BYTES) fica reservada para o WAL.
+            library_version: Versão usada na chave; resultados de outras versões são ignorados.
+            timeout: Tempo de espera (s) por locks de escrita de outros processos.
+            touch_interval: Intervalo mínimo (s) entre atualizações de last_access de uma
+                entrada; leituras mais próximas não pegam o lock de escrita, e a ordem
+                de remoção fica aproximada dentro desse intervalo.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.wal_bytes = min(max_bytes // 4, MAX_WAL_BYTES)
+        self.library_version = library_version
+        self.timeout = timeout
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self._initialize_schema()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            # auto_vacuum precisa vir antes do modo WAL, que já grava o cabeçalho de um banco novo
+            connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            # Checkpoint automático na metade da reserva do WAL (cada quadro tem 24 bytes de
+            # cabeçalho), para que a última transação ainda caiba; o arquivo volta ao limite
+            frame_bytes = connection.execute("PRAGMA page_size").fetchone()[0] + 24
+            connection.execute(f"PRAGMA wal_autocheckpoint={max(1, self.wal_bytes // frame_bytes // 2)}")
+            connection.execute(f"PRAGMA journal_size_limit={self.wal_bytes}")
+            self._local.connection = connection
+        return connection
+
+    def _initialize_schema(self) -> None:
+        connection = self._connection()
+        # Bancos criados sem auto_vacuum incremental só mudam com um VACUUM completo
+        if connection.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            connection.execute("VACUUM")
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            statements = [statement for statement in _SCHEMA.split(";") if statement.strip()]
+            connection.execute(statements[0])  # tabela meta
+            row = connection.execute("SELECT value FROM meta WHERE name = 'schema_version'").fetchone()
+            if row is not None and int(row[0]) != SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS results")
+            for statement in statements[1:]:
+                connection.execute(statement)
+            connection.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT payload, last_access FROM results WHERE key = ? AND library_version = ?",
+            (key, self.library_version),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        now = time.time()
+        if now - row[1] > self.touch_interval:
+            connection.execute(
+                "UPDATE results SET last_access = ? WHERE key = ? AND library_version = ?",
+                (now, key, self.library_version),
+            )
+        self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, results: Dict[str, Any]) -> None:
+        payload = json.dumps(results, separators=(",", ":"))
+        now = time.time()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO results (key, library_version, payload, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, self.library_version, payload, len(payload), now, now),
+            )
+            evicted = self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if evicted:
+            self._checkpoint(connection)
+
+    @staticmethod
+    def _database_bytes(connection: sqlite3.Connection) -> int:
+        """ Tamanho do banco (páginas, incluindo as ainda não devolvidas pelo vacuum). """
+        page_size = connection.execute("PRAGMA page_size").fetchone()[0]
+        return connection.execute("PRAGMA page_count").fetchone()[0] * page_size
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        """
+        Remove as entradas acessadas há mais tempo até o banco caber em max_bytes menos
+        a reserva do WAL. O tamanho dos payloads estima as páginas liberadas; o vacuum
+        incremental devolve as páginas dentro da mesma transação e a medição é repetida
+        até caber (ou até não restar entrada).
+        """
+        budget = self.max_bytes - self.wal_bytes
+        evicted = 0
+        while (excess := self._database_bytes(connection) - budget) > 0:
+            cursor = connection.execute(
+                """
+                DELETE FROM results WHERE rowid IN (
+                    SELECT rowid FROM (
+                        SELECT rowid, size, SUM(size) OVER (ORDER BY last_access, rowid) AS running_size
+                        FROM results
+                    ) WHERE running_size - size < ?
+                )
+                """,
+                (excess,),
+            )
+            self._vacuum(connection)
+            if cursor.rowcount <= 0:
+                break
+            evicted += cursor.rowcount
+        return evicted
+
+    @staticmethod
+    def _vacuum(connection: sqlite3.Connection) -> None:
+        """ Devolve as páginas livres (o módulo sqlite3 executa um passo, uma página, por chamada). """
+        for _ in range(connection.execute("PRAGMA freelist_count").fetchone()[0]):
+            connection.execute("PRAGMA incremental_vacuum")
+
+    def _checkpoint(self, connection: sqlite3.Connection) -> None:
+        """
+        Grava o WAL no banco (que encolhe com as páginas devolvidas) e trunca o WAL.
+        Sem esperar por leitores de outros processos: se algum estiver lendo, o
+        checkpoint fica para o próximo.
+        """
+        connection.execute("PRAGMA busy_timeout=0")
+        try:
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        finally:
+            connection.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+
+    def file_bytes(self) -> int:
+        """ Tamanho atual em disco: arquivo do banco mais o WAL. """
+        wal_path = f"{self.path}-wal"
+        return self.path.stat().st_size + (os.path.getsize(wal_path) if os.path.exists(wal_path) else 0)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        results = self.get(key)
+        if results is None:
+            results = compute()
+            self.set(key, results)
+        return results
+
+    def clear(self) -> None:
+        connection = self._connection()
+        connection.execute("DELETE FROM results")
+        self._vacuum(connection)
+        self._checkpoint(connection)
+
+    def stored_bytes(self) -> int:
+        """ Soma do tamanho dos resultados guardados (para todas as versões). """
+        row = self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+        return int(row[0])
+
+    def stats(self) -> Dict[str, Any]:
+        row = self._connection().execute("SELECT COUNT(*) FROM results").fetchone()
+        return {
+            "entries": int(row[0]),
+            "stored_bytes": self.stored_bytes(),
+            "file_bytes": self.file_bytes(),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
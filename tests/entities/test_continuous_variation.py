@@ -0,0 +1,85 @@
+from functools import reduce
+import numpy as np
+import pytest
+from domain.entities.continuous_variation import ContinuousVariation, StreamingCovariance, StreamingMoments
+
+
+def test_streaming_moments_match_numpy_across_chunks():
+    rng = np.random.default_rng(11)
+    values = rng.lognormal(3.0, 1.2, size=100_003)
+    moments = StreamingMoments()
+    for chunk in np.array_split(values, 17):
+        moments.update(chunk)
+    assert moments.count == values.size
+    assert moments.mean == pytest.approx(values.mean(), rel=1e-12)
+    assert moments.variance == pytest.approx(values.var(ddof=1), rel=1e-10)
+    assert moments.total == pytest.approx(values.sum(), rel=1e-12)
+
+
+def test_merge_is_order_independent():
+    rng = np.random.default_rng(5)
+    shards = [StreamingMoments.from_values(rng.normal(i, 1 + i, size=1000 * (i + 1))) for i in range(5)]
+    forward = reduce(lambda left, right: left.merge(right), shards, StreamingMoments())
+    backward = reduce(lambda left, right: left.merge(right), reversed(shards), StreamingMoments())
+    assert forward.count == backward.count
+    assert forward.mean == pytest.approx(backward.mean, rel=1e-12)
+    assert forward.m2 == pytest.approx(backward.m2, rel=1e-12)
+
+
+def test_welford_is_stable_with_a_large_offset():
+    rng = np.random.default_rng(2)
+    values = 1e9 + rng.normal(0, 1, size=200_000)
+    moments = StreamingMoments()
+    for chunk in np.array_split(values, 40):
+        moments.update(chunk)
+    assert moments.variance == pytest.approx(np.var(values - 1e9, ddof=1), rel=1e-6)
+
+
+def test_sufficient_statistics_and_raw_values_agree():
+    values_a = np.array([0.0, 10.0, 0.0, 25.0, 5.0])
+    values_b = np.array([0.0, 0.0, 30.0, 12.0])
+    from_values = ContinuousVariation.from_values(values_a, values_b, 2, 95.0, 10.0)
+    from_sums = ContinuousVariation.from_sums(5, 4, values_a.sum(), values_b.sum(),
+                                              (values_a ** 2).sum(), (values_b ** 2).sum(), 2, 95.0, 10.0)
+
+    assert from_values.variation_a_visitors == from_sums.variation_a_visitors == 5
+    assert from_sums.mean_a == pytest.approx(8.0)
+    assert from_sums.conversion_rate_b == pytest.approx(10.5)
+    assert from_sums.variance_a == pytest.approx(values_a.var(ddof=1))
+    assert from_sums.default_error_b == pytest.approx(np.sqrt(values_b.var(ddof=1) / 4))
+    assert from_values.default_error_a == pytest.approx(from_sums.default_error_a)
+    assert from_values.obs_power_on
+
+
+def test_empty_arm_and_invalid_inputs():
+    variation = ContinuousVariation(0, 10, 0.0, 5.0, 0.0, 4.0, 2, 95.0, 10.0)
+    assert variation.default_error_a == 0.0
+    assert StreamingMoments.from_sums(0, 0.0, 0.0).variance == 0.0
+    with pytest.raises(ValueError):
+        ContinuousVariation(10, 10, 1.0, 1.0, -1.0, 1.0, 2, 95.0, 10.0)
+
+
+def test_streaming_covariance_matches_numpy_and_merges():
+    rng = np.random.default_rng(12)
+    x = rng.gamma(2.0, 30.0, size=50_000) + 1e6
+    y = 0.5 * x + rng.normal(0, 10, size=x.size)
+    expected = np.cov(x, y)
+
+    chunked = StreamingCovariance()
+    for start in range(0, x.size, 7_000):
+        chunked.update(x[start:start + 7_000], y[start:start + 7_000])
+    shards = StreamingCovariance.from_values(x[:20_000], y[:20_000]).merge(
+        StreamingCovariance.from_values(x[20_000:], y[20_000:]))
+    for accumulator in (chunked, shards):
+        assert accumulator.count == x.size
+        assert accumulator.covariance == pytest.approx(expected[0, 1], rel=1e-9)
+        assert accumulator.moments_x.variance == pytest.approx(expected[0, 0], rel=1e-9)
+        assert accumulator.moments_y.variance == pytest.approx(expected[1, 1], rel=1e-9)
+        assert accumulator.correlation == pytest.approx(np.corrcoef(x, y)[0, 1], rel=1e-9)
+
+    small = rng.normal(size=(2, 100))
+    from_sums = StreamingCovariance.from_sums(100, *small.sum(axis=1), *(small ** 2).sum(axis=1),
+                                              (small[0] * small[1]).sum())
+    assert from_sums.comoment == pytest.approx(StreamingCovariance.from_values(*small).comoment)
+    with pytest.raises(ValueError, match="mesmo número"):
+        StreamingCovariance().update([1.0, 2.0], [1.0])
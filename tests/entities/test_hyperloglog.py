@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+from domain.entities.hyperloglog import HyperLogLog
+
+
+def _hashes(values) -> np.ndarray:
+    return pd.util.hash_array(np.asarray(values, dtype=object).astype(str))
+
+
+@pytest.mark.parametrize("cardinality", [10, 1_000, 200_000])
+def test_estimate_is_within_the_error_bound(cardinality: int):
+    sketch = HyperLogLog().add_hashes(_hashes(np.arange(cardinality)))
+    # Repetições não mudam o sketch
+    sketch.add_hashes(_hashes(np.arange(cardinality)))
+    assert sketch.relative_error == pytest.approx(0.008125)
+    assert len(sketch) == pytest.approx(cardinality, rel=4 * sketch.relative_error, abs=1)
+
+
+@pytest.mark.parametrize("cardinality", [41_000, 45_000, 49_000])
+def test_estimate_is_unbiased_between_2_5m_and_3m(cardinality: int):
+    # Faixa em que o estimador com troca para contagem linear tinha viés de 1 a 2%
+    errors = []
+    for seed in range(30):
+        hashes = np.random.default_rng(seed).integers(0, 2 ** 64, cardinality, dtype=np.uint64)
+        sketch = HyperLogLog().add_hashes(hashes)
+        errors.append(sketch.estimate() / cardinality - 1)
+    errors = np.asarray(errors)
+    assert abs(errors.mean()) < 0.004
+    assert np.sqrt(np.mean(errors ** 2)) < 1.25 * sketch.relative_error
+
+
+def test_merge_is_the_union():
+    first = HyperLogLog(12).add_hashes(_hashes(np.arange(0, 60_000)))
+    second = HyperLogLog(12).add_hashes(_hashes(np.arange(40_000, 100_000)))
+    union = HyperLogLog(12).add_hashes(_hashes(np.arange(100_000)))
+
+    merged = first.copy().merge(second)
+    np.testing.assert_array_equal(merged.registers, union.registers)
+    assert len(first) == pytest.approx(60_000, rel=0.06)
+    with pytest.raises(ValueError, match="mesma precisão"):
+        first.merge(HyperLogLog(10))
+
+
+def test_serialization_round_trip():
+    sketch = HyperLogLog().add_hashes(_hashes(np.arange(50_000)))
+    data = sketch.to_bytes()
+    assert len(data) < sketch.size
+    restored = HyperLogLog.from_bytes(data)
+    assert restored.precision == sketch.precision
+    np.testing.assert_array_equal(restored.registers, sketch.registers)
+
+    with pytest.raises(ValueError):
+        HyperLogLog.from_bytes(b"xx")
+    with pytest.raises(ValueError):
+        HyperLogLog.from_bytes(data[:5] + b"corrompido")
+    with pytest.raises(ValueError, match="precisão"):
+        HyperLogLog(3)
@@ -0,0 +1,67 @@
+import pytest
+
+from domain.entities.multi_arm_variation import MultiArmVariation
+from domain.entities.variation import Variation
+
+
+@pytest.fixture
+def multi_arm_instance() -> MultiArmVariation:
+    return MultiArmVariation(
+        arm_names=["Controle", "B", "C"],
+        visitors=[80000, 80000, 0],
+        conversions=[1600, 1696, 0],
+        tail_numbers=2,
+        confidence_level=95.0,
+        estimated_uplift=10.0,
+        expected_weights=[50, 25, 25],
+    )
+
+
+def test_rates_and_errors_match_variation(multi_arm_instance: MultiArmVariation):
+    variation = multi_arm_instance.to_variation(1)
+    assert multi_arm_instance.conversion_rates[:2].tolist() == pytest.approx(
+        [variation.conversion_rate_a, variation.conversion_rate_b])
+    assert multi_arm_instance.default_errors[:2].tolist() == pytest.approx(
+        [variation.default_error_a, variation.default_error_b])
+    # Braço sem visitantes não gera divisão por zero
+    assert multi_arm_instance.conversion_rates[2] == 0.0
+    assert multi_arm_instance.default_errors[2] == 0.0
+
+
+def test_weights_are_normalized(multi_arm_instance: MultiArmVariation):
+    assert multi_arm_instance.expected_weights.tolist() == [0.5, 0.25, 0.25]
+    assert multi_arm_instance.control_name == "Controle"
+
+
+def test_from_variation_keeps_two_arms():
+    variation = Variation(1000, 1200, 50, 70, 1, 90.0, 5.0)
+    multi_arm = MultiArmVariation.from_variation(variation)
+    assert len(multi_arm) == 2
+    assert multi_arm.visitors.tolist() == [1000, 1200]
+    assert multi_arm.confidence_level == pytest.approx(0.90)
+
+
+def test_count_relative_error_widens_errors_like_variation():
+    kwargs = dict(arm_names=["Controle", "B", "C"], visitors=[40000, 40000, 40000],
+                  conversions=[2000, 2100, 2050], tail_numbers=2, confidence_level=95.0, estimated_uplift=10.0)
+    exact = MultiArmVariation(**kwargs)
+    approximate = MultiArmVariation(count_relative_error=0.008, **kwargs)
+    assert (approximate.default_errors > exact.default_errors).all()
+
+    variation = approximate.to_variation(2)
+    assert variation.count_relative_error == 0.008
+    assert approximate.default_errors[[0, 2]].tolist() == pytest.approx(
+        [variation.default_error_a, variation.default_error_b])
+    assert MultiArmVariation.from_variation(variation).count_relative_error == 0.008
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"arm_names": ["A"], "visitors": [10], "conversions": [1]},
+    {"arm_names": ["A", "B"], "visitors": [10], "conversions": [1, 2]},
+    {"arm_names": ["A", "B"], "visitors": [10, 10], "conversions": [1, 2], "expected_weights": [1, 0]},
+    {"arm_names": ["A", "B"], "visitors": [10, 10], "conversions": [1, 2], "control_index": 2},
+    {"arm_names": ["A", "B"], "visitors": [10, 10], "conversions": [1, 2], "count_relative_error": -0.01},
+])
+def test_invalid_arms_raise(kwargs):
+    with pytest.raises(ValueError):
+        MultiArmVariation(tail_numbers=2, confidence_level=95.0, estimated_uplift=10.0, **kwargs)
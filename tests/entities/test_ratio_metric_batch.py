@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from domain.entities.ratio_metric_batch import RatioMetricBatch
+from domain.entities.variation import Variation
+
+
+def _sums(numerator: np.ndarray, denominator: np.ndarray) -> tuple:
+    return (numerator.size, numerator.sum(), denominator.sum(), (numerator ** 2).sum(),
+            (denominator ** 2).sum(), (numerator * denominator).sum())
+
+
+def _batch(arm_a: tuple, arm_b: tuple, **parameters) -> RatioMetricBatch:
+    units_a, numerator_a, denominator_a, numerator_squares_a, denominator_squares_a, cross_a = arm_a
+    units_b, numerator_b, denominator_b, numerator_squares_b, denominator_squares_b, cross_b = arm_b
+    return RatioMetricBatch(
+        [units_a], [units_b], [numerator_a], [numerator_b], [denominator_a], [denominator_b],
+        [numerator_squares_a], [numerator_squares_b], [denominator_squares_a], [denominator_squares_b],
+        [cross_a], [cross_b], parameters.get("tail_numbers", 2), parameters.get("confidence_level", 95.0),
+        parameters.get("estimated_uplift", 10.0),
+    )
+
+
+def test_delta_method_matches_the_linearized_metric():
+    rng = np.random.default_rng(5)
+    sessions = rng.poisson(4, size=20_000) + 1
+    clicks = rng.binomial(sessions, 0.12)
+    batch = _batch(_sums(clicks, sessions), _sums(clicks[:10_000], sessions[:10_000]))
+
+    ratio = clicks.sum() / sessions.sum()
+    linearized = (clicks - ratio * sessions) / sessions.mean()
+    assert batch.conversion_rate_a[0] == pytest.approx(ratio)
+    assert batch.unit_variance_a[0] == pytest.approx(linearized.var(ddof=1), rel=1e-9)
+    assert batch.default_error_a[0] == pytest.approx(np.sqrt(linearized.var(ddof=1) / clicks.size), rel=1e-9)
+
+
+def test_one_denominator_per_user_reduces_to_a_proportion():
+    converted = np.r_[np.ones(500), np.zeros(9_500)]
+    batch = _batch(_sums(converted, np.ones_like(converted)), _sums(converted, np.ones_like(converted)))
+    variation = Variation(10_000, 10_000, 500, 500, 2, 95.0, 10.0)
+    # A única diferença é o n - 1 da variância amostral
+    assert batch.default_error_a[0] == pytest.approx(variation.default_error_a, rel=1e-4)
+
+
+def test_clustered_denominators_widen_the_binomial_error():
+    rng = np.random.default_rng(8)
+    sessions = rng.poisson(10, size=5_000) + 1
+    # Cada usuário tem a sua propensão a clicar: sessões do mesmo usuário são correlacionadas
+    clicks = rng.binomial(sessions, rng.beta(1, 9, size=sessions.size))
+    batch = _batch(_sums(clicks, sessions), _sums(clicks, sessions))
+    ratio = batch.conversion_rate_a[0]
+    assert batch.default_error_a[0] > 1.3 * np.sqrt(ratio * (1 - ratio) / sessions.sum())
+
+
+def test_empty_arms_and_slicing():
+    batch = RatioMetricBatch([0, 10], [1, 10], 0.0, [5.0, 5.0], 0.0, [20.0, 20.0], 0.0, [5.0, 5.0],
+                             0.0, [50.0, 50.0], 0.0, [12.0, 12.0], 2, 95.0, 10.0)
+    assert batch.conversion_rate_a[0] == 0.0
+    assert batch.default_error_a[0] == 0.0
+    assert batch.unit_variance_b[0] == 0.0
+    assert len(batch[1:]) == 1
+    assert batch[1].conversion_rate_b[0] == pytest.approx(0.25)
+    with pytest.raises(ValueError, match="mesmo tamanho"):
+        RatioMetricBatch([1, 2], [1], 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 95.0, 10.0)
@@ -43,4 +43,13 @@ def test_default_error_b(variation_instance: Variation):
     """Verifica o Erro Padrão da Variação (Grupo B)."""
     # Na imagem: 0.0509%
     expected_error = 0.000509
-    assert variation_instance.default_error_b == pytest.approx(expected_error, abs=1e-5)
\ No newline at end of file
+    assert variation_instance.default_error_b == pytest.approx(expected_error, abs=1e-5)
+
+def test_approximate_counts_widen_the_standard_error(variation_instance: Variation):
+    """Contagens aproximadas somam 2 (ε p)² à variância de cada taxa."""
+    approximate = Variation(80000, 80000, 1600, 1696, 1, 95.0, 10.0, count_relative_error=0.01)
+    expected = (0.02 * 0.98 / 80000 + 2 * (0.01 * 0.02) ** 2) ** 0.5
+    assert approximate.default_error_a == pytest.approx(expected)
+    assert approximate.default_error_a > variation_instance.default_error_a
+    with pytest.raises(ValueError):
+        Variation(80000, 80000, 1600, 1696, 1, 95.0, 10.0, count_relative_error=-0.1)
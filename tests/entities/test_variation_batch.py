@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from domain.entities.variation import Variation
+from domain.entities.variation_batch import VariationBatch
+
+
+@pytest.fixture
+def variation_batch() -> VariationBatch:
+    """
+    Lote com três testes: os dados da planilha, um teste sem visitantes e um
+    teste em que o Controle converte mais que a Variação.
+    """
+    return VariationBatch(
+        variation_a_visitors=[80000, 0, 1000],
+        variation_b_visitors=[80000, 0, 1000],
+        conversions_a=[1600, 0, 80],
+        conversions_b=[1696, 0, 50],
+        tail_numbers=[1, 2, 2],
+        confidence_level=95.0,
+        estimated_uplift=10.0,
+    )
+
+
+def test_columns_are_contiguous_and_typed(variation_batch: VariationBatch):
+    assert variation_batch.variation_a_visitors.dtype == np.int64
+    assert variation_batch.confidence_level.dtype == np.float64
+    assert variation_batch.variation_a_visitors.flags["C_CONTIGUOUS"]
+    assert variation_batch.confidence_level[0] == pytest.approx(0.95)
+
+
+def test_derived_columns_are_lazy(variation_batch: VariationBatch):
+    """As colunas derivadas só existem depois do primeiro acesso."""
+    assert "default_error_a" not in vars(variation_batch)
+    _ = variation_batch.default_error_a
+    assert "default_error_a" in vars(variation_batch)
+    assert "default_error_b" not in vars(variation_batch)
+
+
+def test_derived_columns_match_variation(variation_batch: VariationBatch):
+    for row in range(len(variation_batch)):
+        variation = variation_batch.to_variation(row)
+        assert variation_batch.conversion_rate_a[row] == pytest.approx(variation.conversion_rate_a)
+        assert variation_batch.conversion_rate_b[row] == pytest.approx(variation.conversion_rate_b)
+        assert variation_batch.default_error_a[row] == pytest.approx(variation.default_error_a)
+        assert variation_batch.default_error_b[row] == pytest.approx(variation.default_error_b)
+        assert bool(variation_batch.obs_power_on[row]) == variation.obs_power_on
+
+
+def test_slicing_filtering_and_concat(variation_batch: VariationBatch):
+    head = variation_batch[:2]
+    assert len(head) == 2
+    assert np.shares_memory(head.conversions_a, variation_batch.conversions_a)
+
+    filtered = variation_batch.filter(variation_batch.variation_a_visitors > 0)
+    assert filtered.conversions_b.tolist() == [1696, 50]
+
+    combined = VariationBatch.concat([head, variation_batch[-1]])
+    assert combined.conversions_a.tolist() == [1600, 0, 80]
+    assert combined.confidence_level.tolist() == pytest.approx([0.95, 0.95, 0.95])
+
+
+def test_from_variations_round_trip():
+    variations = [Variation(100, 120, 5, 9, 2, 99.0, 5.0), Variation(50, 40, 1, 0, 1, 90.0, 20.0)]
+    batch = VariationBatch.from_variations(variations)
+    restored = batch.to_variation(1)
+    assert restored.variation_b_visitors == 40
+    assert restored.confidence_level == pytest.approx(0.90)
+    assert restored.estimated_uplift == pytest.approx(0.20)
+
+
+def test_mismatched_columns_raise():
+    with pytest.raises(ValueError):
+        VariationBatch([1, 2], [1], [0, 0], [0, 0], 2, 95.0, 10.0)
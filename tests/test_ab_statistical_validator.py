@@ -84,7 +84,41 @@ class TestABStatisticalValidator:
 
         # --- Validação de Planejamento ---
         planning = results["planning_results"]
-        assert planning["required_users_80_power"] == 156800
-        assert planning["required_users_95_power"] == 254800
-        assert planning["required_days_80_power"] == 249 # 156800 / 629.92
-        assert planning["required_days_95_power"] == 405 # 254800 / 629.92 (planilha arredonda para 404)
\ No newline at end of file
+        # Solver exato (unicaudal, alfa 5%); a planilha usava as constantes 16/26 (156800 e 254800)
+        assert planning["required_users_80_power"] == 127106
+        assert planning["required_users_95_power"] == 222488
+        assert planning["required_days_80_power"] == 202 # 127106 / 629.92
+        assert planning["required_days_95_power"] == 354 # 222488 / 629.92
+
+    def test_metric_subset_only_evaluates_required_subgraph(self, setup_validator: ABStatisticalValidator):
+        """
+        Pedir apenas algumas métricas deve avaliar somente as suas dependências.
+        """
+        results = setup_validator.get_statistical_results(metrics=["p_value", "srm_results"])
+
+        assert set(results) == {"p_value", "srm_results"}
+        assert results["p_value"] == pytest.approx(0.0455, abs=1e-4)
+        assert set(setup_validator._metric_cache) == {
+            "standard_error_difference", "z_score", "p_value", "srm_results"
+        }
+
+    def test_temporal_results_are_computed_once(self, setup_validator: ABStatisticalValidator, monkeypatch):
+        """
+        A validação temporal é compartilhada entre o resultado direto e o planejamento.
+        """
+        calls = []
+        original = ABStatisticalValidator._calculate_temporal_validation_results
+
+        def counting(validator):
+            calls.append(1)
+            return original(validator)
+
+        monkeypatch.setattr(ABStatisticalValidator, "_calculate_temporal_validation_results", counting)
+        setup_validator.get_statistical_results()
+        setup_validator.get_statistical_results()
+
+        assert len(calls) == 1
+
+    def test_unknown_metric_raises(self, setup_validator: ABStatisticalValidator):
+        with pytest.raises(KeyError):
+            setup_validator.get_statistical_results(metrics=["nao_existe"])
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import pytest
+from api import server
+from api.server import HttpServer, ValidatorService
+
+EXPERIMENT = {
+    "name": "Teste da Planilha",
+    "start_date": "2024-09-22",
+    "end_date": "2025-06-03",
+    "variation_a_visitors": 80000,
+    "conversions_a": 1600,
+    "variation_b_visitors": 80000,
+    "conversions_b": 1696,
+    "tail_numbers": 1,
+    "confidence_level": 95.0,
+    "estimated_uplift": 10.0,
+}
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple:
+    status_line = await reader.readline()
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode().partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding") == "chunked":
+        body = b""
+        while (size := int((await reader.readline()).strip(), 16)) > 0:
+            body += await reader.readexactly(size)
+            await reader.readline()
+        await reader.readline()
+    else:
+        body = await reader.readexactly(int(headers["content-length"]))
+    return int(status_line.split()[1]), headers, body
+
+
+async def _exchange(requests: list) -> list:
+    """ Sobe o servidor em uma porta livre e envia as requisições em uma única conexão keep-alive. """
+    server = HttpServer(ValidatorService())
+    tcp_server = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    responses = []
+    try:
+        for method, path, body, content_type in requests:
+            writer.write(
+                f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+            responses.append(await _read_response(reader))
+    finally:
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+    return responses
+
+
+async def _send_raw(request: bytes, service: ValidatorService | None = None) -> tuple:
+    """
+    Envia uma requisição já montada (cabeçalhos incluídos) e lê a resposta, seguida
+    do que mais o servidor enviar até fechar a conexão.
+    """
+    server = HttpServer(service or ValidatorService())
+    tcp_server = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(request)
+        await writer.drain()
+        response = await _read_response(reader)
+        trailing = await asyncio.wait_for(reader.read(), 5)
+        return (*response, trailing)
+    finally:
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+
+
+def test_analyze_and_keep_alive():
+    body = json.dumps(EXPERIMENT).encode()
+    responses = asyncio.run(_exchange([
+        ("POST", "/analyze", body, "application/json"),
+        ("POST", "/analyze", body, "application/json"),
+        ("GET", "/health", b"", "application/json"),
+    ]))
+
+    (status, headers, payload), second, health = responses
+    results = json.loads(payload)
+    assert status == 200
+    assert headers["connection"] == "keep-alive"
+    assert results["p_value"] == pytest.approx(0.0455, abs=1e-4)
+    assert results["srm_results"]["has_srm"] is False
+    assert json.loads(second[2]) == results
+    assert json.loads(health[2])["cache"]["hits"] == 1
+
+
+def test_batch_streams_ndjson_in_order():
+    records = [dict(EXPERIMENT, name=f"Teste {i}", conversions_b=1600 + i) for i in range(12)]
+    records[3].pop("tail_numbers")  # campo opcional ausente usa o padrão
+    ndjson = "\n".join(json.dumps(record) for record in records).encode()
+
+    [(status, headers, body)] = asyncio.run(_exchange([
+        ("POST", "/analyze/batch", ndjson, "application/x-ndjson"),
+    ]))
+    rows = [json.loads(line) for line in body.decode().splitlines()]
+
+    assert status == 200
+    assert headers["content-type"] == "application/x-ndjson"
+    assert [row["name"] for row in rows] == [record["name"] for record in records]
+    assert rows[0]["conversion_rate_uplift"] == pytest.approx(0.0)
+
+
+def test_client_errors_keep_connection_usable():
+    invalid = dict(EXPERIMENT)
+    invalid.pop("conversions_a")
+    responses = asyncio.run(_exchange([
+        ("POST", "/analyze", json.dumps(invalid).encode(), "application/json"),
+        ("POST", "/analyze", b"{nao-e-json", "application/json"),
+        ("GET", "/nao-existe", b"", "application/json"),
+        ("POST", "/analyze", json.dumps(dict(EXPERIMENT, tail_numbers=3)).encode(), "application/json"),
+        ("POST", "/analyze", json.dumps(EXPERIMENT).encode(), "application/json"),
+    ]))
+
+    assert [status for status, _, _ in responses] == [400, 400, 404, 400, 200]
+    assert "conversions_a" in json.loads(responses[0][2])["error"]
+
+
+@pytest.mark.parametrize("content_length", ["abc", "-5", "+5", "1e3"])
+def test_malformed_content_length_is_a_bad_request(content_length: str):
+    status, headers, body, _ = asyncio.run(_send_raw(
+        f"POST /analyze HTTP/1.1\r\nHost: localhost\r\nContent-Length: {content_length}\r\n\r\n{{}}".encode()
+    ))
+    assert status == 400
+    assert headers["connection"] == "close"
+    assert "Content-Length" in json.loads(body)["error"]
+
+
+class _FailingService(ValidatorService):
+    """ Falha com um erro interno a partir do segundo bloco do lote. """
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def analyze_batch_chunk(self, records):
+        self.calls += 1
+        if self.calls > 1:
+            raise RuntimeError("falha no bloco")
+        return super().analyze_batch_chunk(records)
+
+
+def test_internal_error_in_later_batch_chunk_ends_the_stream(monkeypatch):
+    monkeypatch.setattr(server, "BATCH_CHUNK_SIZE", 2)
+    ndjson = "\n".join(json.dumps(dict(EXPERIMENT, name=f"Teste {i}")) for i in range(5)).encode()
+    request = (f"POST /analyze/batch HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/x-ndjson\r\n"
+               f"Content-Length: {len(ndjson)}\r\n\r\n").encode() + ndjson
+    # Uma segunda requisição na mesma conexão não deve ser atendida
+    request += request
+
+    status, headers, body, trailing = asyncio.run(_send_raw(request, _FailingService()))
+    lines = [json.loads(line) for line in body.decode().splitlines()]
+
+    assert status == 200
+    assert headers["transfer-encoding"] == "chunked"
+    assert [line.get("name") for line in lines[:2]] == ["Teste 0", "Teste 1"]
+    assert lines[2] == {"error": "Erro interno: falha no bloco"}
+    assert len(lines) == 3
+    # O corpo chunked termina em 0\r\n\r\n e a conexão é fechada, sem outra resposta
+    assert trailing == b""
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+from datetime import date
+from domain.entities.variation import Variation
+from domain.entities.ab_tester import ABTester
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.batch_statistical_validator import BatchStatisticalValidator
+from domain.use_cases.sequential_testing import calculate_sequential_results
+
+
+def _flatten(results: dict) -> dict:
+    """ Achata os dicionários aninhados do validador escalar no formato colunar. """
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update({k: v for k, v in value.items() if k != "current_date"})
+        else:
+            flat[key] = value
+    return flat
+
+
+@pytest.fixture
+def experiments() -> list:
+    """
+    Gera uma carteira de experimentos aleatórios, incluindo casos de borda
+    (zero conversões, zero visitantes, taxas iguais e duração zero).
+    """
+    rng = np.random.default_rng(42)
+    pairs = []
+    for i in range(200):
+        visitors_a = int(rng.integers(0, 100_000))
+        visitors_b = int(rng.integers(0, 100_000))
+        pairs.append((
+            Variation(
+                variation_a_visitors=visitors_a,
+                variation_b_visitors=visitors_b,
+                conversions_a=int(rng.integers(0, visitors_a + 1) * 0.1),
+                conversions_b=int(rng.integers(0, visitors_b + 1) * 0.1),
+                tail_numbers=int(rng.integers(1, 3)),
+                confidence_level=float(rng.choice([90.0, 95.0, 99.0])),
+                estimated_uplift=float(rng.choice([0.0, 5.0, 10.0])),
+            ),
+            ABTester(
+                name=f"Teste {i}",
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 1, 1 + int(rng.integers(0, 30))),
+                hypothesis="",
+                desired_confidence_level=95.0,
+            ),
+        ))
+    pairs.append((Variation(0, 0, 0, 0, 2, 95.0, 10.0), pairs[0][1]))
+    pairs.append((Variation(1000, 1000, 50, 50, 1, 95.0, 10.0), pairs[0][1]))
+    pairs.append((Variation(50_000, 50_000, 2_500, 2_650, 2, 95.0, 10.0, count_relative_error=0.008), pairs[0][1]))
+    return pairs
+
+
+def test_batch_matches_scalar_path(experiments: list):
+    """Cada coluna do lote deve coincidir com o validador escalar linha a linha."""
+    today = date(2025, 6, 3)
+    batch = BatchStatisticalValidator.from_entities(experiments, today=today).get_statistical_results()
+
+    for row, (variation, tester) in enumerate(experiments):
+        expected = _flatten(ABStatisticalValidator(variation, tester).get_statistical_results())
+        for key, value in expected.items():
+            assert batch[key][row] == pytest.approx(value, rel=1e-9, abs=1e-12), (key, row)
+
+
+def test_batch_spreadsheet_values():
+    """Reproduz os valores da planilha com a API de arrays."""
+    results = BatchStatisticalValidator.from_arrays(
+        variation_a_visitors=[80000],
+        variation_b_visitors=[80000],
+        conversions_a=[1600],
+        conversions_b=[1696],
+        tail_numbers=1,
+        confidence_level=95.0,
+        estimated_uplift=10.0,
+        start_dates=[date(2024, 9, 22)],
+        end_dates=[date(2025, 6, 3)],
+    ).get_statistical_results()
+
+    assert results["z_score"][0] == pytest.approx(1.689668, abs=1e-5)
+    assert results["p_value"][0] == pytest.approx(0.0455, abs=1e-4)
+    assert results["observed_test_power"][0] == pytest.approx(0.7757, abs=1e-4)
+    assert results["required_days_80_power"][0] == 202
+
+
+def test_batch_rejects_invalid_tails():
+    with pytest.raises(ValueError):
+        BatchStatisticalValidator.from_arrays([10], [10], [1], [1], 3, 95.0, 10.0, [date(2025, 1, 1)], [date(2025, 1, 2)])
+
+
+def test_batch_sequential_results_accept_a_fixed_mixing_variance():
+    variations = [Variation(8000, 8000, 160, 190, 2, 95.0, 10.0), Variation(500, 520, 0, 3, 2, 95.0, 10.0)]
+    validator = BatchStatisticalValidator.from_arrays(
+        [v.variation_a_visitors for v in variations], [v.variation_b_visitors for v in variations],
+        [v.conversions_a for v in variations], [v.conversions_b for v in variations],
+        2, 95.0, 10.0, date(2025, 1, 1), date(2025, 1, 2))
+    results = validator.get_sequential_results(mixing_variance=4e-6)
+    for row, variation in enumerate(variations):
+        expected = calculate_sequential_results(variation, mixing_variance=4e-6)
+        assert results["mixing_variance"][row] == 4e-6
+        assert results["sequential_p_value"][row] == pytest.approx(expected["sequential_p_value"])
+        assert results["sequential_lower_bound"][row] == pytest.approx(expected["sequential_lower_bound"])
+    with pytest.raises(ValueError, match="τ²"):
+        validator.get_sequential_results(mixing_variance=0.0)
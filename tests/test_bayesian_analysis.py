@@ -0,0 +1,106 @@
+from datetime import date
+import numpy as np
+import pytest
+from domain.entities.ab_tester import ABTester
+from domain.entities.multi_arm_variation import MultiArmVariation
+from domain.entities.variation import Variation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.bayesian_analysis import (
+    calculate_bayesian_arrays,
+    calculate_bayesian_results,
+    posterior_parameters,
+)
+from domain.use_cases.multi_arm_validator import MultiArmStatisticalValidator
+
+
+def _monte_carlo_reference(visitors_a, conversions_a, visitors_b, conversions_b, prior=(1.0, 1.0)):
+    rng = np.random.default_rng(123)
+    draws_a = rng.beta(prior[0] + conversions_a, prior[1] + visitors_a - conversions_a, 2_000_000)
+    draws_b = rng.beta(prior[0] + conversions_b, prior[1] + visitors_b - conversions_b, 2_000_000)
+    difference = draws_b - draws_a
+    return np.mean(difference > 0), np.mean(np.maximum(difference, 0)), np.mean(np.maximum(-difference, 0))
+
+
+@pytest.mark.parametrize("counts, method", [
+    ((1000, 50, 1000, 60), "exact"),
+    ((5000, 5, 5000, 9), "exact"),
+    ((200000, 30000, 200000, 30500), "normal"),
+])
+def test_probability_and_loss_match_monte_carlo(counts, method):
+    results = calculate_bayesian_results(*counts)
+    probability, loss_a, loss_b = _monte_carlo_reference(*counts)
+    assert results["bayesian_method"] == method
+    assert results["probability_b_beats_a"] == pytest.approx(probability, abs=2e-3)
+    assert results["expected_loss_a"] == pytest.approx(loss_a, rel=1e-2, abs=1e-7)
+    assert results["expected_loss_b"] == pytest.approx(loss_b, rel=1e-2, abs=1e-7)
+
+
+def test_uniform_posteriors_without_data():
+    results = calculate_bayesian_results(0, 0, 0, 0)
+    assert results["probability_b_beats_a"] == pytest.approx(0.5)
+    # E[max(U1 - U2, 0)] para duas uniformes independentes = 1/6
+    assert results["expected_loss_a"] == pytest.approx(1 / 6)
+
+
+def test_non_integer_prior_uses_monte_carlo():
+    results = calculate_bayesian_results(1000, 50, 1000, 60, 0.5, 0.5)
+    probability, _, _ = _monte_carlo_reference(1000, 50, 1000, 60, prior=(0.5, 0.5))
+    assert results["bayesian_method"] == "monte_carlo"
+    assert results["probability_b_beats_a"] == pytest.approx(probability, abs=1e-2)
+    assert calculate_bayesian_results(1000, 50, 1000, 60, 0.5, 0.5) is results
+
+
+def test_rows_do_not_depend_on_the_rest_of_the_batch():
+    visitors = np.array([1000, 20000, 300, 0])
+    conversions = np.array([50, 400, 3, 0])
+    batch = calculate_bayesian_arrays(visitors, conversions, visitors[::-1], conversions[::-1])
+    for row in range(len(visitors)):
+        single = calculate_bayesian_arrays(visitors[row], conversions[row], visitors[::-1][row], conversions[::-1][row])
+        for key in ("probability_b_beats_a", "expected_loss_a", "expected_loss_b"):
+            assert batch[key][row] == single[key][0]
+
+
+def test_invalid_prior_raises():
+    with pytest.raises(ValueError):
+        posterior_parameters(np.array([10]), np.array([1]), prior_alpha=0.0)
+
+
+def test_validator_exposes_bayesian_results():
+    variation = Variation(1000, 1000, 50, 60, 2, 95.0, 10.0)
+    tester = ABTester("Teste", date(2025, 1, 1), date(2025, 2, 1), "", 95.0)
+    validator = ABStatisticalValidator(variation=variation, tester=tester)
+    results = validator.get_statistical_results()
+    assert results["bayesian_results"] == calculate_bayesian_results(1000, 50, 1000, 60)
+    assert validator.get_bayesian_results(2, 2)["prior_alpha"] == 2.0
+
+
+def test_multi_arm_bayesian_results():
+    variation = MultiArmVariation(
+        arm_names=["A", "B", "C"],
+        visitors=[1000, 1000, 1000],
+        conversions=[50, 60, 55],
+        tail_numbers=2,
+        confidence_level=95.0,
+        estimated_uplift=10.0,
+    )
+    bayesian = MultiArmStatisticalValidator(variation).get_statistical_results()["bayesian_results"]
+    assert np.isnan(bayesian["probability_beats_control"][0])
+    assert bayesian["probability_beats_control"][1] == pytest.approx(
+        calculate_bayesian_results(1000, 50, 1000, 60)["probability_b_beats_a"])
+    assert sum(bayesian["probability_best"]) == pytest.approx(1.0)
+    assert int(np.argmax(bayesian["probability_best"])) == 1
+    assert int(np.argmin(bayesian["expected_loss"])) == 1
+
+
+def test_cached_multi_arm_results_cannot_be_changed_by_callers():
+    variation = MultiArmVariation(["A", "B", "C"], [1000, 1000, 1000], [50, 60, 55], 2, 95.0, 10.0)
+    validator = MultiArmStatisticalValidator(variation)
+    first = validator.get_bayesian_results()
+    expected = first["probability_best"]
+    with pytest.raises(TypeError):
+        first["probability_best"][0] = 1.0
+    first["expected_loss"] = None
+
+    again = validator.get_bayesian_results()
+    assert again["probability_best"] == expected
+    assert again["expected_loss"] is not None
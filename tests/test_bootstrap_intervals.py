@@ -0,0 +1,104 @@
+import tracemalloc
+from datetime import date
+import numpy as np
+import pytest
+from domain.entities.ab_tester import ABTester
+from domain.entities.variation import Variation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.bootstrap_intervals import BootstrapEngine, _draw_chunk
+
+
+def _variation(visitors_a, conversions_a, visitors_b, conversions_b) -> Variation:
+    return Variation(
+        variation_a_visitors=visitors_a,
+        variation_b_visitors=visitors_b,
+        conversions_a=conversions_a,
+        conversions_b=conversions_b,
+        tail_numbers=2,
+        confidence_level=95.0,
+        estimated_uplift=10.0,
+    )
+
+
+def test_same_seed_is_reproducible_regardless_of_chunking_and_workers():
+    variation = _variation(20000, 40, 20000, 62)
+    reference = BootstrapEngine(replicates=5000, seed=7, max_bytes=64 * 1000).run(variation)
+    parallel = BootstrapEngine(replicates=5000, seed=7, max_bytes=64 * 1000, workers=2).run(variation)
+    assert parallel == reference
+    assert BootstrapEngine(replicates=5000, seed=8).run(variation) != reference
+
+
+@pytest.mark.parametrize("method", ["binomial", "poisson"])
+def test_streamed_quantiles_match_all_replicates_in_memory(method):
+    variation = _variation(3000, 30, 3000, 45)
+    engine = BootstrapEngine(replicates=25_000, seed=5, method=method, max_bytes=256 * 1000)
+    assert engine.chunk_size == 1000
+    results = engine.run(variation)
+
+    # Referência: todas as réplicas na memória, com as mesmas sementes por bloco
+    sizes = engine._chunk_sizes()
+    seeds = np.random.SeedSequence(5).spawn(len(sizes))
+    chunks = [_draw_chunk(method, seed, size, (3000, 30, 3000, 45)) for seed, size in zip(seeds, sizes)]
+    for index, name in enumerate(("absolute_lift", "relative_lift")):
+        replicates = np.concatenate([chunk[index] for chunk in chunks])
+        replicates = replicates[np.isfinite(replicates)]
+        expected = np.quantile(replicates, [0.025, 0.975])
+        assert [results[name]["percentile"]["lower"], results[name]["percentile"]["upper"]] == pytest.approx(
+            expected, rel=1e-12, abs=1e-15)
+
+
+def test_peak_memory_does_not_grow_with_replicates():
+    variation = _variation(20000, 400, 20000, 480)
+    budget = 1024 * 1024
+
+    def peak(replicates: int) -> int:
+        tracemalloc.start()
+        BootstrapEngine(replicates=replicates, seed=2, max_bytes=budget).run(variation)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_bytes
+
+    assert peak(400_000) <= budget
+    assert peak(400_000) < 1.5 * peak(20_000)
+
+
+@pytest.mark.parametrize("method", ["binomial", "poisson"])
+def test_intervals_match_wald_for_large_samples(method):
+    variation = _variation(200000, 10000, 200000, 10600)
+    results = BootstrapEngine(replicates=20000, seed=3, method=method).run(variation)
+
+    rate_a, rate_b = 0.05, 0.053
+    wald_half_width = 1.959964 * np.sqrt(rate_a * (1 - rate_a) / 200000 + rate_b * (1 - rate_b) / 200000)
+    absolute = results["absolute_lift"]
+    assert absolute["estimate"] == pytest.approx(0.003)
+    for kind in ("percentile", "bca"):
+        assert absolute[kind]["lower"] == pytest.approx(0.003 - wald_half_width, abs=2e-4)
+        assert absolute[kind]["upper"] == pytest.approx(0.003 + wald_half_width, abs=2e-4)
+
+    relative = results["relative_lift"]
+    assert relative["estimate"] == pytest.approx(0.06)
+    assert relative["bca"]["lower"] < 0.06 < relative["bca"]["upper"]
+
+
+def test_relative_lift_without_control_conversions_is_nan():
+    results = BootstrapEngine(replicates=1000, seed=0).run(_variation(500, 0, 500, 3))
+    assert np.isnan(results["relative_lift"]["percentile"]["lower"])
+    assert results["absolute_lift"]["percentile"]["upper"] > 0
+
+
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError):
+        BootstrapEngine(method="jackknife")
+    with pytest.raises(ValueError):
+        BootstrapEngine(replicates=0)
+    with pytest.raises(ValueError):
+        BootstrapEngine().run(_variation(0, 0, 100, 10))
+
+
+def test_validator_exposes_bootstrap_intervals():
+    variation = _variation(20000, 400, 20000, 480)
+    tester = ABTester("Teste", date(2025, 1, 1), date(2025, 2, 1), "", 95.0)
+    validator = ABStatisticalValidator(variation=variation, tester=tester)
+    results = validator.get_bootstrap_intervals(replicates=2000, seed=11)
+    assert results == BootstrapEngine(replicates=2000, seed=11).run(variation)
+    assert "bootstrap_intervals" not in validator.get_statistical_results()
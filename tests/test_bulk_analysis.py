@@ -0,0 +1,87 @@
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+import pandas as pd
+import pytest
+from cli.main import main
+from logic.bulk_analysis import analyze_file, iter_experiment_chunks
+from domain.use_cases.batch_statistical_validator import BatchStatisticalValidator
+
+TODAY = date(2025, 6, 3)
+
+
+@pytest.fixture
+def experiments_frame() -> pd.DataFrame:
+    """ Carteira pequena no formato de entrada da CLI (um experimento por linha). """
+    return pd.DataFrame({
+        "name": [f"Teste {i}" for i in range(7)],
+        "start_date": ["2024-09-22"] * 7,
+        "end_date": ["2025-06-03", "2025-06-03", None, "2025-01-10", "2025-06-03", "2025-02-01", "2025-06-03"],
+        "variation_a_visitors": [80000, 1000, 500, 0, 12000, 3000, 80000],
+        "conversions_a": [1600, 50, 10, 0, 300, 90, 1600],
+        "variation_b_visitors": [80000, 1100, 520, 0, 11800, 2900, 79000],
+        "conversions_b": [1696, 60, 9, 0, 330, 101, 1700],
+        "tail_numbers": [1, 2, 2, 1, 2, 1, 2],
+        "confidence_level": [95.0, 95.0, 90.0, 99.0, 95.0, 95.0, 99.0],
+        "estimated_uplift": [10.0, 5.0, 10.0, 10.0, 2.0, 10.0, 10.0],
+    })
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_analyze_file_streams_chunks(tmp_path: Path, experiments_frame: pd.DataFrame, suffix: str):
+    input_path = tmp_path / f"experiments{suffix}"
+    output_path = tmp_path / f"results{suffix}"
+    if suffix == ".csv":
+        experiments_frame.to_csv(input_path, index=False)
+    else:
+        experiments_frame.to_parquet(input_path, index=False)
+
+    assert [len(c) for c in iter_experiment_chunks(input_path, chunk_size=3)] == [3, 3, 1]
+    assert analyze_file(input_path, output_path, chunk_size=3, today=TODAY) == 7
+
+    output = pd.read_csv(output_path) if suffix == ".csv" else pd.read_parquet(output_path)
+    expected = BatchStatisticalValidator.from_arrays(
+        variation_a_visitors=experiments_frame["variation_a_visitors"],
+        variation_b_visitors=experiments_frame["variation_b_visitors"],
+        conversions_a=experiments_frame["conversions_a"],
+        conversions_b=experiments_frame["conversions_b"],
+        tail_numbers=experiments_frame["tail_numbers"],
+        confidence_level=experiments_frame["confidence_level"],
+        estimated_uplift=experiments_frame["estimated_uplift"],
+        start_dates=pd.to_datetime(experiments_frame["start_date"]).to_numpy(),
+        end_dates=pd.to_datetime(experiments_frame["end_date"]).to_numpy(),
+        today=TODAY,
+    ).get_statistical_results()
+
+    assert output["name"].tolist() == experiments_frame["name"].tolist()
+    for column in ("z_score", "p_value", "observed_test_power", "srm_p_value", "required_days_80_power"):
+        assert output[column].to_numpy() == pytest.approx(expected[column], rel=1e-9)
+
+
+def test_missing_parameter_columns_use_defaults(tmp_path: Path, experiments_frame: pd.DataFrame):
+    input_path = tmp_path / "experiments.csv"
+    experiments_frame.drop(columns=["tail_numbers", "confidence_level", "estimated_uplift"]).to_csv(input_path, index=False)
+
+    assert main(["analyze", str(input_path), "--out", str(tmp_path / "results.csv")]) == 0
+    assert len(pd.read_csv(tmp_path / "results.csv")) == 7
+
+
+def test_unsupported_format_raises(tmp_path: Path):
+    with pytest.raises(ValueError):
+        analyze_file(tmp_path / "experiments.xlsx", tmp_path / "results.csv")
+
+
+def test_cli_does_not_import_streamlit(tmp_path: Path, experiments_frame: pd.DataFrame):
+    """ O caminho da CLI não deve carregar o Streamlit. """
+    input_path = tmp_path / "experiments.csv"
+    experiments_frame.to_csv(input_path, index=False)
+    repo_root = Path(__file__).resolve().parents[1]
+    script = (
+        "import runpy, sys; "
+        f"sys.argv = ['main.py', 'analyze', {str(input_path)!r}, '--out', {str(tmp_path / 'out.csv')!r}]; "
+        "runpy.run_path('main.py', run_name='not_main'); "
+        "from cli.main import main; main(sys.argv[1:]); "
+        "assert 'streamlit' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=repo_root, check=True)
@@ -0,0 +1,102 @@
+import io
+from datetime import date
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from domain.entities.ab_tester import ABTester
+from domain.entities.continuous_variation import ContinuousVariation
+from domain.entities.variation import Variation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.continuous_validator import ContinuousStatisticalValidator
+from domain.use_cases.power_analysis import required_sample_size_means
+from logic.continuous_metrics import accumulate_values, continuous_variation_from_file
+
+TODAY = date(2025, 6, 3)
+
+
+@pytest.fixture
+def tester() -> ABTester:
+    return ABTester("Receita", date(2025, 5, 1), date(2025, 5, 29), "", 95.0)
+
+
+@pytest.fixture
+def revenue():
+    rng = np.random.default_rng(42)
+    control = rng.exponential(40.0, size=20_000) * (rng.random(20_000) < 0.1)
+    variant = rng.exponential(44.0, size=19_000) * (rng.random(19_000) < 0.1)
+    return control, variant
+
+
+@pytest.mark.parametrize("tails", [1, 2])
+def test_welch_t_test_matches_scipy(tester: ABTester, revenue, tails: int):
+    control, variant = revenue
+    variation = ContinuousVariation.from_values(control, variant, tails, 95.0, 10.0)
+    validator = ContinuousStatisticalValidator(variation, tester, today=TODAY)
+    expected = stats.ttest_ind(variant, control, equal_var=False,
+                               alternative="greater" if tails == 1 else "two-sided")
+
+    assert validator.get_metric("z_score") == pytest.approx(expected.statistic, rel=1e-9)
+    assert validator.get_metric("p_value") == pytest.approx(expected.pvalue, rel=1e-9)
+    assert validator.get_metric("degrees_of_freedom") == pytest.approx(expected.df, rel=1e-9)
+    critical = stats.t.ppf(1 - 0.05 / tails, expected.df)
+    assert validator.get_metric("z_critical") == pytest.approx(critical)
+    assert validator.get_metric("control_upper_bound") == pytest.approx(
+        control.mean() + critical * control.std(ddof=1) / np.sqrt(control.size))
+
+
+def test_results_have_the_same_shape_as_the_binomial_validator(tester: ABTester, revenue):
+    variation = ContinuousVariation.from_values(*revenue, 2, 95.0, 10.0)
+    results = ContinuousStatisticalValidator(variation, tester, today=TODAY).get_statistical_results()
+    binomial = ABStatisticalValidator(Variation(20_000, 19_000, 2000, 1950, 2, 95.0, 10.0), tester,
+                                      today=TODAY).get_statistical_results()
+
+    assert results.keys() == binomial.keys()
+    for key in ("srm_results", "temporal_validation_results", "planning_results", "sequential_results"):
+        assert results[key].keys() == binomial[key].keys()
+    assert results["srm_results"]["srm_p_value"] == binomial["srm_results"]["srm_p_value"]
+    assert 0.5 < results["bayesian_results"]["probability_b_beats_a"] < 1.0
+    assert results["bayesian_results"]["bayesian_method"] == "normal"
+
+
+def test_planning_uses_the_sample_size_for_means(tester: ABTester, revenue):
+    variation = ContinuousVariation.from_values(*revenue, 2, 95.0, 10.0)
+    planning = ContinuousStatisticalValidator(variation, tester, today=TODAY).get_metric("planning_results")
+
+    expected = required_sample_size_means(variation.mean_a, variation.standard_deviation_a, 0.10,
+                                          power=0.80, standard_deviation_variant=variation.standard_deviation_b)
+    assert planning["required_users_80_power"] == expected["total_users"]
+    # Aproximação de primeira ordem: n por braço = (z_α/2 + z_β)² (σ_A² + σ_B²) / Δ²
+    closed_form = 2 * (stats.norm.ppf(0.975) + stats.norm.ppf(0.8)) ** 2 * (
+        variation.variance_a + variation.variance_b) / (0.10 * variation.mean_a) ** 2
+    assert planning["required_users_80_power"] == pytest.approx(closed_form, rel=1e-3)
+    assert planning["required_users_95_power"] > planning["required_users_80_power"]
+
+
+def test_required_sample_size_means_edge_cases():
+    sizes = required_sample_size_means(np.array([10.0, 0.0, 10.0]), np.array([30.0, 30.0, 0.0]), 0.05)
+    assert sizes["total_users"][0] > 0
+    assert sizes["total_users"][1:].tolist() == [0, 0]
+    one_tailed = required_sample_size_means(10.0, 30.0, 0.05, tails=1)["total_users"]
+    assert one_tailed < sizes["total_users"][0]
+
+
+def test_file_is_read_in_chunks(revenue):
+    control, variant = revenue
+    frame = pd.DataFrame({"arm": ["controle"] * control.size + ["variacao"] * variant.size,
+                          "value": np.concatenate([control, variant])}).sample(frac=1.0, random_state=3)
+    buffer = io.StringIO(frame.to_csv(index=False))
+
+    variation = continuous_variation_from_file(buffer, control_arm="controle", chunk_size=4096)
+    assert variation.variation_a_visitors == control.size
+    assert variation.mean_b == pytest.approx(variant.mean(), rel=1e-9)
+    assert variation.variance_a == pytest.approx(control.var(ddof=1), rel=1e-9)
+
+    moments = accumulate_values(io.StringIO("arm,value\nA,1\nB,\nB,3\nA,2\n"), chunk_size=2)
+    assert (moments["A"].count, moments["A"].mean) == (2, 1.5)
+    assert moments["B"].count == 1
+
+    with pytest.raises(ValueError, match="dois braços"):
+        continuous_variation_from_file(io.StringIO("arm,value\nA,1\nA,2\n"))
+    with pytest.raises(ValueError, match="colunas"):
+        continuous_variation_from_file(io.StringIO("grupo,receita\nA,1\n"))
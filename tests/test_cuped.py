@@ -0,0 +1,103 @@
+import io
+from datetime import date
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from domain.entities.ab_tester import ABTester
+from domain.entities.continuous_variation import StreamingCovariance
+from domain.use_cases.cuped import CupedAnalysis
+from logic.continuous_metrics import accumulate_covariances, cuped_analysis_from_file
+
+TODAY = date(2025, 6, 3)
+
+
+@pytest.fixture
+def tester() -> ABTester:
+    return ABTester("CUPED", date(2025, 5, 1), date(2025, 5, 29), "", 95.0)
+
+
+@pytest.fixture
+def users() -> pd.DataFrame:
+    """ Receita por usuário correlacionada com a receita do mês anterior (ρ ≈ 0,8). """
+    rng = np.random.default_rng(21)
+    size = 40_000
+    arm = np.where(rng.random(size) < 0.5, "A", "B")
+    covariate = rng.gamma(2.0, 10.0, size=size)
+    value = 0.8 * covariate + rng.normal(0, 8, size=size) + np.where(arm == "B", 0.4, 0.0)
+    return pd.DataFrame({"arm": arm, "value": value, "covariate": covariate})
+
+
+def _analysis(users: pd.DataFrame, tester: ABTester) -> CupedAnalysis:
+    arms = [users[users["arm"] == arm] for arm in ("A", "B")]
+    return CupedAnalysis(
+        *(StreamingCovariance.from_values(arm["covariate"], arm["value"]) for arm in arms),
+        tester, tail_numbers=2, confidence_level=95.0, estimated_uplift=2.0, today=TODAY,
+    )
+
+
+def test_adjusted_effect_matches_the_adjusted_welch_test(users: pd.DataFrame, tester: ABTester):
+    analysis = _analysis(users, tester)
+    control = users[users["arm"] == "A"]
+    variant = users[users["arm"] == "B"]
+    # θ com os co-momentos dentro de cada braço
+    centered = users.groupby("arm")[["covariate", "value"]].transform(lambda column: column - column.mean())
+    theta = (centered["covariate"] * centered["value"]).sum() / (centered["covariate"] ** 2).sum()
+    assert analysis.theta == pytest.approx(theta, rel=1e-9)
+
+    adjust = lambda frame: frame["value"] - theta * (frame["covariate"] - users["covariate"].mean())
+    expected = stats.ttest_ind(adjust(variant), adjust(control), equal_var=False)
+    results = analysis.get_results()
+    adjusted = results["adjusted"]
+    assert adjusted["effect"] == pytest.approx(adjust(variant).mean() - adjust(control).mean(), rel=1e-9)
+    assert adjusted["t_score"] == pytest.approx(expected.statistic, rel=1e-9)
+    assert adjusted["p_value"] == pytest.approx(expected.pvalue, rel=1e-6)
+    assert adjusted["effect_lower_bound"] < adjusted["effect"] < adjusted["effect_upper_bound"]
+
+    unadjusted = results["unadjusted"]
+    assert unadjusted["effect"] == pytest.approx(variant["value"].mean() - control["value"].mean())
+    assert unadjusted["t_score"] == pytest.approx(
+        stats.ttest_ind(variant["value"], control["value"], equal_var=False).statistic, rel=1e-9)
+
+
+def test_variance_reduction_cuts_the_required_sample(users: pd.DataFrame, tester: ABTester):
+    results = _analysis(users, tester).get_results()
+    correlation = users[["covariate", "value"]].corr().iloc[0, 1]
+    assert results["correlation"] == pytest.approx(correlation, abs=0.01)
+    assert results["variance_reduction"] == pytest.approx(correlation ** 2, abs=0.02)
+    assert results["adjusted"]["standard_error"] < results["unadjusted"]["standard_error"]
+
+    raw = results["unadjusted"]["planning_results"]
+    adjusted = results["adjusted"]["planning_results"]
+    for power in (80, 95):
+        ratio = adjusted[f"required_users_{power}_power"] / raw[f"required_users_{power}_power"]
+        assert ratio == pytest.approx(1 - results["variance_reduction"], abs=0.01)
+        assert results[f"days_saved_{power}_power"] == (
+            raw[f"required_days_{power}_power"] - adjusted[f"required_days_{power}_power"])
+    assert results["days_saved_95_power"] > 0
+
+
+def test_uncorrelated_covariate_changes_nothing(tester: ABTester):
+    values = np.arange(1.0, 201.0)
+    flat = StreamingCovariance.from_values(np.ones(100), values[:100])
+    analysis = CupedAnalysis(flat, StreamingCovariance.from_values(np.ones(100), values[100:]),
+                             tester, 2, 95.0, 10.0, today=TODAY)
+    results = analysis.get_results()
+    assert analysis.theta == 0.0
+    assert results["variance_reduction"] == pytest.approx(0.0)
+    assert results["adjusted"]["p_value"] == pytest.approx(results["unadjusted"]["p_value"])
+
+
+def test_file_is_read_in_chunks(users: pd.DataFrame, tester: ABTester):
+    data = users.to_csv(index=False)
+    covariances = accumulate_covariances(io.StringIO(data), chunk_size=3_000)
+    for arm, frame in users.groupby("arm"):
+        expected = np.cov(frame["covariate"], frame["value"])[0, 1]
+        assert covariances[arm].covariance == pytest.approx(expected, rel=1e-9)
+
+    analysis = cuped_analysis_from_file(io.StringIO(data), tester, estimated_uplift=2.0, control_arm="A",
+                                        chunk_size=3_000, today=TODAY)
+    assert analysis.get_results()["adjusted"]["t_score"] == pytest.approx(
+        _analysis(users, tester).get_results()["adjusted"]["t_score"], rel=1e-9)
+    with pytest.raises(ValueError, match="colunas"):
+        accumulate_covariances(io.StringIO("arm,value\nA,1\n"))
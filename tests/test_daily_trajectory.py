@@ -0,0 +1,107 @@
+from datetime import date
+import numpy as np
+import pandas as pd
+import pytest
+from domain.entities.ab_tester import ABTester
+from domain.entities.variation import Variation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.sequential_testing import SequentialMonitor, default_mixing_variance
+from logic.daily_trajectory import calculate_trajectories, pivot_daily, read_daily_table
+
+
+@pytest.fixture
+def daily() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    days = pd.date_range("2025-03-01", periods=14, freq="D")
+    totals = rng.integers(1800, 2200, size=14)
+    visitors_a = rng.binomial(totals, 0.5)
+    rows = []
+    for day, visitors_a, visitors_b in zip(days, visitors_a, totals - visitors_a):
+        rows.append((day.date().isoformat(), "controle", visitors_a, rng.binomial(visitors_a, 0.05)))
+        rows.append((day.date().isoformat(), "variacao", visitors_b, rng.binomial(visitors_b, 0.056)))
+    return pd.DataFrame(rows, columns=["date", "arm", "visitors", "conversions"])
+
+
+def test_read_daily_table_accepts_pasted_text():
+    frame = read_daily_table("Date;Arm;Visitors;Conversions\n2025-01-01;A;100;5\n2025-01-01;B;90;4\n")
+    assert frame.columns.tolist() == ["date", "arm", "visitors", "conversions"]
+    assert frame["visitors"].tolist() == [100, 90]
+
+    tabbed = read_daily_table(b"date\tarm\tvisitors\tconversions\n2025-01-01\tA\t100\t5\n")
+    assert tabbed.loc[0, "conversions"] == 5
+
+
+def test_pivot_fills_missing_days_with_zeros():
+    frame = pd.DataFrame({
+        "date": ["2025-01-01", "2025-01-01", "2025-01-03", "2025-01-03", "2025-01-03"],
+        "arm": ["A", "B", "B", "A", "A"],
+        "visitors": [100, 90, 80, 40, 30],
+        "conversions": [5, 4, 3, 2, 1],
+    })
+    wide = pivot_daily(frame)
+    assert len(wide) == 3
+    assert wide.iloc[1].tolist() == [0, 0, 0, 0]
+    assert wide.iloc[2].tolist() == [70, 3, 80, 3]
+
+    swapped = pivot_daily(frame, control_arm="B")
+    assert swapped.iloc[0].tolist() == [90, 4, 100, 5]
+
+
+@pytest.mark.parametrize("frame, message", [
+    (pd.DataFrame({"date": ["2025-01-01"], "arm": ["A"], "visitors": [1]}), "Colunas ausentes"),
+    (pd.DataFrame({"date": ["2025-01-01"] * 3, "arm": ["A", "B", "C"], "visitors": [1] * 3,
+                   "conversions": [0] * 3}), "dois braços"),
+    (pd.DataFrame({"date": ["2025-01-01"] * 2, "arm": ["A", "B"], "visitors": [1, 1],
+                   "conversions": [2, 0]}), "no máximo uma conversão"),
+])
+def test_pivot_rejects_invalid_tables(frame: pd.DataFrame, message: str):
+    with pytest.raises(ValueError, match=message):
+        pivot_daily(frame)
+
+
+def test_trajectory_matches_the_scalar_validator(daily: pd.DataFrame):
+    trajectory = calculate_trajectories(daily, tail_numbers=2, confidence_level=95.0, estimated_uplift=10.0)
+    assert len(trajectory) == 14
+    assert trajectory["variation_a_visitors"].is_monotonic_increasing
+    assert trajectory["sequential_p_value"].is_monotonic_decreasing
+
+    tester = ABTester("Teste", date(2025, 3, 1), date(2025, 3, 14), "", 95.0)
+    for index in (0, 6, 13):
+        row = trajectory.iloc[index]
+        variation = Variation(int(row["variation_a_visitors"]), int(row["variation_b_visitors"]),
+                              int(row["conversions_a"]), int(row["conversions_b"]), 2, 95.0, 10.0)
+        tester.end_date = row["date"].date()
+        expected = ABStatisticalValidator(variation, tester, today=date(2025, 3, 14)).get_statistical_results()
+        assert row["z_score"] == pytest.approx(expected["z_score"])
+        assert row["p_value"] == pytest.approx(expected["p_value"])
+        assert row["control_lower_bound"] == pytest.approx(expected["control_lower_bound"])
+        assert row["srm_p_value"] == pytest.approx(expected["srm_results"]["srm_p_value"])
+        assert row["total_duration_days"] == expected["temporal_validation_results"]["total_duration_days"]
+
+
+def test_daily_srm_uses_only_the_counts_of_the_day(daily: pd.DataFrame):
+    skewed = daily.copy()
+    skewed.loc[(skewed["date"] == "2025-03-05") & (skewed["arm"] == "variacao"), "visitors"] = 600
+    trajectory = calculate_trajectories(skewed)
+    flagged = trajectory.loc[trajectory["daily_has_srm"], "date"].dt.date.tolist()
+    assert flagged == [date(2025, 3, 5)]
+    assert trajectory["daily_srm_p_value"].iloc[4] < 0.01
+
+
+def test_sequential_columns_use_one_mixing_variance_for_every_day(daily: pd.DataFrame):
+    # As consultas diárias só podem ser combinadas com o mesmo τ² em todos os dias
+    trajectory = calculate_trajectories(daily)
+    first = trajectory.iloc[0]
+    frozen = default_mixing_variance(first["conversions_a"] / first["variation_a_visitors"], 0.10)
+    assert trajectory["mixing_variance"].tolist() == pytest.approx([frozen] * len(trajectory))
+
+    monitor = SequentialMonitor()
+    for _, row in trajectory.iterrows():
+        expected = monitor.observe(Variation(int(row["variation_a_visitors"]), int(row["variation_b_visitors"]),
+                                             int(row["conversions_a"]), int(row["conversions_b"]), 2, 95.0, 10.0))
+        assert row["sequential_p_value"] == pytest.approx(expected["sequential_p_value"])
+        assert row["sequential_lower_bound"] == pytest.approx(expected["sequential_lower_bound"])
+        assert row["sequential_upper_bound"] == pytest.approx(expected["sequential_upper_bound"])
+
+    planned = calculate_trajectories(daily, baseline_rate=4.0)
+    assert planned["mixing_variance"].tolist() == pytest.approx([default_mixing_variance(0.04, 0.10)] * len(planned))
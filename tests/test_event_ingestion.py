@@ -0,0 +1,264 @@
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+from cli.main import main
+from logic.event_ingestion import (
+    detect_event_format,
+    ingest_event_log,
+    iter_event_chunks,
+    read_sketches,
+    sketch_event_log,
+    summarize_sketches,
+    summary_to_variation,
+    write_sketches,
+)
+
+
+@pytest.fixture
+def events() -> pd.DataFrame:
+    return pd.DataFrame([
+        # u1: exposto duas vezes ao controle e converte depois
+        ("u1", "exposure", "controle", "2025-03-01T10:00:00"),
+        ("u1", "exposure", "controle", "2025-03-02T10:00:00"),
+        ("u1", "conversion", None, "2025-03-02T11:00:00"),
+        ("u1", "conversion", None, "2025-03-03T11:00:00"),
+        # u2: converte antes da exposição (não conta)
+        ("u2", "conversion", None, "2025-03-01T09:00:00"),
+        ("u2", "exposure", "variacao", "2025-03-01T12:00:00"),
+        # u3: exposição na variação e conversão depois (conversão aparece antes no log)
+        ("u3", "conversion", None, "2025-03-02T08:00:00"),
+        ("u3", "exposure", "variacao", "2025-03-01T08:00:00"),
+        # u4: conversão sem exposição
+        ("u4", "conversion", None, "2025-03-02T08:00:00"),
+        # u5: exposto aos dois braços
+        ("u5", "exposure", "controle", "2025-03-01T08:00:00"),
+        ("u5", "exposure", "variacao", "2025-03-02T08:00:00"),
+        ("u5", "conversion", None, "2025-03-03T08:00:00"),
+        ("u6", "exposure", "controle", "2025-03-02T08:00:00"),
+    ], columns=["user_id", "event", "arm", "timestamp"])
+
+
+def test_deduplicates_and_attributes_conversions(events: pd.DataFrame):
+    summary = ingest_event_log(events.to_csv(index=False).encode(), file_format="csv", chunk_rows=3)
+
+    assert summary["arms"] == ["controle", "variacao"]
+    assert summary["visitors"] == {"controle": 2, "variacao": 2}
+    assert summary["conversions"] == {"controle": 1, "variacao": 1}
+    assert summary["events"] == len(events)
+    assert summary["users_in_multiple_arms"] == 1
+    assert summary["conversions_without_exposure"] == 1
+    assert summary["conversions_before_exposure"] == 1
+
+    kept = ingest_event_log(events.to_csv(index=False).encode(), file_format="csv", drop_multi_arm_users=False)
+    assert kept["visitors"] == {"controle": 3, "variacao": 2}
+    assert kept["conversions"] == {"controle": 2, "variacao": 1}
+
+
+def test_daily_series_uses_the_first_exposure_day(events: pd.DataFrame):
+    daily = ingest_event_log(events.to_csv(index=False).encode(), file_format="csv")["daily"]
+    assert daily.columns.tolist() == ["date", "arm", "visitors", "conversions"]
+    assert daily.to_dict("records") == [
+        {"date": pd.Timestamp("2025-03-01").date(), "arm": "controle", "visitors": 1, "conversions": 1},
+        {"date": pd.Timestamp("2025-03-01").date(), "arm": "variacao", "visitors": 2, "conversions": 1},
+        {"date": pd.Timestamp("2025-03-02").date(), "arm": "controle", "visitors": 1, "conversions": 0},
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".ndjson", ".parquet"])
+def test_formats_and_chunk_sizes_agree(tmp_path: Path, suffix: str):
+    rng = np.random.default_rng(9)
+    size = 20_000
+    users = rng.integers(0, 4_000, size=size)
+    frame = pd.DataFrame({
+        "user_id": users,
+        "event": np.where(rng.random(size) < 0.3, "conversion", "exposure"),
+        "arm": np.where(users % 3 == 0, "A", "B"),
+        "timestamp": (pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 7 * 86400, size), unit="s")),
+    })
+    path = tmp_path / f"events{suffix}"
+    if suffix == ".csv":
+        frame.to_csv(path, index=False)
+    elif suffix == ".ndjson":
+        frame.assign(timestamp=frame["timestamp"].astype(str)).to_json(path, orient="records", lines=True)
+    else:
+        frame.to_parquet(path)
+
+    # Referência direta com pandas
+    times = frame["timestamp"]
+    first = frame[frame["event"] == "exposure"].assign(time=times).groupby("user_id")["time"].min()
+    conversions = frame[(frame["event"] == "conversion") & frame["user_id"].isin(first.index)]
+    converted = conversions[conversions["timestamp"].to_numpy() >= first.loc[conversions["user_id"]].to_numpy()]
+    converted_users = converted["user_id"].unique()
+
+    small = ingest_event_log(path, chunk_rows=1_500, chunk_bytes=50_000)
+    large = ingest_event_log(path)
+    assert small["visitors"] == large["visitors"]
+    assert small["conversions"] == large["conversions"]
+    assert small["visitors"]["A"] == int((first.index % 3 == 0).sum())
+    assert small["conversions"]["B"] == int((converted_users % 3 != 0).sum())
+    assert small["daily"]["visitors"].sum() == len(first)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".ndjson", ".parquet"])
+def test_blank_user_ids_do_not_depend_on_chunk_size(tmp_path: Path, suffix: str):
+    # O id em branco não pode tornar float os ids do bloco ("2" viraria "2.0")
+    frame = pd.DataFrame({
+        "user_id": pd.array([1, 2, 3, None, 2, 1, 3], dtype="Int64"),
+        "event": ["exposure"] * 4 + ["conversion"] * 3,
+        "arm": ["A", "B", "A", "B", None, None, None],
+        "timestamp": pd.date_range("2025-01-01", periods=7, freq="h").astype(str),
+    })
+    path = tmp_path / f"events{suffix}"
+    if suffix == ".csv":
+        frame.to_csv(path, index=False)
+    elif suffix == ".ndjson":
+        frame.to_json(path, orient="records", lines=True)
+    else:
+        frame.to_parquet(path)
+
+    small = ingest_event_log(path, chunk_rows=3, chunk_bytes=150)
+    large = ingest_event_log(path, chunk_rows=100)
+    for summary in (small, large):
+        assert summary["visitors"] == {"A": 2, "B": 1}
+        assert summary["conversions"] == {"A": 2, "B": 1}
+        assert summary["events_without_user_id"] == 1
+        assert summary["conversions_without_exposure"] == 0
+    assert ingest_event_log(path, counting="sketch", chunk_rows=3)["events_without_user_id"] == 1
+
+
+def test_upload_without_timestamps_and_invalid_logs():
+    ndjson = b'{"user_id": 1, "event": "exposure", "arm": "A"}\n{"user_id": 1, "event": "conversion"}\n' \
+             b'{"user_id": 2, "event": "EXPOSURE", "arm": "B"}\n'
+    summary = ingest_event_log(ndjson, file_format="ndjson")
+    assert summary["visitors"] == {"A": 1, "B": 1}
+    assert summary["conversions"] == {"A": 1, "B": 0}
+    assert summary["daily"] is None
+
+    with pytest.raises(ValueError, match="Colunas ausentes"):
+        ingest_event_log(b"user_id,event\n1,exposure\n", file_format="csv")
+    with pytest.raises(ValueError, match="formato"):
+        detect_event_format(b"")
+    assert detect_event_format(Path("log.JSONL")) == "ndjson"
+    assert next(iter_event_chunks(b"User_ID,Event,Arm\n1,exposure,A\n", "csv")).columns.tolist() == [
+        "user_id", "event", "arm"]
+
+
+def test_summary_to_variation(events: pd.DataFrame):
+    summary = ingest_event_log(events.to_csv(index=False).encode(), file_format="csv")
+    variation = summary_to_variation(summary, control_arm="variacao")
+    assert (variation.variation_a_visitors, variation.conversions_a) == (2, 1)
+    assert (variation.variation_b_visitors, variation.conversions_b) == (2, 1)
+    with pytest.raises(ValueError, match="Braço de controle"):
+        summary_to_variation(summary, control_arm="outro")
+
+
+def test_cli_ingest(tmp_path: Path, events: pd.DataFrame):
+    input_path = tmp_path / "events.csv"
+    events.to_csv(input_path, index=False)
+    out = tmp_path / "counts.csv"
+    daily_out = tmp_path / "daily.csv"
+
+    assert main(["ingest", str(input_path), "--out", str(out), "--daily-out", str(daily_out)]) == 0
+    assert pd.read_csv(out).to_dict("records") == [
+        {"arm": "controle", "visitors": 2, "conversions": 1},
+        {"arm": "variacao", "visitors": 2, "conversions": 1},
+    ]
+    assert len(pd.read_csv(daily_out)) == 3
+
+
+def _arm_events(size: int, seed: int) -> pd.DataFrame:
+    """ Log sem conversões antes da exposição, com o braço também nas conversões. """
+    rng = np.random.default_rng(seed)
+    users = rng.integers(0, size // 2, size=size)
+    return pd.DataFrame({
+        "user_id": users,
+        "event": np.where(rng.random(size) < 0.3, "conversion", "exposure"),
+        "arm": np.where(users % 2 == 0, "A", "B"),
+        "timestamp": (pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 5 * 86400, size), unit="s")),
+    })
+
+
+def test_sketch_counting_is_close_to_exact_counts():
+    frame = _arm_events(60_000, seed=3)
+    data = frame.to_csv(index=False).encode()
+    sketch = ingest_event_log(data, file_format="csv", counting="sketch", chunk_rows=7_000)
+
+    exposed = frame[frame["event"] == "exposure"].groupby("arm")["user_id"].nunique()
+    converted = frame[frame["event"] == "conversion"].groupby("arm")["user_id"].nunique()
+    assert sketch["counting"] == "sketch"
+    # Os sketches não medem usuários em mais de um braço: nada de um zero enganoso
+    assert sketch["users_in_multiple_arms"] is None
+    assert sketch["conversions_before_exposure"] is None
+    daily = sketch["daily"]
+    assert daily.columns.tolist() == ["date", "arm", "visitors", "conversions"]
+    assert daily["date"].nunique() == 5
+    assert (daily[["visitors", "conversions"]] >= 0).all().all()
+    assert sketch["arms"] == sorted(sketch["arms"], key=frame["arm"].tolist().index)
+    for arm in ("A", "B"):
+        assert sketch["visitors"][arm] == pytest.approx(exposed[arm], rel=4 * sketch["relative_error"])
+        assert sketch["conversions"][arm] == pytest.approx(converted[arm], rel=4 * sketch["relative_error"])
+        assert sketch["conversions"][arm] <= sketch["visitors"][arm]
+
+    variation = summary_to_variation(sketch, control_arm="A")
+    assert variation.count_relative_error == sketch["relative_error"]
+    assert ingest_event_log(data, file_format="csv")["relative_error"] == 0.0
+    with pytest.raises(ValueError, match="Modo de contagem"):
+        ingest_event_log(data, file_format="csv", counting="aproximado")
+
+
+def test_daily_sketch_partitions_merge_without_rereading(tmp_path: Path):
+    frame = _arm_events(30_000, seed=5)
+    days = frame["timestamp"].dt.normalize()
+    paths = []
+    for index, (_, partition) in enumerate(frame.groupby(days)):
+        sketches, counters = sketch_event_log(partition.to_csv(index=False).encode(), "csv")
+        assert counters["events"] == len(partition)
+        paths.append(tmp_path / f"day{index}.ndjson")
+        write_sketches(sketches, paths[-1])
+
+    whole, counters = sketch_event_log(frame.to_csv(index=False).encode(), "csv")
+    merged = read_sketches(paths)
+    assert set(merged) == set(whole)
+    for key, sketch in whole.items():
+        np.testing.assert_array_equal(merged[key].registers, sketch.registers)
+    merged_summary = summarize_sketches(merged)
+    assert merged_summary["visitors"] == summarize_sketches(whole, **counters)["visitors"]
+
+    # A série diária acumulada termina nos totais e acompanha a contagem exata por dia
+    totals = merged_summary["daily"].groupby("arm")[["visitors", "conversions"]].sum()
+    for arm in ("A", "B"):
+        assert totals.loc[arm, "visitors"] == pytest.approx(merged_summary["visitors"][arm], rel=0.01)
+        assert totals.loc[arm, "conversions"] == pytest.approx(merged_summary["conversions"][arm], rel=0.01)
+    exposures = frame[frame["event"] == "exposure"].assign(day=days.dt.date)
+    first_day = exposures.groupby("user_id")["day"].min()
+    expected = first_day.groupby(first_day.index % 2 == 0).value_counts()
+    cohort = merged_summary["daily"].set_index(["arm", "date"])["visitors"]
+    for day, count in expected.loc[True].items():
+        assert cohort.loc[("A", day)] == pytest.approx(count, rel=0.05)
+
+    paths[0].write_text('{"date": null, "arm": "A"}\n')
+    with pytest.raises(ValueError, match="Partição de sketches inválida"):
+        read_sketches(paths)
+
+
+def test_cli_sketches_and_merge(tmp_path: Path, capsys: pytest.CaptureFixture):
+    frame = _arm_events(20_000, seed=8)
+    input_path = tmp_path / "events.parquet"
+    frame.to_parquet(input_path)
+    sketch_path = tmp_path / "sketches.ndjson"
+    counts_path = tmp_path / "counts.csv"
+    merged_path = tmp_path / "merged.csv"
+    daily_path = tmp_path / "daily.csv"
+    merged_daily_path = tmp_path / "merged_daily.csv"
+
+    assert main(["ingest", str(input_path), "--approximate", "--precision", "12", "--sketch-out", str(sketch_path),
+                 "--out", str(counts_path), "--daily-out", str(daily_path)]) == 0
+    report = capsys.readouterr().err
+    assert "não são verificados" in report and "None" not in report
+    assert main(["merge-sketches", str(sketch_path), "--out", str(merged_path),
+                 "--daily-out", str(merged_daily_path)]) == 0
+    assert pd.read_csv(merged_path).equals(pd.read_csv(counts_path))
+    assert pd.read_csv(merged_daily_path).equals(pd.read_csv(daily_path))
+    with pytest.raises(SystemExit):
+        main(["ingest", str(input_path), "--sketch-out", str(sketch_path)])
@@ -0,0 +1,108 @@
+from datetime import date
+import pytest
+from streamlit.testing.v1 import AppTest
+from domain.entities.ab_tester import ABTester
+from domain.entities.variation import Variation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases import group_sequential
+from domain.use_cases.group_sequential import (
+    BOUNDARY_TABLE,
+    SAMPLE_SIZE_TABLE,
+    GroupSequentialDesign,
+    get_boundaries,
+    precompute_boundary_table,
+)
+
+
+def test_boundaries_match_reference_values():
+    """Valores de referência de Lan-DeMets (gsDesign / Jennison & Turnbull)."""
+    obrien_fleming = get_boundaries(4, 0.025, "obrien_fleming", tails=1)
+    assert obrien_fleming == pytest.approx((4.333, 2.963, 2.359, 2.014), abs=2e-3)
+
+    pocock = get_boundaries(5, 0.05, "pocock", tails=2)
+    assert pocock == pytest.approx((2.438, 2.427, 2.410, 2.397, 2.386), abs=2e-3)
+
+    assert get_boundaries(1, 0.05, "pocock", tails=2) == pytest.approx((1.959964,), abs=1e-5)
+
+
+def test_boundaries_are_served_from_the_precomputed_table():
+    first = get_boundaries(6, 0.05, "obrien_fleming", 2)
+    assert BOUNDARY_TABLE[(6, 0.05, "obrien_fleming", 2)] is first
+    assert get_boundaries(6, 0.05000000001, "obrien_fleming", 2) is first
+
+
+def test_design_spends_alpha_and_reports_sample_sizes():
+    design = GroupSequentialDesign(5, alpha=0.05, spending="obrien_fleming", tails=2)
+    assert sum(design.stopping_probabilities(0.0)) == pytest.approx(0.05, abs=1e-4)
+
+    factors = design.expected_sample_fraction(0.8)
+    assert factors["inflation"] == pytest.approx(1.03, abs=0.01)
+    assert factors["alternative"] < 1 < factors["inflation"]
+
+    pocock = GroupSequentialDesign(5, alpha=0.05, spending="pocock", tails=2).expected_sample_fraction(0.8)
+    assert pocock["inflation"] > factors["inflation"]
+
+    assert design.crosses_boundary(5, -2.1)
+    assert not design.crosses_boundary(1, 4.0)
+    with pytest.raises(ValueError):
+        design.crosses_boundary(6, 3.0)
+    with pytest.raises(ValueError):
+        GroupSequentialDesign(5, spending="haybittle")
+
+
+def test_validator_group_sequential_plan():
+    validator = ABStatisticalValidator(
+        variation=Variation(80000, 80000, 1600, 1696, 2, 95.0, 10.0),
+        tester=ABTester("Teste", date(2024, 9, 22), date(2025, 6, 3), "", 95.0),
+    )
+    fixed = validator.get_test_planning_metrics(0.10)
+    plan = validator.get_group_sequential_plan(looks=6)
+
+    assert len(plan["boundaries"]) == 6
+    assert plan["max_users_80_power"] > fixed["required_users_80_power"] > plan["expected_users_80_power"]
+    assert 0 < plan["expected_savings_80_power"] < plan["expected_savings_95_power"] < 1
+    assert plan["users_per_look_80_power"][-1] == plan["max_users_80_power"]
+
+    interim = validator.check_interim_look(look=3, looks=6)
+    assert interim["boundary"] == plan["boundaries"][2]
+    assert interim["crossed_boundary"] is False
+
+
+def test_generated_tables_cover_the_default_grid(monkeypatch):
+    # A tabela gerada coincide com o cálculo atual
+    key = (6, 0.05, "obrien_fleming", 2)
+    assert BOUNDARY_TABLE[key] == pytest.approx(group_sequential._compute_boundaries(key), abs=1e-9)
+    assert SAMPLE_SIZE_TABLE[key][0.8] == pytest.approx(group_sequential._sample_size_factors(key, 0.8), abs=1e-9)
+
+    # Na inicialização, a grade padrão (fronteiras e fatores de amostra) não recalcula nada
+    def fail(*args, **kwargs):
+        raise AssertionError("A grade padrão deveria vir da tabela gerada.")
+    monkeypatch.setattr(group_sequential, "_sequential_recursion", fail)
+    assert precompute_boundary_table() == len(BOUNDARY_TABLE)
+    design = GroupSequentialDesign(4, alpha=0.1, spending="pocock", tails=1)
+    assert design.expected_sample_fraction(0.95) == SAMPLE_SIZE_TABLE[(4, 0.1, "pocock", 1)][0.95]
+
+
+def _group_sequential_app():
+    from datetime import date
+    from components.results_component import ResultsComponent
+    from domain.entities.ab_tester import ABTester
+    from domain.entities.variation import Variation
+
+    component = ResultsComponent(
+        tester=ABTester("Teste", date(2024, 9, 22), date(2025, 6, 3), "", 95.0),
+        variation=Variation(80000, 80000, 1600, 1696, 2, 95.0, 10.0),
+        results={},
+    )
+    component._display_group_sequential_planning()
+
+
+def test_planning_section_shows_the_group_sequential_plan():
+    at = AppTest.from_function(_group_sequential_app, default_timeout=30).run()
+    assert not at.exception
+    assert len(at.table[0].value) == 5
+    at.number_input(key="gs_looks").set_value(3).run()
+    at.selectbox(key="gs_spending").set_value("pocock").run()
+    assert not at.exception
+    assert len(at.table[0].value) == 3
+    assert at.metric[2].value.endswith("%")
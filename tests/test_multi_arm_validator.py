@@ -0,0 +1,119 @@
+from datetime import date
+import numpy as np
+import pytest
+from scipy.stats import chisquare
+from domain.entities.ab_tester import ABTester
+from domain.entities.multi_arm_variation import MultiArmVariation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.multi_arm_validator import MultiArmStatisticalValidator
+
+
+def _variation(tail_numbers: int = 2, weights=None) -> MultiArmVariation:
+    return MultiArmVariation(
+        arm_names=["Controle", "B", "C", "D"],
+        visitors=[10000, 10000, 10000, 10000],
+        conversions=[500, 560, 590, 510],
+        tail_numbers=tail_numbers,
+        confidence_level=95.0,
+        estimated_uplift=10.0,
+        expected_weights=weights,
+    )
+
+
+@pytest.mark.parametrize("tail_numbers", [1, 2])
+def test_each_comparison_matches_the_two_arm_validator(tail_numbers: int):
+    variation = _variation(tail_numbers)
+    tester = ABTester("Teste", date(2025, 1, 1), date(2025, 2, 1), "", 95.0)
+    results = MultiArmStatisticalValidator(variation, correction="none").get_statistical_results()
+
+    for arm, comparison in enumerate(results["comparisons"], start=1):
+        expected = ABStatisticalValidator(variation.to_variation(arm), tester).get_statistical_results(
+            ["z_score", "p_value", "standard_error_difference", "conversion_rate_uplift"])
+        assert comparison["z_score"] == pytest.approx(expected["z_score"])
+        assert comparison["p_value"] == pytest.approx(expected["p_value"], abs=1e-12)
+        assert comparison["standard_error_difference"] == pytest.approx(expected["standard_error_difference"])
+        assert comparison["conversion_rate_uplift"] == pytest.approx(expected["conversion_rate_uplift"])
+
+
+def test_count_relative_error_widens_the_comparisons():
+    exact = _variation()
+    approximate = MultiArmVariation(
+        arm_names=exact.arm_names, visitors=exact.visitors, conversions=exact.conversions,
+        tail_numbers=2, confidence_level=95.0, estimated_uplift=10.0, count_relative_error=0.01)
+    tester = ABTester("Teste", date(2025, 1, 1), date(2025, 2, 1), "", 95.0)
+    exact_results = MultiArmStatisticalValidator(exact, correction="none").get_statistical_results()
+    results = MultiArmStatisticalValidator(approximate, correction="none").get_statistical_results()
+
+    for arm, comparison in enumerate(results["comparisons"], start=1):
+        expected = ABStatisticalValidator(approximate.to_variation(arm), tester).get_statistical_results(
+            ["standard_error_difference", "p_value"])
+        assert comparison["standard_error_difference"] == pytest.approx(expected["standard_error_difference"])
+        assert comparison["p_value"] == pytest.approx(expected["p_value"], abs=1e-12)
+        assert comparison["p_value"] > exact_results["comparisons"][arm - 1]["p_value"]
+
+
+def test_pairwise_matrices_and_all_pairs():
+    validator = MultiArmStatisticalValidator(_variation(), all_pairs=True)
+    difference, standard_error, z_score, _ = validator.calculate_pairwise_matrices()
+
+    assert np.allclose(difference, -difference.T)
+    assert np.allclose(standard_error, standard_error.T)
+    assert np.allclose(np.diag(z_score), 0.0)
+
+    comparisons = validator.get_statistical_results()["comparisons"]
+    assert [(c["baseline"], c["arm"]) for c in comparisons] == [
+        ("Controle", "B"), ("Controle", "C"), ("Controle", "D"), ("B", "C"), ("B", "D"), ("C", "D"),
+    ]
+
+
+def test_multiplicity_corrections():
+    raw = np.array([c["p_value"] for c in
+                    MultiArmStatisticalValidator(_variation(), "none").get_statistical_results()["comparisons"]])
+
+    def adjusted(correction: str) -> np.ndarray:
+        results = MultiArmStatisticalValidator(_variation(), correction).get_statistical_results()
+        return np.array([c["adjusted_p_value"] for c in results["comparisons"]])
+
+    bonferroni = adjusted("bonferroni")
+    assert bonferroni == pytest.approx(np.minimum(1, raw * 3))
+
+    # Holm: p ordenados multiplicados por 3, 2, 1 e tornados monótonos
+    order = np.argsort(raw)
+    holm_sorted = np.maximum.accumulate(raw[order] * np.array([3, 2, 1]))
+    assert adjusted("holm")[order] == pytest.approx(np.minimum(1, holm_sorted))
+
+    dunnett = adjusted("dunnett")
+    assert np.all(dunnett >= raw - 1e-9)
+    assert np.all(dunnett <= bonferroni + 1e-6)
+    assert np.argmin(dunnett) == np.argmin(raw)
+
+
+def test_dunnett_with_a_single_comparison_is_the_raw_p_value():
+    variation = MultiArmVariation(["A", "B"], [10000, 10000], [500, 560], 2, 95.0, 10.0)
+    raw = MultiArmStatisticalValidator(variation, "none").get_statistical_results()["comparisons"][0]
+    dunnett = MultiArmStatisticalValidator(variation, "dunnett").get_statistical_results()["comparisons"][0]
+    assert dunnett["adjusted_p_value"] == pytest.approx(raw["p_value"], abs=1e-6)
+
+
+def test_k_cell_srm_uses_expected_weights():
+    visitors = [5000, 2500, 2600, 2400]
+    weighted = MultiArmVariation(["A", "B", "C", "D"], visitors, [0, 0, 0, 0], 2, 95.0, 10.0,
+                                 expected_weights=[50, 50 / 3, 50 / 3, 50 / 3])
+    # A divisão 40/20/20/20 está fora do planejado e deve disparar o alerta
+    srm = MultiArmStatisticalValidator(weighted).check_sample_ratio_mismatch()
+    expected = chisquare(visitors, f_exp=np.array([0.5, 1 / 6, 1 / 6, 1 / 6]) * sum(visitors))
+    assert srm["srm_p_value"] == pytest.approx(expected.pvalue)
+    assert srm["has_srm"]
+
+    planned = MultiArmVariation(["A", "B", "C", "D"], visitors, [0, 0, 0, 0], 2, 95.0, 10.0,
+                                expected_weights=[40, 20, 20, 20])
+    srm = MultiArmStatisticalValidator(planned).check_sample_ratio_mismatch()
+    assert not srm["has_srm"]
+    assert srm["srm_expected_per_arm"] == pytest.approx([5000, 2500, 2500, 2500])
+
+
+def test_invalid_corrections_raise():
+    with pytest.raises(ValueError):
+        MultiArmStatisticalValidator(_variation(), correction="sidak")
+    with pytest.raises(ValueError):
+        MultiArmStatisticalValidator(_variation(), correction="dunnett", all_pairs=True)
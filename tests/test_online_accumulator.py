@@ -0,0 +1,76 @@
+import pickle
+import random
+from datetime import date
+from functools import reduce
+import pytest
+from domain.entities.ab_tester import ABTester
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.online_accumulator import OnlineExperimentAccumulator
+
+TODAY = date(2025, 6, 3)
+
+
+@pytest.fixture
+def tester() -> ABTester:
+    return ABTester(
+        name="Teste da Planilha",
+        start_date=date(2024, 9, 22),
+        end_date=None,
+        hypothesis="",
+        desired_confidence_level=95.0,
+    )
+
+
+def _accumulator(tester: ABTester) -> OnlineExperimentAccumulator:
+    return OnlineExperimentAccumulator(tester, tail_numbers=1, confidence_level=95.0, estimated_uplift=10.0)
+
+
+def test_incremental_updates_match_validator_from_totals(tester: ABTester):
+    accumulator = _accumulator(tester)
+    for _ in range(80):
+        accumulator.add("A", visitors=1000, conversions=20)
+        accumulator.add("b", visitors=1000, conversions=21)
+    accumulator.add("B", conversions=16)
+
+    variation = accumulator.to_variation()
+    expected = ABStatisticalValidator(variation=variation, tester=tester, today=TODAY).get_statistical_results()
+
+    assert (variation.variation_a_visitors, variation.conversions_a) == (80000, 1600)
+    assert (variation.variation_b_visitors, variation.conversions_b) == (80000, 1696)
+    assert accumulator.get_statistical_results(today=TODAY) == expected
+    assert accumulator.z_score == pytest.approx(1.689668, abs=1e-5)
+    assert accumulator.p_value == expected["p_value"]
+
+
+def test_sharded_accumulators_merge_exactly(tester: ABTester):
+    rng = random.Random(7)
+    events = [(rng.choice("AB"), 1, int(rng.random() < 0.03)) for _ in range(20_000)]
+
+    single = _accumulator(tester).add_events(events)
+    shards = [_accumulator(tester).add_events(events[i::4]) for i in range(4)]
+    # Os shards viajam entre processos via pickle
+    shards = [pickle.loads(pickle.dumps(shard)) for shard in shards]
+    merged = reduce(OnlineExperimentAccumulator.merge, shards)
+
+    assert merged.visitors == single.visitors
+    assert merged.conversions == single.conversions
+    assert merged.get_statistical_results(today=TODAY) == single.get_statistical_results(today=TODAY)
+
+
+def test_results_are_refreshed_after_each_update(tester: ABTester):
+    accumulator = _accumulator(tester).add("A", 1000, 20).add("B", 1000, 20)
+    assert accumulator.z_score == 0.0
+    accumulator.add("B", conversions=10)
+    assert accumulator.z_score > 0
+
+
+def test_invalid_updates_and_incompatible_merge(tester: ABTester):
+    accumulator = _accumulator(tester)
+    with pytest.raises(ValueError):
+        accumulator.add("C", 1, 0)
+    with pytest.raises(ValueError):
+        accumulator.add("A", -1, 0)
+
+    other = OnlineExperimentAccumulator(tester, tail_numbers=2)
+    with pytest.raises(ValueError):
+        accumulator.merge(other)
@@ -0,0 +1,56 @@
+from datetime import date
+import numpy as np
+import pytest
+from domain.entities.variation_batch import VariationBatch
+from domain.use_cases.batch_statistical_validator import BatchStatisticalValidator
+from logic.parallel_analysis import ParallelBatchRunner, run_batch_parallel
+
+TODAY = date(2025, 6, 3)
+
+
+@pytest.fixture
+def portfolio() -> tuple:
+    rng = np.random.default_rng(7)
+    size = 1_001
+    visitors_a = rng.integers(0, 50_000, size)
+    visitors_b = rng.integers(0, 50_000, size)
+    variations = VariationBatch(
+        variation_a_visitors=visitors_a,
+        variation_b_visitors=visitors_b,
+        conversions_a=rng.binomial(visitors_a, 0.04),
+        conversions_b=rng.binomial(visitors_b, 0.042),
+        tail_numbers=rng.integers(1, 3, size),
+        confidence_level=rng.choice([90.0, 95.0, 99.0], size),
+        estimated_uplift=10.0,
+    )
+    start_dates = np.datetime64("2025-01-01") + rng.integers(0, 30, size).astype("timedelta64[D]")
+    end_dates = np.where(rng.random(size) < 0.2, np.datetime64("NaT"), start_dates + np.timedelta64(20, "D"))
+    return variations, start_dates, end_dates
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_results_match_serial_in_order(portfolio: tuple, workers: int):
+    variations, start_dates, end_dates = portfolio
+    expected = BatchStatisticalValidator(variations, start_dates, end_dates, today=TODAY).get_statistical_results()
+
+    results = run_batch_parallel(variations, start_dates, end_dates, workers=workers, today=TODAY)
+
+    assert results.keys() == expected.keys()
+    for name, values in expected.items():
+        np.testing.assert_array_equal(results[name], values, err_msg=name)
+
+
+def test_runner_reuses_pool_between_batches(portfolio: tuple):
+    variations, start_dates, end_dates = portfolio
+    with ParallelBatchRunner(workers=2, today=TODAY) as runner:
+        first = runner.run(variations[:500], start_dates[:500], end_dates[:500])
+        executor = runner._executor
+        second = runner.run(variations[500:], start_dates[500:], end_dates[500:])
+        assert runner._executor is executor
+
+    assert len(first["p_value"]) + len(second["p_value"]) == len(variations)
+
+
+def test_invalid_worker_count():
+    with pytest.raises(ValueError):
+        ParallelBatchRunner(workers=0)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from domain.use_cases.planning_surface import PlanningSurface, get_planning_surface
+from domain.use_cases.power_analysis import required_sample_size
+
+
+@pytest.fixture(scope="module")
+def surface() -> PlanningSurface:
+    return get_planning_surface(alpha=0.05, tails=2)
+
+
+def test_lookup_matches_exact_solver(surface):
+    rng = np.random.default_rng(0)
+    baseline = np.exp(rng.uniform(np.log(0.001), np.log(0.45), 5000))
+    mde = np.exp(rng.uniform(np.log(0.01), 0.0, 5000))
+    power = rng.uniform(0.5, 0.99, 5000)
+    exact = required_sample_size(baseline, mde, alpha=0.05, power=power, tails=2)["total_users"]
+    interpolated = surface.lookup(baseline, mde, power)
+    large = exact >= 1000
+    assert np.max(np.abs(interpolated[large] / exact[large] - 1)) < 0.005
+
+
+def test_grid_points_are_exact(surface):
+    baseline = np.exp(surface.log_baselines[17])
+    mde = np.exp(surface.log_mdes[40])
+    exact = required_sample_size(baseline, mde, alpha=0.05, power=0.8, tails=2)["total_users"]
+    assert int(surface.lookup(baseline, mde, 0.8)) == pytest.approx(int(exact), rel=1e-6, abs=1)
+
+
+def test_outside_grid_falls_back_to_solver(surface):
+    exact = required_sample_size(0.6, 0.05, alpha=0.05, power=0.995, tails=2)["total_users"]
+    assert int(surface.lookup(0.6, 0.05, 0.995)) == int(exact)
+    assert int(surface.lookup(0.0, 0.1, 0.8)) == 0
+
+
+def test_days_and_heatmap(surface):
+    users = int(surface.lookup(0.05, 0.1, 0.8))
+    assert int(surface.lookup_days(0.05, 0.1, 0.8, daily_visitors=1000)) == int(np.ceil(users / 1000))
+    assert int(surface.lookup_days(0.05, 0.1, 0.8, daily_visitors=0)) == 0
+
+    heatmap = surface.heatmap(0.8, points=10)
+    assert heatmap["users"].shape == (100,)
+    assert np.all(heatmap["users"] > 0)
+
+
+def test_surfaces_are_cached_per_alpha_and_tails(surface):
+    assert get_planning_surface(0.05, 2) is surface
+    assert get_planning_surface(0.05, 1) is not surface
+    assert surface.nbytes >= surface.log_users.nbytes
+    assert surface.build_seconds > 0
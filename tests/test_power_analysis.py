@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from domain.use_cases.power_analysis import (
+    calculate_power,
+    required_sample_size,
+    required_total_users,
+    solve_planning_grid,
+    z_quantiles,
+)
+
+
+def test_two_tailed_sample_size_matches_reference_calculators():
+    # 2% de base, +10% relativo, bicaudal a 5% e 80% de poder: ~80.7 mil por braço
+    sample_size = required_sample_size(0.02, 0.10, alpha=0.05, power=0.80, tails=2)
+    assert int(sample_size["control_users"]) == 80682
+    assert int(sample_size["total_users"]) == 2 * 80682
+
+
+def test_sample_size_reaches_requested_power():
+    alphas = np.array([0.01, 0.05, 0.10])
+    for tails in (1, 2):
+        for power in (0.5, 0.8, 0.9, 0.99):
+            users = required_sample_size(0.05, 0.05, alpha=alphas, power=power, tails=tails)["control_users"]
+            achieved = calculate_power(0.05, 0.05, users, alpha=alphas, tails=tails)
+            below = calculate_power(0.05, 0.05, users - 2, alpha=alphas, tails=tails)
+            assert np.all(achieved >= power - 1e-6)
+            assert np.all(below < power)
+
+
+def test_unequal_allocation_needs_more_total_users():
+    balanced = required_sample_size(0.05, 0.10, allocation_ratio=1.0)
+    unbalanced = required_sample_size(0.05, 0.10, allocation_ratio=3.0)
+    assert int(unbalanced["variant_users"]) == pytest.approx(3 * int(unbalanced["control_users"]), abs=3)
+    assert unbalanced["total_users"] > balanced["total_users"]
+
+
+def test_invalid_inputs_return_zero():
+    sample_size = required_sample_size([0.0, 0.05, 0.6], [0.1, 0.0, 1.0])
+    assert sample_size["total_users"].tolist() == [0, 0, 0]
+    assert calculate_power(0.05, 0.1, 0).item() == 0.0
+
+
+def test_grid_matches_pointwise_solution():
+    baselines, mdes, powers = [0.01, 0.05, 0.2], [0.02, 0.1], [0.8, 0.95]
+    grid = solve_planning_grid(baselines, mdes, powers, alpha=0.05, tails=1)
+    assert grid.shape == (3, 2, 2)
+    for i, baseline in enumerate(baselines):
+        for j, mde in enumerate(mdes):
+            for k, power in enumerate(powers):
+                expected = required_sample_size(baseline, mde, alpha=0.05, power=power, tails=1)["total_users"]
+                assert grid[i, j, k] == int(expected)
+
+
+def test_z_quantiles_table():
+    assert z_quantiles([0.975, 0.8, 0.975]) == pytest.approx([1.959964, 0.841621, 1.959964], abs=1e-6)
+
+
+def test_scalar_solver_matches_vectorized():
+    rng = np.random.default_rng(0)
+    p_control = rng.uniform(0.001, 0.5, 500)
+    mde = rng.uniform(0.0, 0.5, 500)
+    tails = rng.integers(1, 3, 500)
+    power = rng.choice([0.8, 0.95], 500)
+    vectorized = required_sample_size(p_control, mde, alpha=0.05, power=power, tails=tails)["total_users"]
+    scalar = [required_total_users(*row) for row in zip(p_control, mde, [0.05] * 500, power, tails)]
+    assert vectorized.tolist() == scalar
@@ -0,0 +1,98 @@
+from datetime import date
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+from cli.main import main
+from domain.entities.ratio_metric_batch import RatioMetricBatch
+from domain.use_cases.batch_statistical_validator import BatchStatisticalValidator
+from domain.use_cases.power_analysis import required_sample_size_means
+from domain.use_cases.ratio_metric_validator import RatioMetricValidator
+from logic.ratio_metrics import analyze_ratio_metrics
+
+TODAY = date(2025, 6, 3)
+
+
+@pytest.fixture
+def sums() -> pd.DataFrame:
+    """ Somas por experimento, métrica e braço, como sairiam de um GROUP BY. """
+    rng = np.random.default_rng(17)
+    rows = []
+    for experiment in ("checkout", "busca"):
+        for metric, rate in (("cliques_por_sessao", 0.1), ("compras_por_pageview", 0.02)):
+            for arm, lift in (("controle", 1.0), ("variacao", 1.08)):
+                sessions = rng.poisson(5, size=8_000) + 1
+                events = rng.binomial(sessions, rate * lift)
+                rows.append({
+                    "experiment": experiment, "metric": metric, "arm": arm, "units": sessions.size,
+                    "numerator": events.sum(), "denominator": sessions.sum(),
+                    "numerator_squares": (events ** 2).sum(), "denominator_squares": (sessions ** 2).sum(),
+                    "cross_products": (events * sessions).sum(),
+                    "start_date": "2025-05-01", "end_date": "2025-05-29",
+                })
+    # Braços de pares diferentes intercalados: o pareamento não depende da ordem das linhas
+    return pd.DataFrame(rows).sample(frac=1.0, random_state=3).sort_values("arm", kind="stable")
+
+
+def test_outputs_match_the_batch_validator_with_delta_errors(sums: pd.DataFrame):
+    results = analyze_ratio_metrics(sums, today=TODAY)
+    assert len(results) == 4
+    assert (results["control_arm"] == "controle").all()
+
+    batch_keys = set(BatchStatisticalValidator.from_arrays(
+        [1000], [1000], [50], [55], 2, 95.0, 10.0, "2025-05-01", "2025-05-29", today=TODAY
+    ).get_statistical_results())
+    bayesian = {"probability_b_beats_a", "expected_loss_a", "expected_loss_b", "bayesian_method",
+                "prior_alpha", "prior_beta"}
+    assert batch_keys - bayesian <= set(results.columns)
+
+    row = results.iloc[0]
+    pair = sums[(sums["experiment"] == row["experiment"]) & (sums["metric"] == row["metric"])]
+    control, variant = (pair[pair["arm"] == arm].iloc[0] for arm in ("controle", "variacao"))
+    assert row["control_ratio"] == pytest.approx(control["numerator"] / control["denominator"])
+    standard_error = np.sqrt(row["control_unit_variance"] / control["units"]
+                             + row["variation_unit_variance"] / variant["units"])
+    assert row["standard_error_difference"] == pytest.approx(standard_error)
+    assert row["z_score"] == pytest.approx((row["variation_ratio"] - row["control_ratio"]) / standard_error)
+    assert row["total_duration_days"] == 28
+
+
+def test_rows_match_one_metric_at_a_time(sums: pd.DataFrame):
+    together = analyze_ratio_metrics(sums, today=TODAY)
+    for _, row in together.iterrows():
+        pair = sums[(sums["experiment"] == row["experiment"]) & (sums["metric"] == row["metric"])]
+        alone = analyze_ratio_metrics(pair, today=TODAY).iloc[0]
+        for column in ("p_value", "observed_test_power", "sequential_p_value", "required_users_80_power"):
+            assert alone[column] == pytest.approx(row[column]), column
+
+
+def test_planning_uses_the_linearized_variance():
+    batch = RatioMetricBatch([10_000], [10_000], 5_000.0, 5_400.0, 50_000.0, 50_000.0, 9_000.0, 9_800.0,
+                             300_000.0, 300_000.0, 40_000.0, 43_000.0, 2, 95.0, 10.0)
+    validator = RatioMetricValidator(batch, "2025-05-01", "2025-05-29", today=TODAY)
+    results = validator.get_statistical_results()
+    expected = required_sample_size_means(0.1, np.sqrt(batch.unit_variance_a), 0.1, power=0.8,
+                                          standard_deviation_variant=np.sqrt(batch.unit_variance_b))
+    assert results["required_users_80_power"][0] == expected["total_users"][0]
+    assert results["required_days_80_power"][0] == np.ceil(expected["total_users"][0] / (20_000 / 28))
+    with pytest.raises(ValueError, match="bayesiana"):
+        validator.get_bayesian_results()
+
+
+def test_invalid_tables(sums: pd.DataFrame):
+    with pytest.raises(ValueError, match="Colunas ausentes"):
+        analyze_ratio_metrics(sums.drop(columns="cross_products"))
+    with pytest.raises(ValueError, match="exatamente dois braços"):
+        analyze_ratio_metrics(sums.iloc[1:])
+    pair = sums[(sums["experiment"] == "busca") & (sums["metric"] == "cliques_por_sessao")]
+    undated = analyze_ratio_metrics(pair.drop(columns=["start_date", "end_date", "experiment"]))
+    assert "required_days_80_power" not in undated
+    assert "required_users_80_power" in undated
+
+
+def test_cli_ratio(tmp_path: Path, sums: pd.DataFrame):
+    input_path = tmp_path / "sums.parquet"
+    out = tmp_path / "ratios.csv"
+    sums.to_parquet(input_path)
+    assert main(["ratio", str(input_path), "--out", str(out), "--mde", "5"]) == 0
+    assert len(pd.read_csv(out)) == 4
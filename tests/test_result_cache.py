@@ -0,0 +1,71 @@
+from datetime import date
+import pytest
+from domain.entities.ab_tester import ABTester
+from domain.entities.variation import Variation
+from logic.result_cache import ResultCache, canonical_input_key
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def entities() -> tuple:
+    tester = ABTester("Teste", date(2024, 9, 22), date(2025, 6, 3), "Hipótese", 95.0)
+    variation = Variation(80000, 80000, 1600, 1696, 1, 95.0, 10.0)
+    return tester, variation
+
+
+def test_key_depends_only_on_calculation_inputs(entities: tuple):
+    tester, variation = entities
+    renamed = ABTester("Outro nome", tester.start_date, tester.end_date, "Outra hipótese", 95.0)
+    today = date(2025, 6, 3)
+
+    assert canonical_input_key(tester, variation, today) == canonical_input_key(renamed, variation, today)
+    assert canonical_input_key(tester, variation, today) != canonical_input_key(
+        tester, Variation(80000, 80000, 1600, 1697, 1, 95.0, 10.0), today
+    )
+    assert canonical_input_key(tester, variation, today) != canonical_input_key(tester, variation, date(2025, 6, 4))
+
+
+def test_hits_misses_and_copies():
+    cache = ResultCache(max_entries=2)
+    calls = []
+    compute = lambda: calls.append(1) or {"p_value": 0.04, "srm_results": {"has_srm": False}}
+
+    first = cache.get_or_compute("a", compute)
+    first["srm_results"]["has_srm"] = True  # mutar a cópia não afeta o cache
+    second = cache.get_or_compute("a", compute)
+
+    assert len(calls) == 1
+    assert second["srm_results"]["has_srm"] is False
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction():
+    cache = ResultCache(max_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")          # "a" passa a ser o mais recente
+    cache.set("c", {"v": 3})  # remove "b"
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiration():
+    clock = FakeClock()
+    cache = ResultCache(ttl_seconds=10, clock=clock)
+    cache.set("a", {"v": 1})
+
+    clock.now = 9.9
+    assert cache.get("a") == {"v": 1}
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
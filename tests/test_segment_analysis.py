@@ -0,0 +1,89 @@
+from datetime import date
+import numpy as np
+import pandas as pd
+import pytest
+from domain.entities.ab_tester import ABTester
+from domain.entities.variation import Variation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from logic.segment_analysis import analyze_segments, heterogeneity_test, pivot_segments
+
+TODAY = date(2025, 6, 3)
+
+
+@pytest.fixture
+def segments() -> pd.DataFrame:
+    return pd.DataFrame({
+        "segment": ["mobile", "mobile", "desktop", "desktop", "tablet", "mobile"],
+        "arm": ["controle", "variacao", "controle", "variacao", "controle", "variacao"],
+        "visitors": [40000, 40000, 30000, 30500, 1000, 0],
+        "conversions": [800, 880, 900, 870, 20, 0],
+    })
+
+
+def test_pivot_aggregates_and_fills_missing_arms(segments: pd.DataFrame):
+    wide, control, variant = pivot_segments(segments)
+    assert (control, variant) == ("controle", "variacao")
+    assert wide.loc["mobile"].tolist() == [40000, 800, 40000, 880]
+    assert wide.loc["tablet"].tolist() == [1000, 20, 0, 0]
+
+    swapped, control, _ = pivot_segments(segments, control_arm="variacao")
+    assert control == "variacao"
+    assert swapped.loc["desktop", "variation_a_visitors"] == 30500
+
+
+def test_segments_match_the_scalar_validator(segments: pd.DataFrame):
+    output, _ = analyze_segments(segments, tail_numbers=2, confidence_level=95.0, estimated_uplift=10.0,
+                                 start_date=date(2025, 5, 1), end_date=date(2025, 5, 29), today=TODAY)
+    tester = ABTester("Teste", date(2025, 5, 1), date(2025, 5, 29), "", 95.0)
+
+    for _, row in output.iterrows():
+        variation = Variation(row["variation_a_visitors"], row["variation_b_visitors"],
+                              row["conversions_a"], row["conversions_b"], 2, 95.0, 10.0)
+        expected = ABStatisticalValidator(variation, tester, today=TODAY).get_statistical_results()
+        assert row["z_score"] == pytest.approx(expected["z_score"])
+        assert row["p_value"] == pytest.approx(expected["p_value"])
+        assert row["has_srm"] == expected["srm_results"]["has_srm"]
+        assert row["required_users_80_power"] == expected["planning_results"]["required_users_80_power"]
+
+
+def test_heterogeneity_test():
+    difference = np.array([0.002, 0.002, 0.002, 0.0])
+    standard_error = np.array([0.001, 0.002, 0.001, 0.0])
+    homogeneous = heterogeneity_test(difference, standard_error)
+    assert homogeneous["cochran_q"] == pytest.approx(0.0)
+    assert homogeneous["degrees_of_freedom"] == 2
+    assert homogeneous["i_squared"] == 0.0
+    assert homogeneous["pooled_difference"] == pytest.approx(0.002)
+
+    heterogeneous = heterogeneity_test(np.array([0.01, -0.01]), np.array([0.002, 0.002]))
+    weights = 1 / 0.002 ** 2
+    assert heterogeneous["cochran_q"] == pytest.approx(2 * weights * 0.01 ** 2)
+    assert heterogeneous["heterogeneity_p_value"] < 0.001
+    assert heterogeneous["i_squared"] > 0.9
+
+
+def test_many_segments_in_one_pass():
+    rng = np.random.default_rng(3)
+    count = 10_000
+    visitors = rng.integers(100, 5000, size=2 * count)
+    frame = pd.DataFrame({
+        "segment": np.repeat(np.arange(count), 2),
+        "arm": np.tile(["A", "B"], count),
+        "visitors": visitors,
+        "conversions": rng.binomial(visitors, 0.05),
+    })
+    output, heterogeneity = analyze_segments(frame, today=TODAY)
+    assert len(output) == heterogeneity["segments"] == count
+    # Sem efeito real entre segmentos, o I² fica próximo de zero
+    assert heterogeneity["i_squared"] < 0.1
+
+
+@pytest.mark.parametrize("frame, kwargs", [
+    (pd.DataFrame({"segment": ["x"], "arm": ["A"], "visitors": [1]}), {}),
+    (pd.DataFrame({"segment": ["x"] * 3, "arm": ["A", "B", "C"], "visitors": [1] * 3, "conversions": [0] * 3}), {}),
+    (pd.DataFrame({"segment": ["x"] * 2, "arm": ["A", "B"], "visitors": [1] * 2, "conversions": [0] * 2}),
+     {"control_arm": "Z"}),
+])
+def test_invalid_tables_raise(frame: pd.DataFrame, kwargs: dict):
+    with pytest.raises(ValueError):
+        pivot_segments(frame, **kwargs)
@@ -0,0 +1,92 @@
+import math
+from datetime import date
+import numpy as np
+import pytest
+from domain.entities.ab_tester import ABTester
+from domain.entities.variation import Variation
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.sequential_testing import (
+    SequentialMonitor,
+    calculate_sequential_results,
+    default_mixing_variance,
+    msprt_statistics,
+)
+
+
+def _variation(visitors_a, conversions_a, visitors_b, conversions_b) -> Variation:
+    return Variation(
+        variation_a_visitors=visitors_a,
+        variation_b_visitors=visitors_b,
+        conversions_a=conversions_a,
+        conversions_b=conversions_b,
+        tail_numbers=2,
+        confidence_level=95.0,
+        estimated_uplift=10.0,
+    )
+
+
+def test_confidence_sequence_matches_likelihood_ratio_threshold():
+    variance, mixing_variance, alpha = 1e-5, 4e-6, 0.05
+    half_width = msprt_statistics(0.0, variance, mixing_variance, alpha)["half_width"]
+    # Na borda da sequência de confiança, Λ = 1/α
+    at_border = msprt_statistics(half_width, variance, mixing_variance, alpha)
+    assert at_border["p_value"] == pytest.approx(alpha)
+    assert msprt_statistics(0.0, 0.0, mixing_variance, alpha)["p_value"] == 1.0
+
+
+def test_validator_exposes_sequential_results():
+    variation = _variation(80000, 1600, 80000, 1800)
+    tester = ABTester("Teste", date(2025, 1, 1), date(2025, 2, 1), "", 95.0)
+    validator = ABStatisticalValidator(variation=variation, tester=tester)
+
+    results = validator.get_statistical_results()
+    assert results["sequential_results"] == calculate_sequential_results(variation)
+    assert results["sequential_results"]["mixing_variance"] == pytest.approx(default_mixing_variance(0.02, 0.10))
+    assert results["sequential_results"]["is_significant"]
+    lower, upper = (results["sequential_results"]["sequential_lower_bound"],
+                    results["sequential_results"]["sequential_upper_bound"])
+    assert lower < 0.0025 < upper
+    # Mais conservador que o teste de horizonte fixo
+    assert results["sequential_results"]["sequential_p_value"] > 2 * (1 - 0.5 * math.erfc(-3.23 / math.sqrt(2)))
+
+
+def test_monitor_is_monotone_and_ignores_repeated_looks():
+    monitor = SequentialMonitor()
+    daily = [(1000, 20, 1000, 24), (2000, 41, 2000, 45), (3000, 60, 3000, 75), (4000, 79, 4000, 96)]
+    previous = monitor.observe(_variation(*daily[0]))
+    for counts in daily[1:]:
+        current = monitor.observe(_variation(*counts))
+        assert current["sequential_p_value"] <= previous["sequential_p_value"]
+        assert current["sequential_lower_bound"] >= previous["sequential_lower_bound"]
+        assert current["sequential_upper_bound"] <= previous["sequential_upper_bound"]
+        previous = current
+
+    assert monitor.observe(_variation(*daily[-1]))["looks"] == len(daily)
+
+
+def test_peeking_keeps_false_positive_rate_under_alpha():
+    """
+    Testes A/A consultados diariamente: o teste z de horizonte fixo acumula falsos
+    positivos, enquanto o mSPRT permanece abaixo de α.
+    """
+    rng = np.random.default_rng(11)
+    experiments, days, daily_visitors, rate = 300, 30, 2000, 0.05
+    conversions = rng.binomial(daily_visitors, rate, size=(2, experiments, days)).cumsum(axis=2)
+    visitors = daily_visitors * np.arange(1, days + 1)
+
+    naive_rejections = sequential_rejections = 0
+    for experiment in range(experiments):
+        monitor = SequentialMonitor(mixing_variance=default_mixing_variance(rate, 0.10))
+        naive = False
+        for day in range(days):
+            variation = _variation(visitors[day], conversions[0, experiment, day],
+                                   visitors[day], conversions[1, experiment, day])
+            state = monitor.observe(variation)
+            standard_error = math.hypot(variation.default_error_a, variation.default_error_b)
+            z_score = (variation.conversion_rate_b - variation.conversion_rate_a) / standard_error
+            naive = naive or abs(z_score) > 1.959964
+        naive_rejections += naive
+        sequential_rejections += state["is_significant"]
+
+    assert naive_rejections / experiments > 0.10
+    assert sequential_rejections / experiments <= 0.05
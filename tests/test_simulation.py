@@ -0,0 +1,71 @@
+import json
+import numpy as np
+import pytest
+from cli.main import main
+from logic.simulation import simulate_experiments
+
+
+def test_aa_false_positive_rate_and_peeking():
+    summary = simulate_experiments(60_000, control_rate=0.05, daily_visitors=2_000, days=28,
+                                   looks=[7, 14, 21, 28], seed=4, chunk_size=20_000)
+    assert summary["hypothesis"] == "A/A"
+    assert summary["power"] is None
+    assert summary["look_days"] == [7, 14, 21, 28]
+    # Na última olhada o erro tipo I fica no nível nominal...
+    assert summary["type_i_error"] == pytest.approx(0.05, abs=4 * summary["standard_errors"]["rejection_rate"])
+    # ...olhar toda semana o infla, e o teste sequencial continua controlado
+    assert summary["peeking_rejection_rate"] > 0.08
+    assert summary["sequential_rejection_rate"] <= 0.05
+    assert summary["sequential_ci_coverage"] >= 0.95
+
+
+def test_interval_coverage_follows_the_spreadsheet_critical_value():
+    # O valor crítico da planilha, (caudas - confiança) / caudas, dá z ≈ 0,063 no bicaudal
+    # e 1,645 no unicaudal: os intervalos cobrem ≈ 5% e ≈ 90% das vezes
+    two_tailed = simulate_experiments(40_000, control_rate=0.1, daily_visitors=1_000, days=14, seed=2)
+    one_tailed = simulate_experiments(40_000, control_rate=0.1, daily_visitors=1_000, days=14, seed=2,
+                                      tail_numbers=1)
+    assert two_tailed["control_ci_coverage"] == pytest.approx(0.05, abs=0.01)
+    assert one_tailed["control_ci_coverage"] == pytest.approx(0.90, abs=0.01)
+    assert one_tailed["difference_ci_coverage"] == pytest.approx(0.90, abs=0.01)
+
+
+def test_ab_power_matches_the_normal_approximation():
+    from scipy.stats import norm
+    rate_a, rate_b, per_arm = 0.05, 0.055, 20_000
+    summary = simulate_experiments(40_000, control_rate=rate_a, true_uplift=10.0, daily_visitors=2 * per_arm,
+                                   days=1, seed=3)
+    standard_error = np.sqrt(rate_a * (1 - rate_a) / per_arm + rate_b * (1 - rate_b) / per_arm)
+    expected = norm.sf(norm.isf(0.025) - (rate_b - rate_a) / standard_error)
+    assert summary["type_i_error"] is None
+    assert summary["variant_rate"] == pytest.approx(rate_b)
+    assert summary["power"] == pytest.approx(expected, abs=0.02)
+    assert 0 <= summary["mean_observed_power"] <= 1
+
+
+def test_results_do_not_depend_on_the_number_of_workers():
+    options = dict(control_rate=0.03, true_uplift=5.0, daily_visitors=[500, 800, 1_200, 900],
+                   looks=[2, 4], seed=11, chunk_size=3_000)
+    serial = simulate_experiments(10_000, workers=1, **options)
+    parallel = simulate_experiments(10_000, workers=3, **options)
+    assert serial == parallel
+    assert simulate_experiments(10_000, **{**options, "seed": 12}) != serial
+
+
+def test_invalid_scenarios():
+    with pytest.raises(ValueError, match="olhadas"):
+        simulate_experiments(10, control_rate=0.1, days=7, looks=[8])
+    with pytest.raises(ValueError, match="duração"):
+        simulate_experiments(10, control_rate=0.1, daily_visitors=[10, 10], days=3)
+    with pytest.raises(ValueError, match="taxas"):
+        simulate_experiments(10, control_rate=0.8, true_uplift=50.0, days=7)
+    with pytest.raises(ValueError, match="caudas"):
+        simulate_experiments(10, control_rate=0.1, days=7, tail_numbers=3)
+
+
+def test_cli_simulate(capsys):
+    assert main(["simulate", "--simulations", "2000", "--control-rate", "0.05", "--days", "7",
+                 "--looks", "3", "7", "--seed", "1"]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["simulations"] == 2_000
+    assert summary["look_days"] == [3, 7]
@@ -0,0 +1,103 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from logic.sqlite_result_cache import SQLiteResultCache
+
+RESULTS = {
+    "p_value": 0.0455,
+    "conversion_rate_uplift": float("inf"),
+    "srm_results": {"has_srm": False, "srm_p_value": 1.0},
+}
+
+
+def _read_from_other_process(path: str) -> dict:
+    return SQLiteResultCache(path).get("chave")
+
+
+def test_results_survive_reopening(tmp_path: Path):
+    path = tmp_path / "cache.sqlite"
+    SQLiteResultCache(path).set("chave", RESULTS)
+
+    reopened = SQLiteResultCache(path)
+    assert reopened.get("chave") == RESULTS
+    assert reopened.stats()["hits"] == 1
+
+
+def test_wal_mode_and_concurrent_readers(tmp_path: Path):
+    path = tmp_path / "cache.sqlite"
+    cache = SQLiteResultCache(path)
+    cache.set("chave", RESULTS)
+
+    assert cache._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        assert list(executor.map(_read_from_other_process, [str(path)] * 3)) == [RESULTS] * 3
+
+
+def test_library_version_is_part_of_the_key(tmp_path: Path):
+    path = tmp_path / "cache.sqlite"
+    SQLiteResultCache(path, library_version="0.1.0").set("chave", RESULTS)
+
+    assert SQLiteResultCache(path, library_version="0.2.0").get("chave") is None
+    assert SQLiteResultCache(path, library_version="0.1.0").get("chave") == RESULTS
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path: Path):
+    # Cerca de 10 KB por entrada (páginas de overflow) em um arquivo de até 128 KB
+    large = dict(RESULTS, trajectory=[i / 7 for i in range(500)])
+    cache = SQLiteResultCache(tmp_path / "cache.sqlite", max_bytes=128 * 1024, touch_interval=0.0)
+
+    for key in ("a", "b", "c"):
+        cache.set(key, large)
+    cache.get("a")  # "a" passa a ser o mais recente
+    stored = lambda key: cache._connection().execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone()
+    index = 0
+    while stored("b") and index < 50:
+        cache.set(f"d{index}", large)
+        index += 1
+
+    assert not stored("b")
+    assert cache.get("a") == large
+    assert cache.get(f"d{index - 1}") == large
+    assert cache.file_bytes() <= cache.max_bytes
+
+
+def test_file_size_stays_within_max_bytes(tmp_path: Path):
+    path = tmp_path / "cache.sqlite"
+    cache = SQLiteResultCache(path, max_bytes=256 * 1024)
+    large = dict(RESULTS, trajectory=[i / 7 for i in range(500)])
+
+    for index in range(200):
+        cache.set(f"chave {index}", large)
+        assert cache.file_bytes() <= cache.max_bytes
+
+    stats = cache.stats()
+    assert stats["file_bytes"] <= cache.max_bytes
+    assert stats["stored_bytes"] > cache.max_bytes / 4
+    assert cache.get("chave 199") == large
+
+
+def test_recent_hits_do_not_write(tmp_path: Path):
+    cache = SQLiteResultCache(tmp_path / "cache.sqlite", touch_interval=60.0)
+    cache.set("chave", RESULTS)
+    last_access = lambda: cache._connection().execute("SELECT last_access FROM results").fetchone()[0]
+    stored = last_access()
+
+    changes = cache._connection().total_changes
+    assert cache.get("chave") == RESULTS
+    assert cache._connection().total_changes == changes
+    assert last_access() == stored
+
+    # Entrada acessada há mais tempo que o intervalo: a leitura atualiza last_access
+    cache._connection().execute("UPDATE results SET last_access = last_access - 120")
+    assert cache.get("chave") == RESULTS
+    assert last_access() > stored - 120
+
+
+def test_get_or_compute_only_computes_once(tmp_path: Path):
+    cache = SQLiteResultCache(tmp_path / "cache.sqlite")
+    calls = []
+
+    for _ in range(2):
+        cache.get_or_compute("chave", lambda: calls.append(1) or RESULTS)
+
+    assert len(calls) == 1
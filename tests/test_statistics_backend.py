@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from datetime import date
+from domain.entities.variation import Variation
+from domain.entities.ab_tester import ABTester
+from domain.use_cases.ab_statistical_validator import ABStatisticalValidator
+from domain.use_cases.statistics_backend import (
+    FastStatisticsBackend,
+    ScipyStatisticsBackend,
+    Z_CRITICAL_TABLE,
+    get_statistics_backend,
+)
+
+fast = FastStatisticsBackend()
+reference = ScipyStatisticsBackend()
+
+
+@pytest.mark.parametrize("x", np.linspace(-8, 8, 161))
+def test_norm_cdf_and_sf_parity(x: float):
+    assert fast.norm_cdf(x) == pytest.approx(reference.norm_cdf(x), rel=1e-12, abs=1e-300)
+    assert fast.norm_sf(x) == pytest.approx(reference.norm_sf(x), rel=1e-12, abs=1e-300)
+
+
+@pytest.mark.parametrize("p", [1e-12, 1e-6, 0.001, 0.01, 0.02425, 0.05, 0.3, 0.5, 0.525, 0.9, 0.975, 0.999999])
+def test_norm_ppf_parity(p: float):
+    assert fast.norm_ppf(p) == pytest.approx(reference.norm_ppf(p), rel=1e-12, abs=1e-14)
+
+
+@pytest.mark.parametrize("tails, confidence", list(Z_CRITICAL_TABLE))
+def test_z_critical_table_matches_scipy(tails: int, confidence: float):
+    assert fast.z_critical(tails, confidence) == reference.z_critical(tails, confidence)
+
+
+@pytest.mark.parametrize("observed", [[80000, 80000], [1000, 1100], [50, 70], [10, 1], [123456, 120001]])
+def test_two_cell_chisquare_parity(observed: list):
+    expected = [sum(observed) / 2.0] * 2
+    assert fast.chisquare_p_value(observed, expected) == pytest.approx(
+        reference.chisquare_p_value(observed, expected), rel=1e-10, abs=1e-300
+    )
+
+
+def test_fast_chisquare_rejects_more_than_two_cells():
+    with pytest.raises(ValueError):
+        fast.chisquare_p_value([1, 2, 3], [2, 2, 2])
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError):
+        get_statistics_backend("numba")
+
+
+@pytest.mark.parametrize("tails", [1, 2])
+@pytest.mark.parametrize("confidence", [90.0, 95.0, 99.0])
+def test_validator_results_identical_between_backends(tails: int, confidence: float):
+    """O validador deve produzir os mesmos resultados com os dois backends."""
+    variation = Variation(80000, 80500, 1600, 1696, tails, confidence, 10.0)
+    tester = ABTester("Paridade", date(2024, 9, 22), date(2025, 6, 3), "", confidence)
+
+    fast_results = ABStatisticalValidator(variation, tester, backend="fast").get_statistical_results()
+    scipy_results = ABStatisticalValidator(variation, tester, backend="scipy").get_statistical_results()
+
+    assert fast_results["temporal_validation_results"] == scipy_results.pop("temporal_validation_results")
+    for key, value in scipy_results.items():
+        assert fast_results[key] == pytest.approx(value, rel=1e-10), key
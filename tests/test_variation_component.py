@@ -0,0 +1,72 @@
+from streamlit.testing.v1 import AppTest
+
+
+def _variation_app():
+    import streamlit as st
+    from components.variation_component import VariationComponent
+
+    component = VariationComponent()
+    component.render_inputs()
+    st.session_state.entity_error = component.get_variation_entity().count_relative_error
+
+
+def _imported_app() -> AppTest:
+    """ Estado logo após importar um log com contagens aproximadas. """
+    at = AppTest.from_function(_variation_app, default_timeout=30)
+    at.session_state.var_control_visitors = 40_000
+    at.session_state.var_control_conversions = 2_000
+    at.session_state.var_variant_visitors = 40_000
+    at.session_state.var_variant_conversions = 2_100
+    at.session_state.var_count_relative_error = 0.008
+    at.session_state.var_imported_counts = (40_000, 2_000, 40_000, 2_100)
+    return at.run()
+
+
+def test_imported_sketch_error_applies_to_the_imported_counts():
+    at = _imported_app()
+    assert not at.exception
+    assert at.session_state.entity_error == 0.008
+
+
+def test_typed_counts_drop_the_sketch_error():
+    at = _imported_app()
+    at.number_input(key="var_variant_conversions").set_value(2_300).run()
+    assert not at.exception
+    assert at.session_state.entity_error == 0.0
+    assert at.session_state.var_count_relative_error == 0.0
+
+    # Voltar aos números importados não traz o erro de volta: eles foram digitados
+    at.number_input(key="var_variant_conversions").set_value(2_100).run()
+    assert at.session_state.entity_error == 0.0
+
+
+def _multi_arm_app():
+    import streamlit as st
+    from components.variation_component import VariationComponent
+
+    component = VariationComponent()
+    component.render_inputs()
+    st.session_state.entity_error = component.get_multi_arm_entity().count_relative_error
+
+
+def test_imported_sketch_error_applies_to_the_imported_arms_table():
+    import pandas as pd
+
+    at = AppTest.from_function(_multi_arm_app, default_timeout=30)
+    at.session_state.var_arm_count = 3
+    at.session_state.var_arms_table = pd.DataFrame({
+        "Braço": ["A", "B", "C"],
+        "Visitantes": [40_000, 40_000, 40_000],
+        "Conversões": [2_000, 2_100, 2_050],
+        "Peso (%)": 1.0,
+    })
+    at.session_state.var_count_relative_error = 0.008
+    at.session_state.var_imported_counts = ((40_000, 40_000, 40_000), (2_000, 2_100, 2_050))
+    at.run()
+    assert not at.exception
+    assert at.session_state.entity_error == 0.008
+
+    # Outro número de braços muda a tabela: o erro das contagens importadas deixa de valer
+    at.number_input(key="var_arm_count").set_value(4).run()
+    assert not at.exception
+    assert at.session_state.entity_error == 0.0